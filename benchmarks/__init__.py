@@ -0,0 +1,36 @@
+"""
+HACS Benchmarks
+
+Throughput and p95 latency benchmarks for model validation, persistence,
+chunked extraction, alignment and tool search. Datasets are synthetic and
+seeded, extraction runs against a fake LLM provider with configurable
+latency, and persistence benchmarks run only when a Postgres URL is given.
+
+Usage:
+    uv run python -m benchmarks --output results.json
+    uv run python -m benchmarks --suite models --baseline benchmarks/baseline.json
+"""
+
+from .harness import (
+    BENCHMARKS,
+    BenchmarkContext,
+    BenchmarkResult,
+    SkipBenchmark,
+    Target,
+    benchmark,
+    compare,
+    run_benchmark,
+    run_suites,
+)
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkContext",
+    "BenchmarkResult",
+    "SkipBenchmark",
+    "Target",
+    "benchmark",
+    "compare",
+    "run_benchmark",
+    "run_suites",
+]
@@ -0,0 +1,84 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+from .harness import BENCHMARKS, BenchmarkContext, compare, run_suites
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="HACS benchmarks")
+    parser.add_argument("--suite", action="append", help="Suite to run (repeatable)")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks whose key contains this")
+    parser.add_argument("--scale", type=float, default=1.0, help="Dataset size multiplier")
+    parser.add_argument("--seed", type=int, default=42, help="Dataset seed")
+    parser.add_argument(
+        "--llm-latency-ms", type=float, default=5.0, help="Fake LLM latency per call"
+    )
+    parser.add_argument(
+        "--postgres-url",
+        default=os.getenv("HACS_BENCH_DATABASE_URL"),
+        help="Enable persistence benchmarks against this database",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Compare against a stored report")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed relative slowdown vs baseline"
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    # Adapters log every operation at INFO, which would dominate timings
+    logging.disable(logging.INFO)
+
+    if args.list:
+        from . import suites  # noqa: F401
+
+        for key, bench in BENCHMARKS.items():
+            print(f"{key:40} {bench.target}")
+        return 0
+
+    context = BenchmarkContext(
+        seed=args.seed,
+        scale=args.scale,
+        llm_latency_ms=args.llm_latency_ms,
+        postgres_url=args.postgres_url,
+    )
+    report = run_suites(context, args.suite, args.pattern)
+
+    failed = False
+    for result in report["results"]:
+        if result["skipped"]:
+            status = f"SKIP ({result['skipped']})"
+        else:
+            status = "ok" if result["passed"] else "MISSED TARGET"
+            failed |= not result["passed"]
+        metrics = "".join(f"  {k}={v:,.1f}" for k, v in result.get("metrics", {}).items())
+        print(
+            f"{result['key']:40} {result['ops_per_second']:>12,.1f} ops/s "
+            f"p95 {result['p95_ms']:>9.3f} ms  {status}{metrics}"
+        )
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        report["regressions"] = regressions
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['key']}: "
+                f"{regression['ops_per_second']:,.1f} ops/s "
+                f"(baseline {regression['baseline_ops_per_second']:,.1f}), "
+                f"p95 {regression['p95_ms']:.3f} ms (baseline {regression['baseline_p95_ms']:.3f})"
+            )
+        failed |= bool(regressions)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Reproducible synthetic datasets for benchmarks."""
+
+import random
+from datetime import date, timedelta
+
+GIVEN_NAMES = [
+    "Ana", "John", "Maria", "Wei", "Fatima", "Lucas", "Priya", "Omar", "Sofia", "Kenji"
+]
+FAMILY_NAMES = [
+    "Silva", "Smith", "Garcia", "Chen", "Khan", "Costa", "Patel", "Ali", "Rossi", "Sato"
+]
+VITALS = [
+    ("8867-4", "Heart rate", "beats/min", 50, 120),
+    ("8480-6", "Systolic blood pressure", "mm[Hg]", 90, 180),
+    ("8462-4", "Diastolic blood pressure", "mm[Hg]", 50, 110),
+    ("8310-5", "Body temperature", "Cel", 35, 40),
+    ("2339-0", "Glucose", "mg/dL", 60, 250),
+]
+
+# Clinical findings planted in notes; the fake LLM "extracts" them back
+FINDINGS = {
+    "condition": [
+        "hypertension", "type 2 diabetes", "atrial fibrillation", "asthma", "CKD stage 3"
+    ],
+    "medication": ["metformin 500 mg", "lisinopril 10 mg", "apixaban 5 mg", "albuterol inhaler"],
+    "symptom": ["shortness of breath", "chest pain", "fatigue", "dizziness", "palpitations"],
+    "procedure": ["echocardiogram", "HbA1c test", "spirometry", "ECG"],
+}
+FILLER = [
+    "Patient seen in clinic for follow-up.",
+    "Vital signs reviewed with the patient.",
+    "No acute distress noted on examination.",
+    "Plan discussed and questions answered.",
+    "Family history reviewed and unchanged.",
+    "Will reassess at the next scheduled visit.",
+]
+
+
+def make_patients(count: int, seed: int = 42) -> list[dict]:
+    """Patient payloads with names, demographics and identifiers."""
+    rng = random.Random(seed)
+    patients = []
+    for i in range(count):
+        given, family = rng.choice(GIVEN_NAMES), rng.choice(FAMILY_NAMES)
+        patients.append(
+            {
+                "id": f"patient-{i:06d}",
+                "full_name": f"{given} {family}",
+                "gender": rng.choice(["female", "male", "other"]),
+                "birth_date": (date(1940, 1, 1) + timedelta(days=rng.randrange(25000))).isoformat(),
+                "identifier": [{"system": "urn:mrn", "value": f"MRN{i:08d}"}],
+            }
+        )
+    return patients
+
+
+def make_observations(count: int, patient_ids: list[str], seed: int = 42) -> list[dict]:
+    """Vital-sign Observation payloads spread across ``patient_ids``."""
+    rng = random.Random(seed)
+    observations = []
+    for i in range(count):
+        loinc, display, unit, low, high = rng.choice(VITALS)
+        observations.append(
+            {
+                "id": f"observation-{i:07d}",
+                "status": "final",
+                "code": {
+                    "text": display,
+                    "coding": [{"system": "http://loinc.org", "code": loinc, "display": display}],
+                },
+                "subject": f"Patient/{rng.choice(patient_ids)}",
+                "value_quantity": {"value": round(rng.uniform(low, high), 1), "unit": unit},
+            }
+        )
+    return observations
+
+
+def make_clinical_note(chars: int, seed: int = 42) -> str:
+    """Long free-text clinical note with planted findings."""
+    rng = random.Random(seed)
+    sentences = []
+    length = 0
+    while length < chars:
+        if rng.random() < 0.3:
+            kind = rng.choice(list(FINDINGS))
+            sentence = f"Assessment notes {rng.choice(FINDINGS[kind])} in this encounter."
+        else:
+            sentence = rng.choice(FILLER)
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)[:chars]
@@ -0,0 +1,40 @@
+"""Deterministic LLM stand-in with configurable latency."""
+
+import asyncio
+import json
+
+from .datasets import FINDINGS
+
+
+class FakeLLMProvider:
+    """LLM provider returning planted findings found in the prompt.
+
+    ``ainvoke`` sleeps for ``latency_ms`` to model network and generation
+    time, then answers with a fenced JSON array of
+    ``{"extraction_class", "extraction_text"}`` objects for every known
+    finding that appears in the prompt's ``CHUNK`` section.
+    """
+
+    def __init__(self, latency_ms: float = 5.0) -> None:
+        """Initialize provider.
+
+        Args:
+            latency_ms: Simulated latency per call in milliseconds
+        """
+        self.latency_ms = latency_ms
+        self.calls = 0
+
+    async def ainvoke(self, prompt: str) -> str:
+        """Answer a prompt after the simulated latency."""
+        self.calls += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        text = prompt.split("CHUNK:", 1)[-1]
+        items = [
+            {"extraction_class": kind, "extraction_text": finding}
+            for kind, findings in FINDINGS.items()
+            for finding in findings
+            if finding in text
+        ]
+        return f"```json\n{json.dumps(items)}\n```"
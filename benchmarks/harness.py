@@ -0,0 +1,269 @@
+"""Benchmark registration, timing and baseline comparison."""
+
+import asyncio
+import inspect
+import platform
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+
+class SkipBenchmark(Exception):
+    """Raised by a benchmark setup when its environment is unavailable."""
+
+
+@dataclass
+class Target:
+    """Performance target a benchmark must meet."""
+
+    min_ops_per_second: float | None = None
+    max_p95_ms: float | None = None
+
+
+@dataclass
+class BenchmarkContext:
+    """Options shared by all benchmarks in a run."""
+
+    seed: int = 42
+    scale: float = 1.0
+    llm_latency_ms: float = 5.0
+    postgres_url: str | None = None
+    # Extra measurements recorded by the benchmark being set up
+    metrics: dict[str, float] = field(default_factory=dict)
+
+    def record(self, **metrics: float) -> None:
+        """Attach extra measurements (e.g. bytes per item) to the current result."""
+        self.metrics.update(metrics)
+
+    def scaled(self, count: int) -> int:
+        """Scale a dataset size, keeping at least one item."""
+        return max(1, int(count * self.scale))
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark.
+
+    ``setup(context)`` builds the dataset and returns the operation to time,
+    optionally as an ``(operation, cleanup)`` pair; each call of the operation
+    processes ``batch`` items.
+    """
+
+    suite: str
+    name: str
+    setup: Callable[[BenchmarkContext], Callable[[], Any]]
+    target: Target
+    iterations: int = 50
+    warmup: int = 3
+    batch: int = 1
+
+    @property
+    def key(self) -> str:
+        """Unique benchmark identifier."""
+        return f"{self.suite}.{self.name}"
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary for one benchmark."""
+
+    key: str
+    suite: str
+    iterations: int = 0
+    batch: int = 1
+    ops_per_second: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+    target: dict[str, float | None] = field(default_factory=dict)
+    passed: bool = True
+    skipped: str | None = None
+    metrics: dict[str, float] = field(default_factory=dict)
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    suite: str,
+    name: str,
+    target: Target,
+    iterations: int = 50,
+    warmup: int = 3,
+    batch: int = 1,
+) -> Callable:
+    """Register a benchmark setup function.
+
+    Args:
+        suite: Subsystem the benchmark belongs to
+        name: Benchmark name within the suite
+        target: Throughput and p95 latency target
+        iterations: Timed calls of the operation
+        warmup: Untimed calls before measuring
+        batch: Items processed per call, used for throughput
+
+    Returns:
+        Decorator registering the setup function unchanged
+    """
+
+    def decorator(setup: Callable) -> Callable:
+        bench = Benchmark(suite, name, setup, target, iterations, warmup, batch)
+        BENCHMARKS[bench.key] = bench
+        return setup
+
+    return decorator
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    index = min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))
+    return samples[index]
+
+
+def run_benchmark(bench: Benchmark, context: BenchmarkContext) -> BenchmarkResult:
+    """Set up and time one benchmark.
+
+    Args:
+        bench: Benchmark to run
+        context: Run options
+
+    Returns:
+        Result with throughput, latency percentiles and target verdict
+    """
+    result = BenchmarkResult(key=bench.key, suite=bench.suite, target=asdict(bench.target))
+    context.metrics.clear()
+    try:
+        prepared = bench.setup(context)
+    except SkipBenchmark as e:
+        result.skipped = str(e)
+        return result
+    operation, cleanup = prepared if isinstance(prepared, tuple) else (prepared, None)
+
+    if inspect.iscoroutinefunction(operation):
+        samples = asyncio.run(_time_async(operation, cleanup, bench))
+    else:
+        samples = _time_sync(operation, cleanup, bench)
+
+    samples.sort()
+    total = sum(samples)
+    result.iterations = len(samples)
+    result.batch = bench.batch
+    result.ops_per_second = round(len(samples) * bench.batch / total, 2) if total else 0.0
+    result.p50_ms = round(_percentile(samples, 0.50) * 1000, 4)
+    result.p95_ms = round(_percentile(samples, 0.95) * 1000, 4)
+    result.max_ms = round(samples[-1] * 1000, 4)
+    result.metrics = dict(context.metrics)
+
+    target = bench.target
+    if target.min_ops_per_second is not None:
+        result.passed &= result.ops_per_second >= target.min_ops_per_second
+    if target.max_p95_ms is not None:
+        result.passed &= result.p95_ms <= target.max_p95_ms
+    return result
+
+
+def _time_sync(
+    operation: Callable[[], Any], cleanup: Callable | None, bench: Benchmark
+) -> list[float]:
+    try:
+        for _ in range(bench.warmup):
+            operation()
+        samples = []
+        for _ in range(bench.iterations):
+            started = time.perf_counter()
+            operation()
+            samples.append(time.perf_counter() - started)
+        return samples
+    finally:
+        if cleanup is not None:
+            cleanup()
+
+
+async def _time_async(
+    operation: Callable[[], Any], cleanup: Callable | None, bench: Benchmark
+) -> list[float]:
+    # Everything runs in one event loop so pools and sessions stay valid
+    try:
+        for _ in range(bench.warmup):
+            await operation()
+        samples = []
+        for _ in range(bench.iterations):
+            started = time.perf_counter()
+            await operation()
+            samples.append(time.perf_counter() - started)
+        return samples
+    finally:
+        if cleanup is not None:
+            await cleanup()
+
+
+def run_suites(
+    context: BenchmarkContext,
+    suites: list[str] | None = None,
+    pattern: str | None = None,
+) -> dict[str, Any]:
+    """Run registered benchmarks and build the JSON report.
+
+    Args:
+        context: Run options
+        suites: Suites to run, all if omitted
+        pattern: Substring filter on benchmark keys
+
+    Returns:
+        Report with run metadata and one result per benchmark
+    """
+    from . import suites as _suites  # noqa: F401  (registers benchmarks)
+
+    results = []
+    for key, bench in BENCHMARKS.items():
+        if suites and bench.suite not in suites:
+            continue
+        if pattern and pattern not in key:
+            continue
+        results.append(asdict(run_benchmark(bench, context)))
+
+    return {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "context": {
+            k: v for k, v in asdict(context).items() if k not in ("postgres_url", "metrics")
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.25
+) -> list[dict[str, Any]]:
+    """Find benchmarks that regressed against a baseline report.
+
+    Args:
+        report: Current report from ``run_suites``
+        baseline: Stored report to compare against
+        tolerance: Allowed relative slowdown before flagging a regression
+
+    Returns:
+        One entry per regressed benchmark with current and baseline values
+    """
+    previous = {r["key"]: r for r in baseline.get("results", []) if not r.get("skipped")}
+    regressions = []
+    for current in report["results"]:
+        before = previous.get(current["key"])
+        if current.get("skipped") or before is None:
+            continue
+        slower_throughput = current["ops_per_second"] < before["ops_per_second"] * (1 - tolerance)
+        slower_p95 = current["p95_ms"] > before["p95_ms"] * (1 + tolerance)
+        if slower_throughput or slower_p95:
+            regressions.append(
+                {
+                    "key": current["key"],
+                    "ops_per_second": current["ops_per_second"],
+                    "baseline_ops_per_second": before["ops_per_second"],
+                    "p95_ms": current["p95_ms"],
+                    "baseline_p95_ms": before["p95_ms"],
+                }
+            )
+    return regressions
@@ -0,0 +1,5 @@
+"""Benchmark suites; importing this package registers every benchmark."""
+
+from . import extraction, models, persistence, registry
+
+__all__ = ["extraction", "models", "persistence", "registry"]
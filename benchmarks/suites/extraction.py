@@ -0,0 +1,74 @@
+"""Chunked extraction and alignment benchmarks using the fake LLM provider."""
+
+import random
+
+from hacs_models import ChunkingPolicy, ExtractionResults
+from hacs_models.annotation import FormatType
+from hacs_utils.annotation.resolver import Resolver
+from hacs_utils.extraction.pipeline import _extract_chunked
+
+from ..datasets import FINDINGS, make_clinical_note
+from ..fake_llm import FakeLLMProvider
+from ..harness import BenchmarkContext, Target, benchmark
+
+PROMPT = "Extract conditions, medications, symptoms and procedures from the clinical note."
+
+
+@benchmark(
+    "extraction",
+    "extract_chunked",
+    Target(min_ops_per_second=5, max_p95_ms=250),
+    iterations=20,
+)
+def extract_chunked(context: BenchmarkContext):
+    note = make_clinical_note(context.scaled(40_000), context.seed)
+    provider = FakeLLMProvider(latency_ms=context.llm_latency_ms)
+    policy = ChunkingPolicy(strategy="char", max_chars=4_000)
+
+    async def operation():
+        await _extract_chunked(
+            provider,
+            PROMPT,
+            ExtractionResults,
+            source_text=note,
+            chunking_policy=policy,
+            many=True,
+            max_items=500,
+            format_type=FormatType.JSON,
+            fenced_output=True,
+            max_retries=0,
+            strict=False,
+            use_descriptive_schema=False,
+            case_insensitive_align=True,
+            injected_instance=None,
+            injected_fields=None,
+            debug_dir=None,
+            debug_prefix=None,
+        )
+
+    return operation
+
+
+ALIGN_BATCH = 200
+
+
+@benchmark(
+    "extraction",
+    "resolver_align",
+    Target(min_ops_per_second=2_000, max_p95_ms=100),
+    iterations=30,
+    batch=ALIGN_BATCH,
+)
+def resolver_align(context: BenchmarkContext):
+    note = make_clinical_note(context.scaled(40_000), context.seed)
+    rng = random.Random(context.seed)
+    extractions = [
+        ExtractionResults(extraction_class=kind, extraction_text=rng.choice(FINDINGS[kind]))
+        for kind in rng.choices(list(FINDINGS), k=ALIGN_BATCH)
+    ]
+    resolver = Resolver()
+
+    def operation():
+        resolver.align(extractions, note, case_insensitive=True)
+
+    return operation
@@ -0,0 +1,247 @@
+"""BaseResource validation and serialization benchmarks."""
+
+import json
+
+from hacs_models import CodeableConcept, Observation, Patient, validate_many
+from hacs_models.serialization import (
+    SERIALIZATION_PROFILES,
+    dumps,
+    dumps_many,
+    loads,
+    profile_sizes,
+)
+
+from ..datasets import make_observations, make_patients
+from ..harness import BenchmarkContext, Target, benchmark
+
+BATCH = 100
+
+
+@benchmark(
+    "models", "patient_validate", Target(min_ops_per_second=5_000, max_p95_ms=40), batch=BATCH
+)
+def patient_validate(context: BenchmarkContext):
+    payloads = make_patients(BATCH, context.seed)
+
+    def operation():
+        for payload in payloads:
+            Patient.model_validate(payload)
+
+    return operation
+
+
+@benchmark(
+    "models", "observation_validate", Target(min_ops_per_second=5_000, max_p95_ms=40), batch=BATCH
+)
+def observation_validate(context: BenchmarkContext):
+    payloads = make_observations(BATCH, ["patient-000001"], context.seed)
+
+    def operation():
+        for payload in payloads:
+            Observation.model_validate(payload)
+
+    return operation
+
+
+@benchmark(
+    "models",
+    "patient_dump_json",
+    Target(min_ops_per_second=10_000, max_p95_ms=20),
+    batch=BATCH,
+)
+def patient_dump_json(context: BenchmarkContext):
+    patients = [Patient.model_validate(p) for p in make_patients(BATCH, context.seed)]
+
+    def operation():
+        for patient in patients:
+            patient.model_dump_json()
+
+    return operation
+
+
+BULK_BATCH = 1_000
+
+
+@benchmark(
+    "models",
+    "bulk_validate",
+    Target(min_ops_per_second=10_000, max_p95_ms=200),
+    batch=BULK_BATCH,
+)
+def bulk_validate(context: BenchmarkContext):
+    patients = make_patients(BULK_BATCH // 2, context.seed)
+    observations = make_observations(BULK_BATCH // 2, ["patient-000001"], context.seed)
+    payloads = [{**p, "resource_type": "Patient"} for p in patients] + [
+        {**o, "resource_type": "Observation"} for o in observations
+    ]
+
+    def operation():
+        validate_many(payloads)
+
+    return operation
+
+
+def _serialize_case(profile: str):
+    def setup(context: BenchmarkContext):
+        patients = [Patient.model_validate(p) for p in make_patients(BATCH, context.seed)]
+        encoded = [dumps(patient, profile) for patient in patients]
+        baseline = [json.dumps(patient.model_dump(mode="json")).encode() for patient in patients]
+        context.record(
+            bytes_per_resource=sum(map(len, encoded)) / BATCH,
+            baseline_bytes_per_resource=sum(map(len, baseline)) / BATCH,
+        )
+
+        def operation():
+            for patient in patients:
+                dumps(patient, profile)
+
+        return operation
+
+    return setup
+
+
+for _profile in SERIALIZATION_PROFILES:
+    benchmark(
+        "models",
+        f"serialize_{_profile}",
+        Target(min_ops_per_second=20_000, max_p95_ms=10),
+        batch=BATCH,
+    )(_serialize_case(_profile))
+
+
+@benchmark(
+    "models",
+    "serialize_model_dump_stdlib",
+    Target(min_ops_per_second=5_000, max_p95_ms=40),
+    batch=BATCH,
+)
+def serialize_model_dump_stdlib(context: BenchmarkContext):
+    """Previous persistence path, for comparison with serialize_storage."""
+    patients = [Patient.model_validate(p) for p in make_patients(BATCH, context.seed)]
+
+    def operation():
+        for patient in patients:
+            json.dumps(patient.model_dump(mode="json"))
+
+    return operation
+
+
+@benchmark(
+    "models", "serialize_many", Target(min_ops_per_second=20_000, max_p95_ms=10), batch=BATCH
+)
+def serialize_many(context: BenchmarkContext):
+    patients = [Patient.model_validate(p) for p in make_patients(BATCH, context.seed)]
+
+    def operation():
+        dumps_many(patients)
+
+    return operation
+
+
+@benchmark(
+    "models", "deserialize_compact", Target(min_ops_per_second=5_000, max_p95_ms=40), batch=BATCH
+)
+def deserialize_compact(context: BenchmarkContext):
+    patients = [Patient.model_validate(p) for p in make_patients(BATCH, context.seed)]
+    encoded = [dumps(patient, "compact") for patient in patients]
+
+    def operation():
+        for data in encoded:
+            loads(data, Patient)
+
+    return operation
+
+
+@benchmark(
+    "models",
+    "observation_compact_storage",
+    Target(min_ops_per_second=10_000, max_p95_ms=20),
+    batch=BATCH,
+)
+def observation_compact_storage(context: BenchmarkContext):
+    """Compact storage writes; records bytes saved against the storage profile."""
+    observations = [
+        Observation.model_validate(p)
+        for p in make_observations(BATCH, ["patient-000001"], context.seed)
+    ]
+    sizes = profile_sizes(observations, ("storage", "compact"))
+    context.record(
+        storage_bytes_per_resource=sizes["bytes"]["storage"] // BATCH,
+        compact_bytes_per_resource=sizes["bytes"]["compact"] // BATCH,
+        saved_ratio=sizes["savings"]["compact"],
+    )
+
+    def operation():
+        for observation in observations:
+            dumps(observation, "compact")
+
+    return operation
+
+
+def _observation_fields(context: BenchmarkContext) -> list[dict]:
+    """Validated field values, as an internal path holding upstream models would have."""
+    observations = [
+        Observation.model_validate(p)
+        for p in make_observations(BATCH, ["patient-000001"], context.seed)
+    ]
+    return [
+        {
+            "status": o.status,
+            "code": o.code,
+            "subject": o.subject,
+            "value_quantity": o.value_quantity,
+        }
+        for o in observations
+    ]
+
+
+@benchmark(
+    "models", "construct_validated", Target(min_ops_per_second=20_000, max_p95_ms=10), batch=BATCH
+)
+def construct_validated(context: BenchmarkContext):
+    fields = _observation_fields(context)
+
+    def operation():
+        for values in fields:
+            Observation(**values)
+
+    return operation
+
+
+@benchmark(
+    "models", "construct_trusted", Target(min_ops_per_second=40_000, max_p95_ms=5), batch=BATCH
+)
+def construct_trusted(context: BenchmarkContext):
+    fields = _observation_fields(context)
+
+    def operation():
+        for values in fields:
+            Observation.trusted(**values)
+
+    return operation
+
+
+def _mutate_case(trusted: bool):
+    def case(context: BenchmarkContext):
+        observations = [Observation.trusted(**values) for values in _observation_fields(context)]
+        code = CodeableConcept(text="Heart rate")
+
+        def operation():
+            for observation in observations:
+                if trusted:
+                    observation.trusted_update(status="amended", code=code)
+                else:
+                    observation.status = "amended"
+                    observation.code = code
+
+        return operation
+
+    return case
+
+
+benchmark(
+    "models", "mutate_validated", Target(min_ops_per_second=50_000, max_p95_ms=5), batch=BATCH
+)(_mutate_case(trusted=False))
+benchmark(
+    "models", "mutate_trusted", Target(min_ops_per_second=200_000, max_p95_ms=2), batch=BATCH
+)(_mutate_case(trusted=True))
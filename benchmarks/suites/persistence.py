@@ -0,0 +1,150 @@
+"""PostgreSQLAdapter benchmarks against an optional local Postgres.
+
+Skipped unless a database URL is passed with ``--postgres-url`` or
+``HACS_BENCH_DATABASE_URL``. Rows are written to a dedicated schema.
+"""
+
+import itertools
+
+from hacs_models import Actor, Patient, WorkflowExecution
+
+from ..datasets import make_patients
+from ..harness import BenchmarkContext, SkipBenchmark, Target, benchmark
+
+SCHEMA = "hacs_benchmarks"
+BATCH = 20
+
+
+def _adapter(context: BenchmarkContext):
+    if not context.postgres_url:
+        raise SkipBenchmark("no Postgres URL configured")
+    try:
+        from hacs_persistence.adapter import PostgreSQLAdapter
+    except ImportError as e:
+        raise SkipBenchmark(f"hacs_persistence unavailable: {e}") from e
+    return PostgreSQLAdapter(context.postgres_url, schema_name=SCHEMA)
+
+
+def _actor() -> Actor:
+    return Actor(name="benchmark", role="system")
+
+
+@benchmark(
+    "persistence",
+    "save",
+    Target(min_ops_per_second=200, max_p95_ms=250),
+    iterations=20,
+    batch=BATCH,
+)
+def save(context: BenchmarkContext):
+    adapter, actor = _adapter(context), _actor()
+    payloads = make_patients(context.scaled(2_000), context.seed)
+    batches = itertools.cycle(range(0, len(payloads), BATCH))
+
+    async def operation():
+        start = next(batches)
+        for payload in payloads[start : start + BATCH]:
+            await adapter.save(Patient.model_validate(payload), actor)
+
+    return operation, adapter.disconnect
+
+
+@benchmark(
+    "persistence",
+    "read",
+    Target(min_ops_per_second=300, max_p95_ms=150),
+    iterations=20,
+    batch=BATCH,
+)
+def read(context: BenchmarkContext):
+    adapter, actor = _adapter(context), _actor()
+    patients = [Patient.model_validate(p) for p in make_patients(BATCH, context.seed)]
+    seeded = False
+
+    async def operation():
+        nonlocal seeded
+        if not seeded:
+            for patient in patients:
+                await adapter.save(patient, actor)
+            seeded = True
+        for patient in patients:
+            await adapter.read(Patient, patient.id, actor)
+
+    return operation, adapter.disconnect
+
+
+@benchmark("persistence", "search", Target(min_ops_per_second=20, max_p95_ms=200), iterations=20)
+def search(context: BenchmarkContext):
+    adapter, actor = _adapter(context), _actor()
+
+    async def operation():
+        await adapter.search(Patient, actor, filters={"gender": "female"}, limit=100)
+
+    return operation, adapter.disconnect
+
+
+# Steps already recorded before the step-write benchmarks are timed
+WORKFLOW_HISTORY = 2_000
+
+
+def _long_execution(context: BenchmarkContext) -> WorkflowExecution:
+    execution = WorkflowExecution(
+        workflow_definition="PlanDefinition/benchmark", total_steps=10**9
+    )
+    for step in range(context.scaled(WORKFLOW_HISTORY)):
+        execution.complete_step(step, {"result": "ok", "step": step})
+    return execution
+
+
+@benchmark(
+    "persistence",
+    "workflow_step_save_full",
+    Target(min_ops_per_second=20, max_p95_ms=500),
+    iterations=20,
+    batch=BATCH,
+)
+def workflow_step_save_full(context: BenchmarkContext):
+    """Previous pattern: rewrite the whole execution after every step."""
+    adapter, actor = _adapter(context), _actor()
+    execution = _long_execution(context)
+    steps = itertools.count(execution.current_step)
+    seeded = False
+
+    async def operation():
+        nonlocal seeded
+        if not seeded:
+            await adapter.save(execution, actor)
+            seeded = True
+        for _ in range(BATCH):
+            execution.complete_step(next(steps), {"result": "ok"})
+            await adapter.update(execution, actor)
+
+    return operation, adapter.disconnect
+
+
+@benchmark(
+    "persistence",
+    "workflow_step_append",
+    Target(min_ops_per_second=500, max_p95_ms=100),
+    iterations=20,
+    batch=BATCH,
+)
+def workflow_step_append(context: BenchmarkContext):
+    """Step writes through the event store, after the same history."""
+    from hacs_persistence.workflow_state import PostgresWorkflowStateStore
+
+    adapter = _adapter(context)
+    store = PostgresWorkflowStateStore(adapter)
+    execution = _long_execution(context)
+    steps = itertools.count(execution.current_step)
+    seeded = False
+
+    async def operation():
+        nonlocal seeded
+        if not seeded:
+            await store.create(execution)
+            seeded = True
+        for _ in range(BATCH):
+            await store.record_step(execution.id, next(steps), {"result": "ok"})
+
+    return operation, adapter.disconnect
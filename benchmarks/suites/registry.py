@@ -0,0 +1,58 @@
+"""HACSToolRegistry search benchmarks over a synthetic tool catalog."""
+
+import random
+
+from hacs_models import ToolDefinition
+from hacs_registry.tool_registry import HACSToolRegistry
+
+from ..harness import BenchmarkContext, Target, benchmark
+
+VERBS = ["create", "read", "update", "delete", "search", "validate", "summarize", "export"]
+NOUNS = ["patient", "observation", "encounter", "medication", "condition", "bundle", "memory"]
+CATEGORIES = ["resource_management", "clinical_workflows", "memory_operations", "schema_discovery"]
+TAGS = ["fhir", "clinical", "admin", "phi", "search", "write", "read", "agent"]
+
+
+def _registry(context: BenchmarkContext) -> HACSToolRegistry:
+    rng = random.Random(context.seed)
+    registry = HACSToolRegistry()
+    for i in range(context.scaled(1_000)):
+        verb, noun = rng.choice(VERBS), rng.choice(NOUNS)
+        registry._register_tool_definition(
+            ToolDefinition(
+                name=f"{verb}_{noun}_{i}",
+                version="1.0.0",
+                description=f"{verb.title()} {noun} records for clinical agents",
+                category=rng.choice(CATEGORIES),
+                domain=noun,
+                tags=rng.sample(TAGS, 3),
+                requires_db=rng.random() < 0.5,
+            )
+        )
+    return registry
+
+
+@benchmark(
+    "registry", "search_text", Target(min_ops_per_second=1_000, max_p95_ms=5), iterations=100
+)
+def search_text(context: BenchmarkContext):
+    registry = _registry(context)
+
+    def operation():
+        registry.search_tools(query="patient")
+
+    return operation
+
+
+@benchmark(
+    "registry", "search_filtered", Target(min_ops_per_second=1_000, max_p95_ms=5), iterations=100
+)
+def search_filtered(context: BenchmarkContext):
+    registry = _registry(context)
+
+    def operation():
+        registry.search_tools(
+            query="clinical", category="clinical_workflows", tags=["fhir"], requires_db=True
+        )
+
+    return operation
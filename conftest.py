@@ -24,11 +24,31 @@ def pytest_ignore_collect(path):
     allow_prefixes = (
         # HACS utils tests
         "packages/hacs-utils/tests/",
+        # HACS auth tests
+        "packages/hacs-auth/tests/",
+        # HACS infrastructure tests
+        "packages/hacs-infrastructure/tests/",
     )
     allow_exact = {
         # Targeted hacs-tools tests
         "tests/test_hacs_tools_resource_management.py",
         "tests/test_hacs_tools_schema.py",
+        # Tool registry search indexes and discovery manifest
+        "tests/test_tool_registry_search.py",
+        "tests/test_tool_manifest.py",
+        # Batch resource validation
+        "tests/test_bulk_validation.py",
+        # JSON Patch diffs and server-side patching
+        "tests/test_json_patch.py",
+        # GraphDefinition traversal
+        "tests/test_graph_traversal.py",
+        # Resource serialization profiles
+        "tests/test_serialization.py",
+        "tests/test_compact_storage.py",
+        "tests/test_trusted_construction.py",
+        # ResourceBundle entry indexes
+        "tests/test_resource_bundle_index.py",
+        "tests/test_workflow_state.py",
     }
 
     # Allowlisted by prefix
@@ -31,6 +31,7 @@ from .auth_manager import AuthConfig, AuthError, AuthManager, TokenData
 from .decorators import require_auth, require_permission, require_role
 from .permissions import Permission, PermissionManager, PermissionSchema
 from .session import Session, SessionConfig, SessionManager
+from .session_store import InMemorySessionStore, SQLiteSessionStore, SessionStore
 
 # Tool security integration
 from .tool_security import ToolSecurityContext, create_secure_actor, secure_tool_execution
@@ -78,6 +79,9 @@ __all__ = [
     "SessionConfig",
     # Session management
     "SessionManager",
+    "SessionStore",
+    "InMemorySessionStore",
+    "SQLiteSessionStore",
     "SessionStatus",
     "TokenData",
     # Tool security integration
@@ -5,15 +5,17 @@ security requirements, including session expiration, activity tracking,
 and multi-factor authentication support.
 """
 
-import contextlib
 import uuid
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
 from .actor import Actor, SessionStatus
 
+if TYPE_CHECKING:
+    from .session_store import SessionStore
+
 
 class SessionConfig(BaseModel):
     """Configuration for session management."""
@@ -30,6 +32,10 @@ class SessionConfig(BaseModel):
 
     idle_timeout_minutes: int = Field(default=30, description="Idle timeout before warning")
 
+    enforce_idle_timeout: bool = Field(
+        default=False, description="Expire sessions idle longer than idle_timeout_minutes"
+    )
+
     require_activity_tracking: bool = Field(
         default=True, description="Whether to track user activity"
     )
@@ -153,17 +159,39 @@ class Session(BaseModel):
 
 
 class SessionManager:
-    """Manages user sessions with healthcare security requirements."""
+    """Manages user sessions with healthcare security requirements.
+
+    Sessions live in a pluggable ``SessionStore``. The default in-memory store
+    keeps a deadline heap and per-user counters, so expiry sweeps, concurrent
+    session checks and statistics stay cheap with many live sessions. Pass a
+    ``SQLiteSessionStore`` to share sessions between worker processes.
+    """
 
-    def __init__(self, config: SessionConfig | None = None) -> None:
+    def __init__(
+        self, config: SessionConfig | None = None, store: "SessionStore | None" = None
+    ) -> None:
         """Initialize session manager.
 
         Args:
             config: Session configuration
+            store: Session storage backend (in-memory store if None)
         """
+        from .session_store import InMemorySessionStore
+
         self.config = config or SessionConfig()
-        self._sessions: dict[str, Session] = {}
-        self._user_sessions: dict[str, list[str]] = {}
+        if store is None:
+            idle_timeout = (
+                timedelta(minutes=self.config.idle_timeout_minutes)
+                if self.config.enforce_idle_timeout
+                else None
+            )
+            store = InMemorySessionStore(idle_timeout=idle_timeout)
+        self._store = store
+
+    @property
+    def store(self) -> "SessionStore":
+        """Session storage backend."""
+        return self._store
 
     def create_session(
         self,
@@ -194,15 +222,11 @@ class SessionManager:
         Raises:
             ValueError: If user has too many concurrent sessions
         """
+        # Expire overdue sessions first so they don't count against the limit
+        self._store.expire_due()
+
         # Check concurrent session limit
-        user_sessions = self._user_sessions.get(user_id, [])
-        active_sessions = [
-            s
-            for s in user_sessions
-            if s in self._sessions and self._sessions[s].status == SessionStatus.ACTIVE
-        ]
-
-        if len(active_sessions) >= self.config.max_concurrent_sessions:
+        if self._store.count_active(user_id) >= self.config.max_concurrent_sessions:
             msg = f"User {user_id} has too many concurrent sessions"
             raise ValueError(msg)
 
@@ -224,12 +248,7 @@ class SessionManager:
         )
 
         # Store session
-        self._sessions[session.session_id] = session
-
-        # Track user sessions
-        if user_id not in self._user_sessions:
-            self._user_sessions[user_id] = []
-        self._user_sessions[user_id].append(session.session_id)
+        self._store.add(session)
 
         # Update actor if provided
         if actor:
@@ -252,11 +271,16 @@ class SessionManager:
         Returns:
             Session if found, None otherwise
         """
-        session = self._sessions.get(session_id)
-
-        # Clean up expired sessions
-        if session and session.is_expired():
+        session = self._store.get(session_id)
+
+        # Mark overdue sessions as expired
+        if (
+            session
+            and session.status not in (SessionStatus.EXPIRED, SessionStatus.TERMINATED)
+            and self._store.deadline(session) <= datetime.now(UTC)
+        ):
             session.status = SessionStatus.EXPIRED
+            self._store.save(session)
 
         return session
 
@@ -301,6 +325,7 @@ class SessionManager:
             if time_until_expiry.total_seconds() < 300:  # Less than 5 minutes
                 session.extend_session(self.config.default_timeout_minutes)
 
+        self._store.save(session)
         return True
 
     def terminate_session(self, session_id: str, reason: str = "user_logout") -> bool:
@@ -318,12 +343,7 @@ class SessionManager:
             return False
 
         session.terminate(reason)
-
-        # Remove from active tracking
-        if session.user_id in self._user_sessions:
-            with contextlib.suppress(ValueError):
-                self._user_sessions[session.user_id].remove(session_id)
-
+        self._store.save(session)
         return True
 
     def terminate_user_sessions(self, user_id: str, reason: str = "administrative") -> int:
@@ -336,10 +356,12 @@ class SessionManager:
         Returns:
             Number of sessions terminated
         """
-        user_sessions = self._user_sessions.get(user_id, [])
         terminated_count = 0
 
-        for session_id in user_sessions.copy():
+        for session_id in self._store.user_session_ids(user_id):
+            session = self._store.get(session_id)
+            if session is None or session.status == SessionStatus.TERMINATED:
+                continue
             if self.terminate_session(session_id, reason):
                 terminated_count += 1
 
@@ -360,6 +382,7 @@ class SessionManager:
             return False
 
         session.lock(reason)
+        self._store.save(session)
         return True
 
     def get_user_sessions(self, user_id: str, active_only: bool = True) -> list[Session]:
@@ -370,14 +393,15 @@ class SessionManager:
             active_only: Whether to return only active sessions
 
         Returns:
-            List of user sessions
+            List of user sessions (terminated sessions are never included)
         """
-        session_ids = self._user_sessions.get(user_id, [])
         sessions = []
 
-        for session_id in session_ids:
+        for session_id in self._store.user_session_ids(user_id):
             session = self.get_session(session_id)
-            if session and (not active_only or session.status == SessionStatus.ACTIVE):
+            if session is None or session.status == SessionStatus.TERMINATED:
+                continue
+            if not active_only or session.status == SessionStatus.ACTIVE:
                 sessions.append(session)
 
         return sessions
@@ -385,29 +409,14 @@ class SessionManager:
     def cleanup_expired_sessions(self) -> int:
         """Clean up expired and terminated sessions.
 
+        Only sessions whose deadline has passed are visited, so the cost is
+        proportional to the number of sessions cleaned up.
+
         Returns:
             Number of sessions cleaned up
         """
-        cleaned_count = 0
-        expired_sessions = []
-
-        for session_id, session in self._sessions.items():
-            if session.is_expired() or session.status in [
-                SessionStatus.TERMINATED,
-                SessionStatus.EXPIRED,
-            ]:
-                expired_sessions.append(session_id)
-
-        for session_id in expired_sessions:
-            session = self._sessions.pop(session_id, None)
-            if session:
-                # Remove from user tracking
-                if session.user_id in self._user_sessions:
-                    with contextlib.suppress(ValueError):
-                        self._user_sessions[session.user_id].remove(session_id)
-                cleaned_count += 1
-
-        return cleaned_count
+        self._store.expire_due()
+        return self._store.purge_inactive()
 
     def get_session_stats(self) -> dict[str, Any]:
         """Get session statistics.
@@ -415,23 +424,5 @@ class SessionManager:
         Returns:
             Dictionary with session statistics
         """
-        total_sessions = len(self._sessions)
-        active_sessions = sum(
-            1
-            for s in self._sessions.values()
-            if s.status == SessionStatus.ACTIVE and not s.is_expired()
-        )
-        expired_sessions = sum(1 for s in self._sessions.values() if s.is_expired())
-
-        return {
-            "total_sessions": total_sessions,
-            "active_sessions": active_sessions,
-            "expired_sessions": expired_sessions,
-            "locked_sessions": sum(
-                1 for s in self._sessions.values() if s.status == SessionStatus.LOCKED
-            ),
-            "terminated_sessions": sum(
-                1 for s in self._sessions.values() if s.status == SessionStatus.TERMINATED
-            ),
-            "unique_users": len(self._user_sessions),
-        }
+        self._store.expire_due()
+        return self._store.stats()
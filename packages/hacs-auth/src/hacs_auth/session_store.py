@@ -0,0 +1,426 @@
+"""Session storage backends for HACS authentication system.
+
+This module provides the storage layer behind ``SessionManager``. Stores keep
+secondary indexes (per-user session sets, per-user active counters, status
+counters and a deadline schedule) so that session creation, expiry sweeps and
+statistics do not scan every stored session.
+
+Two backends are available:
+    - ``InMemorySessionStore``: single-process store backed by dicts and a
+      min-heap keyed by session deadline.
+    - ``SQLiteSessionStore``: file-backed store that lets several worker
+      processes share sessions through one SQLite database.
+"""
+
+import heapq
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .actor import SessionStatus
+from .session import Session
+
+# Statuses that still hold a live deadline and can be expired by a sweep
+_EXPIRABLE_STATUSES = frozenset(
+    {SessionStatus.ACTIVE, SessionStatus.INACTIVE, SessionStatus.LOCKED}
+)
+
+# Statuses removed by ``purge_inactive``
+_PURGEABLE_STATUSES = frozenset({SessionStatus.EXPIRED, SessionStatus.TERMINATED})
+
+
+class SessionStore(ABC):
+    """Abstract storage backend for sessions.
+
+    Stores own the session records and every index derived from them. Callers
+    must invoke ``save`` after mutating a session so the indexes stay in sync.
+    """
+
+    def __init__(self, idle_timeout: timedelta | None = None) -> None:
+        """Initialize session store.
+
+        Args:
+            idle_timeout: If set, sessions idle for longer than this are
+                expired by ``expire_due`` in addition to hard expiry
+        """
+        self.idle_timeout = idle_timeout
+
+    def deadline(self, session: Session) -> datetime:
+        """Get the moment a session stops being valid.
+
+        Args:
+            session: Session to evaluate
+
+        Returns:
+            Earliest of the hard expiry and, when enforced, the idle deadline
+        """
+        if self.idle_timeout is None:
+            return session.expires_at
+        return min(session.expires_at, session.last_activity + self.idle_timeout)
+
+    @abstractmethod
+    def add(self, session: Session) -> None:
+        """Store a new session."""
+
+    @abstractmethod
+    def get(self, session_id: str) -> Session | None:
+        """Get session by ID."""
+
+    @abstractmethod
+    def save(self, session: Session) -> None:
+        """Persist changes made to a stored session and refresh its indexes."""
+
+    @abstractmethod
+    def remove(self, session_id: str) -> Session | None:
+        """Remove a session from the store."""
+
+    @abstractmethod
+    def user_session_ids(self, user_id: str) -> list[str]:
+        """Get IDs of all stored sessions for a user."""
+
+    @abstractmethod
+    def count_active(self, user_id: str) -> int:
+        """Count sessions with ACTIVE status for a user."""
+
+    @abstractmethod
+    def expire_due(self, now: datetime | None = None) -> int:
+        """Mark every session whose deadline has passed as EXPIRED.
+
+        Returns:
+            Number of sessions newly marked as expired
+        """
+
+    @abstractmethod
+    def purge_inactive(self) -> int:
+        """Remove expired and terminated sessions.
+
+        Returns:
+            Number of sessions removed
+        """
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        """Get counts by status plus total and unique user counts."""
+
+
+class InMemorySessionStore(SessionStore):
+    """Single-process session store with a deadline min-heap.
+
+    The heap holds at most one live entry per session, keyed by a deadline
+    that is never later than the real one (deadlines only move forward when
+    sessions are extended or see activity). Popping an entry whose session
+    was pushed back simply reschedules it, so sweeps cost O(k log n) for k
+    due sessions.
+    """
+
+    def __init__(self, idle_timeout: timedelta | None = None) -> None:
+        """Initialize in-memory session store.
+
+        Args:
+            idle_timeout: Optional idle timeout enforced by ``expire_due``
+        """
+        super().__init__(idle_timeout)
+        self._sessions: dict[str, Session] = {}
+        self._user_sessions: dict[str, set[str]] = {}
+        self._active_by_user: Counter[str] = Counter()
+        self._status_counts: Counter[SessionStatus] = Counter()
+        # Last status seen by the indexes, so in-place mutations can be diffed on save
+        self._indexed_status: dict[str, SessionStatus] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._scheduled: set[str] = set()
+        self._stale_entries = 0
+        self._purgeable: set[str] = set()
+        self._lock = threading.RLock()
+
+    def add(self, session: Session) -> None:
+        with self._lock:
+            session_id = session.session_id
+            if session_id in self._sessions:
+                self.remove(session_id)
+            self._sessions[session_id] = session
+            self._user_sessions.setdefault(session.user_id, set()).add(session_id)
+            self._index_status(session_id, session.user_id, None, session.status)
+            if session.status in _EXPIRABLE_STATUSES:
+                self._schedule(session)
+
+    def get(self, session_id: str) -> Session | None:
+        return self._sessions.get(session_id)
+
+    def save(self, session: Session) -> None:
+        with self._lock:
+            session_id = session.session_id
+            if session_id not in self._sessions:
+                self.add(session)
+                return
+            self._sessions[session_id] = session
+            old_status = self._indexed_status.get(session_id)
+            if old_status != session.status:
+                self._index_status(session_id, session.user_id, old_status, session.status)
+
+    def remove(self, session_id: str) -> Session | None:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return None
+            old_status = self._indexed_status.pop(session_id, None)
+            if old_status is not None:
+                self._status_counts[old_status] -= 1
+                if old_status == SessionStatus.ACTIVE:
+                    self._decrement_active(session.user_id)
+            self._purgeable.discard(session_id)
+
+            user_ids = self._user_sessions.get(session.user_id)
+            if user_ids is not None:
+                user_ids.discard(session_id)
+                if not user_ids:
+                    del self._user_sessions[session.user_id]
+
+            # The heap entry stays behind until popped or compacted
+            if session_id in self._scheduled:
+                self._scheduled.discard(session_id)
+                self._stale_entries += 1
+                if self._stale_entries > len(self._heap) // 2:
+                    self._compact_heap()
+            return session
+
+    def user_session_ids(self, user_id: str) -> list[str]:
+        return list(self._user_sessions.get(user_id, ()))
+
+    def count_active(self, user_id: str) -> int:
+        return self._active_by_user.get(user_id, 0)
+
+    def expire_due(self, now: datetime | None = None) -> int:
+        now_ts = (now or datetime.now(UTC)).timestamp()
+        expired = 0
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now_ts:
+                _, session_id = heapq.heappop(heap)
+                if session_id not in self._scheduled:
+                    self._stale_entries = max(0, self._stale_entries - 1)
+                    continue
+                session = self._sessions[session_id]
+                if session.status not in _EXPIRABLE_STATUSES:
+                    self._scheduled.discard(session_id)
+                    continue
+                deadline_ts = self.deadline(session).timestamp()
+                if deadline_ts > now_ts:
+                    heapq.heappush(heap, (deadline_ts, session_id))
+                    continue
+                self._scheduled.discard(session_id)
+                session.status = SessionStatus.EXPIRED
+                self.save(session)
+                expired += 1
+        return expired
+
+    def purge_inactive(self) -> int:
+        with self._lock:
+            purgeable = list(self._purgeable)
+            for session_id in purgeable:
+                self.remove(session_id)
+            return len(purgeable)
+
+    def stats(self) -> dict[str, Any]:
+        counts = self._status_counts
+        return {
+            "total_sessions": len(self._sessions),
+            "active_sessions": counts[SessionStatus.ACTIVE],
+            "expired_sessions": counts[SessionStatus.EXPIRED],
+            "locked_sessions": counts[SessionStatus.LOCKED],
+            "terminated_sessions": counts[SessionStatus.TERMINATED],
+            "unique_users": len(self._user_sessions),
+        }
+
+    def _index_status(
+        self,
+        session_id: str,
+        user_id: str,
+        old_status: SessionStatus | None,
+        new_status: SessionStatus,
+    ) -> None:
+        """Move a session between status counters."""
+        if old_status is not None:
+            self._status_counts[old_status] -= 1
+            if old_status == SessionStatus.ACTIVE:
+                self._decrement_active(user_id)
+        self._status_counts[new_status] += 1
+        if new_status == SessionStatus.ACTIVE:
+            self._active_by_user[user_id] += 1
+        self._indexed_status[session_id] = new_status
+
+        if new_status in _PURGEABLE_STATUSES:
+            self._purgeable.add(session_id)
+        else:
+            self._purgeable.discard(session_id)
+            if old_status is not None and session_id not in self._scheduled:
+                # Revived sessions need a schedule entry again
+                self._schedule(self._sessions[session_id])
+
+    def _decrement_active(self, user_id: str) -> None:
+        remaining = self._active_by_user[user_id] - 1
+        if remaining > 0:
+            self._active_by_user[user_id] = remaining
+        else:
+            self._active_by_user.pop(user_id, None)
+
+    def _schedule(self, session: Session) -> None:
+        heapq.heappush(self._heap, (self.deadline(session).timestamp(), session.session_id))
+        self._scheduled.add(session.session_id)
+
+    def _compact_heap(self) -> None:
+        """Rebuild the heap from live sessions, dropping stale entries."""
+        self._heap = [
+            (self.deadline(session).timestamp(), session_id)
+            for session_id, session in self._sessions.items()
+            if session.status in _EXPIRABLE_STATUSES
+        ]
+        heapq.heapify(self._heap)
+        self._scheduled = {session_id for _, session_id in self._heap}
+        self._stale_entries = 0
+
+
+class SQLiteSessionStore(SessionStore):
+    """Session store backed by SQLite so several processes can share sessions.
+
+    Status, user and deadline are kept in indexed columns; the session body is
+    stored as JSON. The ``status`` column is authoritative, which lets expiry
+    sweeps run as a single indexed UPDATE without rewriting session bodies.
+    Sessions returned by ``get`` are copies, so callers must ``save`` changes.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS hacs_sessions (
+            session_id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            deadline REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_hacs_sessions_user_status
+            ON hacs_sessions (user_id, status);
+        CREATE INDEX IF NOT EXISTS idx_hacs_sessions_status_deadline
+            ON hacs_sessions (status, deadline);
+    """
+
+    def __init__(
+        self, path: str | Path = ":memory:", idle_timeout: timedelta | None = None
+    ) -> None:
+        """Initialize SQLite session store.
+
+        Args:
+            path: Database file path; use a shared file for multi-process setups
+            idle_timeout: Optional idle timeout enforced by ``expire_due``
+        """
+        super().__init__(idle_timeout)
+        self.path = str(path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def add(self, session: Session) -> None:
+        self.save(session)
+
+    def get(self, session_id: str) -> Session | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, data FROM hacs_sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        session = Session.model_validate_json(row[1])
+        session.status = SessionStatus(row[0])
+        return session
+
+    def save(self, session: Session) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hacs_sessions "
+                "(session_id, user_id, status, deadline, data) VALUES (?, ?, ?, ?, ?)",
+                (
+                    session.session_id,
+                    session.user_id,
+                    session.status.value,
+                    self.deadline(session).timestamp(),
+                    session.model_dump_json(),
+                ),
+            )
+
+    def remove(self, session_id: str) -> Session | None:
+        with self._lock:
+            session = self.get(session_id)
+            if session is not None:
+                self._conn.execute(
+                    "DELETE FROM hacs_sessions WHERE session_id = ?", (session_id,)
+                )
+            return session
+
+    def user_session_ids(self, user_id: str) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session_id FROM hacs_sessions WHERE user_id = ?", (user_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def count_active(self, user_id: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM hacs_sessions WHERE user_id = ? AND status = ?",
+                (user_id, SessionStatus.ACTIVE.value),
+            ).fetchone()
+        return row[0]
+
+    def expire_due(self, now: datetime | None = None) -> int:
+        now_ts = (now or datetime.now(UTC)).timestamp()
+        placeholders = ", ".join("?" for _ in _EXPIRABLE_STATUSES)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE hacs_sessions SET status = ? "
+                f"WHERE status IN ({placeholders}) AND deadline <= ?",
+                (
+                    SessionStatus.EXPIRED.value,
+                    *(status.value for status in _EXPIRABLE_STATUSES),
+                    now_ts,
+                ),
+            )
+        return cursor.rowcount
+
+    def purge_inactive(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM hacs_sessions WHERE status IN (?, ?)",
+                tuple(status.value for status in _PURGEABLE_STATUSES),
+            )
+        return cursor.rowcount
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counts = dict(
+                self._conn.execute(
+                    "SELECT status, COUNT(*) FROM hacs_sessions GROUP BY status"
+                ).fetchall()
+            )
+            unique_users = self._conn.execute(
+                "SELECT COUNT(DISTINCT user_id) FROM hacs_sessions"
+            ).fetchone()[0]
+        return {
+            "total_sessions": sum(counts.values()),
+            "active_sessions": counts.get(SessionStatus.ACTIVE.value, 0),
+            "expired_sessions": counts.get(SessionStatus.EXPIRED.value, 0),
+            "locked_sessions": counts.get(SessionStatus.LOCKED.value, 0),
+            "terminated_sessions": counts.get(SessionStatus.TERMINATED.value, 0),
+            "unique_users": unique_users,
+        }
@@ -0,0 +1,77 @@
+"""Tests for session storage backends and the indexed SessionManager."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from hacs_auth import (
+    InMemorySessionStore,
+    SessionConfig,
+    SessionManager,
+    SessionStatus,
+    SQLiteSessionStore,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemorySessionStore()
+    return SQLiteSessionStore(tmp_path / "sessions.db")
+
+
+def test_concurrent_session_limit_uses_active_counter(store):
+    manager = SessionManager(SessionConfig(max_concurrent_sessions=2), store=store)
+    first = manager.create_session("user-1")
+    manager.create_session("user-1")
+
+    with pytest.raises(ValueError):
+        manager.create_session("user-1")
+
+    assert manager.terminate_session(first.session_id)
+    manager.create_session("user-1")
+    assert store.count_active("user-1") == 2
+
+
+def test_expired_sessions_swept_and_purged(store):
+    manager = SessionManager(store=store)
+    expired = manager.create_session("user-1")
+    live = manager.create_session("user-2")
+
+    expired.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+    store.add(expired)
+
+    assert manager.get_session_stats()["expired_sessions"] == 1
+    assert manager.cleanup_expired_sessions() == 1
+    assert store.get(expired.session_id) is None
+    assert manager.validate_session(live.session_id)
+
+    stats = manager.get_session_stats()
+    assert stats["total_sessions"] == 1
+    assert stats["active_sessions"] == 1
+    assert stats["unique_users"] == 1
+
+
+def test_activity_pushes_back_idle_deadline():
+    store = InMemorySessionStore(idle_timeout=timedelta(minutes=30))
+    manager = SessionManager(store=store)
+    session = manager.create_session("user-1")
+
+    # Schedule entry predates the activity; sweeping must reschedule, not expire
+    session.last_activity = datetime.now(UTC) - timedelta(minutes=29)
+    manager.update_session_activity(session.session_id)
+    assert store.expire_due(datetime.now(UTC) + timedelta(minutes=10)) == 0
+    assert store.expire_due(datetime.now(UTC) + timedelta(minutes=31)) == 1
+    assert manager.get_session(session.session_id).status == SessionStatus.EXPIRED
+
+
+def test_sqlite_store_shared_between_managers(tmp_path):
+    path = tmp_path / "shared.db"
+    writer = SessionManager(store=SQLiteSessionStore(path))
+    reader = SessionManager(store=SQLiteSessionStore(path))
+
+    session = writer.create_session("user-1", organization="General Hospital")
+    assert reader.validate_session(session.session_id)
+
+    reader.lock_session(session.session_id)
+    assert writer.get_session(session.session_id).status == SessionStatus.LOCKED
@@ -108,6 +108,7 @@ from .exceptions import (
     ConfigurationError,
     ResourceError,
     ResourceNotFoundError,
+    ResourceConflictError,
     MemoryError,
     VectorStoreError,
 )
@@ -233,6 +234,7 @@ __all__ = [
     "ConfigurationError",
     "ResourceError",
     "ResourceNotFoundError",
+    "ResourceConflictError",
     "MemoryError",
     "VectorStoreError",
     # Configuration
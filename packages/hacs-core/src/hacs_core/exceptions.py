@@ -127,6 +127,20 @@ class ResourceNotFoundError(ResourceError):
         )
 
 
+class ResourceConflictError(ResourceError):
+    """Raised when a resource changed since the version a write was based on."""
+
+    def __init__(self, resource_type: str, resource_id: str, message: str = None):
+        if message is None:
+            message = f"Resource was modified concurrently: {resource_type}#{resource_id}"
+        super().__init__(
+            message,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            code="RESOURCE_CONFLICT",
+        )
+
+
 class MemoryError(HACSError):
     """Memory operation errors."""
 
@@ -0,0 +1,57 @@
+"""
+Span instrumentation hooks for HACS packages.
+
+Re-exports ``start_span``, ``current_span`` and ``traced`` from
+``hacs_infrastructure.instrumentation`` when hacs-infrastructure is
+installed. Without it, spans are no-ops and ``traced`` returns the function
+unchanged, so packages can instrument their hot paths without depending on
+hacs-infrastructure.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from hacs_infrastructure.instrumentation import current_span, start_span, traced
+except ImportError:
+
+    class _NoOpSpan:
+        """Span used when hacs-infrastructure is not installed."""
+
+        __slots__ = ()
+
+        def __enter__(self) -> "_NoOpSpan":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> bool:
+            return False
+
+        def set_attribute(self, key: str, value: Any) -> None:
+            """Ignore the attribute."""
+
+        def set_attributes(self, **attributes: Any) -> None:
+            """Ignore the attributes."""
+
+        def set_error(self, error: str) -> None:
+            """Ignore the error."""
+
+    _NOOP_SPAN = _NoOpSpan()
+
+    def start_span(name: str, **attributes: Any) -> _NoOpSpan:
+        """Return the shared no-op span."""
+        return _NOOP_SPAN
+
+    def current_span() -> _NoOpSpan:
+        """Return the shared no-op span."""
+        return _NOOP_SPAN
+
+    def traced(name: str | None = None, **attributes: Any) -> Callable:
+        """Return a decorator that leaves the function unchanged."""
+
+        def decorator(func: Callable) -> Callable:
+            return func
+
+        return decorator
+
+
+__all__ = ["current_span", "start_span", "traced"]
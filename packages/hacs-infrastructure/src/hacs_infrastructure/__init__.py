@@ -27,6 +27,7 @@ Version: 0.1.0
 # Core infrastructure components
 from .config import ConfigurationError, HACSConfig, configure_hacs, get_config, reset_config
 from .container import (
+    CircularDependencyError,
     Container,
     DependencyError,
     Injectable,
@@ -38,7 +39,14 @@ from .container import (
 )
 
 # Event system
-from .events import Event, EventBus, EventError, EventHandler, EventSubscription
+from .events import (
+    Event,
+    EventBus,
+    EventError,
+    EventHandler,
+    EventSubscription,
+    OverflowPolicy,
+)
 from .lifecycle import (
     GracefulShutdown,
     LifecycleState,
@@ -48,7 +56,24 @@ from .lifecycle import (
 )
 
 # Monitoring and observability
+from .instrumentation import (
+    SpanStatsExporter,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_span_exporter,
+    start_span,
+    traced,
+)
+from .metrics_engine import (
+    MetricsEngine,
+    QuantileSketch,
+    get_metrics_engine,
+    register_metrics_engine,
+    render_exported_metrics,
+    reset_metrics_engine,
+)
 from .monitoring import HealthMonitor, MetricsCollector, PerformanceMonitor, ServiceMetrics
+from .rolling_aggregates import HyperLogLog, RollingAggregator
 from .protocols import (
     Configurable,
     HealthCheckable,
@@ -59,6 +84,8 @@ from .protocols import (
     Injectable as InjectableProtocol,
 )
 from .service_registry import (
+    CircuitBreaker,
+    CircuitState,
     HealthCheck,
     ServiceDiscovery,
     ServiceInfo,
@@ -78,6 +105,9 @@ __all__ = [
     "Configurable",
     "ConfigurationError",
     # Core container
+    "CircuitBreaker",
+    "CircuitState",
+    "CircularDependencyError",
     "Container",
     "DependencyError",
     "Event",
@@ -93,11 +123,16 @@ __all__ = [
     "HealthCheckable",
     # Monitoring
     "HealthMonitor",
+    "HyperLogLog",
     "Injectable",
     "InjectableProtocol",
     "LifecycleState",
     "MetricsCollector",
+    "MetricsEngine",
+    "OverflowPolicy",
     "PerformanceMonitor",
+    "QuantileSketch",
+    "RollingAggregator",
     "Scoped",
     "ServiceDiscovery",
     "ServiceError",
@@ -110,14 +145,24 @@ __all__ = [
     "ServiceStatus",
     "ShutdownManager",
     "Singleton",
+    "SpanStatsExporter",
     "Startable",
     "StartupManager",
     "Stoppable",
     "configure_hacs",
+    "disable_instrumentation",
+    "enable_instrumentation",
     "get_config",
     "get_container",
+    "get_metrics_engine",
+    "register_metrics_engine",
+    "render_exported_metrics",
+    "get_span_exporter",
     "reset_config",
     "reset_container",
+    "reset_metrics_engine",
+    "start_span",
+    "traced",
 ]
 
 # Package metadata
@@ -30,8 +30,8 @@ from typing import Any
 
 try:
     import smtplib
-    from email.mime.multipart import MimeMultipart
-    from email.mime.text import MimeText
+    from email.mime.multipart import MIMEMultipart as MimeMultipart
+    from email.mime.text import MIMEText as MimeText
 
     EMAIL_AVAILABLE = True
 except ImportError:
@@ -46,6 +46,7 @@ from .healthcare_monitoring import (
     ComplianceEvent,
     ComplianceStatus,
 )
+from .notification_delivery import ChannelWorker, NotificationDispatcher
 from .observability import get_observability_manager
 
 
@@ -61,6 +62,17 @@ class AlertChannel(str, Enum):
     IN_APP = "in_app"
 
 
+# Notification channel configuration used for each deliverable alert channel
+_CHANNEL_CONFIG_KEYS = {
+    AlertChannel.EMAIL: "email_default",
+    AlertChannel.SLACK: "slack_default",
+    AlertChannel.WEBHOOK: "webhook_default",
+}
+
+# Alerts listed individually in a Slack digest; the rest are summarized
+_SLACK_DIGEST_ATTACHMENTS = 20
+
+
 class AlertType(str, Enum):
     """Types of alerts."""
 
@@ -184,8 +196,23 @@ class OnCallSchedule:
 class AlertManager:
     """Healthcare alert management system."""
 
-    def __init__(self) -> None:
-        """Initialize alert manager."""
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        channel_queue_size: int = 1000,
+        channel_concurrency: int = 4,
+        digest_threshold: int = 10,
+        dispatcher: NotificationDispatcher | None = None,
+    ) -> None:
+        """Initialize alert manager.
+
+        Args:
+            max_queue_size: Maximum alerts awaiting fan-out to channels
+            channel_queue_size: Maximum queued notifications per channel
+            channel_concurrency: Concurrent deliveries per channel
+            digest_threshold: Channel backlog at which alerts are sent as one digest
+            dispatcher: Shared HTTP dispatcher, created on demand if omitted
+        """
         self.observability = get_observability_manager()
         self.logger = self.observability.get_logger("hacs.alerting")
 
@@ -196,8 +223,17 @@ class AlertManager:
         self._on_call_schedules: list[OnCallSchedule] = []
 
         # Alert processing
-        self._alert_queue: asyncio.Queue = asyncio.Queue()
+        self._alert_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
         self._suppression_cache: dict[str, datetime] = {}
+        self._dropped_alerts = 0
+
+        # Notification delivery
+        self.channel_queue_size = channel_queue_size
+        self.channel_concurrency = channel_concurrency
+        self.digest_threshold = digest_threshold
+        self._dispatcher = dispatcher or NotificationDispatcher()
+        self._owns_dispatcher = dispatcher is None
+        self._workers: dict[AlertChannel, ChannelWorker] = {}
 
         # Background tasks
         self._running = False
@@ -324,6 +360,18 @@ class AlertManager:
         self._processing_task = asyncio.create_task(self._process_alerts())
         self._escalation_task = asyncio.create_task(self._handle_escalations())
 
+        # One bounded worker pool per channel so a slow channel only delays itself
+        for channel in _CHANNEL_CONFIG_KEYS:
+            worker = ChannelWorker(
+                channel.value,
+                lambda items, overflow, channel=channel: self._deliver(channel, items, overflow),
+                concurrency=self.channel_concurrency,
+                max_queue_size=self.channel_queue_size,
+                digest_threshold=self.digest_threshold,
+            )
+            worker.start()
+            self._workers[channel] = worker
+
         self.logger.info("Alert manager started")
 
     async def stop(self) -> None:
@@ -344,6 +392,12 @@ class AlertManager:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Flush queued notifications, then release pooled connections
+        await asyncio.gather(*(worker.stop() for worker in self._workers.values()))
+        self._workers.clear()
+        if self._owns_dispatcher:
+            await self._dispatcher.close()
+
         self.logger.info("Alert manager stopped")
 
     def create_alert(
@@ -387,8 +441,13 @@ class AlertManager:
         # Store alert
         self._alerts[alert_id] = alert
 
-        # Add to processing queue
-        self._alert_queue.put_nowait(alert)
+        # Add to processing queue; during incident storms the alert is still
+        # stored and escalated, only its notification is dropped
+        try:
+            self._alert_queue.put_nowait(alert)
+        except asyncio.QueueFull:
+            self._dropped_alerts += 1
+            self.logger.warn(f"Alert queue full, notification dropped for {alert_id}")
 
         # Set suppression
         self._suppression_cache[suppression_key] = now
@@ -509,7 +568,7 @@ class AlertManager:
             try:
                 handler(alert)
             except Exception as e:
-                self.logger.exception(f"Error in alert handler: {e}")
+                self.logger.error(f"Error in alert handler: {e}")
 
         return True
 
@@ -536,7 +595,7 @@ class AlertManager:
             try:
                 handler(alert)
             except Exception as e:
-                self.logger.exception(f"Error in alert handler: {e}")
+                self.logger.error(f"Error in alert handler: {e}")
 
         return True
 
@@ -609,6 +668,16 @@ class AlertManager:
             "critical_alerts": by_priority.get("p1_critical", 0),
         }
 
+    def get_delivery_stats(self) -> dict[str, Any]:
+        """Get notification delivery statistics per channel."""
+        return {
+            "pending_alerts": self._alert_queue.qsize(),
+            "dropped_alerts": self._dropped_alerts,
+            "channels": {
+                channel.value: worker.get_stats() for channel, worker in self._workers.items()
+            },
+        }
+
     def register_alert_handler(self, handler: Callable[[Alert], None]) -> None:
         """Register alert event handler."""
         self._alert_handlers.append(handler)
@@ -625,44 +694,78 @@ class AlertManager:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.exception(f"Error processing alert: {e}")
+                self.logger.error(f"Error processing alert: {e}")
 
     async def _send_notifications(self, alert: Alert) -> None:
-        """Send notifications for an alert."""
+        """Send notifications for an alert.
+
+        While the manager is running, notifications are queued on each channel's
+        workers and this returns immediately; otherwise channels are delivered
+        to directly and concurrently.
+        """
         rule = self._alert_rules.get(alert.rule_id)
         if not rule or not rule.enabled:
             return
 
-        # Send to each configured channel
+        direct: list[AlertChannel] = []
         for channel in rule.channels:
-            try:
-                await self._send_to_channel(alert, channel, rule.recipients)
-                alert.channels_notified.append(channel)
-            except Exception as e:
-                self.logger.exception(f"Failed to send alert {alert.id} to {channel}: {e}")
+            worker = self._workers.get(channel)
+            if worker is None:
+                direct.append(channel)
+            elif not worker.submit((alert, rule.recipients)):
+                self.logger.warn(f"Notification queue full for {channel.value}, alert {alert.id}")
+
+        results = await asyncio.gather(
+            *(self._send_to_channel(alert, channel, rule.recipients) for channel in direct),
+            return_exceptions=True,
+        )
+        for channel, result in zip(direct, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to send alert {alert.id} to {channel}: {result}")
 
         # Notify handlers
         for handler in self._alert_handlers:
             try:
                 handler(alert)
             except Exception as e:
-                self.logger.exception(f"Error in alert handler: {e}")
+                self.logger.error(f"Error in alert handler: {e}")
 
     async def _send_to_channel(self, alert: Alert, channel: AlertChannel, recipients: list[str]) -> None:
         """Send alert to specific channel."""
+        await self._deliver(channel, [(alert, recipients)], 0)
+
+    async def _deliver(
+        self, channel: AlertChannel, items: list[tuple[Alert, list[str]]], overflow: int
+    ) -> None:
+        """Deliver a batch of alerts to one channel.
+
+        Args:
+            channel: Target channel
+            items: ``(alert, recipients)`` pairs; more than one is sent as a digest
+            overflow: Notifications dropped on this channel since the last delivery
+        """
+        alerts = [alert for alert, _ in items]
         if channel == AlertChannel.EMAIL:
-            await self._send_email(alert, recipients)
+            sent = True
+            for alert, recipients in items:
+                sent = await self._send_email(alert, recipients) and sent
         elif channel == AlertChannel.SLACK:
-            await self._send_slack(alert)
+            sent = await self._send_slack(alerts, overflow)
         elif channel == AlertChannel.WEBHOOK:
-            await self._send_webhook(alert)
-        # Add more channels as needed
+            sent = await self._send_webhook(alerts, overflow)
+        else:
+            # Add more channels as needed
+            sent = False
+
+        if sent:
+            for alert in alerts:
+                alert.channels_notified.append(channel)
 
-    async def _send_email(self, alert: Alert, recipients: list[str]) -> None:
+    async def _send_email(self, alert: Alert, recipients: list[str]) -> bool:
         """Send email notification."""
         channel = self._notification_channels.get("email_default")
-        if not channel or not channel.enabled:
-            return
+        if not channel or not channel.enabled or not EMAIL_AVAILABLE:
+            return False
 
         config = channel.config
 
@@ -696,14 +799,10 @@ This is an automated message from HACS Healthcare Monitoring System.
 
         # Send email (mock implementation)
         self.logger.info(f"Email notification sent for alert {alert.id}")
+        return True
 
-    async def _send_slack(self, alert: Alert) -> None:
-        """Send Slack notification."""
-        channel = self._notification_channels.get("slack_default")
-        if not channel or not channel.enabled:
-            return
-
-        # Create Slack message
+    def _slack_attachment(self, alert: Alert) -> dict[str, Any]:
+        """Build the Slack attachment for one alert."""
         color_map = {
             AlertPriority.P1_CRITICAL: "danger",
             AlertPriority.P2_HIGH: "warning",
@@ -711,37 +810,88 @@ This is an automated message from HACS Healthcare Monitoring System.
             AlertPriority.P4_LOW: "#439FE0",
             AlertPriority.P5_INFO: "#9E9E9E",
         }
+        return {
+            "color": color_map.get(alert.priority, "good"),
+            "title": alert.title,
+            "text": alert.description,
+            "fields": [
+                {"title": "Priority", "value": alert.priority.value, "short": True},
+                {"title": "Type", "value": alert.alert_type.value, "short": True},
+                {"title": "Status", "value": alert.status.value, "short": True},
+                {"title": "Alert ID", "value": alert.id, "short": True},
+            ],
+            "ts": int(alert.created_at.timestamp()),
+        }
+
+    async def _send_slack(self, alerts: list[Alert], overflow: int = 0) -> bool:
+        """Send Slack notification, as a digest when several alerts are batched."""
+        channel = self._notification_channels.get("slack_default")
+        if not channel or not channel.enabled:
+            return False
+
+        webhook_url = channel.config.get("webhook_url")
+        if not webhook_url:
+            self.logger.debug("Slack webhook_url not configured, notification skipped")
+            return False
 
-        {
+        payload: dict[str, Any] = {
             "username": channel.config["username"],
             "channel": channel.config["channel"],
             "attachments": [
-                {
-                    "color": color_map.get(alert.priority, "good"),
-                    "title": alert.title,
-                    "text": alert.description,
-                    "fields": [
-                        {"title": "Priority", "value": alert.priority.value, "short": True},
-                        {"title": "Type", "value": alert.alert_type.value, "short": True},
-                        {"title": "Status", "value": alert.status.value, "short": True},
-                        {"title": "Alert ID", "value": alert.id, "short": True},
-                    ],
-                    "ts": int(alert.created_at.timestamp()),
-                }
+                self._slack_attachment(alert) for alert in alerts[:_SLACK_DIGEST_ATTACHMENTS]
             ],
         }
+        if len(alerts) > 1 or overflow:
+            by_priority: dict[str, int] = {}
+            for alert in alerts:
+                by_priority[alert.priority.value] = by_priority.get(alert.priority.value, 0) + 1
+            summary = ", ".join(f"{count} {priority}" for priority, count in by_priority.items())
+            payload["text"] = f"HACS alert digest: {len(alerts)} alerts ({summary})"
+            if len(alerts) > _SLACK_DIGEST_ATTACHMENTS:
+                payload["text"] += f", {len(alerts) - _SLACK_DIGEST_ATTACHMENTS} not listed"
+            if overflow:
+                payload["text"] += f"; {overflow} notifications dropped during burst"
+
+        await self._dispatcher.post_json(
+            webhook_url,
+            payload,
+            retry_attempts=channel.retry_attempts,
+            retry_delay_seconds=channel.retry_delay_seconds,
+        )
+        self.logger.info(f"Slack notification sent for {len(alerts)} alert(s)")
+        return True
 
-        # Send to Slack (mock implementation)
-        self.logger.info(f"Slack notification sent for alert {alert.id}")
-
-    async def _send_webhook(self, alert: Alert) -> None:
-        """Send webhook notification."""
+    async def _send_webhook(self, alerts: list[Alert], overflow: int = 0) -> bool:
+        """Send webhook notification, as a digest when several alerts are batched."""
         channel = self._notification_channels.get("webhook_default")
         if not channel or not channel.enabled:
-            return
+            return False
+
+        url = channel.config.get("url")
+        if not url:
+            self.logger.debug("Webhook url not configured, notification skipped")
+            return False
+
+        if len(alerts) == 1 and not overflow:
+            payload: dict[str, Any] = alerts[0].to_dict()
+        else:
+            payload = {
+                "digest": True,
+                "count": len(alerts),
+                "dropped": overflow,
+                "alerts": [alert.to_dict() for alert in alerts],
+            }
 
-        # Send webhook (mock implementation)
-        self.logger.info(f"Webhook notification sent for alert {alert.id}")
+        await self._dispatcher.post_json(
+            url,
+            payload,
+            headers=channel.config.get("headers"),
+            timeout_seconds=channel.config.get("timeout_seconds"),
+            retry_attempts=channel.retry_attempts,
+            retry_delay_seconds=channel.retry_delay_seconds,
+        )
+        self.logger.info(f"Webhook notification sent for {len(alerts)} alert(s)")
+        return True
 
     async def _handle_escalations(self) -> None:
         """Handle alert escalations."""
@@ -752,7 +902,7 @@ This is an automated message from HACS Healthcare Monitoring System.
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.exception(f"Error handling escalations: {e}")
+                self.logger.error(f"Error handling escalations: {e}")
 
     async def _check_escalations(self) -> None:
         """Check for alerts that need escalation."""
@@ -783,7 +933,7 @@ This is an automated message from HACS Healthcare Monitoring System.
             # Send to additional channels or recipients for escalation
             await self._send_notifications(alert)
 
-        self.logger.warning(f"Alert escalated: {alert.id}")
+        self.logger.warn(f"Alert escalated: {alert.id}")
 
     def _generate_alert_id(self, rule_id: str, title: str) -> str:
         """Generate unique alert ID."""
@@ -17,6 +17,7 @@ import threading
 from collections.abc import Callable
 from contextlib import contextmanager, suppress
 from enum import Enum
+from types import UnionType
 from typing import (
     Any,
     Optional,
@@ -24,6 +25,7 @@ from typing import (
     Union,
     get_args,
     get_origin,
+    get_type_hints,
 )
 
 from pydantic import BaseModel, Field
@@ -108,6 +110,99 @@ class InjectionContext:
             self._resolving.discard(service_type)
 
 
+_MISSING = object()
+
+
+def _type_name(service_type: Any) -> str:
+    """Readable name for a service type or type hint."""
+    return getattr(service_type, "__name__", repr(service_type))
+
+
+def _injectable_parameters(
+    target: Callable[..., Any], skip_first: bool
+) -> list[tuple[str, Any, Any]]:
+    """Extract ``(name, annotation, default)`` for each injectable parameter.
+
+    String annotations are resolved through ``get_type_hints`` where possible;
+    ``*args`` and ``**kwargs`` are never injected.
+    """
+    try:
+        signature = inspect.signature(target)
+    except (ValueError, TypeError):
+        return []
+
+    try:
+        hints = get_type_hints(target)
+    except Exception:
+        hints = {}
+
+    parameters = list(signature.parameters.values())
+    if skip_first:
+        parameters = parameters[1:]
+
+    return [
+        (param.name, hints.get(param.name, param.annotation), param.default)
+        for param in parameters
+        if param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
+
+
+def _constructor(
+    target: Callable[..., Any],
+    constants: dict[str, Any],
+    required: list[tuple[str, Callable[[], Any]]],
+    fallible: list[tuple[str, Callable[[], Any], Any]],
+    wrap_errors: bool,
+) -> Callable[[], Any]:
+    """Create a closure that builds dependencies and calls ``target``.
+
+    Args:
+        target: Implementation type or factory function
+        constants: Arguments fixed at compile time
+        required: Arguments whose resolution errors propagate
+        fallible: Arguments that fall back to a default on ``DependencyError``
+        wrap_errors: Whether to wrap constructor failures in ``DependencyError``
+    """
+
+    def construct() -> Any:
+        kwargs = constants.copy()
+        for name, build in required:
+            kwargs[name] = build()
+        for name, build, fallback in fallible:
+            try:
+                kwargs[name] = build()
+            except DependencyError:
+                kwargs[name] = fallback
+
+        if not wrap_errors:
+            return target(**kwargs)
+        try:
+            return target(**kwargs)
+        except Exception as e:
+            msg = f"Failed to create instance of {target.__name__}: {e}"
+            raise DependencyError(msg, target) from e
+
+    return construct
+
+
+class _ResolutionPlan:
+    """Precompiled recipe for producing instances of one service type."""
+
+    __slots__ = ("acyclic", "build", "dependencies", "service_type")
+
+    def __init__(
+        self,
+        service_type: type,
+        build: Callable[[], Any],
+        dependencies: list[type],
+        acyclic: bool,
+    ) -> None:
+        self.service_type = service_type
+        self.build = build
+        self.dependencies = dependencies
+        self.acyclic = acyclic
+
+
 class Scope:
     """Represents a dependency injection scope."""
 
@@ -168,6 +263,10 @@ class Container:
         self._parent = parent
         self._lock = threading.RLock()
         self._current_scope: Scope | None = None
+        # Compiled resolution plans, invalidated whenever registrations change
+        self._plans: dict[type, _ResolutionPlan] = {}
+        self._generation = 0
+        self._parent_stamp = parent._stamp() if parent is not None else ()
 
     def register(
         self,
@@ -190,29 +289,38 @@ class Container:
             Self for method chaining
         """
         with self._lock:
-            impl_type = implementation_type or service_type
-
             # If instance provided, force singleton lifetime
             if instance is not None:
                 lifetime = ServiceLifetime.SINGLETON
                 self._singletons[service_type] = instance
 
-            # Analyze dependencies from constructor
-            dependencies = self._analyze_dependencies(impl_type)
-
-            descriptor = ServiceDescriptor(
-                service_type=service_type,
-                implementation_type=impl_type,
-                factory=factory,
-                instance=instance,
-                lifetime=lifetime,
-                dependencies=dependencies,
+            self._services[service_type] = self._describe(
+                service_type, implementation_type, factory, instance, lifetime
             )
-
-            self._services[service_type] = descriptor
+            self._invalidate_plans()
 
         return self
 
+    def _describe(
+        self,
+        service_type: type,
+        implementation_type: type | None = None,
+        factory: Callable[..., Any] | None = None,
+        instance: Any | None = None,
+        lifetime: ServiceLifetime = ServiceLifetime.TRANSIENT,
+    ) -> ServiceDescriptor:
+        """Create the descriptor for a service registration."""
+        impl_type = implementation_type or service_type
+        return ServiceDescriptor(
+            service_type=service_type,
+            implementation_type=impl_type,
+            factory=factory,
+            instance=instance,
+            lifetime=lifetime,
+            # Analyze dependencies from constructor
+            dependencies=self._analyze_dependencies(impl_type),
+        )
+
     def register_singleton(
         self, service_type: type[T], implementation_type: type[T] | None = None
     ) -> "Container":
@@ -236,6 +344,9 @@ class Container:
     def get(self, service_type: type[T]) -> T:
         """Get service instance from container.
 
+        The first request for a service type compiles a resolution plan that
+        is reused for every later call until the registrations change.
+
         Args:
             service_type: Type of service to retrieve
 
@@ -245,175 +356,181 @@ class Container:
         Raises:
             DependencyError: If service is not registered or cannot be created
         """
-        context = InjectionContext()
-        return self._resolve_service(service_type, context)
+        if self._parent is not None and self._parent_stamp != self._parent._stamp():
+            with self._lock:
+                self._invalidate_plans()
+                self._parent_stamp = self._parent._stamp()
 
-    def _resolve_service(self, service_type: type[T], context: InjectionContext) -> T:
-        """Resolve service with dependency injection context."""
-        with context.resolving(service_type), self._lock:
-            # Check if service is registered in this container
-            if service_type in self._services:
-                descriptor = self._services[service_type]
-                return self._create_instance(descriptor, context)
+        plan = self._plans.get(service_type)
+        if plan is None:
+            with self._lock:
+                plan = self._plan_for(service_type, ())
+        return plan.build()
 
-            # Check parent container
-            if self._parent is not None:
-                try:
-                    return self._parent._resolve_service(service_type, context)
-                except DependencyError:
-                    pass
-
-            # Try to auto-register if it's a concrete class
-            if self._can_auto_register(service_type):
-                self.register(service_type)
-                descriptor = self._services[service_type]
-                return self._create_instance(descriptor, context)
-
-            msg = f"Service {service_type.__name__} is not registered"
-            raise DependencyError(
-                msg, service_type
-            )
+    def validate(self) -> None:
+        """Compile resolution plans for every registered service.
 
-    def _create_instance(self, descriptor: ServiceDescriptor, context: InjectionContext) -> Any:
-        """Create service instance based on descriptor."""
-        service_type = descriptor.service_type
+        Surfaces wiring problems such as dependency cycles at startup rather
+        than on first resolution.
 
-        # Handle singleton lifetime
-        if descriptor.lifetime == ServiceLifetime.SINGLETON:
-            if service_type in self._singletons:
-                return self._singletons[service_type]
-
-            instance = self._construct_instance(descriptor, context)
-            self._singletons[service_type] = instance
-            return instance
-
-        # Handle scoped lifetime
-        if descriptor.lifetime == ServiceLifetime.SCOPED:
-            if self._current_scope is not None:
-                scoped_instance = self._current_scope.get_scoped_instance(service_type)
-                if scoped_instance is not None:
-                    return scoped_instance
+        Raises:
+            CircularDependencyError: If required dependencies form a cycle
+            DependencyError: If a required dependency cannot be resolved
+        """
+        with self._lock:
+            for service_type in list(self._services):
+                self._plan_for(service_type, ())
 
-                instance = self._construct_instance(descriptor, context)
-                self._current_scope.set_scoped_instance(service_type, instance)
-                return instance
-            # No scope, treat as transient
-            return self._construct_instance(descriptor, context)
+    def _plan_for(self, service_type: type, path: tuple[type, ...]) -> "_ResolutionPlan":
+        """Return the cached plan for a service type, compiling it if needed.
 
-        # Handle transient lifetime (default)
-        return self._construct_instance(descriptor, context)
+        Callers must hold ``self._lock``. ``path`` holds the service types
+        being compiled above this one and is used to detect cycles.
+        """
+        plan = self._plans.get(service_type)
+        if plan is not None and (plan.acyclic or not path):
+            return plan
+
+        if service_type in path:
+            cycle = path[path.index(service_type) :] + (service_type,)
+            msg = "Circular dependency detected: " + " -> ".join(_type_name(t) for t in cycle)
+            raise CircularDependencyError(msg, service_type)
+
+        descriptor = self._services.get(service_type)
+        if descriptor is not None:
+            plan = self._compile_plan(descriptor, path)
+        elif self._parent is not None:
+            # Unknown services are auto-registered at the root container
+            with self._parent._lock:
+                plan = self._parent._plan_for(service_type, path)
+        elif self._can_auto_register(service_type):
+            self._services[service_type] = self._describe(service_type)
+            plan = self._compile_plan(self._services[service_type], path)
+        else:
+            msg = f"Service {_type_name(service_type)} is not registered"
+            raise DependencyError(msg, service_type)
+
+        # Plans that broke a cycle with a default depend on where resolution
+        # started, so they are only reused as entry points.
+        if plan.acyclic or not path:
+            self._plans[service_type] = plan
+        return plan
+
+    def _compile_plan(
+        self, descriptor: ServiceDescriptor, path: tuple[type, ...]
+    ) -> "_ResolutionPlan":
+        """Build the flat factory closure for a registered service."""
+        service_type = descriptor.service_type
 
-    def _construct_instance(self, descriptor: ServiceDescriptor, context: InjectionContext) -> Any:
-        """Construct instance using factory or constructor."""
-        # Use pre-created instance if available
         if descriptor.instance is not None:
-            return descriptor.instance
+            instance = descriptor.instance
+            return _ResolutionPlan(service_type, lambda: instance, [], True)
 
-        # Use factory if provided
         if descriptor.factory is not None:
-            factory_args = self._resolve_factory_args(descriptor.factory, context)
-            return descriptor.factory(**factory_args)
+            target = descriptor.factory
+            owner = getattr(target, "__qualname__", repr(target))
+            parameters = _injectable_parameters(target, skip_first=False)
+        else:
+            target = descriptor.implementation_type or service_type
+            owner = target.__name__
+            parameters = _injectable_parameters(target.__init__, skip_first=True)
+
+        constants: dict[str, Any] = {}
+        required: list[tuple[str, Callable[[], Any]]] = []
+        fallible: list[tuple[str, Callable[[], Any], Any]] = []
+        dependencies: list[type] = []
+        acyclic = True
+        path = (*path, service_type)
+
+        for name, annotation, default in parameters:
+            has_default = default is not inspect.Parameter.empty
+
+            if annotation is inspect.Parameter.empty:
+                if not has_default:
+                    msg = f"Parameter '{name}' in {owner} has no type annotation and no default value"
+                    raise DependencyError(msg, service_type)
+                continue
 
-        # Use constructor injection
-        impl_type = descriptor.implementation_type or descriptor.service_type
-        constructor_args = self._resolve_constructor_args(impl_type, context)
+            # Unresolvable forward references keep their defaults
+            if isinstance(annotation, str):
+                if has_default:
+                    constants[name] = default
+                continue
 
-        try:
-            return impl_type(**constructor_args)
-        except Exception as e:
-            msg = f"Failed to create instance of {impl_type.__name__}: {e}"
-            raise DependencyError(
-                msg, impl_type
-            ) from e
-
-    def _resolve_constructor_args(
-        self, service_type: type, context: InjectionContext
-    ) -> dict[str, Any]:
-        """Resolve constructor arguments through dependency injection."""
-        args = {}
-
-        # Get constructor signature
-        try:
-            signature = inspect.signature(service_type.__init__)
-        except (ValueError, TypeError):
-            return args
+            optional = self._is_optional_type(annotation)
+            dependency = self._get_optional_inner_type(annotation) if optional else annotation
+            fallback = default if has_default else (None if optional else _MISSING)
 
-        # Skip 'self' parameter
-        parameters = list(signature.parameters.values())[1:]
+            try:
+                dependency_plan = self._plan_for(dependency, path)
+            except DependencyError as e:
+                if fallback is _MISSING:
+                    raise
+                acyclic = acyclic and not isinstance(e, CircularDependencyError)
+                constants[name] = fallback
+                continue
 
-        for param in parameters:
-            param_type = param.annotation
+            acyclic = acyclic and dependency_plan.acyclic
+            dependencies.append(dependency)
+            if fallback is _MISSING:
+                required.append((name, dependency_plan.build))
+            else:
+                fallible.append((name, dependency_plan.build, fallback))
 
-            # Skip parameters without type annotations
-            if param_type == inspect.Parameter.empty:
-                if param.default == inspect.Parameter.empty:
-                    msg = f"Parameter '{param.name}' in {service_type.__name__} has no type annotation and no default value"
-                    raise DependencyError(
-                        msg
-                    )
-                continue
+        construct = _constructor(target, constants, required, fallible, descriptor.factory is None)
+        return _ResolutionPlan(
+            service_type, self._apply_lifetime(descriptor, construct), dependencies, acyclic
+        )
 
-            # Skip string annotations (forward references) that can't be resolved
-            if isinstance(param_type, str):
-                if param.default != inspect.Parameter.empty:
-                    args[param.name] = param.default
-                else:
-                    # For testing purposes, skip unresolvable forward references
-                    continue
+    def _apply_lifetime(
+        self, descriptor: ServiceDescriptor, construct: Callable[[], Any]
+    ) -> Callable[[], Any]:
+        """Wrap a constructor closure with the caching its lifetime requires."""
+        service_type = descriptor.service_type
 
-            # Handle Optional types
-            elif self._is_optional_type(param_type):
-                try:
-                    args[param.name] = self._resolve_service(
-                        self._get_optional_inner_type(param_type), context
-                    )
-                except DependencyError:
-                    # Optional dependency not available, use default or None
-                    if param.default != inspect.Parameter.empty:
-                        args[param.name] = param.default
-                    else:
-                        args[param.name] = None
-            else:
-                # Required dependency
-                try:
-                    args[param.name] = self._resolve_service(param_type, context)
-                except DependencyError:
-                    if param.default != inspect.Parameter.empty:
-                        args[param.name] = param.default
-                    else:
-                        raise
+        if descriptor.lifetime == ServiceLifetime.SINGLETON:
+            singletons = self._singletons
+            lock = self._lock
+
+            def build_singleton() -> Any:
+                instance = singletons.get(service_type, _MISSING)
+                if instance is _MISSING:
+                    with lock:
+                        instance = singletons.get(service_type, _MISSING)
+                        if instance is _MISSING:
+                            instance = construct()
+                            singletons[service_type] = instance
+                return instance
 
-        return args
+            return build_singleton
 
-    def _resolve_factory_args(self, factory: Callable, context: InjectionContext) -> dict[str, Any]:
-        """Resolve factory function arguments."""
-        args = {}
+        if descriptor.lifetime == ServiceLifetime.SCOPED:
 
-        try:
-            signature = inspect.signature(factory)
-        except (ValueError, TypeError):
-            return args
+            def build_scoped() -> Any:
+                scope = self._current_scope
+                # No scope, treat as transient
+                if scope is None:
+                    return construct()
+                instance = scope.get_scoped_instance(service_type)
+                if instance is None:
+                    instance = construct()
+                    scope.set_scoped_instance(service_type, instance)
+                return instance
 
-        for param in signature.parameters.values():
-            param_type = param.annotation
+            return build_scoped
 
-            if param_type == inspect.Parameter.empty:
-                if param.default == inspect.Parameter.empty:
-                    msg = f"Factory parameter '{param.name}' has no type annotation and no default value"
-                    raise DependencyError(
-                        msg
-                    )
-                continue
+        return construct
 
-            try:
-                args[param.name] = self._resolve_service(param_type, context)
-            except DependencyError:
-                if param.default != inspect.Parameter.empty:
-                    args[param.name] = param.default
-                else:
-                    raise
+    def _invalidate_plans(self) -> None:
+        """Drop compiled plans after the registrations changed."""
+        self._plans.clear()
+        self._generation += 1
 
-        return args
+    def _stamp(self) -> tuple[int, ...]:
+        """Registration generations of this container and its ancestors."""
+        if self._parent is None:
+            return (self._generation,)
+        return (self._generation, *self._parent._stamp())
 
     def _analyze_dependencies(self, service_type: type) -> list[type]:
         """Analyze service dependencies from constructor."""
@@ -438,9 +555,15 @@ class Container:
         return dependencies
 
     def _can_auto_register(self, service_type: type) -> bool:
-        """Check if service can be auto-registered."""
+        """Check if service can be auto-registered.
+
+        Builtins such as ``int`` or ``str`` are configuration values rather
+        than services, so parameters typed with them keep their defaults
+        unless the type was registered explicitly.
+        """
         return (
             inspect.isclass(service_type)
+            and service_type.__module__ != "builtins"
             and not inspect.isabstract(service_type)
             and hasattr(service_type, "__init__")
         )
@@ -448,7 +571,7 @@ class Container:
     def _is_optional_type(self, type_hint: Any) -> bool:
         """Check if type hint is Optional[T] or Union[T, None]."""
         origin = get_origin(type_hint)
-        if origin is Union:
+        if origin is Union or origin is UnionType:
             args = get_args(type_hint)
             return len(args) == 2 and type(None) in args
         return False
@@ -654,6 +777,7 @@ class Container:
 
             self._singletons.clear()
             self._services.clear()
+            self._invalidate_plans()
 
             if self._current_scope is not None:
                 self._current_scope.clear()
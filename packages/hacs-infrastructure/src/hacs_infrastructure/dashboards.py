@@ -16,6 +16,7 @@ License: MIT
 Version: 1.0.0
 """
 
+import asyncio
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -65,6 +66,7 @@ class DashboardWidget:
     chart_type: ChartType
     data_source: str
     refresh_interval_seconds: int = 30
+    timeout_seconds: float = 10.0
     width: int = 6  # Grid width (1-12)
     height: int = 4  # Grid height
     config: dict[str, Any] = field(default_factory=dict)
@@ -102,9 +104,10 @@ class HealthcareDashboardManager:
         self.dashboards: dict[str, Dashboard] = {}
         self._data_sources: dict[str, Callable] = {}
 
-        # Cache for dashboard data
-        self._cache = {}
-        self._cache_ttl = {}
+        # Per-widget cache of (fetched_at, entry) and in-flight fetches,
+        # keyed by (dashboard_id, widget_id, organization)
+        self._widget_cache: dict[tuple[str, str, str | None], tuple[float, dict[str, Any]]] = {}
+        self._inflight: dict[tuple[str, str, str | None], asyncio.Task] = {}
 
         # Initialize default dashboards
         self._create_default_dashboards()
@@ -364,39 +367,32 @@ class HealthcareDashboardManager:
     async def get_dashboard_data(
         self, dashboard_id: str, organization: str | None = None, refresh: bool = False
     ) -> dict[str, Any]:
-        """Get complete dashboard data."""
+        """Get complete dashboard data.
+
+        Widgets are fetched concurrently, so load time follows the slowest
+        widget. Each widget is cached for its ``refresh_interval_seconds``;
+        expired entries are served while a background refresh runs.
+
+        Args:
+            dashboard_id: Dashboard to render
+            organization: Optional organization filter
+            refresh: Wait for fresh data instead of serving cached entries
+
+        Returns:
+            Dashboard metadata and per-widget data
+        """
         dashboard = self.dashboards.get(dashboard_id)
         if not dashboard:
             return {"error": "Dashboard not found"}
 
-        # Check cache
-        cache_key = f"{dashboard_id}_{organization or 'all'}"
-        if not refresh and cache_key in self._cache:
-            cache_time = self._cache_ttl.get(cache_key, 0)
-            if time.time() - cache_time < dashboard.auto_refresh_seconds:
-                return self._cache[cache_key]
-
-        # Gather widget data
-        widget_data = {}
-        for widget in dashboard.widgets:
-            try:
-                data_func = self._data_sources.get(widget.data_source)
-                if data_func:
-                    data = await data_func(widget, organization)
-                    widget_data[widget.id] = {
-                        "data": data,
-                        "config": widget.config,
-                        "last_updated": datetime.now(UTC).isoformat(),
-                    }
-                else:
-                    widget_data[widget.id] = {
-                        "error": f"Data source '{widget.data_source}' not found"
-                    }
-            except Exception as e:
-                self.logger.exception(f"Error fetching data for widget {widget.id}: {e}")
-                widget_data[widget.id] = {"error": str(e)}
+        entries = await asyncio.gather(
+            *(
+                self._widget_entry(dashboard_id, widget, organization, refresh)
+                for widget in dashboard.widgets
+            )
+        )
 
-        dashboard_data = {
+        return {
             "dashboard": {
                 "id": dashboard.id,
                 "name": dashboard.name,
@@ -404,18 +400,18 @@ class HealthcareDashboardManager:
                 "type": dashboard.dashboard_type.value,
                 "last_updated": datetime.now(UTC).isoformat(),
             },
-            "widgets": widget_data,
+            "widgets": {
+                widget.id: entry for widget, entry in zip(dashboard.widgets, entries, strict=True)
+            },
             "organization": organization,
         }
 
-        # Cache the data
-        self._cache[cache_key] = dashboard_data
-        self._cache_ttl[cache_key] = time.time()
-
-        return dashboard_data
-
     async def get_widget_data(
-        self, dashboard_id: str, widget_id: str, organization: str | None = None
+        self,
+        dashboard_id: str,
+        widget_id: str,
+        organization: str | None = None,
+        refresh: bool = False,
     ) -> dict[str, Any]:
         """Get data for a specific widget."""
         dashboard = self.dashboards.get(dashboard_id)
@@ -426,20 +422,91 @@ class HealthcareDashboardManager:
         if not widget:
             return {"error": "Widget not found"}
 
-        try:
-            data_func = self._data_sources.get(widget.data_source)
-            if data_func:
-                data = await data_func(widget, organization)
-                return {
-                    "data": data,
-                    "config": widget.config,
-                    "last_updated": datetime.now(UTC).isoformat(),
-                }
+        return await self._widget_entry(dashboard_id, widget, organization, refresh)
+
+    async def _widget_entry(
+        self,
+        dashboard_id: str,
+        widget: DashboardWidget,
+        organization: str | None,
+        refresh: bool,
+    ) -> dict[str, Any]:
+        """Return cached widget data, refreshing it when expired."""
+        key = (dashboard_id, widget.id, organization)
+        cached = self._widget_cache.get(key)
+
+        if cached is not None and not refresh:
+            fetched_at, entry = cached
+            if time.time() - fetched_at < widget.refresh_interval_seconds:
+                return entry
+            # Serve the stale entry while a single refresh runs in the background
+            self._fetch_widget(key, widget, organization)
+            return {**entry, "stale": True}
+
+        # Concurrent viewers share one in-flight fetch
+        return await asyncio.shield(self._fetch_widget(key, widget, organization))
+
+    def _fetch_widget(
+        self,
+        key: tuple[str, str, str | None],
+        widget: DashboardWidget,
+        organization: str | None,
+    ) -> asyncio.Task:
+        """Start fetching widget data unless a fetch for the key is running."""
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(self._load_widget(key, widget, organization))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._discard_inflight(key, t))
+        return task
+
+    def _discard_inflight(self, key: tuple[str, str, str | None], task: asyncio.Task) -> None:
+        """Forget a finished widget fetch."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _load_widget(
+        self,
+        key: tuple[str, str, str | None],
+        widget: DashboardWidget,
+        organization: str | None,
+    ) -> dict[str, Any]:
+        """Fetch widget data with its timeout and cache successful results."""
+        data_func = self._data_sources.get(widget.data_source)
+        if not data_func:
             return {"error": f"Data source '{widget.data_source}' not found"}
+
+        try:
+            data = await asyncio.wait_for(
+                data_func(widget, organization), timeout=widget.timeout_seconds
+            )
+        except TimeoutError:
+            self.logger.warn(
+                f"Widget {widget.id} timed out after {widget.timeout_seconds} seconds"
+            )
+            return {"error": f"Widget data timed out after {widget.timeout_seconds} seconds"}
         except Exception as e:
-            self.logger.exception(f"Error fetching data for widget {widget_id}: {e}")
+            self.logger.error(f"Error fetching data for widget {widget.id}: {e}")
             return {"error": str(e)}
 
+        entry = {
+            "data": data,
+            "config": widget.config,
+            "last_updated": datetime.now(UTC).isoformat(),
+        }
+        # Errors are not cached so the next request retries; a failed
+        # background refresh keeps serving the previous entry
+        self._widget_cache[key] = (time.time(), entry)
+        return entry
+
+    def invalidate_cache(self, dashboard_id: str | None = None) -> None:
+        """Drop cached widget data for one dashboard or for all of them."""
+        if dashboard_id is None:
+            self._widget_cache.clear()
+            return
+        for key in [key for key in self._widget_cache if key[0] == dashboard_id]:
+            del self._widget_cache[key]
+
     def list_dashboards(self, user_permissions: list[str] | None = None) -> list[dict[str, Any]]:
         """List available dashboards based on user permissions."""
         user_permissions = user_permissions or []
@@ -466,11 +533,13 @@ class HealthcareDashboardManager:
     def register_custom_dashboard(self, dashboard: Dashboard) -> None:
         """Register a custom dashboard."""
         self.dashboards[dashboard.id] = dashboard
+        self.invalidate_cache(dashboard.id)
         self.logger.info(f"Registered custom dashboard: {dashboard.id}")
 
     def register_data_source(self, name: str, func: Callable) -> None:
         """Register a custom data source function."""
         self._data_sources[name] = func
+        self.invalidate_cache()
         self.logger.info(f"Registered data source: {name}")
 
     # Data source implementations
@@ -478,8 +547,6 @@ class HealthcareDashboardManager:
         self, widget: DashboardWidget, organization: str | None
     ) -> list[dict]:
         """Get clinical alerts data."""
-        self.healthcare_monitoring.metrics.get_clinical_alerts_summary(24)
-
         # Convert to widget format
         alerts = []
         for alert in self.healthcare_monitoring.metrics._clinical_alerts[-50:]:  # Last 50 alerts
@@ -568,22 +635,13 @@ class HealthcareDashboardManager:
         self, widget: DashboardWidget, organization: str | None
     ) -> dict:
         """Get PHI access timeline data."""
-        self.healthcare_monitoring.metrics.get_phi_access_summary(
-            24 * 7
-        )  # Last week
+        # Hourly buckets for the last week
+        buckets = self.healthcare_monitoring.metrics.get_phi_access_timeline(24 * 7)
 
-        # Generate timeline data
-        now = time.time()
-        timeline = {"timestamps": [], "access_counts": []}
-
-        for i in range(24 * 7):  # Hourly for last week
-            timestamp = now - (i * 3600)
-            timeline["timestamps"].append(
-                datetime.fromtimestamp(timestamp, tz=UTC).isoformat()
-            )
-            timeline["access_counts"].append(max(0, 10 + (i % 15) - 5))  # Mock data
-
-        return timeline
+        return {
+            "timestamps": [start.isoformat() for start, _ in buckets],
+            "access_counts": [count for _, count in buckets],
+        }
 
     async def _get_compliance_violations(
         self, widget: DashboardWidget, organization: str | None
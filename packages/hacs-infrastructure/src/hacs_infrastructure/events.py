@@ -6,8 +6,10 @@ event filtering, and asynchronous event handling.
 
 import asyncio
 import contextlib
+import logging
 import threading
 import uuid
+from collections import deque
 from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
@@ -16,6 +18,9 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 
+logger = logging.getLogger(__name__)
+
+
 class EventPriority(str, Enum):
     """Event priority levels."""
 
@@ -114,6 +119,14 @@ class EventFilter:
         return not (self.custom_filter and not self.custom_filter(event))
 
 
+class OverflowPolicy(str, Enum):
+    """What to do when a bounded event queue is full."""
+
+    DROP_NEWEST = "drop_newest"  # Discard the event being enqueued
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event to make room
+    BLOCK = "block"  # Wait for room (publish_async); sync publish raises EventError
+
+
 EventHandler = Callable[[Event], None]
 AsyncEventHandler = Callable[[Event], None]
 
@@ -127,6 +140,7 @@ class EventSubscription:
         handler: Callable[[Event], Any],
         event_filter: EventFilter | None = None,
         is_async: bool = False,
+        batch_size: int | None = None,
     ) -> None:
         """Initialize event subscription.
 
@@ -135,24 +149,38 @@ class EventSubscription:
             handler: Event handler function
             event_filter: Event filter for this subscription
             is_async: Whether handler is async
+            batch_size: If set, handler receives lists of up to this many events
         """
         self.id = subscription_id
         self.handler = handler
         self.filter = event_filter
         self.is_async = is_async
+        self.batch_size = batch_size
         self.created_at = datetime.now(UTC)
         self.event_count = 0
         self.last_event_at: datetime | None = None
 
+        # Delivery lag tracking (time from event creation to handler call)
+        self.dropped_count = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+        # Worker queue used by concurrent dispatch
+        self.queue: asyncio.Queue | None = None
+        self.worker_task: asyncio.Task | None = None
+
     def matches_event(self, event: Event) -> bool:
         """Check if subscription matches event."""
         return self.filter.matches(event) if self.filter else True
 
     async def handle_event(self, event: Event) -> None:
-        """Handle event with this subscription."""
+        """Handle event with this subscription (as a one-event list for batch subscriptions)."""
+        if self.batch_size:
+            await self.handle_batch([event])
+            return
+
         try:
-            self.event_count += 1
-            self.last_event_at = datetime.now(UTC)
+            self._track_delivery([event])
 
             if self.is_async:
                 await self.handler(event)
@@ -160,11 +188,47 @@ class EventSubscription:
                 self.handler(event)
         except Exception as e:
             # Log error but don't propagate to avoid affecting other handlers
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.exception(f"Event handler failed for subscription {self.id}: {e}")
 
+    async def handle_batch(self, events: list[Event]) -> None:
+        """Handle several queued events, as one call for batch subscriptions."""
+        if not self.batch_size:
+            for event in events:
+                await self.handle_event(event)
+            return
+
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start : start + self.batch_size]
+            try:
+                self._track_delivery(batch)
+
+                if self.is_async:
+                    await self.handler(batch)
+                else:
+                    self.handler(batch)
+            except Exception as e:
+                logger.exception(f"Batch event handler failed for subscription {self.id}: {e}")
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get delivery and lag metrics for this subscription."""
+        return {
+            "subscription_id": self.id,
+            "event_count": self.event_count,
+            "dropped_count": self.dropped_count,
+            "queue_size": self.queue.qsize() if self.queue is not None else 0,
+            "last_lag_seconds": self.last_lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+            "last_event_at": self.last_event_at.isoformat() if self.last_event_at else None,
+        }
+
+    def _track_delivery(self, events: list[Event]) -> None:
+        now = datetime.now(UTC)
+        self.event_count += len(events)
+        self.last_event_at = now
+        lag = (now - events[0].timestamp).total_seconds()
+        self.last_lag_seconds = lag
+        self.max_lag_seconds = max(self.max_lag_seconds, lag)
+
 
 class EventError(Exception):
     """Event system related errors."""
@@ -174,27 +238,50 @@ class EventError(Exception):
 class EventBus:
     """event bus with pub/sub capabilities, filtering,
     and asynchronous event handling.
+
+    History is a fixed-size ring buffer. Queues can be bounded with an
+    ``OverflowPolicy``, and with ``concurrent_dispatch`` every subscription
+    gets its own worker queue so a slow handler cannot stall the others.
     """
 
-    def __init__(self, max_event_history: int = 1000) -> None:
+    def __init__(
+        self,
+        max_event_history: int = 1000,
+        max_queue_size: int = 0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+        concurrent_dispatch: bool = False,
+        subscriber_queue_size: int = 1000,
+        dispatch_batch_size: int = 100,
+    ) -> None:
         """Initialize event bus.
 
         Args:
             max_event_history: Maximum number of events to keep in history
+            max_queue_size: Bound of the publish queue (0 for unbounded)
+            overflow_policy: What to do when a bounded queue is full
+            concurrent_dispatch: Deliver through per-subscription worker queues
+            subscriber_queue_size: Bound of each subscription queue (0 for unbounded)
+            dispatch_batch_size: Maximum events drained from a queue per wakeup
         """
         self._subscriptions: dict[str, EventSubscription] = {}
-        self._event_history: list[Event] = []
+        self._event_history: deque[Event] = deque(maxlen=max_event_history)
         self._max_event_history = max_event_history
         self._lock = threading.RLock()
 
         # Event processing
-        self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+        self._concurrent_dispatch = concurrent_dispatch
+        self._subscriber_queue_size = subscriber_queue_size
+        self._dispatch_batch_size = max(1, dispatch_batch_size)
+        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
         self._processing_task: asyncio.Task | None = None
         self._running = False
 
         # Statistics
         self._total_events_published = 0
         self._total_events_processed = 0
+        self._total_events_dropped = 0
 
     async def start(self) -> None:
         """Start event processing."""
@@ -202,7 +289,7 @@ class EventBus:
             return
 
         self._running = True
-        self._event_queue = asyncio.Queue()
+        self._event_queue = asyncio.Queue(maxsize=self._max_queue_size)
         self._processing_task = asyncio.create_task(self._process_events())
 
     async def stop(self) -> None:
@@ -218,30 +305,63 @@ class EventBus:
                 await self._processing_task
             self._processing_task = None
 
+        for subscription in self.get_subscriptions():
+            await self._stop_subscription_worker(subscription)
+
     def publish(self, event: Event) -> None:
         """Publish event to the bus.
 
+        Args:
+            event: Event to publish
+
+        Raises:
+            EventError: If the queue is full under ``OverflowPolicy.BLOCK``
+        """
+        self._record_published(event)
+
+        # Queue for async processing
+        if self._running and self._offer(self._event_queue, event):
+            if self._overflow_policy == OverflowPolicy.BLOCK:
+                msg = f"Event queue full, cannot publish event: {event.id}"
+                raise EventError(msg)
+            logger.warning(
+                f"Event queue full, dropped an event ({self._overflow_policy.value}): {event.id}"
+            )
+
+    async def publish_async(self, event: Event) -> None:
+        """Publish event, waiting for queue room under ``OverflowPolicy.BLOCK``.
+
         Args:
             event: Event to publish
         """
+        if self._overflow_policy != OverflowPolicy.BLOCK or not self._running:
+            self.publish(event)
+            return
+
+        self._record_published(event)
+        await self._event_queue.put(event)
+
+    def _record_published(self, event: Event) -> None:
         with self._lock:
-            # Add to history
             self._event_history.append(event)
-            if len(self._event_history) > self._max_event_history:
-                self._event_history.pop(0)
-
             self._total_events_published += 1
 
-        # Queue for async processing
-        if self._running:
-            try:
-                self._event_queue.put_nowait(event)
-            except asyncio.QueueFull:
-                # Log warning but don't block
-                import logging
+    def _offer(self, queue: asyncio.Queue, event: Event) -> bool:
+        """Enqueue without waiting, applying the overflow policy.
 
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Event queue full, dropping event: {event.id}")
+        Returns:
+            True if an event was dropped (the new one, or the oldest one evicted)
+        """
+        try:
+            queue.put_nowait(event)
+            return False
+        except asyncio.QueueFull:
+            if self._overflow_policy == OverflowPolicy.DROP_OLDEST:
+                with contextlib.suppress(asyncio.QueueEmpty):
+                    queue.get_nowait()
+                queue.put_nowait(event)
+            self._total_events_dropped += 1
+            return True
 
     def publish_event(
         self,
@@ -282,6 +402,7 @@ class EventBus:
         handler: Callable[[Event], Any],
         event_filter: EventFilter | None = None,
         is_async: bool = False,
+        batch_size: int | None = None,
     ) -> str:
         """Subscribe to events.
 
@@ -289,12 +410,15 @@ class EventBus:
             handler: Event handler function
             event_filter: Event filter for subscription
             is_async: Whether handler is async
+            batch_size: If set, handler receives lists of up to this many events
 
         Returns:
             Subscription ID
         """
         subscription_id = str(uuid.uuid4())
-        subscription = EventSubscription(subscription_id, handler, event_filter, is_async)
+        subscription = EventSubscription(
+            subscription_id, handler, event_filter, is_async, batch_size
+        )
 
         with self._lock:
             self._subscriptions[subscription_id] = subscription
@@ -343,7 +467,14 @@ class EventBus:
             True if subscription was removed
         """
         with self._lock:
-            return self._subscriptions.pop(subscription_id, None) is not None
+            subscription = self._subscriptions.pop(subscription_id, None)
+
+        if subscription is None:
+            return False
+        if subscription.worker_task is not None:
+            subscription.worker_task.cancel()
+            subscription.worker_task = None
+        return True
 
     def get_subscription(self, subscription_id: str) -> EventSubscription | None:
         """Get subscription by ID."""
@@ -359,34 +490,98 @@ class EventBus:
         """Process events from queue."""
         while self._running:
             try:
-                # Get event from queue with timeout
+                # Get event from queue with timeout, then drain a batch
                 event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-                await self._dispatch_event(event)
-                self._total_events_processed += 1
+                events = self._drain(self._event_queue, event)
+
+                if self._concurrent_dispatch:
+                    for event in events:
+                        await self._route_event(event)
+                else:
+                    await self._dispatch_events(events)
+                self._total_events_processed += len(events)
             except TimeoutError:
                 continue
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                import logging
-
-                logger = logging.getLogger(__name__)
                 logger.exception(f"Error processing event: {e}")
 
-    async def _dispatch_event(self, event: Event) -> None:
-        """Dispatch event to matching subscriptions."""
-        matching_subscriptions = []
+    def _drain(self, queue: asyncio.Queue, first: Event) -> list[Event]:
+        """Collect up to ``dispatch_batch_size`` events already waiting in a queue."""
+        events = [first]
+        while len(events) < self._dispatch_batch_size:
+            try:
+                events.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return events
 
+    def _matching_subscriptions(self, event: Event) -> list[EventSubscription]:
         with self._lock:
-            for subscription in self._subscriptions.values():
-                if subscription.matches_event(event):
-                    matching_subscriptions.append(subscription)
+            return [
+                subscription
+                for subscription in self._subscriptions.values()
+                if subscription.matches_event(event)
+            ]
 
-        # Handle events concurrently
-        if matching_subscriptions:
-            tasks = [subscription.handle_event(event) for subscription in matching_subscriptions]
+    async def _dispatch_event(self, event: Event) -> None:
+        """Dispatch event to matching subscriptions."""
+        await self._dispatch_events([event])
+
+    async def _dispatch_events(self, events: list[Event]) -> None:
+        """Dispatch drained events, in order, as one batch per matching subscription."""
+        batches: dict[str, tuple[EventSubscription, list[Event]]] = {}
+        for event in events:
+            for subscription in self._matching_subscriptions(event):
+                batches.setdefault(subscription.id, (subscription, []))[1].append(event)
+
+        # Handle subscriptions concurrently
+        if batches:
+            tasks = [subscription.handle_batch(batch) for subscription, batch in batches.values()]
             await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def _route_event(self, event: Event) -> None:
+        """Hand event to the worker queue of every matching subscription."""
+        for subscription in self._matching_subscriptions(event):
+            if subscription.worker_task is None:
+                self._start_subscription_worker(subscription)
+
+            if self._overflow_policy == OverflowPolicy.BLOCK:
+                # Backpressure: a full subscription queue holds up routing
+                await subscription.queue.put(event)
+                continue
+
+            if subscription.queue.full():
+                # Give this subscription's worker one turn to drain before dropping
+                await asyncio.sleep(0)
+            if self._offer(subscription.queue, event):
+                subscription.dropped_count += 1
+
+    def _start_subscription_worker(self, subscription: EventSubscription) -> None:
+        subscription.queue = asyncio.Queue(maxsize=self._subscriber_queue_size)
+        subscription.worker_task = asyncio.create_task(self._subscription_worker(subscription))
+
+    async def _stop_subscription_worker(self, subscription: EventSubscription) -> None:
+        task = subscription.worker_task
+        subscription.worker_task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _subscription_worker(self, subscription: EventSubscription) -> None:
+        """Deliver queued events to one subscription in batches."""
+        queue = subscription.queue
+        while True:
+            try:
+                event = await queue.get()
+                await subscription.handle_batch(self._drain(queue, event))
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.exception(f"Error delivering events to subscription {subscription.id}: {e}")
+
     def get_event_history(
         self, event_type: str | None = None, source: str | None = None, limit: int = 100
     ) -> list[Event]:
@@ -401,7 +596,7 @@ class EventBus:
             List of events
         """
         with self._lock:
-            events = self._event_history.copy()
+            events = list(self._event_history)
 
         # Apply filters
         if event_type:
@@ -420,12 +615,20 @@ class EventBus:
             return {
                 "total_events_published": self._total_events_published,
                 "total_events_processed": self._total_events_processed,
+                "total_events_dropped": self._total_events_dropped,
                 "active_subscriptions": len(self._subscriptions),
                 "event_history_size": len(self._event_history),
                 "queue_size": self._event_queue.qsize() if self._running else 0,
+                "max_queue_size": self._max_queue_size,
+                "overflow_policy": self._overflow_policy.value,
+                "concurrent_dispatch": self._concurrent_dispatch,
                 "is_running": self._running,
             }
 
+    def get_subscription_metrics(self) -> list[dict[str, Any]]:
+        """Get per-subscription delivery, drop and lag metrics."""
+        return [subscription.get_metrics() for subscription in self.get_subscriptions()]
+
     def clear_history(self) -> None:
         """Clear event history."""
         with self._lock:
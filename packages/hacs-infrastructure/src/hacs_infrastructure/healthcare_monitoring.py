@@ -17,6 +17,7 @@ Version: 1.0.0
 """
 
 import asyncio
+import bisect
 import logging
 import time
 from collections.abc import Callable
@@ -27,6 +28,7 @@ from typing import Any
 
 from .events import EventBus
 from .monitoring import HealthMonitor, MetricsCollector, PerformanceMonitor
+from .rolling_aggregates import RollingAggregator
 
 
 class ClinicalSeverity(str, Enum):
@@ -101,17 +103,45 @@ class ComplianceEvent:
 
 
 class HealthcareMetricsCollector(MetricsCollector):
-    """Extended metrics collector with healthcare-specific metrics."""
+    """Extended metrics collector with healthcare-specific metrics.
 
-    def __init__(self, retention_period: int = 7 * 24 * 3600) -> None:  # 7 days for HIPAA
-        """Initialize with longer retention for healthcare compliance."""
+    Summaries are answered from rolling minute/hour aggregates maintained at
+    record time; the raw event lists only keep the most recent events for
+    display and are bounded by ``max_raw_events``.
+    """
+
+    def __init__(
+        self,
+        retention_period: int = 7 * 24 * 3600,  # 7 days for HIPAA
+        max_raw_events: int = 10000,
+    ) -> None:
+        """Initialize with longer retention for healthcare compliance.
+
+        Args:
+            retention_period: Retention of metrics and aggregates in seconds
+            max_raw_events: Maximum raw events kept per event list
+        """
         super().__init__(retention_period)
+        self.max_raw_events = max_raw_events
 
         # Healthcare-specific metric tracking
         self._phi_access_events: list[PHIAccessEvent] = []
         self._clinical_alerts: list[ClinicalAlert] = []
         self._compliance_events: list[ComplianceEvent] = []
 
+        # Rolling aggregates backing the summaries
+        self._phi_access_aggregates = RollingAggregator(
+            ("resource_type", "action", "user"),
+            unique=("patient", "user"),
+            retention_seconds=retention_period,
+        )
+        self._clinical_alert_aggregates = RollingAggregator(
+            ("severity",), retention_seconds=retention_period
+        )
+        self._compliance_aggregates = RollingAggregator(
+            ("status", "remediation_required"), retention_seconds=retention_period
+        )
+
         # Alert thresholds
         self._phi_access_rate_threshold = 100  # per hour
         self._failed_auth_threshold = 5  # per 15 minutes
@@ -130,7 +160,16 @@ class HealthcareMetricsCollector(MetricsCollector):
             **kwargs,
         )
 
-        self._phi_access_events.append(event)
+        self._append_bounded(self._phi_access_events, event)
+        self._phi_access_aggregates.add(
+            {
+                "resource_type": resource_type,
+                "action": action,
+                "user": user_id,
+                "patient": patient_id_hash,
+            },
+            event.timestamp.timestamp(),
+        )
 
         # Record metrics
         self.increment_counter(
@@ -233,7 +272,10 @@ class HealthcareMetricsCollector(MetricsCollector):
             recommended_actions=recommended_actions or [],
         )
 
-        self._clinical_alerts.append(alert)
+        self._append_bounded(self._clinical_alerts, alert)
+        self._clinical_alert_aggregates.add(
+            {"severity": severity.value}, alert.timestamp.timestamp()
+        )
 
         # Record alert metrics
         self.increment_counter(
@@ -261,7 +303,11 @@ class HealthcareMetricsCollector(MetricsCollector):
             **kwargs,
         )
 
-        self._compliance_events.append(event)
+        self._append_bounded(self._compliance_events, event)
+        self._compliance_aggregates.add(
+            {"status": status.value, "remediation_required": event.remediation_required},
+            event.timestamp.timestamp(),
+        )
 
         # Record compliance metrics
         self.increment_counter(
@@ -276,45 +322,46 @@ class HealthcareMetricsCollector(MetricsCollector):
         return event
 
     def get_phi_access_summary(self, hours: int = 24) -> dict[str, Any]:
-        """Get PHI access summary for specified hours."""
-        cutoff = datetime.now(UTC) - timedelta(hours=hours)
-        recent_events = [e for e in self._phi_access_events if e.timestamp >= cutoff]
-
-        # Group by resource type and action
-        by_resource = {}
-        by_action = {}
-        by_user = {}
+        """Get PHI access summary for specified hours.
 
-        for event in recent_events:
-            by_resource[event.resource_type] = by_resource.get(event.resource_type, 0) + 1
-            by_action[event.action] = by_action.get(event.action, 0) + 1
-            by_user[event.user_id] = by_user.get(event.user_id, 0) + 1
+        Unique patient and user counts are HyperLogLog estimates.
+        """
+        summary = self._phi_access_aggregates.summarize(hours * 3600)
 
         return {
-            "total_accesses": len(recent_events),
+            "total_accesses": summary["total"],
             "time_period_hours": hours,
-            "by_resource_type": by_resource,
-            "by_action": by_action,
-            "by_user": by_user,
-            "unique_patients": len({e.patient_id_hash for e in recent_events}),
-            "unique_users": len({e.user_id for e in recent_events}),
+            "by_resource_type": summary["by"]["resource_type"],
+            "by_action": summary["by"]["action"],
+            "by_user": summary["by"]["user"],
+            "unique_patients": summary["unique"]["patient"],
+            "unique_users": summary["unique"]["user"],
         }
 
+    def get_phi_access_timeline(self, hours: int = 24) -> list[tuple[datetime, int]]:
+        """Get PHI access counts per bucket, oldest first.
+
+        Windows up to two hours are bucketed per minute, longer ones per hour.
+        """
+        return [
+            (datetime.fromtimestamp(start, tz=UTC), count)
+            for start, count in self._phi_access_aggregates.timeline(hours * 3600)
+        ]
+
     def get_clinical_alerts_summary(self, hours: int = 24) -> dict[str, Any]:
         """Get clinical alerts summary."""
-        cutoff = datetime.now(UTC) - timedelta(hours=hours)
-        recent_alerts = [a for a in self._clinical_alerts if a.timestamp >= cutoff]
+        summary = self._clinical_alert_aggregates.summarize(hours * 3600)
 
-        # Group by severity
-        by_severity = {}
-        for alert in recent_alerts:
-            by_severity[alert.severity.value] = by_severity.get(alert.severity.value, 0) + 1
+        # Acknowledgement and resolution change after creation, so they are
+        # counted from the bounded list of recent alerts
+        cutoff = datetime.now(UTC) - timedelta(hours=hours)
+        recent_alerts = self._events_since(self._clinical_alerts, cutoff)
 
         return {
-            "total_alerts": len(recent_alerts),
+            "total_alerts": summary["total"],
             "active_alerts": len([a for a in recent_alerts if not a.resolved]),
             "acknowledged_alerts": len([a for a in recent_alerts if a.acknowledged]),
-            "by_severity": by_severity,
+            "by_severity": summary["by"]["severity"],
             "critical_unresolved": len(
                 [
                     a
@@ -327,28 +374,29 @@ class HealthcareMetricsCollector(MetricsCollector):
 
     def get_compliance_summary(self, hours: int = 24) -> dict[str, Any]:
         """Get HIPAA compliance summary."""
-        cutoff = datetime.now(UTC) - timedelta(hours=hours)
-        recent_events = [e for e in self._compliance_events if e.timestamp >= cutoff]
-
-        # Group by status
-        by_status = {}
-        for event in recent_events:
-            by_status[event.status.value] = by_status.get(event.status.value, 0) + 1
+        summary = self._compliance_aggregates.summarize(hours * 3600)
+        by_status = summary["by"]["status"]
 
         return {
-            "total_events": len(recent_events),
-            "compliance_score": self._calculate_compliance_score(recent_events),
+            "total_events": summary["total"],
+            "compliance_score": self._calculate_compliance_score(by_status),
             "by_status": by_status,
-            "violations": len(
-                [
-                    e
-                    for e in recent_events
-                    if e.status in [ComplianceStatus.VIOLATION, ComplianceStatus.CRITICAL_VIOLATION]
-                ]
-            ),
-            "remediation_required": len([e for e in recent_events if e.remediation_required]),
+            "violations": by_status.get(ComplianceStatus.VIOLATION.value, 0)
+            + by_status.get(ComplianceStatus.CRITICAL_VIOLATION.value, 0),
+            "remediation_required": summary["by"]["remediation_required"].get(True, 0),
         }
 
+    def _append_bounded(self, events: list, event: Any) -> None:
+        """Append an event, trimming the list once it passes its bound."""
+        events.append(event)
+        # Trim in chunks so appends stay amortized O(1)
+        if len(events) > self.max_raw_events + max(self.max_raw_events // 10, 1):
+            del events[: len(events) - self.max_raw_events]
+
+    def _events_since(self, events: list, cutoff: datetime) -> list:
+        """Events at or after ``cutoff`` from a list ordered by timestamp."""
+        return events[bisect.bisect_left(events, cutoff, key=lambda e: e.timestamp) :]
+
     def _classify_user_type(self, user_id: str) -> str:
         """Classify user type based on user ID patterns."""
         user_id_lower = user_id.lower()
@@ -368,16 +416,13 @@ class HealthcareMetricsCollector(MetricsCollector):
     def _check_phi_access_patterns(self, user_id: str) -> None:
         """Check for suspicious PHI access patterns."""
         # Check access rate in last hour
-        cutoff = datetime.now(UTC) - timedelta(hours=1)
-        recent_accesses = [
-            e for e in self._phi_access_events if e.user_id == user_id and e.timestamp >= cutoff
-        ]
+        recent_accesses = self._phi_access_aggregates.count(3600, "user", user_id)
 
-        if len(recent_accesses) > self._phi_access_rate_threshold:
+        if recent_accesses > self._phi_access_rate_threshold:
             self.record_compliance_event(
                 "excessive_phi_access",
                 ComplianceStatus.WARNING,
-                f"User {user_id} accessed PHI {len(recent_accesses)} times in the last hour",
+                f"User {user_id} accessed PHI {recent_accesses} times in the last hour",
                 risk_level="high",
             )
 
@@ -452,20 +497,14 @@ class HealthcareMetricsCollector(MetricsCollector):
                 recommended_actions=event.remediation_steps,
             )
 
-    def _calculate_compliance_score(self, events: list[ComplianceEvent]) -> float:
-        """Calculate compliance score based on recent events."""
-        if not events:
-            return 100.0
-
-        total_score = 100.0
-
-        for event in events:
-            if event.status == ComplianceStatus.CRITICAL_VIOLATION:
-                total_score -= 20.0
-            elif event.status == ComplianceStatus.VIOLATION:
-                total_score -= 10.0
-            elif event.status == ComplianceStatus.WARNING:
-                total_score -= 2.0
+    def _calculate_compliance_score(self, by_status: dict[str, int]) -> float:
+        """Calculate compliance score from recent event counts per status."""
+        total_score = (
+            100.0
+            - 20.0 * by_status.get(ComplianceStatus.CRITICAL_VIOLATION.value, 0)
+            - 10.0 * by_status.get(ComplianceStatus.VIOLATION.value, 0)
+            - 2.0 * by_status.get(ComplianceStatus.WARNING.value, 0)
+        )
 
         return max(0.0, total_score)
 
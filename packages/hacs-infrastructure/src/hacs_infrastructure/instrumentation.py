@@ -0,0 +1,390 @@
+"""Lightweight span instrumentation for HACS hot paths.
+
+Persistence CRUD, tool execution, extraction, vector search and MCP request
+handling open spans through this module. While instrumentation is disabled
+``start_span`` returns a shared no-op span and ``traced`` calls straight
+through, so instrumented code pays a single flag check.
+
+When enabled, finished spans are aggregated in process by
+``SpanStatsExporter`` (latency percentiles, self time, rows and bytes per
+operation) and, if an OpenTelemetry tracer is supplied, mirrored to it.
+
+Example:
+    >>> exporter = enable_instrumentation()
+    >>> with start_span("persistence.read", resource_type="Patient") as span:
+    ...     span.set_attribute("rows", 1)
+    >>> exporter.report()["persistence.read"]["count"]
+    1
+"""
+
+import functools
+import inspect
+import itertools
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any
+
+
+class _NoOpSpan:
+    """Span returned while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoOpSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+    def set_attributes(self, **attributes: Any) -> None:
+        """Ignore the attributes."""
+
+    def set_error(self, error: str) -> None:
+        """Ignore the error."""
+
+
+NOOP_SPAN = _NoOpSpan()
+
+_current_span: ContextVar["Span | None"] = ContextVar("hacs_current_span", default=None)
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """Timed unit of work with attributes.
+
+    ``rows`` and ``bytes`` attributes are summed per operation by the
+    exporter; other attributes are kept on recent spans for inspection.
+    """
+
+    __slots__ = (
+        "_otel_context",
+        "_token",
+        "attributes",
+        "child_seconds",
+        "duration_seconds",
+        "error",
+        "name",
+        "parent_id",
+        "span_id",
+        "started",
+        "trace_id",
+    )
+
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.span_id = next(_span_ids)
+        self.parent_id: int | None = None
+        self.trace_id = self.span_id
+        self.started = 0.0
+        self.duration_seconds = 0.0
+        self.child_seconds = 0.0
+        self.error: str | None = None
+        self._token = None
+        self._otel_context = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set one attribute on the span."""
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        """Set several attributes on the span."""
+        self.attributes.update(attributes)
+
+    def set_error(self, error: str) -> None:
+        """Mark the span failed without an exception, e.g. for error results."""
+        self.error = error
+
+    @property
+    def self_seconds(self) -> float:
+        """Time spent in this span outside its child spans."""
+        return max(self.duration_seconds - self.child_seconds, 0.0)
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        if parent is not None:
+            self.parent_id = parent.span_id
+            self.trace_id = parent.trace_id
+        self._token = _current_span.set(self)
+
+        if _otel_tracer is not None:
+            self._otel_context = _otel_tracer.start_as_current_span(self.name)
+            self._otel_context.__enter__()
+
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration_seconds = time.perf_counter() - self.started
+        if exc_type is not None:
+            self.error = exc_type.__name__
+
+        _current_span.reset(self._token)
+        parent = _current_span.get()
+        if parent is not None:
+            parent.child_seconds += self.duration_seconds
+
+        if self._otel_context is not None:
+            self._export_to_otel(exc)
+            self._otel_context.__exit__(exc_type, exc, tb)
+
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export(self)
+        return False
+
+    def _export_to_otel(self, exc: BaseException | None) -> None:
+        """Copy attributes to the mirrored OpenTelemetry span."""
+        from opentelemetry import trace
+
+        otel_span = trace.get_current_span()
+        for key, value in self.attributes.items():
+            if isinstance(value, str | bool | int | float):
+                otel_span.set_attribute(key, value)
+        if exc is not None:
+            otel_span.record_exception(exc)
+
+
+class _OperationStats:
+    """Aggregated measurements for one operation name."""
+
+    __slots__ = (
+        "bytes",
+        "count",
+        "errors",
+        "max_seconds",
+        "rows",
+        "samples",
+        "self_seconds",
+        "total_seconds",
+    )
+
+    def __init__(self, sample_size: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.self_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.samples: deque[float] = deque(maxlen=sample_size)
+
+
+class SpanStatsExporter:
+    """In-process exporter aggregating span latency per operation.
+
+    Percentiles are computed from the most recent ``sample_size`` durations
+    of each operation; counts and totals cover every span since the last
+    reset.
+    """
+
+    def __init__(self, sample_size: int = 1024, max_recent_spans: int = 1000) -> None:
+        """Initialize exporter.
+
+        Args:
+            sample_size: Durations kept per operation for percentiles
+            max_recent_spans: Finished spans kept for trace inspection
+        """
+        self.sample_size = sample_size
+        self._operations: dict[str, _OperationStats] = {}
+        self._recent: deque[dict[str, Any]] = deque(maxlen=max_recent_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Fold a finished span into the aggregates."""
+        rows = span.attributes.get("rows")
+        size = span.attributes.get("bytes")
+        with self._lock:
+            stats = self._operations.get(span.name)
+            if stats is None:
+                stats = self._operations[span.name] = _OperationStats(self.sample_size)
+            stats.count += 1
+            stats.total_seconds += span.duration_seconds
+            stats.self_seconds += span.self_seconds
+            stats.max_seconds = max(stats.max_seconds, span.duration_seconds)
+            stats.samples.append(span.duration_seconds)
+            if span.error:
+                stats.errors += 1
+            if isinstance(rows, int):
+                stats.rows += rows
+            if isinstance(size, int):
+                stats.bytes += size
+            self._recent.append(
+                {
+                    "name": span.name,
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "duration_ms": span.duration_seconds * 1000,
+                    "self_ms": span.self_seconds * 1000,
+                    "error": span.error,
+                    "attributes": dict(span.attributes),
+                }
+            )
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """Latency summary per operation, slowest total time first."""
+        with self._lock:
+            snapshot = [
+                (name, stats, sorted(stats.samples)) for name, stats in self._operations.items()
+            ]
+
+        report = {}
+        for name, stats, samples in sorted(snapshot, key=lambda item: -item[1].total_seconds):
+            report[name] = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "total_ms": round(stats.total_seconds * 1000, 3),
+                "self_ms": round(stats.self_seconds * 1000, 3),
+                "mean_ms": round(stats.total_seconds * 1000 / stats.count, 3),
+                "p50_ms": round(_percentile(samples, 0.50) * 1000, 3),
+                "p95_ms": round(_percentile(samples, 0.95) * 1000, 3),
+                "p99_ms": round(_percentile(samples, 0.99) * 1000, 3),
+                "max_ms": round(stats.max_seconds * 1000, 3),
+                "rows": stats.rows,
+                "bytes": stats.bytes,
+            }
+        return report
+
+    def get_trace(self, trace_id: int) -> list[dict[str, Any]]:
+        """Recent spans belonging to one trace, in completion order."""
+        with self._lock:
+            return [span for span in self._recent if span["trace_id"] == trace_id]
+
+    def recent_spans(self, limit: int = 100) -> list[dict[str, Any]]:
+        """Most recently finished spans, newest last."""
+        with self._lock:
+            return list(self._recent)[-limit:]
+
+    def reset(self) -> None:
+        """Drop all aggregates and recent spans."""
+        with self._lock:
+            self._operations.clear()
+            self._recent.clear()
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))
+    return samples[index]
+
+
+# Instrumentation is enabled while an exporter is installed
+_exporter: SpanStatsExporter | None = None
+_otel_tracer: Any = None
+
+
+def enable_instrumentation(
+    exporter: SpanStatsExporter | None = None, otel_tracer: Any = None
+) -> SpanStatsExporter:
+    """Start recording spans.
+
+    Args:
+        exporter: Exporter receiving finished spans, created if omitted
+        otel_tracer: Optional OpenTelemetry tracer that spans are mirrored to
+
+    Returns:
+        The active exporter
+    """
+    global _exporter, _otel_tracer
+    _exporter = exporter or _exporter or SpanStatsExporter()
+    _otel_tracer = otel_tracer
+    return _exporter
+
+
+def disable_instrumentation() -> None:
+    """Stop recording spans; instrumented code falls back to no-op spans."""
+    global _exporter, _otel_tracer
+    _exporter = None
+    _otel_tracer = None
+
+
+def is_instrumentation_enabled() -> bool:
+    """Whether spans are currently recorded."""
+    return _exporter is not None
+
+
+def get_span_exporter() -> SpanStatsExporter | None:
+    """The active exporter, or ``None`` while instrumentation is disabled."""
+    return _exporter
+
+
+def start_span(name: str, **attributes: Any) -> Span | _NoOpSpan:
+    """Open a span as a context manager.
+
+    Args:
+        name: Operation name, e.g. ``"persistence.save"``
+        **attributes: Initial span attributes
+
+    Returns:
+        A recording span, or the shared no-op span while disabled
+    """
+    if _exporter is None:
+        return NOOP_SPAN
+    return Span(name, attributes)
+
+
+def current_span() -> Span | _NoOpSpan:
+    """The innermost open span, or the no-op span if there is none."""
+    if _exporter is None:
+        return NOOP_SPAN
+    return _current_span.get() or NOOP_SPAN
+
+
+def traced(name: str | None = None, **attributes: Any) -> Callable:
+    """Decorator wrapping a sync or async function in a span.
+
+    Args:
+        name: Operation name, defaults to the function's qualified name
+        **attributes: Static span attributes
+
+    Returns:
+        Decorator; the wrapped function can annotate its span via ``current_span()``
+    """
+
+    def decorator(func: Callable) -> Callable:
+        operation = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _exporter is None:
+                    return await func(*args, **kwargs)
+                with Span(operation, dict(attributes)):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with Span(operation, dict(attributes)):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "NOOP_SPAN",
+    "Span",
+    "SpanStatsExporter",
+    "current_span",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "get_span_exporter",
+    "is_instrumentation_enabled",
+    "start_span",
+    "traced",
+]
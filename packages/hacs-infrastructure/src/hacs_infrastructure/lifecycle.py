@@ -64,6 +64,8 @@ class ServiceLifecycle:
         self._error: Exception | None = None
         self._started_at: float | None = None
         self._stopped_at: float | None = None
+        self._startup_duration: float | None = None
+        self._shutdown_duration: float | None = None
         self._lock = threading.RLock()
 
         # Lifecycle callbacks
@@ -88,6 +90,16 @@ class ServiceLifecycle:
             return None
         return time.time() - self._started_at
 
+    @property
+    def startup_duration(self) -> float | None:
+        """Get duration of the last startup in seconds."""
+        return self._startup_duration
+
+    @property
+    def shutdown_duration(self) -> float | None:
+        """Get duration of the last shutdown in seconds."""
+        return self._shutdown_duration
+
     def add_startup_callback(self, callback: Callable[[], None]) -> None:
         """Add startup callback."""
         self._startup_callbacks.append(callback)
@@ -106,6 +118,7 @@ class ServiceLifecycle:
             self._state = LifecycleState.STARTING
             self._error = None
 
+        began = time.perf_counter()
         try:
             logger.info(f"Starting service: {self.name}")
 
@@ -120,24 +133,24 @@ class ServiceLifecycle:
             if hasattr(self.service, "start") and callable(self.service.start):
                 await asyncio.wait_for(self.service.start(), timeout=self.startup_timeout)
 
+            # Dependents are released as soon as start() returns, so the
+            # service is marked running without an extra settle delay
             with self._lock:
-                self._state = LifecycleState.STARTED
+                self._state = LifecycleState.RUNNING
                 self._started_at = time.time()
+                self._startup_duration = time.perf_counter() - began
 
-            # Wait a moment then mark as running if no errors
-            await asyncio.sleep(0.1)
-
-            with self._lock:
-                if self._state == LifecycleState.STARTED:
-                    self._state = LifecycleState.RUNNING
-
-            logger.info(f"Service started successfully: {self.name}")
+            logger.info(
+                f"Service started successfully: {self.name} "
+                f"({self._startup_duration * 1000:.1f}ms)"
+            )
 
         except Exception as e:
             logger.exception(f"Failed to start service {self.name}: {e}")
             with self._lock:
                 self._state = LifecycleState.FAILED
                 self._error = e
+                self._startup_duration = time.perf_counter() - began
             raise
 
     async def stop(self) -> None:
@@ -152,6 +165,7 @@ class ServiceLifecycle:
 
             self._state = LifecycleState.STOPPING
 
+        began = time.perf_counter()
         try:
             logger.info(f"Stopping service: {self.name}")
 
@@ -176,6 +190,7 @@ class ServiceLifecycle:
             with self._lock:
                 self._state = LifecycleState.STOPPED
                 self._stopped_at = time.time()
+                self._shutdown_duration = time.perf_counter() - began
 
             logger.info(f"Service stopped successfully: {self.name}")
 
@@ -205,6 +220,9 @@ class ServiceLifecycle:
             if self._stopped_at:
                 status["stopped_at"] = self._stopped_at
 
+            if self._startup_duration is not None:
+                status["startup_ms"] = self._startup_duration * 1000
+
             return status
 
 
@@ -217,6 +235,7 @@ class StartupManager:
         """Initialize startup manager."""
         self._services: dict[str, ServiceLifecycle] = {}
         self._startup_order: list[str] = []
+        self._last_startup: dict[str, Any] | None = None
         self._lock = threading.RLock()
 
     def add_service(self, service_lifecycle: ServiceLifecycle) -> None:
@@ -272,11 +291,31 @@ class StartupManager:
 
         return order
 
-    async def start_all(self, parallel: bool = True) -> None:
+    def _dependency_graph(
+        self, services: dict[str, ServiceLifecycle]
+    ) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+        """Build dependency and dependent maps restricted to known services."""
+        dependencies = {
+            name: {dep for dep in service.dependencies if dep in services and dep != name}
+            for name, service in services.items()
+        }
+        dependents: dict[str, set[str]] = {name: set() for name in services}
+        for name, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].add(name)
+        return dependencies, dependents
+
+    async def start_all(self, parallel: bool = True, timeout: float | None = None) -> None:
         """Start all services in dependency order.
 
+        With ``parallel`` enabled each service starts as soon as its own
+        dependencies are running rather than waiting for a whole wave. If a
+        service fails, no further services are started; services already
+        starting are allowed to finish before the error is raised.
+
         Args:
             parallel: Whether to start independent services in parallel
+            timeout: Optional overall startup deadline in seconds
         """
         logger.info("Starting all services...")
 
@@ -284,46 +323,114 @@ class StartupManager:
             startup_order = self._startup_order.copy()
             services = self._services.copy()
 
-        if not parallel:
-            # Sequential startup
-            for service_name in startup_order:
-                service = services.get(service_name)
-                if service:
-                    await service.start()
-        else:
-            # Parallel startup with dependency respect
-            started = set()
-            remaining = set(startup_order)
-
-            while remaining:
-                # Find services that can be started (dependencies satisfied)
-                ready_to_start = []
-                for service_name in remaining:
-                    service = services[service_name]
-                    dependencies_satisfied = all(
-                        dep in started or dep not in services for dep in service.dependencies
-                    )
-                    if dependencies_satisfied:
-                        ready_to_start.append(service_name)
-
-                if not ready_to_start:
-                    msg = "Cannot resolve service dependencies"
-                    raise RuntimeError(msg)
-
-                # Start ready services in parallel
-                tasks = []
-                for service_name in ready_to_start:
-                    service = services[service_name]
-                    tasks.append(service.start())
-
-                await asyncio.gather(*tasks)
-
-                # Update state
-                for service_name in ready_to_start:
-                    started.add(service_name)
-                    remaining.remove(service_name)
-
-        logger.info("All services started successfully")
+        began = time.perf_counter()
+        timings: dict[str, tuple[float, float]] = {}
+
+        async def start_one(name: str) -> None:
+            started = time.perf_counter()
+            try:
+                await services[name].start()
+            finally:
+                timings[name] = (started - began, time.perf_counter() - began)
+
+        try:
+            if not parallel:
+                # Sequential startup
+                async def start_sequentially() -> None:
+                    for service_name in startup_order:
+                        await start_one(service_name)
+
+                await asyncio.wait_for(start_sequentially(), timeout=timeout)
+            else:
+                await asyncio.wait_for(self._start_eagerly(services, start_one), timeout=timeout)
+        finally:
+            self._last_startup = self._build_startup_report(services, timings, began)
+
+        logger.info(
+            f"All services started successfully in {self._last_startup['total_ms']:.1f}ms "
+            f"(critical path: {' -> '.join(self._last_startup['critical_path'])})"
+        )
+
+    async def _start_eagerly(
+        self,
+        services: dict[str, ServiceLifecycle],
+        start_one: Callable[[str], Any],
+    ) -> None:
+        """Start each service the moment its dependencies are running."""
+        dependencies, dependents = self._dependency_graph(services)
+        waiting = {name: len(deps) for name, deps in dependencies.items()}
+        pending: dict[asyncio.Task, str] = {}
+        failure: BaseException | None = None
+
+        def launch(name: str) -> None:
+            pending[asyncio.create_task(start_one(name))] = name
+
+        for name, count in waiting.items():
+            if count == 0:
+                launch(name)
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = pending.pop(task)
+                    if task.exception() is not None:
+                        failure = failure or task.exception()
+                        continue
+                    if failure is not None:
+                        continue
+                    for dependent in dependents[name]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            launch(dependent)
+        except asyncio.CancelledError:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+
+        if failure is not None:
+            raise failure
+
+    def _build_startup_report(
+        self,
+        services: dict[str, ServiceLifecycle],
+        timings: dict[str, tuple[float, float]],
+        began: float,
+    ) -> dict[str, Any]:
+        """Summarize per-service timing and the critical startup path."""
+        dependencies, _ = self._dependency_graph(services)
+
+        # Walk back from the last service to finish through the dependency
+        # that released it, i.e. the one that finished last
+        critical_path: list[str] = []
+        current = max(timings, key=lambda name: timings[name][1], default=None)
+        while current is not None:
+            critical_path.append(current)
+            finished = [dep for dep in dependencies[current] if dep in timings]
+            current = max(finished, key=lambda dep: timings[dep][1], default=None)
+        critical_path.reverse()
+
+        return {
+            "total_ms": (time.perf_counter() - began) * 1000,
+            "services": {
+                name: {
+                    "started_at_ms": start * 1000,
+                    "finished_at_ms": end * 1000,
+                    "duration_ms": (end - start) * 1000,
+                    "state": services[name].state.value,
+                }
+                for name, (start, end) in timings.items()
+            },
+            "critical_path": critical_path,
+            "critical_path_ms": sum(
+                (timings[name][1] - timings[name][0]) * 1000 for name in critical_path
+            ),
+        }
+
+    def get_startup_report(self) -> dict[str, Any] | None:
+        """Get timing report of the last start_all() run."""
+        return self._last_startup
 
     def get_startup_status(self) -> dict[str, Any]:
         """Get startup status of all services."""
@@ -333,6 +440,7 @@ class StartupManager:
                     name: service.get_status() for name, service in self._services.items()
                 },
                 "startup_order": self._startup_order,
+                "last_startup": self._last_startup,
             }
 
 
@@ -350,11 +458,15 @@ class ShutdownManager:
         self._startup_manager = startup_manager
         self._shutdown_timeout = 60.0
 
-    async def shutdown_all(self, timeout: float | None = None) -> None:
+    async def shutdown_all(self, timeout: float | None = None, parallel: bool = True) -> None:
         """Shutdown all services in reverse dependency order.
 
+        With ``parallel`` enabled a service stops as soon as every service
+        depending on it has stopped, so independent branches stop together.
+
         Args:
             timeout: Total shutdown timeout
+            parallel: Whether to stop independent services in parallel
         """
         shutdown_timeout = timeout or self._shutdown_timeout
         logger.info(f"Shutting down all services (timeout: {shutdown_timeout}s)")
@@ -366,25 +478,48 @@ class ShutdownManager:
 
         start_time = time.time()
 
-        for service_name in shutdown_order:
-            service = services.get(service_name)
-            if service and service.is_running:
-                try:
-                    remaining_time = shutdown_timeout - (time.time() - start_time)
-                    if remaining_time <= 0:
-                        logger.warning(f"Shutdown timeout exceeded, forcing stop of {service_name}")
-                        break
+        async def stop_one(service_name: str) -> None:
+            service = services[service_name]
+            if not service.is_running:
+                return
+            try:
+                remaining_time = shutdown_timeout - (time.time() - start_time)
+                if remaining_time <= 0:
+                    logger.warning(f"Shutdown timeout exceeded, forcing stop of {service_name}")
+                    return
 
-                    # Use the minimum of remaining time and service shutdown timeout
-                    service_timeout = min(remaining_time, service.shutdown_timeout)
-                    await asyncio.wait_for(service.stop(), timeout=service_timeout)
+                # Use the minimum of remaining time and service shutdown timeout
+                service_timeout = min(remaining_time, service.shutdown_timeout)
+                await asyncio.wait_for(service.stop(), timeout=service_timeout)
 
-                except TimeoutError:
-                    logger.exception(f"Service {service_name} shutdown timed out")
-                except Exception as e:
-                    logger.exception(f"Error shutting down service {service_name}: {e}")
+            except TimeoutError:
+                logger.exception(f"Service {service_name} shutdown timed out")
+            except Exception as e:
+                logger.exception(f"Error shutting down service {service_name}: {e}")
+
+        if not parallel:
+            for service_name in shutdown_order:
+                await stop_one(service_name)
+        else:
+            # Dependents must stop before the services they rely on
+            dependencies, dependents = self._startup_manager._dependency_graph(services)
+            waiting = {name: len(users) for name, users in dependents.items()}
+            pending: dict[asyncio.Task, str] = {
+                asyncio.create_task(stop_one(name)): name
+                for name, count in waiting.items()
+                if count == 0
+            }
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = pending.pop(task)
+                    for dependency in dependencies[name]:
+                        waiting[dependency] -= 1
+                        if waiting[dependency] == 0:
+                            pending[asyncio.create_task(stop_one(dependency))] = dependency
 
-        logger.info("Service shutdown completed")
+        logger.info(f"Service shutdown completed in {time.time() - start_time:.2f}s")
 
 
 class GracefulShutdown:
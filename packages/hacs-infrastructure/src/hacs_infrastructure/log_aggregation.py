@@ -19,14 +19,15 @@ Version: 1.0.0
 
 import asyncio
 import logging
-import re
-from collections import defaultdict, deque
+from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from .log_store import LogStore, PatternMatcher
+
 
 class LogSeverity(str, Enum):
     """Log severity levels for analysis."""
@@ -134,10 +135,19 @@ class LogCorrelation:
 
 
 class LogAggregator:
-    """Centralized log aggregation system."""
+    """Centralized log aggregation system.
+
+    Entries are kept in a ``LogStore``: time-partitioned segments with token
+    and field inverted indexes, bounded by ``buffer_size`` and evicted once
+    older than ``retention_days``.
+    """
 
     def __init__(
-        self, buffer_size: int = 10000, flush_interval_seconds: int = 30, retention_days: int = 30
+        self,
+        buffer_size: int = 10000,
+        flush_interval_seconds: int = 30,
+        retention_days: int = 30,
+        segment_minutes: int = 60,
     ) -> None:
         """Initialize log aggregator."""
         self.buffer_size = buffer_size
@@ -145,12 +155,16 @@ class LogAggregator:
         self.retention_days = retention_days
 
         # Log storage
-        self._log_buffer: deque = deque(maxlen=buffer_size)
-        self._log_index: dict[str, list[LogEntry]] = defaultdict(list)
+        self._store = LogStore(
+            max_entries=buffer_size,
+            retention_seconds=retention_days * 86400,
+            segment_seconds=segment_minutes * 60,
+        )
         self._correlation_cache: dict[str, LogCorrelation] = {}
 
         # Pattern matching
         self._patterns: list[LogPattern] = []
+        self._pattern_matcher: PatternMatcher | None = None
         self._pattern_matches: dict[str, int] = defaultdict(int)
 
         # Streaming subscribers
@@ -228,6 +242,11 @@ class LogAggregator:
 
         self._patterns.extend(patterns)
 
+    def add_pattern(self, pattern: LogPattern) -> None:
+        """Register an additional log pattern."""
+        self._patterns.append(pattern)
+        self._pattern_matcher = None
+
     async def start(self) -> None:
         """Start log aggregation."""
         if self._running:
@@ -275,21 +294,7 @@ class LogAggregator:
             **kwargs,
         )
 
-        # Add to buffer
-        self._log_buffer.append(entry)
-
-        # Index for correlation
-        self._index_log_entry(entry)
-
-        # Pattern matching
-        self._match_patterns(entry)
-
-        # Notify stream subscribers
-        for subscriber in self._stream_subscribers:
-            try:
-                subscriber(entry)
-            except Exception as e:
-                self.logger.exception(f"Error notifying subscriber: {e}")
+        self._ingest(entry)
 
     def add_structured_log(self, log_data: dict[str, Any]) -> None:
         """Add structured log data."""
@@ -334,55 +339,80 @@ class LogAggregator:
                 },
             )
 
-            # Add to buffer
-            self._log_buffer.append(entry)
-            self._index_log_entry(entry)
-            self._match_patterns(entry)
-
-            # Notify subscribers
-            for subscriber in self._stream_subscribers:
-                try:
-                    subscriber(entry)
-                except Exception as e:
-                    self.logger.exception(f"Error notifying subscriber: {e}")
+            self._ingest(entry)
 
         except Exception as e:
             self.logger.exception(f"Error processing structured log: {e}")
 
-    def _index_log_entry(self, entry: LogEntry) -> None:
-        """Index log entry for correlation."""
-        # Index by various correlation fields
+    def _ingest(self, entry: LogEntry) -> None:
+        """Match, index and store an entry, then notify stream subscribers."""
+        # Pattern matching runs first so pattern tags are indexed too
+        self._match_patterns(entry)
+
+        keys = self._correlation_keys(entry)
+        for key in keys:
+            self._correlation_cache.pop(key, None)
+
+        keys.append(f"level:{entry.level.value}")
+        keys.append(f"service:{entry.service}")
+        keys.extend(f"tag:{tag}" for tag in entry.tags)
+        self._store.add(entry, keys)
+
+        # Notify stream subscribers
+        for subscriber in self._stream_subscribers:
+            try:
+                subscriber(entry)
+            except Exception as e:
+                self.logger.exception(f"Error notifying subscriber: {e}")
+
+    def _correlation_keys(self, entry: LogEntry) -> list[str]:
+        """Get index keys for the correlation fields set on an entry."""
+        keys = []
         if entry.trace_id:
-            self._log_index[f"trace:{entry.trace_id}"].append(entry)
+            keys.append(f"trace_id:{entry.trace_id}")
         if entry.session_id:
-            self._log_index[f"session:{entry.session_id}"].append(entry)
+            keys.append(f"session_id:{entry.session_id}")
         if entry.user_id:
-            self._log_index[f"user:{entry.user_id}"].append(entry)
+            keys.append(f"user_id:{entry.user_id}")
         if entry.patient_id_hash:
-            self._log_index[f"patient:{entry.patient_id_hash}"].append(entry)
+            keys.append(f"patient_id_hash:{entry.patient_id_hash}")
         if entry.workflow_type:
-            self._log_index[f"workflow:{entry.workflow_type}"].append(entry)
+            keys.append(f"workflow_type:{entry.workflow_type}")
         if entry.ip_address:
-            self._log_index[f"ip:{entry.ip_address}"].append(entry)
+            keys.append(f"ip_address:{entry.ip_address}")
         if entry.organization:
-            self._log_index[f"org:{entry.organization}"].append(entry)
+            keys.append(f"organization:{entry.organization}")
+        return keys
 
     def _match_patterns(self, entry: LogEntry) -> None:
         """Match log entry against known patterns."""
-        full_text = f"{entry.message} {' '.join(entry.extra_fields.values() if isinstance(v, str) else str(v) for v in entry.extra_fields.values())}"
+        if self._pattern_matcher is None or len(self._pattern_matcher.patterns) != len(
+            self._patterns
+        ):
+            self._pattern_matcher = PatternMatcher(self._patterns)
+
+        if entry.extra_fields:
+            extra_text = " ".join(
+                v if isinstance(v, str) else str(v) for v in entry.extra_fields.values()
+            )
+            full_text = f"{entry.message} {extra_text}"
+        else:
+            full_text = entry.message
 
-        for pattern in self._patterns:
-            if re.search(pattern.pattern, full_text, re.IGNORECASE):
-                self._pattern_matches[pattern.name] += 1
+        for pattern in self._pattern_matcher.match(full_text):
+            self._pattern_matches[pattern.name] += 1
 
-                # Add pattern tags
-                if pattern.tags:
-                    entry.tags.extend(pattern.tags)
-                    entry.tags = list(set(entry.tags))  # Remove duplicates
+            # Add pattern tags
+            if pattern.tags:
+                entry.tags = list(set(entry.tags).union(pattern.tags))
 
-                # Execute action if defined
-                if pattern.action:
-                    asyncio.create_task(self._execute_pattern_action(pattern, entry))
+            # Execute action if defined (only when an event loop is running)
+            if pattern.action:
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    continue
+                asyncio.create_task(self._execute_pattern_action(pattern, entry))
 
     async def _execute_pattern_action(self, pattern: LogPattern, entry: LogEntry) -> None:
         """Execute action for matched pattern."""
@@ -419,15 +449,9 @@ class LogAggregator:
         if correlation_key in self._correlation_cache:
             return self._correlation_cache[correlation_key]
 
-        # Get correlated entries
-        entries = self._log_index.get(correlation_key, [])
-        if not entries:
-            return None
-
-        # Filter by time window
-        now = datetime.now(UTC)
-        cutoff = now - timedelta(minutes=time_window_minutes)
-        recent_entries = [e for e in entries if e.timestamp >= cutoff]
+        # Get correlated entries within the time window
+        cutoff = datetime.now(UTC) - timedelta(minutes=time_window_minutes)
+        recent_entries = self._store.lookup(correlation_key, start_time=cutoff)
 
         if not recent_entries:
             return None
@@ -471,56 +495,44 @@ class LogAggregator:
         tags: list[str] | None = None,
         limit: int = 100,
     ) -> list[LogEntry]:
-        """Search logs with filters."""
-        results = []
-
-        for entry in reversed(list(self._log_buffer)):  # Most recent first
-            # Apply filters
-            if level and entry.level != level:
-                continue
-            if service and entry.service != service:
-                continue
-            if start_time and entry.timestamp < start_time:
-                continue
-            if end_time and entry.timestamp > end_time:
-                continue
-            if tags and not any(tag in entry.tags for tag in tags):
-                continue
-            if query and query.lower() not in entry.message.lower():
-                continue
-
-            results.append(entry)
-
-            if len(results) >= limit:
-                break
-
-        return results
+        """Search logs with filters, most recent first.
+
+        Query words narrow candidates through the token index (partial words
+        match inside indexed words) and are confirmed with a case-insensitive
+        substring check on the message.
+        """
+        return self._store.search(
+            query=query,
+            level=level,
+            service=service,
+            start_time=start_time,
+            end_time=end_time,
+            tags=tags,
+            limit=limit,
+        )
 
     def get_log_statistics(self, hours: int = 24) -> dict[str, Any]:
         """Get log statistics for specified time period."""
         cutoff = datetime.now(UTC) - timedelta(hours=hours)
-        recent_logs = [e for e in self._log_buffer if e.timestamp >= cutoff]
-
-        # Count by level
-        level_counts = defaultdict(int)
-        service_counts = defaultdict(int)
-        hourly_counts = defaultdict(int)
-
-        for entry in recent_logs:
-            level_counts[entry.level.value] += 1
-            service_counts[entry.service] += 1
-            hour_key = entry.timestamp.strftime("%Y-%m-%d %H:00")
-            hourly_counts[hour_key] += 1
+        counts = self._store.stats(start_time=cutoff)
+        level_counts = counts["by_level"]
+        service_counts = counts["by_service"]
+        total_logs = sum(level_counts.values())
+
+        hourly_counts = {
+            datetime.fromtimestamp(hour * 3600, UTC).strftime("%Y-%m-%d %H:00"): count
+            for hour, count in sorted(counts["by_hour"].items())
+        }
 
         return {
-            "total_logs": len(recent_logs),
+            "total_logs": total_logs,
             "time_period_hours": hours,
             "by_level": dict(level_counts),
             "by_service": dict(service_counts),
-            "hourly_distribution": dict(hourly_counts),
+            "hourly_distribution": hourly_counts,
             "pattern_matches": dict(self._pattern_matches),
-            "error_rate": level_counts.get("error", 0) / max(len(recent_logs), 1) * 100,
-            "top_services": sorted(service_counts.items(), key=lambda x: x[1], reverse=True)[:10],
+            "error_rate": level_counts.get("error", 0) / max(total_logs, 1) * 100,
+            "top_services": service_counts.most_common(10),
         }
 
     def subscribe_to_stream(self, callback: Callable[[LogEntry], None]) -> None:
@@ -570,12 +582,12 @@ class LogAggregator:
 
     async def _flush_logs(self) -> None:
         """Flush logs to persistent storage."""
-        if not self._log_buffer:
+        if not self._store:
             return
 
         # In a real implementation, this would write to a database or file system
         # For now, we'll just log the flush operation
-        log_count = len(self._log_buffer)
+        log_count = len(self._store)
         self.logger.debug(f"Flushing {log_count} log entries to storage")
 
     async def _cleanup_loop(self) -> None:
@@ -593,11 +605,8 @@ class LogAggregator:
         """Clean up old logs and correlations."""
         cutoff = datetime.now(UTC) - timedelta(days=self.retention_days)
 
-        # Clean up log index
-        for key, entries in list(self._log_index.items()):
-            self._log_index[key] = [e for e in entries if e.timestamp >= cutoff]
-            if not self._log_index[key]:
-                del self._log_index[key]
+        # Drop expired segments together with their indexes
+        self._store.evict_before(cutoff.timestamp())
 
         # Clean up correlation cache
         for key, correlation in list(self._correlation_cache.items()):
@@ -0,0 +1,431 @@
+"""Indexed, time-partitioned log store for HACS log aggregation.
+
+This module provides the storage engine behind ``LogAggregator``. Log entries
+are appended to time-partitioned segments; each segment keeps its timestamps
+in a compact column plus posting lists (token inverted index and field
+indexes such as level, service, tags and correlation keys). Searches walk
+segments newest first and intersect posting lists instead of scanning every
+message, and retention eviction drops whole segments.
+
+The token index is only a prefilter for the substring query: a query word that
+touches the start or end of the query may be part of a longer message word, so
+it is matched as a prefix, suffix or infix of the segment's indexed words.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .log_aggregation import LogEntry, LogPattern, LogSeverity
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def tokenize(text: str) -> set[str]:
+    """Split text into lowercase word tokens."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def query_terms(query: str) -> list[tuple[str, bool, bool]]:
+    """Split a lowercase substring query into index terms.
+
+    Returns:
+        ``(token, starts_word, ends_word)`` tuples; a flag is True when the
+        query has a non-word character on that side of the token, so any
+        message containing the query has a word starting (ending) there
+    """
+    terms = []
+    for match in _TOKEN_RE.finditer(query):
+        term = (match.group(), match.start() > 0, match.end() < len(query))
+        if term not in terms:
+            terms.append(term)
+    return terms
+
+
+def epoch_seconds(timestamp: datetime) -> float:
+    """Convert a timestamp to epoch seconds, treating naive values as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp.timestamp()
+
+
+class PatternMatcher:
+    """Precompiled matcher for a set of log patterns.
+
+    All patterns are joined into one alternation used as a prefilter, so the
+    common case of a log line matching nothing costs a single regex scan.
+    Only lines that hit the prefilter are checked against each pattern.
+    """
+
+    def __init__(self, patterns: list[LogPattern]) -> None:
+        """Compile the given patterns (case-insensitive)."""
+        self.patterns = list(patterns)
+        self._compiled = [re.compile(p.pattern, re.IGNORECASE) for p in self.patterns]
+        self._prefilter = (
+            re.compile("|".join(f"(?:{p.pattern})" for p in self.patterns), re.IGNORECASE)
+            if self.patterns
+            else None
+        )
+
+    def match(self, text: str) -> list[LogPattern]:
+        """Get every pattern that matches the text."""
+        if self._prefilter is None or self._prefilter.search(text) is None:
+            return []
+        return [
+            pattern
+            for pattern, compiled in zip(self.patterns, self._compiled, strict=True)
+            if compiled.search(text)
+        ]
+
+
+class LogSegment:
+    """Entries of one time partition with their column and posting lists.
+
+    Positions are assigned in append order. Entries evicted from the head are
+    released immediately and their positions skipped via ``start_offset``;
+    posting lists are compacted once most of the segment is dead.
+    """
+
+    __slots__ = (
+        "end_ts",
+        "entries",
+        "fields",
+        "hour_counts",
+        "key",
+        "level_counts",
+        "service_counts",
+        "start_offset",
+        "start_ts",
+        "timestamps",
+        "tokens",
+    )
+
+    def __init__(self, key: int, segment_seconds: int) -> None:
+        self.key = key
+        self.start_ts = float(key * segment_seconds)
+        self.end_ts = self.start_ts + segment_seconds
+        self.entries: list[LogEntry | None] = []
+        self.timestamps = array("d")
+        self.start_offset = 0
+        self.tokens: dict[str, array] = {}
+        self.fields: dict[str, array] = {}
+        self.level_counts: Counter[str] = Counter()
+        self.service_counts: Counter[str] = Counter()
+        self.hour_counts: Counter[int] = Counter()
+
+    @property
+    def live_count(self) -> int:
+        return len(self.entries) - self.start_offset
+
+    def append(self, entry: LogEntry, timestamp: float, keys: Iterable[str]) -> None:
+        position = len(self.entries)
+        self.entries.append(entry)
+        self.timestamps.append(timestamp)
+
+        for token in tokenize(entry.message):
+            postings = self.tokens.get(token)
+            if postings is None:
+                postings = self.tokens[token] = array("I")
+            postings.append(position)
+        for key in keys:
+            postings = self.fields.get(key)
+            if postings is None:
+                postings = self.fields[key] = array("I")
+            postings.append(position)
+
+        self.level_counts[entry.level.value] += 1
+        self.service_counts[entry.service] += 1
+        self.hour_counts[int(timestamp // 3600)] += 1
+
+    def trim_head(self, count: int) -> int:
+        """Evict up to ``count`` of the oldest appended live entries."""
+        count = min(count, self.live_count)
+        for position in range(self.start_offset, self.start_offset + count):
+            entry = self.entries[position]
+            self.entries[position] = None
+            self.level_counts[entry.level.value] -= 1
+            self.service_counts[entry.service] -= 1
+            self.hour_counts[int(self.timestamps[position] // 3600)] -= 1
+        self.start_offset += count
+
+        if self.start_offset > 1024 and self.start_offset * 2 > len(self.entries):
+            self._compact()
+        return count
+
+    def live_positions(self, postings: array) -> array | list[int]:
+        """Drop positions that were trimmed from the head."""
+        if not postings or postings[0] >= self.start_offset:
+            return postings
+        return postings[bisect_left(postings, self.start_offset) :]
+
+    def term_postings(self, term: str, starts_word: bool, ends_word: bool) -> Iterable[int] | None:
+        """Postings of every indexed word the query term can be part of.
+
+        A bounded term is an exact word; otherwise it is matched as a prefix,
+        suffix or infix of the segment's words.
+        """
+        if starts_word and ends_word:
+            return self.tokens.get(term)
+        if starts_word:
+            matches = [p for token, p in self.tokens.items() if token.startswith(term)]
+        elif ends_word:
+            matches = [p for token, p in self.tokens.items() if token.endswith(term)]
+        else:
+            matches = [p for token, p in self.tokens.items() if term in token]
+        if not matches:
+            return None
+        if len(matches) == 1:
+            return list(matches[0])
+        return sorted({position for postings in matches for position in postings})
+
+    def _compact(self) -> None:
+        shift = self.start_offset
+        self.entries = self.entries[shift:]
+        self.timestamps = self.timestamps[shift:]
+        for index in (self.tokens, self.fields):
+            for key, postings in list(index.items()):
+                first = bisect_left(postings, shift)
+                if first == len(postings):
+                    del index[key]
+                else:
+                    index[key] = array("I", (p - shift for p in postings[first:]))
+        self.start_offset = 0
+
+
+class LogStore:
+    """Time-partitioned log store with token and field inverted indexes."""
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        retention_seconds: float | None = None,
+        segment_seconds: int = 3600,
+    ) -> None:
+        """Initialize log store.
+
+        Args:
+            max_entries: Maximum live entries kept (oldest evicted first)
+            retention_seconds: Age after which whole segments are dropped
+            segment_seconds: Width of each time partition
+        """
+        self.max_entries = max_entries
+        self.retention_seconds = retention_seconds
+        self.segment_seconds = segment_seconds
+        self._segments: dict[int, LogSegment] = {}
+        self._segment_keys: list[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        """Iterate live entries from the oldest segment to the newest."""
+        for key in list(self._segment_keys):
+            segment = self._segments.get(key)
+            if segment is None:
+                continue
+            for entry in segment.entries[segment.start_offset :]:
+                if entry is not None:
+                    yield entry
+
+    def add(self, entry: LogEntry, keys: Iterable[str] = ()) -> None:
+        """Store an entry under its time partition.
+
+        Args:
+            entry: Log entry to store
+            keys: Field index keys (e.g. ``"level:error"``, ``"trace:abc"``)
+        """
+        timestamp = epoch_seconds(entry.timestamp)
+        key = int(timestamp // self.segment_seconds)
+        segment = self._segments.get(key)
+        if segment is None:
+            # Rolling over to a new partition is when retention is enforced
+            if self.retention_seconds is not None:
+                self.evict_before(timestamp - self.retention_seconds)
+            segment = self._segments[key] = LogSegment(key, self.segment_seconds)
+            self._segment_keys.insert(bisect_left(self._segment_keys, key), key)
+
+        segment.append(entry, timestamp, keys)
+        self._size += 1
+
+        if self.max_entries is not None and self._size > self.max_entries:
+            self._trim(self._size - self.max_entries)
+
+    def evict_before(self, cutoff_ts: float) -> int:
+        """Drop every segment that ends at or before ``cutoff_ts``.
+
+        Returns:
+            Number of entries evicted
+        """
+        evicted = 0
+        while self._segment_keys:
+            segment = self._segments[self._segment_keys[0]]
+            if segment.end_ts > cutoff_ts:
+                break
+            evicted += segment.live_count
+            self._drop_oldest_segment()
+        self._size -= evicted
+        return evicted
+
+    def search(
+        self,
+        query: str = "",
+        level: LogSeverity | None = None,
+        service: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        tags: list[str] | None = None,
+        limit: int = 100,
+    ) -> list[LogEntry]:
+        """Search entries, most recent first.
+
+        Query words are looked up in the token index (see ``query_terms``),
+        then candidates are confirmed with a case-insensitive substring check
+        against the message, so results are exactly the substring matches.
+        """
+        start_ts = epoch_seconds(start_time) if start_time else None
+        end_ts = epoch_seconds(end_time) if end_time else None
+        query_lower = query.lower()
+        terms = query_terms(query_lower)
+
+        results: list[LogEntry] = []
+        for key in reversed(self._segment_keys):
+            segment = self._segments[key]
+            if start_ts is not None and segment.end_ts <= start_ts:
+                break
+            if end_ts is not None and segment.start_ts > end_ts:
+                continue
+
+            for position in self._candidates(segment, terms, level, service, tags):
+                timestamp = segment.timestamps[position]
+                if start_ts is not None and timestamp < start_ts:
+                    continue
+                if end_ts is not None and timestamp > end_ts:
+                    continue
+                entry = segment.entries[position]
+                if query_lower and query_lower not in entry.message.lower():
+                    continue
+                results.append(entry)
+                if len(results) >= limit:
+                    return results
+        return results
+
+    def lookup(self, field_key: str, start_time: datetime | None = None) -> list[LogEntry]:
+        """Get every live entry indexed under a field key, oldest segment first."""
+        start_ts = epoch_seconds(start_time) if start_time else None
+        entries: list[LogEntry] = []
+        for key in self._segment_keys:
+            segment = self._segments[key]
+            if start_ts is not None and segment.end_ts <= start_ts:
+                continue
+            postings = segment.fields.get(field_key)
+            if not postings:
+                continue
+            for position in segment.live_positions(postings):
+                if start_ts is None or segment.timestamps[position] >= start_ts:
+                    entries.append(segment.entries[position])
+        return entries
+
+    def stats(self, start_time: datetime | None = None) -> dict[str, Counter]:
+        """Count live entries by level, service and hour since ``start_time``.
+
+        Segments entirely inside the window are answered from their counters;
+        only a segment straddling the window start is scanned.
+        """
+        start_ts = epoch_seconds(start_time) if start_time else None
+        by_level: Counter[str] = Counter()
+        by_service: Counter[str] = Counter()
+        by_hour: Counter[int] = Counter()
+
+        for key in self._segment_keys:
+            segment = self._segments[key]
+            if start_ts is not None and segment.end_ts <= start_ts:
+                continue
+            if start_ts is None or segment.start_ts >= start_ts:
+                by_level.update(segment.level_counts)
+                by_service.update(segment.service_counts)
+                by_hour.update(segment.hour_counts)
+                continue
+            for position in range(segment.start_offset, len(segment.entries)):
+                timestamp = segment.timestamps[position]
+                if timestamp < start_ts:
+                    continue
+                entry = segment.entries[position]
+                by_level[entry.level.value] += 1
+                by_service[entry.service] += 1
+                by_hour[int(timestamp // 3600)] += 1
+
+        return {
+            "by_level": +by_level,
+            "by_service": +by_service,
+            "by_hour": +by_hour,
+        }
+
+    def _candidates(
+        self,
+        segment: LogSegment,
+        terms: list[tuple[str, bool, bool]],
+        level: LogSeverity | None,
+        service: str | None,
+        tags: list[str] | None,
+    ) -> Iterable[int]:
+        """Positions matching the indexed filters, newest first."""
+        required: list = []
+        if level is not None:
+            required.append(segment.fields.get(f"level:{level.value}"))
+        if service is not None:
+            required.append(segment.fields.get(f"service:{service}"))
+        required.extend(segment.term_postings(*term) for term in terms)
+        if any(not postings for postings in required):
+            return ()
+
+        tag_positions: set[int] | None = None
+        if tags:
+            tag_positions = set()
+            for tag in tags:
+                tag_positions.update(segment.fields.get(f"tag:{tag}", ()))
+            if not tag_positions:
+                return ()
+
+        if not required:
+            if tag_positions is not None:
+                return sorted(
+                    (p for p in tag_positions if p >= segment.start_offset), reverse=True
+                )
+            return range(len(segment.entries) - 1, segment.start_offset - 1, -1)
+
+        # Walk the shortest posting list and probe the others by binary search
+        required = [segment.live_positions(postings) for postings in required]
+        required.sort(key=len)
+        driver, others = required[0], required[1:]
+        return (
+            position
+            for position in reversed(driver)
+            if (tag_positions is None or position in tag_positions)
+            and all(_contains(postings, position) for postings in others)
+        )
+
+    def _trim(self, count: int) -> None:
+        while count > 0 and self._segment_keys:
+            segment = self._segments[self._segment_keys[0]]
+            trimmed = segment.trim_head(count)
+            self._size -= trimmed
+            count -= trimmed
+            if segment.live_count == 0:
+                self._drop_oldest_segment()
+
+    def _drop_oldest_segment(self) -> None:
+        key = self._segment_keys.pop(0)
+        del self._segments[key]
+
+
+def _contains(postings, position: int) -> bool:
+    index = bisect_left(postings, position)
+    return index < len(postings) and postings[index] == position
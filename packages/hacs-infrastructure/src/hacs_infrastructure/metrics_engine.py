@@ -0,0 +1,465 @@
+"""Sharded metrics engine with mergeable quantile sketches.
+
+This module provides the storage engine behind ``MetricsCollector``. Updates go
+to per-thread shards, so recording never contends on a global lock, and
+histograms are kept as fixed-size log-linear bucket sketches (HDR-style), so
+percentile reads walk buckets instead of sorting samples. Sketches and whole
+engine snapshots merge by bucket-wise addition, which makes it cheap to
+combine metrics from several worker processes.
+"""
+
+import math
+import threading
+import weakref
+from array import array
+from typing import Any
+
+
+MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def metric_key(name: str, tags: dict[str, str] | None = None) -> MetricKey:
+    """Build the engine key for a metric name and tag set."""
+    if not tags:
+        return (name, ())
+    return (name, tuple(sorted(tags.items())))
+
+
+class QuantileSketch:
+    """Fixed-memory log-linear histogram for quantile estimation.
+
+    Each power-of-two range is split into ``2 ** significant_bits`` linear
+    sub-buckets, so any recorded value is reported with a relative error of
+    at most ``2 ** -significant_bits``. Memory is allocated once, recording is
+    O(1) and quantile reads are O(buckets).
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_max_exp",
+        "_min_exp",
+        "_sub_buckets",
+        "count",
+        "max",
+        "min",
+        "significant_bits",
+        "sum",
+    )
+
+    def __init__(self, significant_bits: int = 5, min_exp: int = -10, max_exp: int = 40) -> None:
+        """Initialize quantile sketch.
+
+        Args:
+            significant_bits: Sub-bucket resolution per power of two
+            min_exp: Smallest tracked binary exponent (values below share a bucket)
+            max_exp: Largest tracked binary exponent (values above share a bucket)
+        """
+        self.significant_bits = significant_bits
+        self._sub_buckets = 1 << significant_bits
+        self._min_exp = min_exp
+        self._max_exp = max_exp
+        self._buckets = array("Q", bytes(8 * (max_exp - min_exp) * self._sub_buckets))
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        """Record a single value."""
+        self._buckets[self._index(value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile ``q`` (0.0 - 1.0)."""
+        if self.count == 0:
+            return 0.0
+        if q <= 0.0:
+            return self.min
+        if q >= 1.0:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, bucket_count in enumerate(self._buckets):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            if seen > rank:
+                return min(max(self._bucket_midpoint(index), self.min), self.max)
+        return self.max
+
+    def quantiles(self, qs: tuple[float, ...] = (0.5, 0.95, 0.99)) -> dict[float, float]:
+        """Estimate several quantiles in a single bucket walk."""
+        result: dict[float, float] = {}
+        if self.count == 0:
+            return dict.fromkeys(qs, 0.0)
+
+        pending = sorted(qs)
+        seen = 0
+        for index, bucket_count in enumerate(self._buckets):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while pending and seen > pending[0] * (self.count - 1):
+                q = pending.pop(0)
+                result[q] = min(max(self._bucket_midpoint(index), self.min), self.max)
+            if not pending:
+                break
+        for q in pending:
+            result[q] = self.max
+        return result
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add another sketch with the same layout into this one."""
+        if (other.significant_bits, other._min_exp, other._max_exp) != (
+            self.significant_bits,
+            self._min_exp,
+            self._max_exp,
+        ):
+            msg = "Cannot merge sketches with different bucket layouts"
+            raise ValueError(msg)
+        if other.count == 0:
+            return
+        buckets = self._buckets
+        for index, bucket_count in enumerate(other._buckets):
+            if bucket_count:
+                buckets[index] += bucket_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "QuantileSketch":
+        """Create an independent copy of this sketch."""
+        clone = QuantileSketch(self.significant_bits, self._min_exp, self._max_exp)
+        clone.merge(self)
+        return clone
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a sparse, JSON-compatible dictionary."""
+        return {
+            "significant_bits": self.significant_bits,
+            "min_exp": self._min_exp,
+            "max_exp": self._max_exp,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "buckets": {str(i): c for i, c in enumerate(self._buckets) if c},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch serialized with ``to_dict``."""
+        sketch = cls(data["significant_bits"], data["min_exp"], data["max_exp"])
+        for index, bucket_count in data.get("buckets", {}).items():
+            sketch._buckets[int(index)] = bucket_count
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    def _index(self, value: float) -> int:
+        if value <= 0.0:
+            return 0
+        mantissa, exponent = math.frexp(value)
+        if exponent < self._min_exp:
+            return 0
+        if exponent >= self._max_exp:
+            return len(self._buckets) - 1
+        sub_bucket = int((mantissa - 0.5) * 2 * self._sub_buckets)
+        return (exponent - self._min_exp) * self._sub_buckets + sub_bucket
+
+    def _bucket_midpoint(self, index: int) -> float:
+        exponent, sub_bucket = divmod(index, self._sub_buckets)
+        scale = math.ldexp(1.0, exponent + self._min_exp)
+        width = scale / (2 * self._sub_buckets)
+        lower = scale / 2 + sub_bucket * width
+        return lower + width / 2
+
+
+class _Shard:
+    """Metrics written by a single thread."""
+
+    __slots__ = ("counters", "histograms", "thread")
+
+    def __init__(self, thread: threading.Thread | None) -> None:
+        self.thread = thread
+        self.counters: dict[MetricKey, float] = {}
+        self.histograms: dict[MetricKey, QuantileSketch] = {}
+
+
+class MetricsEngine:
+    """Per-thread sharded counters, gauges and quantile sketches.
+
+    Each thread writes only to its own shard, so updates take no lock. Reads
+    merge shards on demand; shards of finished threads are folded into a
+    retired shard so their totals are kept without unbounded growth.
+    """
+
+    def __init__(self, significant_bits: int = 5) -> None:
+        """Initialize metrics engine.
+
+        Args:
+            significant_bits: Histogram resolution (relative error 2**-bits)
+        """
+        self._significant_bits = significant_bits
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._retired = _Shard(None)
+        self._gauges: dict[MetricKey, float] = {}
+        self._registry_lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1, tags: dict[str, str] | None = None) -> None:
+        """Increment a counter."""
+        counters = self._shard().counters
+        key = metric_key(name, tags)
+        counters[key] = counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
+        """Set a gauge value."""
+        self._gauges[metric_key(name, tags)] = value
+
+    def observe(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
+        """Record a value into a histogram sketch."""
+        histograms = self._shard().histograms
+        key = metric_key(name, tags)
+        sketch = histograms.get(key)
+        if sketch is None:
+            sketch = histograms[key] = QuantileSketch(self._significant_bits)
+        sketch.record(value)
+
+    def counter_value(self, name: str, tags: dict[str, str] | None = None) -> float:
+        """Get the total of a counter across all shards."""
+        key = metric_key(name, tags)
+        return sum(shard.counters.get(key, 0) for shard in self._all_shards())
+
+    def counter_estimate(self, name: str, tags: dict[str, str] | None = None) -> float:
+        """Get a counter total without taking the registry lock.
+
+        Meant for sampling on hot paths; the total may be briefly off while
+        another thread registers a shard or finished shards are folded.
+        """
+        key = metric_key(name, tags)
+        return sum(shard.counters.get(key, 0) for shard in (*self._shards, self._retired))
+
+    def gauge_value(self, name: str, tags: dict[str, str] | None = None) -> float | None:
+        """Get the current value of a gauge."""
+        return self._gauges.get(metric_key(name, tags))
+
+    def histogram(self, name: str, tags: dict[str, str] | None = None) -> QuantileSketch:
+        """Get a merged copy of a histogram sketch."""
+        key = metric_key(name, tags)
+        merged = QuantileSketch(self._significant_bits)
+        for shard in self._all_shards():
+            sketch = shard.histograms.get(key)
+            if sketch is not None:
+                merged.merge(sketch)
+        return merged
+
+    def counters(self) -> dict[MetricKey, float]:
+        """Get all counter totals."""
+        totals: dict[MetricKey, float] = {}
+        for shard in self._all_shards():
+            for key, value in shard.counters.copy().items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def gauges(self) -> dict[MetricKey, float]:
+        """Get all gauge values."""
+        return self._gauges.copy()
+
+    def histograms(self) -> dict[MetricKey, QuantileSketch]:
+        """Get merged copies of all histogram sketches."""
+        merged: dict[MetricKey, QuantileSketch] = {}
+        for shard in self._all_shards():
+            for key, sketch in shard.histograms.copy().items():
+                if key in merged:
+                    merged[key].merge(sketch)
+                else:
+                    merged[key] = sketch.copy()
+        return merged
+
+    def snapshot(self) -> dict[str, Any]:
+        """Serialize every metric so another engine can ``merge_snapshot`` it."""
+        return {
+            "counters": [[name, list(tags), value] for (name, tags), value in self.counters().items()],
+            "gauges": [[name, list(tags), value] for (name, tags), value in self.gauges().items()],
+            "histograms": [
+                [name, list(tags), sketch.to_dict()]
+                for (name, tags), sketch in self.histograms().items()
+            ],
+        }
+
+    def merge_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Merge a snapshot taken from another engine, e.g. another worker."""
+        with self._registry_lock:
+            retired = self._retired
+            for name, tags, value in snapshot.get("counters", []):
+                key = (name, tuple(tuple(tag) for tag in tags))
+                retired.counters[key] = retired.counters.get(key, 0) + value
+            for name, tags, value in snapshot.get("gauges", []):
+                self._gauges[(name, tuple(tuple(tag) for tag in tags))] = value
+            for name, tags, data in snapshot.get("histograms", []):
+                key = (name, tuple(tuple(tag) for tag in tags))
+                sketch = QuantileSketch.from_dict(data)
+                if key in retired.histograms:
+                    retired.histograms[key].merge(sketch)
+                else:
+                    retired.histograms[key] = sketch
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._registry_lock:
+            self._shards = []
+            self._retired = _Shard(None)
+            self._gauges = {}
+            self._local = threading.local()
+
+    def render_prometheus(self, namespace: str = "") -> str:
+        """Render all metrics in Prometheus text exposition format.
+
+        Counters and gauges are rendered as-is; histograms are rendered as
+        summaries with p50/p95/p99 quantiles plus ``_sum`` and ``_count``.
+
+        Args:
+            namespace: Optional prefix added to every metric name
+
+        Returns:
+            Exposition text ready to serve on a ``/metrics`` endpoint
+        """
+        lines: list[str] = []
+
+        def family(items: dict[MetricKey, Any]) -> dict[str, list[tuple[tuple, Any]]]:
+            grouped: dict[str, list[tuple[tuple, Any]]] = {}
+            for (name, tags), value in items.items():
+                grouped.setdefault(_prometheus_name(name, namespace), []).append((tags, value))
+            return grouped
+
+        for name, samples in sorted(family(self.counters()).items()):
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f"{name}{_prometheus_labels(tags)} {value}" for tags, value in samples)
+
+        for name, samples in sorted(family(self.gauges()).items()):
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(f"{name}{_prometheus_labels(tags)} {value}" for tags, value in samples)
+
+        for name, samples in sorted(family(self.histograms()).items()):
+            lines.append(f"# TYPE {name} summary")
+            for tags, sketch in samples:
+                for q, value in sketch.quantiles((0.5, 0.95, 0.99)).items():
+                    labels = _prometheus_labels((*tags, ("quantile", str(q))))
+                    lines.append(f"{name}{labels} {value}")
+                labels = _prometheus_labels(tags)
+                lines.append(f"{name}_sum{labels} {sketch.sum}")
+                lines.append(f"{name}_count{labels} {sketch.count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self._registry_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _all_shards(self) -> list[_Shard]:
+        """Get live shards plus the retired shard, folding in finished threads."""
+        with self._registry_lock:
+            live = []
+            for shard in self._shards:
+                if shard.thread is not None and shard.thread.is_alive():
+                    live.append(shard)
+                else:
+                    self._fold_into_retired(shard)
+            self._shards = live
+            return [*live, self._retired]
+
+    def _fold_into_retired(self, shard: _Shard) -> None:
+        retired = self._retired
+        for key, value in shard.counters.items():
+            retired.counters[key] = retired.counters.get(key, 0) + value
+        for key, sketch in shard.histograms.items():
+            if key in retired.histograms:
+                retired.histograms[key].merge(sketch)
+            else:
+                retired.histograms[key] = sketch
+
+
+def _prometheus_name(name: str, namespace: str = "") -> str:
+    """Convert a dotted metric name into a valid Prometheus metric name."""
+    full_name = f"{namespace}_{name}" if namespace else name
+    sanitized = "".join(c if c.isalnum() or c in "_:" else "_" for c in full_name)
+    if sanitized[:1].isdigit():
+        sanitized = f"_{sanitized}"
+    return sanitized
+
+
+def _prometheus_labels(tags: tuple[tuple[str, str], ...]) -> str:
+    """Render a label set, escaping values per the exposition format."""
+    if not tags:
+        return ""
+    rendered = []
+    for key, value in tags:
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        rendered.append(f'{_prometheus_name(key)}="{escaped}"')
+    return "{" + ",".join(rendered) + "}"
+
+
+# Global metrics engine instance
+_global_engine: MetricsEngine | None = None
+_engine_lock = threading.Lock()
+# Further engines rendered alongside the global one (e.g. MetricsCollector's)
+_exported_engines: "weakref.WeakSet[MetricsEngine]" = weakref.WeakSet()
+
+
+def get_metrics_engine() -> MetricsEngine:
+    """Get the global metrics engine instance.
+
+    Returns:
+        Global metrics engine instance
+    """
+    global _global_engine
+    with _engine_lock:
+        if _global_engine is None:
+            _global_engine = MetricsEngine()
+        return _global_engine
+
+
+def reset_metrics_engine() -> None:
+    """Reset the global metrics engine instance."""
+    global _global_engine
+    with _engine_lock:
+        _global_engine = None
+
+
+def register_metrics_engine(engine: MetricsEngine) -> None:
+    """Include an engine in ``render_exported_metrics`` for as long as it lives."""
+    _exported_engines.add(engine)
+
+
+def render_exported_metrics(namespace: str = "") -> str:
+    """Render the global engine merged with every registered engine.
+
+    Args:
+        namespace: Optional prefix added to every metric name
+
+    Returns:
+        Exposition text ready to serve on a ``/metrics`` endpoint
+    """
+    engines = [get_metrics_engine(), *list(_exported_engines)]
+    if len(engines) == 1:
+        return engines[0].render_prometheus(namespace)
+    merged = MetricsEngine()
+    for engine in dict.fromkeys(engines):
+        merged.merge_snapshot(engine.snapshot())
+    return merged.render_prometheus(namespace)
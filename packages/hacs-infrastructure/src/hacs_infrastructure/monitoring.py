@@ -26,6 +26,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from .events import EventBus
+from .metrics_engine import MetricsEngine, QuantileSketch, register_metrics_engine
 from .protocols import HealthCheckable
 
 
@@ -79,25 +80,47 @@ class ServiceMetrics(BaseModel):
 
 
 class MetricsCollector:
-    """Collects and aggregates metrics for services and system resources."""
+    """Collects and aggregates metrics for services and system resources.
 
-    def __init__(self, retention_period: int = 3600) -> None:
+    Counters and histograms are stored in a ``MetricsEngine``: updates land in
+    per-thread shards without taking a lock, and histogram percentiles are
+    read from fixed-memory quantile sketches instead of sorted samples.
+    """
+
+    def __init__(
+        self,
+        retention_period: int = 3600,
+        engine: MetricsEngine | None = None,
+        record_history: bool = True,
+    ) -> None:
         """Initialize metrics collector.
 
         Args:
             retention_period: How long to keep metrics in seconds
+            engine: Metrics engine to record into. If None, a private engine
+                is created and registered for ``/metrics`` exposition
+            record_history: Whether to keep per-update ``MetricPoint`` history
+                (for ``get_metric_history``, bounded per metric); disable it on
+                hot paths to skip an allocation per update
         """
         self._retention_period = retention_period
+        if engine is None:
+            engine = MetricsEngine()
+            register_metrics_engine(engine)
+        self._engine = engine
+        self._record_history = record_history
         self._metrics: dict[str, deque] = defaultdict(lambda: deque(maxlen=10000))
-        self._counters: dict[str, int] = defaultdict(int)
-        self._gauges: dict[str, float] = defaultdict(float)
-        self._histograms: dict[str, list[float]] = defaultdict(list)
         self._lock = threading.RLock()
 
         # Background cleanup task
         self._cleanup_task: asyncio.Task | None = None
         self._running = False
 
+    @property
+    def engine(self) -> MetricsEngine:
+        """Underlying metrics engine."""
+        return self._engine
+
     async def start(self) -> None:
         """Start metrics collection."""
         if self._running:
@@ -121,28 +144,22 @@ class MetricsCollector:
         self, name: str, value: int = 1, tags: dict[str, str] | None = None
     ) -> None:
         """Increment a counter metric."""
-        key = self._build_metric_key(name, tags)
-        with self._lock:
-            self._counters[key] += value
-            self._record_metric_point(name, self._counters[key], tags)
+        self._engine.increment(name, value, tags)
+        if self._record_history:
+            self._record_metric_point(name, self._engine.counter_estimate(name, tags), tags)
 
     def set_gauge(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
         """Set a gauge metric value."""
-        key = self._build_metric_key(name, tags)
-        with self._lock:
-            self._gauges[key] = value
+        self._engine.set_gauge(name, value, tags)
+        if self._record_history:
             self._record_metric_point(name, value, tags)
 
     def record_histogram(
         self, name: str, value: float, tags: dict[str, str] | None = None
     ) -> None:
         """Record a value in a histogram."""
-        key = self._build_metric_key(name, tags)
-        with self._lock:
-            self._histograms[key].append(value)
-            # Keep only recent values for performance
-            if len(self._histograms[key]) > 1000:
-                self._histograms[key] = self._histograms[key][-1000:]
+        self._engine.observe(name, value, tags)
+        if self._record_history:
             self._record_metric_point(name, value, tags)
 
     def record_timing(
@@ -154,38 +171,18 @@ class MetricsCollector:
 
     def get_counter(self, name: str, tags: dict[str, str] | None = None) -> int:
         """Get counter value."""
-        key = self._build_metric_key(name, tags)
-        with self._lock:
-            return self._counters.get(key, 0)
+        return self._engine.counter_value(name, tags)
 
     def get_gauge(self, name: str, tags: dict[str, str] | None = None) -> float:
         """Get gauge value."""
-        key = self._build_metric_key(name, tags)
-        with self._lock:
-            return self._gauges.get(key, 0.0)
+        value = self._engine.gauge_value(name, tags)
+        return 0.0 if value is None else value
 
     def get_histogram_stats(
         self, name: str, tags: dict[str, str] | None = None
     ) -> dict[str, float]:
         """Get histogram statistics."""
-        key = self._build_metric_key(name, tags)
-        with self._lock:
-            values = self._histograms.get(key, [])
-            if not values:
-                return {"count": 0, "min": 0, "max": 0, "avg": 0, "p50": 0, "p95": 0, "p99": 0}
-
-            values_sorted = sorted(values)
-            count = len(values_sorted)
-
-            return {
-                "count": count,
-                "min": values_sorted[0],
-                "max": values_sorted[-1],
-                "avg": sum(values_sorted) / count,
-                "p50": self._percentile(values_sorted, 50),
-                "p95": self._percentile(values_sorted, 95),
-                "p99": self._percentile(values_sorted, 99),
-            }
+        return self._sketch_stats(self._engine.histogram(name, tags))
 
     def get_metric_history(
         self,
@@ -212,15 +209,24 @@ class MetricsCollector:
 
     def get_all_metrics(self) -> dict[str, Any]:
         """Get all current metric values."""
-        with self._lock:
-            return {
-                "counters": dict(self._counters),
-                "gauges": dict(self._gauges),
-                "histograms": {
-                    k: self.get_histogram_stats(k.split("|")[0], self._parse_tags(k))
-                    for k in self._histograms
-                },
-            }
+        return {
+            "counters": {
+                self._build_metric_key(name, dict(tags)): value
+                for (name, tags), value in self._engine.counters().items()
+            },
+            "gauges": {
+                self._build_metric_key(name, dict(tags)): value
+                for (name, tags), value in self._engine.gauges().items()
+            },
+            "histograms": {
+                self._build_metric_key(name, dict(tags)): self._sketch_stats(sketch)
+                for (name, tags), sketch in self._engine.histograms().items()
+            },
+        }
+
+    def render_prometheus(self, namespace: str = "") -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        return self._engine.render_prometheus(namespace)
 
     def _build_metric_key(self, name: str, tags: dict[str, str] | None) -> str:
         """Build metric key with tags."""
@@ -248,18 +254,21 @@ class MetricsCollector:
         point = MetricPoint(timestamp=time.time(), value=value, tags=tags or {})
         self._metrics[name].append(point)
 
-    def _percentile(self, sorted_values: list[float], percentile: float) -> float:
-        """Calculate percentile from sorted values."""
-        if not sorted_values:
-            return 0.0
-
-        index = (percentile / 100.0) * (len(sorted_values) - 1)
-        if index.is_integer():
-            return sorted_values[int(index)]
-        lower_index = int(index)
-        upper_index = lower_index + 1
-        weight = index - lower_index
-        return sorted_values[lower_index] * (1 - weight) + sorted_values[upper_index] * weight
+    def _sketch_stats(self, sketch: QuantileSketch) -> dict[str, float]:
+        """Summarize a quantile sketch."""
+        if not sketch.count:
+            return {"count": 0, "min": 0, "max": 0, "avg": 0, "p50": 0, "p95": 0, "p99": 0}
+
+        quantiles = sketch.quantiles((0.5, 0.95, 0.99))
+        return {
+            "count": sketch.count,
+            "min": sketch.min,
+            "max": sketch.max,
+            "avg": sketch.sum / sketch.count,
+            "p50": quantiles[0.5],
+            "p95": quantiles[0.95],
+            "p99": quantiles[0.99],
+        }
 
     async def _cleanup_loop(self) -> None:
         """Background cleanup of old metrics."""
@@ -0,0 +1,250 @@
+"""Pooled, batched notification delivery for HACS alerting.
+
+Notifications are handed to per-channel workers through bounded queues so a
+slow or failing channel never blocks the others. Workers coalesce bursts into
+digests and deliver over one shared, pooled HTTP client with jittered
+exponential backoff on transient failures.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import aiohttp
+
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying; other 4xx responses are permanent failures
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class DeliveryError(Exception):
+    """Raised when a notification cannot be delivered."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class NotificationDispatcher:
+    """Shared async HTTP client for notification delivery.
+
+    One connection pool is reused by every channel, keeping connections to
+    webhook endpoints alive between alerts.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 20,
+        request_timeout_seconds: float = 10.0,
+        max_backoff_seconds: float = 60.0,
+    ) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            max_connections: Total pooled connections
+            max_connections_per_host: Pooled connections per endpoint
+            request_timeout_seconds: Default timeout for one request
+            max_backoff_seconds: Upper bound for a single retry delay
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.request_timeout_seconds = request_timeout_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session on first use within the running loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, limit_per_host=self.max_connections_per_host
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds),
+            )
+        return self._session
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Any,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: float | None = None,
+        retry_attempts: int = 3,
+        retry_delay_seconds: float = 1.0,
+    ) -> int:
+        """POST a JSON payload, retrying transient failures.
+
+        Args:
+            url: Endpoint URL
+            payload: JSON-serializable body
+            headers: Extra request headers
+            timeout_seconds: Per-request timeout override
+            retry_attempts: Retries after the first attempt
+            retry_delay_seconds: Base delay for exponential backoff
+
+        Returns:
+            HTTP status of the successful response
+
+        Raises:
+            DeliveryError: If the request fails permanently or retries run out
+        """
+        session = self._get_session()
+        timeout = aiohttp.ClientTimeout(total=timeout_seconds) if timeout_seconds else None
+
+        for attempt in range(retry_attempts + 1):
+            retry_after: float | None = None
+            try:
+                async with session.post(
+                    url, json=payload, headers=headers, timeout=timeout
+                ) as response:
+                    if response.status < 300:
+                        return response.status
+                    body = await response.text()
+                    error = DeliveryError(
+                        f"{url} returned {response.status}: {body[:200]}", response.status
+                    )
+                    if response.status not in RETRYABLE_STATUS:
+                        raise error
+                    with contextlib.suppress(TypeError, ValueError):
+                        retry_after = float(response.headers.get("Retry-After"))
+            except (TimeoutError, aiohttp.ClientError) as e:
+                error = DeliveryError(f"{url} request failed: {e}")
+
+            if attempt == retry_attempts:
+                raise error
+
+            # Full jitter keeps retries from many workers from synchronizing
+            ceiling = min(self.max_backoff_seconds, retry_delay_seconds * 2**attempt)
+            delay = random.uniform(0, ceiling)
+            if retry_after is not None:
+                delay = min(max(delay, retry_after), self.max_backoff_seconds)
+            logger.debug("Retrying %s in %.2fs after: %s", url, delay, error)
+            await asyncio.sleep(delay)
+
+        msg = f"{url} delivery failed"
+        raise DeliveryError(msg)
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class ChannelWorker:
+    """Concurrent, bounded delivery queue for one notification channel.
+
+    Items are delivered by ``send(items, overflow)``. When the backlog reaches
+    ``digest_threshold`` a worker takes up to ``max_digest_size`` queued items
+    at once so the channel can send a single digest. Items arriving while the
+    queue is full are counted in ``overflow`` and reported with the next
+    delivery instead of growing the queue.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send: Callable[[list[Any], int], Awaitable[None]],
+        concurrency: int = 2,
+        max_queue_size: int = 1000,
+        digest_threshold: int = 10,
+        max_digest_size: int = 100,
+    ) -> None:
+        """Initialize channel worker.
+
+        Args:
+            name: Channel name used in logs and statistics
+            send: Coroutine delivering a batch plus the overflow count
+            concurrency: Number of concurrent delivery tasks
+            max_queue_size: Maximum queued items
+            digest_threshold: Backlog size at which items are coalesced
+            max_digest_size: Maximum items in one digest
+        """
+        self.name = name
+        self._send = send
+        self.concurrency = concurrency
+        self.digest_threshold = digest_threshold
+        self.max_digest_size = max_digest_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._tasks: list[asyncio.Task] = []
+        self._overflow = 0
+
+        self.delivered = 0
+        self.failed = 0
+        self.digests = 0
+        self.dropped = 0
+
+    def submit(self, item: Any) -> bool:
+        """Queue an item for delivery without blocking.
+
+        Returns:
+            False if the queue was full and the item was counted as overflow
+        """
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            self._overflow += 1
+            self.dropped += 1
+            return False
+
+    def start(self) -> None:
+        """Start delivery tasks."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run(), name=f"notify-{self.name}-{i}")
+                for i in range(self.concurrency)
+            ]
+
+    async def stop(self, drain_timeout_seconds: float = 5.0) -> None:
+        """Deliver what is queued, within a deadline, then stop the tasks."""
+        if self._tasks:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout_seconds)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self) -> None:
+        """Take items (or digests of items) off the queue and deliver them."""
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() + 1 >= self.digest_threshold:
+                while len(batch) < self.max_digest_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+            overflow, self._overflow = self._overflow, 0
+            try:
+                await self._send(batch, overflow)
+                self.delivered += len(batch)
+                if len(batch) > 1:
+                    self.digests += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error("Delivery to %s failed for %d item(s): %s", self.name, len(batch), e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get delivery statistics."""
+        return {
+            "queued": self._queue.qsize(),
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "digests": self.digests,
+            "dropped": self.dropped,
+        }
+
+
+__all__ = ["ChannelWorker", "DeliveryError", "NotificationDispatcher"]
@@ -29,6 +29,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .instrumentation import enable_instrumentation
+
 
 # OpenTelemetry imports
 try:
@@ -118,6 +120,7 @@ class ObservabilityConfig:
 
     # Performance monitoring
     enable_performance_monitoring: bool = True
+    enable_instrumentation: bool = False
     slow_query_threshold_ms: int = 1000
     memory_threshold_mb: int = 512
 
@@ -604,6 +607,10 @@ class ObservabilityManager:
         self.tracer = HealthcareTracer(self.config)
         self.metrics = HealthcareMetrics(self.config)
 
+        # Hot-path spans are recorded in process and mirrored to OpenTelemetry
+        if self.config.enable_instrumentation:
+            enable_instrumentation(otel_tracer=self.tracer.tracer)
+
         # Health check status
         self.health_checks = {}
 
@@ -624,6 +631,8 @@ class ObservabilityManager:
             metrics_endpoint=os.getenv("OTEL_EXPORTER_OTLP_METRICS_ENDPOINT"),
             enable_tracing=os.getenv("HACS_ENABLE_TRACING", "true").lower() == "true",
             enable_metrics=os.getenv("HACS_ENABLE_METRICS", "true").lower() == "true",
+            enable_instrumentation=os.getenv("HACS_ENABLE_INSTRUMENTATION", "false").lower()
+            == "true",
             enable_structured_logging=os.getenv("HACS_ENABLE_STRUCTURED_LOGGING", "true").lower()
             == "true",
         )
@@ -6,7 +6,9 @@ with health monitoring, load balancing, and automatic failover.
 
 import asyncio
 import contextlib
+import heapq
 import threading
+import time
 from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
@@ -27,6 +29,63 @@ class ServiceStatus(str, Enum):
     STOPPED = "stopped"
 
 
+class CircuitState(str, Enum):
+    """Circuit breaker state for a service instance."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Per-instance circuit breaker.
+
+    The circuit opens after ``failure_threshold`` consecutive failures and
+    stays open for ``reset_timeout`` seconds. It then half-opens to let a
+    trial request through: a success closes it, a failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._state = CircuitState.CLOSED
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, half-opening once the reset timeout has passed."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self.opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether traffic may be sent to the instance."""
+        return self.state != CircuitState.OPEN
+
+    def record_success(self) -> None:
+        """Record a successful call or health check."""
+        self.failures = 0
+        self.opened_at = None
+        self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a failed call or health check."""
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+
+
 class ServiceInfo(BaseModel):
     """Information about a registered service."""
 
@@ -83,6 +142,13 @@ class HealthCheck(BaseModel):
     failure_threshold: int = Field(3, description="Consecutive failures before marking unhealthy")
     success_threshold: int = Field(1, description="Consecutive successes before marking healthy")
 
+    # Adaptive scheduling: healthy services back off, failing ones are probed faster
+    min_interval: float = Field(5.0, description="Interval for failing services in seconds")
+    max_interval: float = Field(300.0, description="Upper bound for backed-off intervals")
+    backoff_factor: float = Field(2.0, description="Interval growth per healthy check")
+    max_concurrency: int = Field(100, description="Concurrent health checks and connections")
+    circuit_reset_timeout: float = Field(30.0, description="Seconds a circuit stays open")
+
     # Custom health check function
     custom_check: Callable[[ServiceInfo], bool] | None = Field(
         None, description="Custom health check function"
@@ -118,6 +184,15 @@ class ServiceRegistry:
         self._health_check_task: asyncio.Task | None = None
         self._running = False
 
+        # Adaptive schedule: due-time heap plus the current interval per service
+        self._schedule: list[tuple[float, str]] = []
+        self._next_check: dict[str, float | None] = {}
+        self._intervals: dict[str, float] = {}
+        self._circuits: dict[str, CircuitBreaker] = {}
+        self._session = None
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
     def register_service(
         self,
         name: str,
@@ -173,6 +248,11 @@ class ServiceRegistry:
             # Initialize health tracking
             self._health_failures[service_id] = 0
             self._health_successes[service_id] = 0
+            self._circuits[service_id] = CircuitBreaker(
+                self._health_config.failure_threshold, self._health_config.circuit_reset_timeout
+            )
+            self._intervals[service_id] = float(self._health_config.interval)
+            self._schedule_check(service_id, time.monotonic())
 
         return service_id
 
@@ -202,9 +282,12 @@ class ServiceRegistry:
                 if not self._services_by_name[service.name]:
                     del self._services_by_name[service.name]
 
-            # Clean up health tracking
+            # Clean up health tracking; heap entries are skipped lazily
             self._health_failures.pop(service_id, None)
             self._health_successes.pop(service_id, None)
+            self._circuits.pop(service_id, None)
+            self._intervals.pop(service_id, None)
+            self._next_check.pop(service_id, None)
 
         return True
 
@@ -302,34 +385,171 @@ class ServiceRegistry:
             service.updated_at = datetime.now(UTC)
             return True
 
+    def allows_traffic(self, service_id: str) -> bool:
+        """Check whether a service's circuit lets requests through.
+
+        Args:
+            service_id: Service identifier
+
+        Returns:
+            False while the service's circuit is open
+        """
+        with self._lock:
+            circuit = self._circuits.get(service_id)
+            return circuit is None or circuit.allow_request()
+
+    def get_circuit_state(self, service_id: str) -> CircuitState | None:
+        """Get the circuit breaker state of a service.
+
+        Args:
+            service_id: Service identifier
+
+        Returns:
+            Circuit state if the service is registered
+        """
+        with self._lock:
+            circuit = self._circuits.get(service_id)
+            return circuit.state if circuit else None
+
+    def record_call_result(self, service_id: str, success: bool) -> None:
+        """Feed the outcome of a real request into the service's circuit.
+
+        A failure also pulls the service's next health check forward so a
+        broken instance is confirmed (or cleared) quickly.
+
+        Args:
+            service_id: Service identifier
+            success: Whether the request succeeded
+        """
+        with self._lock:
+            circuit = self._circuits.get(service_id)
+            if circuit is None:
+                return
+            if success:
+                circuit.record_success()
+                return
+            circuit.record_failure()
+            due = time.monotonic() + self._health_config.min_interval
+            scheduled = self._next_check.get(service_id)
+            if scheduled is not None and due < scheduled:
+                self._schedule_check(service_id, due)
+
     async def start_health_monitoring(self) -> None:
         """Start health monitoring background task."""
         if not self._health_config.enabled or self._running:
             return
 
         self._running = True
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        with self._lock:
+            # Checks interrupted by a previous stop are rescheduled immediately
+            now = time.monotonic()
+            for service_id in self._services:
+                if self._next_check.get(service_id) is None:
+                    self._schedule_check(service_id, now)
         self._health_check_task = asyncio.create_task(self._health_check_loop())
 
     async def stop_health_monitoring(self) -> None:
-        """Stop health monitoring background task."""
+        """Stop health monitoring background task and close pooled connections."""
         self._running = False
         if self._health_check_task:
             self._health_check_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._health_check_task
             self._health_check_task = None
+        self._wakeup = None
+        self._loop = None
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session used for health checks."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self):
+        """Long-lived pooled session shared by every HTTP health check."""
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._health_config.max_concurrency, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=self._health_config.timeout),
+            )
+        return self._session
+
+    def _schedule_check(self, service_id: str, due: float) -> None:
+        """Schedule a service's next check; the caller holds the lock."""
+        self._next_check[service_id] = due
+        heapq.heappush(self._schedule, (due, service_id))
+
+        # Wake the monitoring loop so it can shorten its sleep; may run off-loop
+        if self._wakeup is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _pop_due_services(self, now: float) -> list[ServiceInfo]:
+        """Take services whose check is due off the schedule."""
+        due = []
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                when, service_id = heapq.heappop(self._schedule)
+                if self._next_check.get(service_id) != when:
+                    continue  # Rescheduled or deregistered since this entry was pushed
+                service = self._services.get(service_id)
+                if service:
+                    # Rescheduled from the result in _update_health_status
+                    self._next_check[service_id] = None
+                    due.append(service)
+        return due
+
+    def _seconds_until_next_check(self, now: float) -> float:
+        """Time until the earliest scheduled check."""
+        with self._lock:
+            while self._schedule:
+                when, service_id = self._schedule[0]
+                if self._next_check.get(service_id) == when:
+                    return max(when - now, 0.0)
+                heapq.heappop(self._schedule)
+        return float(self._health_config.interval)
 
     async def _health_check_loop(self) -> None:
-        """Health check background loop."""
+        """Health check background loop.
+
+        Sleeps until the next service is due instead of checking every
+        service on a fixed cycle.
+        """
+        semaphore = asyncio.Semaphore(self._health_config.max_concurrency)
+        pending: set[asyncio.Task] = set()
+
+        async def run_check(service: ServiceInfo) -> None:
+            async with semaphore:
+                await self._check_service_health(service)
+
         while self._running:
             try:
-                await self._perform_health_checks()
-                await asyncio.sleep(self._health_config.interval)
+                self._wakeup.clear()
+                now = time.monotonic()
+                for service in self._pop_due_services(now):
+                    task = asyncio.create_task(run_check(service))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self._seconds_until_next_check(now)
+                    )
             except asyncio.CancelledError:
                 break
             except Exception:
                 # Log error but continue monitoring
-                await asyncio.sleep(self._health_config.interval)
+                await asyncio.sleep(self._health_config.min_interval)
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
     async def _perform_health_checks(self) -> None:
         """Perform health checks on all registered services."""
@@ -338,8 +558,14 @@ class ServiceRegistry:
         with self._lock:
             services_to_check = list(self._services.values())
 
-        # Check services concurrently
-        tasks = [self._check_service_health(service) for service in services_to_check]
+        # Check services concurrently, bounded by the connection pool size
+        semaphore = asyncio.Semaphore(self._health_config.max_concurrency)
+
+        async def run_check(service: ServiceInfo) -> None:
+            async with semaphore:
+                await self._check_service_health(service)
+
+        tasks = [run_check(service) for service in services_to_check]
 
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
@@ -367,20 +593,27 @@ class ServiceRegistry:
             await self._update_health_status(service.id, False)
 
     async def _http_health_check(self, service: ServiceInfo) -> bool:
-        """Perform HTTP health check."""
-        import aiohttp
-
+        """Perform HTTP health check over the pooled session."""
         try:
-            timeout = aiohttp.ClientTimeout(total=self._health_config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                url = service.health_check_url or f"{service.url}/health"
-                async with session.get(url) as response:
-                    return response.status == 200
+            url = service.health_check_url or f"{service.url}/health"
+            async with self._get_session().get(url) as response:
+                return response.status == 200
         except Exception:
             return False
 
     async def _connectivity_check(self, service: ServiceInfo) -> bool:
-        """Perform basic connectivity check."""
+        """Perform basic connectivity check.
+
+        HTTP services are probed through the pooled session, reusing kept-alive
+        connections; other protocols fall back to a TCP connect.
+        """
+        if service.protocol in ("http", "https"):
+            try:
+                async with self._get_session().head(service.url) as response:
+                    return response.status < 500
+            except Exception:
+                return False
+
         try:
             reader, writer = await asyncio.wait_for(
                 asyncio.open_connection(service.host, service.port),
@@ -400,8 +633,12 @@ class ServiceRegistry:
                 return
 
             service.last_health_check = datetime.now(UTC)
+            circuit = self._circuits.get(service_id)
+            was_healthy = service.status == ServiceStatus.HEALTHY
 
             if is_healthy:
+                if circuit:
+                    circuit.record_success()
                 self._health_successes[service_id] = self._health_successes.get(service_id, 0) + 1
                 self._health_failures[service_id] = 0
 
@@ -412,12 +649,28 @@ class ServiceRegistry:
             else:
                 self._health_failures[service_id] = self._health_failures.get(service_id, 0) + 1
                 self._health_successes[service_id] = 0
+                if circuit:
+                    circuit.record_failure()
 
                 # Mark unhealthy if enough consecutive failures
                 if self._health_failures[service_id] >= self._health_config.failure_threshold:
                     if service.status != ServiceStatus.UNHEALTHY:
                         service.update_status(ServiceStatus.UNHEALTHY)
 
+            # Steadily healthy services back off; anything else is probed sooner
+            config = self._health_config
+            if is_healthy and was_healthy:
+                interval = min(
+                    self._intervals.get(service_id, config.interval) * config.backoff_factor,
+                    config.max_interval,
+                )
+            elif is_healthy:
+                interval = float(config.interval)
+            else:
+                interval = config.min_interval
+            self._intervals[service_id] = interval
+            self._schedule_check(service_id, time.monotonic() + interval)
+
     def get_health_summary(self) -> dict[str, Any]:
         """Get health summary of all services.
 
@@ -431,12 +684,14 @@ class ServiceRegistry:
                 1 for s in self._services.values() if s.status == ServiceStatus.UNHEALTHY
             )
             unknown = total - healthy - unhealthy
+            open_circuits = sum(1 for c in self._circuits.values() if c.state == CircuitState.OPEN)
 
             return {
                 "total_services": total,
                 "healthy_services": healthy,
                 "unhealthy_services": unhealthy,
                 "unknown_services": unknown,
+                "open_circuits": open_circuits,
                 "health_check_enabled": self._health_config.enabled,
                 "monitoring_active": self._running,
             }
@@ -460,6 +715,8 @@ class ServiceDiscovery:
     ) -> ServiceInfo | None:
         """Discover a service instance.
 
+        Only healthy instances whose circuit is not open are considered.
+
         Args:
             name: Service name
             tags: Required tags
@@ -468,7 +725,11 @@ class ServiceDiscovery:
         Returns:
             Selected service instance
         """
-        services = self._registry.get_services_by_name(name, healthy_only=True, tags=tags)
+        services = [
+            service
+            for service in self._registry.get_services_by_name(name, healthy_only=True, tags=tags)
+            if self._registry.allows_traffic(service.id)
+        ]
         if not services:
             return None
 
@@ -515,6 +776,18 @@ class ServiceDiscovery:
         """Least connections load balancing."""
         return min(services, key=lambda s: s.connections)
 
+    def report_result(self, service_id: str, success: bool) -> None:
+        """Report the outcome of a request to a discovered instance.
+
+        Repeated failures open the instance's circuit, removing it from
+        discovery until a trial request or health check succeeds.
+
+        Args:
+            service_id: Service identifier
+            success: Whether the request succeeded
+        """
+        self._registry.record_call_result(service_id, success)
+
     def get_service_url(
         self, name: str, tags: set[str] | None = None, load_balance: str = "round_robin"
     ) -> str | None:
@@ -0,0 +1,168 @@
+"""Tests for pooled, batched alert notification delivery."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from hacs_infrastructure.alerting import (
+    AlertChannel,
+    AlertManager,
+    AlertPriority,
+    AlertRule,
+    AlertType,
+)
+from hacs_infrastructure.notification_delivery import (
+    ChannelWorker,
+    DeliveryError,
+    NotificationDispatcher,
+)
+
+
+class StandIn:
+    """Local HTTP endpoint standing in for Slack and webhook receivers."""
+
+    def __init__(self) -> None:
+        self.requests: dict[str, list] = {"/slack": [], "/webhook": []}
+        self.failures: dict[str, int] = {}
+        self.delays: dict[str, float] = {}
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.delays.get(request.path, 0))
+        if self.failures.get(request.path, 0) > 0:
+            self.failures[request.path] -= 1
+            return web.Response(status=503)
+        self.requests[request.path].append(await request.json())
+        return web.Response(text="ok")
+
+    async def __aenter__(self) -> "StandIn":
+        app = web.Application()
+        app.router.add_post("/{name}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._runner.cleanup()
+
+
+def _manager(server: StandIn, **kwargs) -> AlertManager:
+    manager = AlertManager(**kwargs)
+    manager._alert_rules["storm"] = AlertRule(
+        id="storm",
+        name="Storm",
+        description="Test rule",
+        alert_type=AlertType.SYSTEM,
+        priority=AlertPriority.P2_HIGH,
+        condition="true",
+        channels=[AlertChannel.SLACK, AlertChannel.WEBHOOK],
+    )
+    for key, option, path in (
+        ("slack_default", "webhook_url", "/slack"),
+        ("webhook_default", "url", "/webhook"),
+    ):
+        channel = manager._notification_channels[key]
+        channel.config[option] = server.base_url + path
+        channel.retry_delay_seconds = 0.01
+    return manager
+
+
+async def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_alert_is_delivered_to_slack_and_webhook():
+    async with StandIn() as server:
+        manager = _manager(server)
+        await manager.start()
+        alert = manager.create_alert("storm", "Disk full", "Volume at 99%")
+
+        await _wait_for(lambda: len(alert.channels_notified) == 2)
+        await manager.stop()
+
+    assert server.requests["/webhook"][0]["id"] == alert.id
+    slack = server.requests["/slack"][0]
+    assert slack["attachments"][0]["title"] == "Disk full"
+
+
+@pytest.mark.asyncio
+async def test_burst_is_coalesced_into_digests():
+    async with StandIn() as server:
+        server.delays["/webhook"] = 0.05
+        manager = _manager(server, channel_concurrency=1, digest_threshold=5)
+        await manager.start()
+        alerts = [manager.create_alert("storm", f"Alert {i}", "burst") for i in range(50)]
+
+        await _wait_for(lambda: all(len(a.channels_notified) == 2 for a in alerts))
+        await manager.stop()
+
+    webhook = server.requests["/webhook"]
+    assert len(webhook) < 50
+    assert any(payload.get("digest") for payload in webhook)
+    delivered = sum(payload.get("count", 1) for payload in webhook)
+    assert delivered == 50
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried():
+    async with StandIn() as server:
+        server.failures["/webhook"] = 2
+        manager = _manager(server)
+        await manager.start()
+        alert = manager.create_alert("storm", "Flaky", "retry me")
+
+        await _wait_for(lambda: AlertChannel.WEBHOOK in alert.channels_notified)
+        await manager.stop()
+
+    assert len(server.requests["/webhook"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_channel_does_not_block_others():
+    async with StandIn() as server:
+        server.delays["/webhook"] = 1.0
+        manager = _manager(server)
+        await manager.start()
+        alert = manager.create_alert("storm", "Slow", "slow webhook")
+
+        await _wait_for(lambda: AlertChannel.SLACK in alert.channels_notified, timeout=0.5)
+        assert AlertChannel.WEBHOOK not in alert.channels_notified
+        await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_permanent_failure_is_not_retried():
+    async with StandIn() as server:
+        dispatcher = NotificationDispatcher()
+        with pytest.raises(DeliveryError) as excinfo:
+            await dispatcher.post_json(server.base_url + "/missing/path", {}, retry_attempts=3)
+        await dispatcher.close()
+
+    assert excinfo.value.status == 404
+
+
+@pytest.mark.asyncio
+async def test_full_channel_queue_counts_overflow():
+    delivered: list[tuple[list, int]] = []
+
+    async def send(items, overflow):
+        delivered.append((items, overflow))
+
+    worker = ChannelWorker("test", send, concurrency=1, max_queue_size=3, digest_threshold=2)
+    accepted = [worker.submit(i) for i in range(5)]
+    worker.start()
+    await worker.stop()
+
+    assert accepted == [True, True, True, False, False]
+    assert delivered == [([0, 1, 2], 2)]
+    assert worker.get_stats()["dropped"] == 2
@@ -0,0 +1,100 @@
+"""Tests for compiled resolution plans in the dependency injection container."""
+
+import pytest
+
+from hacs_infrastructure.container import (
+    CircularDependencyError,
+    Container,
+    DependencyError,
+    ServiceLifetime,
+)
+
+
+class Repository:
+    def __init__(self) -> None:
+        self.items: list[str] = []
+
+
+class Cache:
+    pass
+
+
+class Service:
+    def __init__(self, repository: Repository, cache: Cache | None = None, retries: int = 3):
+        self.repository = repository
+        self.cache = cache
+        self.retries = retries
+
+
+class Left:
+    def __init__(self, right: "Right") -> None:
+        self.right = right
+
+
+class Right:
+    def __init__(self, left: Left) -> None:
+        self.left = left
+
+
+def test_lifetimes_and_plan_reuse():
+    container = Container()
+    container.register_singleton(Repository)
+    container.register(Service)
+
+    first = container.get(Service)
+    second = container.get(Service)
+
+    assert first is not second
+    assert first.repository is second.repository
+    assert isinstance(first.cache, Cache)
+    assert first.retries == 3
+    assert container._plans[Service].dependencies == [Repository, Cache]
+
+    container.register(Service, factory=lambda: "replaced")
+    assert container.get(Service) == "replaced"
+
+
+def test_scoped_services_and_child_containers():
+    parent = Container()
+    parent.register(Repository, lifetime=ServiceLifetime.SCOPED)
+    child = parent.create_child()
+
+    with parent.create_scope():
+        assert parent.get(Repository) is parent.get(Repository)
+    assert parent.get(Repository) is not parent.get(Repository)
+
+    assert isinstance(child.get(Service).repository, Repository)
+    parent.register_instance(Repository, marker := Repository())
+    assert child.get(Service).repository is marker
+
+
+def test_builtin_parameters_keep_defaults():
+    class Settings:
+        def __init__(self, name: str = "x", retries: int = 3, timeout: float | None = None):
+            self.name = name
+            self.retries = retries
+            self.timeout = timeout
+
+    class NeedsPort:
+        def __init__(self, port: int) -> None:
+            self.port = port
+
+    container = Container()
+    settings = container.get(Settings)
+    assert (settings.name, settings.retries, settings.timeout) == ("x", 3, None)
+
+    with pytest.raises(DependencyError, match="int is not registered"):
+        container.get(NeedsPort)
+    container.register_instance(int, 8080)
+    assert container.get(NeedsPort).port == 8080
+
+
+def test_cycles_are_reported_ahead_of_time():
+    container = Container()
+    container.register(Left)
+    container.register(Right)
+
+    with pytest.raises(CircularDependencyError, match="Left -> Right -> Left"):
+        container.validate()
+    with pytest.raises(DependencyError):
+        container.get(Right)
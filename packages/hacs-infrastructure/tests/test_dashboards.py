@@ -0,0 +1,87 @@
+"""Tests for concurrent, cached dashboard widget loading."""
+
+import asyncio
+import time
+
+import pytest
+
+from hacs_infrastructure.dashboards import (
+    ChartType,
+    Dashboard,
+    DashboardType,
+    DashboardWidget,
+    HealthcareDashboardManager,
+)
+
+
+def _manager(sources: dict, timeout: float = 1.0, refresh_interval: int = 30):
+    manager = HealthcareDashboardManager()
+    for name, func in sources.items():
+        manager.register_data_source(name, func)
+    manager.register_custom_dashboard(
+        Dashboard(
+            id="ops",
+            name="Ops",
+            description="Ops",
+            dashboard_type=DashboardType.PERFORMANCE_MONITORING,
+            widgets=[
+                DashboardWidget(
+                    id=name,
+                    title=name,
+                    chart_type=ChartType.METRIC_CARD,
+                    data_source=name,
+                    refresh_interval_seconds=refresh_interval,
+                    timeout_seconds=timeout,
+                )
+                for name in sources
+            ],
+        )
+    )
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_widgets_load_concurrently_and_coalesce():
+    calls = []
+
+    def source(delay):
+        async def fetch(widget, organization):
+            calls.append(widget.id)
+            await asyncio.sleep(delay)
+            return {"value": delay}
+
+        return fetch
+
+    manager = _manager({"fast": source(0.05), "slow": source(0.2), "hangs": source(5)}, 0.3)
+
+    started = time.perf_counter()
+    views = await asyncio.gather(*(manager.get_dashboard_data("ops") for _ in range(5)))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert sorted(calls) == ["fast", "hangs", "slow"]
+    assert views[0]["widgets"]["slow"]["data"] == {"value": 0.2}
+    assert "timed out" in views[0]["widgets"]["hangs"]["error"]
+
+    # Successful widgets are cached; the failed one is retried
+    await manager.get_dashboard_data("ops")
+    assert calls.count("slow") == 1 and calls.count("hangs") == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_widgets_refresh_in_background():
+    values = iter(range(10))
+
+    async def counter(widget, organization):
+        await asyncio.sleep(0.05)
+        return next(values)
+
+    manager = _manager({"count": counter}, refresh_interval=0)
+
+    first = await manager.get_widget_data("ops", "count")
+    second = await manager.get_widget_data("ops", "count")
+    assert first["data"] == second["data"] == 0 and second["stale"] is True
+
+    await asyncio.sleep(0.1)
+    assert (await manager.get_widget_data("ops", "count"))["data"] == 1
+    assert (await manager.get_widget_data("ops", "count", refresh=True))["data"] == 2
@@ -0,0 +1,91 @@
+"""Tests for bounded and concurrent EventBus dispatch."""
+
+import asyncio
+
+import pytest
+
+from hacs_infrastructure import EventBus, EventError, OverflowPolicy
+
+
+def test_slow_subscriber_does_not_stall_others():
+    async def scenario():
+        bus = EventBus(
+            concurrent_dispatch=True,
+            subscriber_queue_size=10,
+            overflow_policy=OverflowPolicy.DROP_OLDEST,
+        )
+        fast, slow, batches = [], [], []
+
+        async def slow_handler(event):
+            await asyncio.sleep(0.05)
+            slow.append(event)
+
+        bus.subscribe(fast.append)
+        slow_id = bus.subscribe(slow_handler, is_async=True)
+        bus.subscribe(lambda batch: batches.append(len(batch)), batch_size=20)
+
+        await bus.start()
+        for i in range(200):
+            bus.publish_event("tool_call", "agent", {"i": i})
+        await asyncio.sleep(0.1)
+        await bus.stop()
+
+        metrics = {m["subscription_id"]: m for m in bus.get_subscription_metrics()}
+        return fast, slow, batches, metrics[slow_id]
+
+    fast, slow, batches, slow_metrics = asyncio.run(scenario())
+
+    assert len(fast) == 200
+    assert sum(batches) == 200 and max(batches) <= 20
+    assert len(slow) < 200
+    assert slow_metrics["dropped_count"] > 0
+    assert slow_metrics["max_lag_seconds"] > 0
+
+
+def test_batch_subscription_with_default_dispatch():
+    async def scenario():
+        bus = EventBus(dispatch_batch_size=50)
+        batches, single = [], []
+        bus.subscribe(lambda batch: batches.append([e.data["i"] for e in batch]), batch_size=20)
+        bus.subscribe(single.append)
+
+        await bus.start()
+        bus._processing_task.cancel()  # queue everything, then drain in one go
+        for i in range(45):
+            bus.publish_event("tool_call", "agent", {"i": i})
+        bus._processing_task = asyncio.create_task(bus._process_events())
+        await asyncio.sleep(0.05)
+        await bus.stop()
+        return batches, single
+
+    batches, single = asyncio.run(scenario())
+
+    assert [len(batch) for batch in batches] == [20, 20, 5]
+    assert [i for batch in batches for i in batch] == list(range(45))
+    assert [event.data["i"] for event in single] == list(range(45))
+
+
+def test_bounded_queue_overflow_policies():
+    async def scenario(policy):
+        bus = EventBus(max_event_history=5, max_queue_size=3, overflow_policy=policy)
+        await bus.start()
+        bus._processing_task.cancel()  # keep events queued
+        try:
+            for i in range(5):
+                bus.publish_event("clinical_action", "agent", {"i": i})
+        finally:
+            stats = bus.get_statistics()
+            queued = [bus._event_queue.get_nowait().data["i"] for _ in range(stats["queue_size"])]
+            await bus.stop()
+        return stats, queued, bus.get_event_history()
+
+    stats, queued, history = asyncio.run(scenario(OverflowPolicy.DROP_OLDEST))
+    assert queued == [2, 3, 4]
+    assert stats["total_events_dropped"] == 2
+    assert [e.data["i"] for e in history] == [4, 3, 2, 1, 0]
+
+    _, queued, _ = asyncio.run(scenario(OverflowPolicy.DROP_NEWEST))
+    assert queued == [0, 1, 2]
+
+    with pytest.raises(EventError):
+        asyncio.run(scenario(OverflowPolicy.BLOCK))
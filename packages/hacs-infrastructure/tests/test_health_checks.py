@@ -0,0 +1,91 @@
+"""Tests for the concurrent health check scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from hacs_infrastructure.health_checks import CheckType, HealthCheckConfig, HealthCheckManager
+
+
+def _manager(**checks) -> HealthCheckManager:
+    manager = HealthCheckManager()
+    manager._check_configs.clear()
+    manager._check_functions.clear()
+    for name, (function, timeout, interval) in checks.items():
+        manager.register_health_check(
+            HealthCheckConfig(
+                name=name,
+                check_type=CheckType.SERVICE,
+                description=name,
+                timeout_seconds=timeout,
+                interval_seconds=interval,
+            ),
+            function,
+        )
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_checks_run_concurrently_with_timeouts():
+    async def slow():
+        await asyncio.sleep(0.2)
+        return True
+
+    def blocking():
+        time.sleep(0.2)
+        return {"healthy": True, "details": {"mode": "sync"}}
+
+    async def hangs():
+        await asyncio.sleep(10)
+
+    manager = _manager(
+        slow=(slow, 5, 30), blocking=(blocking, 5, 30), hangs=(hangs, 0.3, 30)
+    )
+
+    started = time.perf_counter()
+    results = await manager.run_all_checks()
+
+    assert time.perf_counter() - started < 0.6
+    assert results["slow"].is_healthy and results["blocking"].is_healthy
+    assert "timed out" in results["hangs"].error
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_report_served_from_cache_while_revalidating():
+    calls = 0
+
+    async def counted():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return True
+
+    manager = _manager(counted=(counted, 5, 0))
+    assert manager.get_readiness()["ready"] is False
+
+    first = await manager.get_health_report()
+    assert calls == 1 and first.checks["counted"].is_healthy
+    assert manager.get_readiness()["ready"] is True
+
+    # Expired results are returned immediately and refreshed in the background
+    started = time.perf_counter()
+    await manager.get_health_report()
+    assert time.perf_counter() - started < 0.04
+    await asyncio.sleep(0.1)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_checks_on_interval():
+    calls = []
+    manager = _manager(ping=(lambda: calls.append(1) or True, 5, 0.05))
+    manager.stagger_window_seconds = 0
+
+    await manager.start()
+    await asyncio.sleep(0.18)
+    await manager.stop()
+
+    assert 3 <= len(calls) <= 5
+    assert manager.get_readiness()["status"] == "healthy"
@@ -0,0 +1,91 @@
+"""Tests for hot-path span instrumentation."""
+
+import asyncio
+
+import pytest
+
+from hacs_infrastructure.instrumentation import (
+    NOOP_SPAN,
+    SpanStatsExporter,
+    current_span,
+    disable_instrumentation,
+    enable_instrumentation,
+    start_span,
+    traced,
+)
+
+
+@pytest.fixture
+def exporter():
+    exporter = enable_instrumentation(SpanStatsExporter())
+    yield exporter
+    disable_instrumentation()
+
+
+def test_disabled_instrumentation_returns_noop_span():
+    disable_instrumentation()
+
+    @traced("noop.call")
+    def call():
+        return current_span()
+
+    with start_span("noop") as span:
+        assert span is NOOP_SPAN
+        span.set_attributes(rows=1)
+    assert call() is NOOP_SPAN
+
+
+def test_nested_spans_aggregate_self_time_rows_and_bytes(exporter):
+    with start_span("agent.turn") as turn:
+        for _ in range(3):
+            with start_span("persistence.read", resource_type="Patient") as span:
+                span.set_attributes(rows=2, bytes=100)
+
+    report = exporter.report()
+    read = report["persistence.read"]
+    assert read["count"] == 3
+    assert read["rows"] == 6
+    assert read["bytes"] == 300
+    assert report["agent.turn"]["self_ms"] <= report["agent.turn"]["total_ms"]
+
+    trace = exporter.get_trace(turn.trace_id)
+    assert [span["name"] for span in trace] == ["persistence.read"] * 3 + ["agent.turn"]
+    assert all(span["parent_id"] == turn.span_id for span in trace[:3])
+
+
+@pytest.mark.asyncio
+async def test_traced_coroutine_records_latency_and_errors(exporter):
+    @traced("tool.execute", tool="lookup")
+    async def execute(fail: bool):
+        await asyncio.sleep(0.01)
+        current_span().set_attribute("rows", 1)
+        if fail:
+            msg = "boom"
+            raise ValueError(msg)
+        return "ok"
+
+    assert await execute(False) == "ok"
+    with pytest.raises(ValueError):
+        await execute(True)
+
+    stats = exporter.report()["tool.execute"]
+    assert stats["count"] == 2
+    assert stats["errors"] == 1
+    assert stats["p95_ms"] >= 10
+    assert exporter.recent_spans()[-1]["error"] == "ValueError"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_keep_separate_parents(exporter):
+    async def request(name: str):
+        with start_span("mcp.handle_request", method=name):
+            await asyncio.sleep(0)
+            with start_span("tool.execute"):
+                await asyncio.sleep(0)
+
+    await asyncio.gather(request("a"), request("b"))
+
+    spans = exporter.recent_spans()
+    parents = {span["span_id"] for span in spans if span["name"] == "mcp.handle_request"}
+    children = [span for span in spans if span["name"] == "tool.execute"]
+    assert {span["parent_id"] for span in children} == parents
@@ -0,0 +1,94 @@
+"""Tests for dependency-driven service startup and shutdown."""
+
+import asyncio
+import time
+
+import pytest
+
+from hacs_infrastructure.lifecycle import (
+    LifecycleState,
+    ServiceLifecycle,
+    ShutdownManager,
+    StartupManager,
+)
+
+
+class FakeService:
+    def __init__(self, name: str, delay: float, events: list[str], fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.events = events
+        self.fail = fail
+
+    async def start(self):
+        self.events.append(f"start:{self.name}")
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        self.events.append(f"up:{self.name}")
+
+    async def stop(self):
+        await asyncio.sleep(self.delay / 2)
+        self.events.append(f"down:{self.name}")
+
+
+def _manager(events: list[str], spec: dict[str, tuple[float, list[str]]], fail=()):
+    manager = StartupManager()
+    for name, (delay, deps) in spec.items():
+        manager.add_service(
+            ServiceLifecycle(name, FakeService(name, delay, events, name in fail), deps)
+        )
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_services_start_as_soon_as_dependencies_are_up():
+    events: list[str] = []
+    # mcp only needs the fast pool; it must not wait for the slow vector store
+    manager = _manager(
+        events,
+        {
+            "db_pool": (0.05, []),
+            "vector_store": (0.3, []),
+            "mcp": (0.05, ["db_pool"]),
+            "gateway": (0.05, ["mcp", "vector_store"]),
+        },
+    )
+
+    started = time.perf_counter()
+    await manager.start_all()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.45
+    assert events.index("start:mcp") < events.index("up:vector_store")
+    report = manager.get_startup_report()
+    assert report["critical_path"] == ["vector_store", "gateway"]
+    assert report["services"]["mcp"]["duration_ms"] >= 40
+
+    await ShutdownManager(manager).shutdown_all(timeout=5)
+    assert events.index("down:gateway") < events.index("down:mcp") < events.index("down:db_pool")
+    assert events.index("down:gateway") < events.index("down:vector_store")
+
+
+@pytest.mark.asyncio
+async def test_failure_stops_scheduling_dependents():
+    events: list[str] = []
+    manager = _manager(
+        events, {"db_pool": (0.01, []), "mcp": (0.01, ["db_pool"])}, fail={"db_pool"}
+    )
+
+    with pytest.raises(RuntimeError, match="db_pool failed"):
+        await manager.start_all()
+
+    assert "start:mcp" not in events
+    status = manager.get_startup_status()["services"]
+    assert status["db_pool"]["state"] == LifecycleState.FAILED
+    assert status["mcp"]["state"] == LifecycleState.CREATED
+
+
+@pytest.mark.asyncio
+async def test_startup_timeout():
+    manager = _manager([], {"slow": (1.0, [])})
+
+    with pytest.raises(TimeoutError):
+        await manager.start_all(timeout=0.05)
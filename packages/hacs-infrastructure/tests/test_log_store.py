@@ -0,0 +1,67 @@
+"""Tests for the indexed log store behind LogAggregator."""
+
+from datetime import UTC, datetime, timedelta
+
+from hacs_infrastructure.log_aggregation import CorrelationType, LogAggregator, LogSeverity
+
+
+def test_search_uses_tokens_prefixes_and_filters():
+    aggregator = LogAggregator(buffer_size=1000)
+    aggregator.add_log_entry(LogSeverity.INFO, "mcp", "Tool execution completed")
+    aggregator.add_log_entry(LogSeverity.ERROR, "db", "Authentication failed for user_7")
+    aggregator.add_log_entry(LogSeverity.WARN, "db", "Slow query performance warning")
+
+    assert [e.message for e in aggregator.search_logs("slow query")] == [
+        "Slow query performance warning"
+    ]
+    assert len(aggregator.search_logs("authent")) == 1
+    assert aggregator.search_logs("failed", level=LogSeverity.INFO) == []
+    assert len(aggregator.search_logs(service="db")) == 2
+    # Pattern tags are applied before indexing
+    assert len(aggregator.search_logs(tags=["security"])) == 1
+
+
+def test_search_matches_substrings_inside_words():
+    aggregator = LogAggregator(buffer_size=1000)
+    messages = [
+        "Unauthorized access attempt for patient_id=a12345",
+        "Access granted",
+        "Order 912345 shipped",
+    ]
+    for message in messages:
+        aggregator.add_log_entry(LogSeverity.INFO, "api", message)
+
+    for query in ["authorized", "12345", "ccess", "ent_id", "id=a12", "d access", "a", "=", " "]:
+        expected = [m for m in reversed(messages) if query.lower() in m.lower()]
+        assert [e.message for e in aggregator.search_logs(query)] == expected, query
+    assert aggregator.search_logs("access granted!") == []
+
+
+def test_buffer_bound_and_correlation():
+    aggregator = LogAggregator(buffer_size=5)
+    for i in range(8):
+        aggregator.add_log_entry(
+            LogSeverity.INFO, "agent", f"step {i}", trace_id="trace-1" if i % 2 else "trace-2"
+        )
+
+    assert [e.message for e in aggregator.search_logs("step")] == [
+        f"step {i}" for i in range(7, 2, -1)
+    ]
+    correlation = aggregator.correlate_logs(CorrelationType.TRACE_ID, "trace-1")
+    assert [e.message for e in correlation.entries] == ["step 3", "step 5", "step 7"]
+
+    aggregator.add_log_entry(LogSeverity.ERROR, "agent", "step 8", trace_id="trace-1")
+    assert aggregator.correlate_logs(CorrelationType.TRACE_ID, "trace-1").error_count == 1
+
+
+def test_retention_drops_old_segments():
+    aggregator = LogAggregator(retention_days=1)
+    old = datetime.now(UTC) - timedelta(days=3)
+    aggregator.add_structured_log(
+        {"timestamp": old.isoformat(), "level": "info", "service": "s", "message": "old entry"}
+    )
+    aggregator.add_log_entry(LogSeverity.INFO, "s", "new entry")
+
+    assert [e.message for e in aggregator.search_logs("entry")] == ["new entry"]
+    stats = aggregator.get_log_statistics(hours=24)
+    assert stats["total_logs"] == 1
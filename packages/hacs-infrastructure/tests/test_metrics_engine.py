@@ -0,0 +1,94 @@
+"""Tests for the sharded metrics engine and quantile sketches."""
+
+import random
+import threading
+
+from hacs_infrastructure import (
+    MetricsCollector,
+    MetricsEngine,
+    QuantileSketch,
+    get_metrics_engine,
+    render_exported_metrics,
+)
+
+
+def test_sketch_quantiles_within_relative_error():
+    rng = random.Random(7)
+    values = [rng.expovariate(1 / 40) for _ in range(20000)]
+    sketch = QuantileSketch(significant_bits=5)
+    for value in values:
+        sketch.record(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert abs(sketch.quantile(q) - exact) / exact < 0.05
+
+
+def test_sketch_merge_and_round_trip():
+    left, right = QuantileSketch(), QuantileSketch()
+    for value in range(1, 501):
+        left.record(value)
+        right.record(value + 500)
+
+    left.merge(QuantileSketch.from_dict(right.to_dict()))
+    assert left.count == 1000
+    assert left.min == 1 and left.max == 1000
+    assert abs(left.quantile(0.5) - 500) / 500 < 0.05
+
+
+def test_engine_counts_across_threads_and_workers():
+    engine = MetricsEngine()
+
+    def work():
+        for _ in range(1000):
+            engine.increment("tool.calls", tags={"tool": "search"})
+            engine.observe("tool.latency_ms", 12.5, tags={"tool": "search"})
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert engine.counter_value("tool.calls", {"tool": "search"}) == 4000
+    assert engine.histogram("tool.latency_ms", {"tool": "search"}).count == 4000
+
+    aggregate = MetricsEngine()
+    aggregate.merge_snapshot(engine.snapshot())
+    aggregate.merge_snapshot(engine.snapshot())
+    assert aggregate.counter_value("tool.calls", {"tool": "search"}) == 8000
+
+
+def test_collector_prometheus_exposition():
+    collector = MetricsCollector(record_history=False)
+    collector.record_timing("db.query", 3.0, tags={"table": "patients"})
+    collector.set_gauge("pool.size", 5)
+
+    text = collector.render_prometheus("hacs")
+    assert "# TYPE hacs_db_query_count counter" in text
+    assert 'hacs_db_query_duration{table="patients",quantile="0.99"} 3.0' in text
+    assert "hacs_pool_size 5" in text
+    assert collector.get_histogram_stats("db.query.duration", {"table": "patients"})["count"] == 1
+
+
+def test_collector_history_can_be_disabled():
+    collector = MetricsCollector()
+    collector.increment_counter("jobs.done")
+    collector.increment_counter("jobs.done")
+    assert [point.value for point in collector.get_metric_history("jobs.done")] == [1, 2]
+
+    collector = MetricsCollector(record_history=False)
+    collector.increment_counter("jobs.done")
+    assert collector.get_metric_history("jobs.done") == []
+
+
+def test_exported_metrics_include_collector_engines():
+    get_metrics_engine().increment("exporter.global.hits")
+    collector = MetricsCollector()
+    collector.increment_counter("exporter.collector.hits", 3)
+
+    text = render_exported_metrics("hacs")
+    assert "hacs_exporter_global_hits 1" in text
+    assert "hacs_exporter_collector_hits 3" in text
+    assert text.count("# TYPE hacs_exporter_collector_hits counter") == 1
@@ -0,0 +1,66 @@
+"""Tests for rolling aggregates behind the healthcare monitoring summaries."""
+
+import time
+
+from hacs_infrastructure.healthcare_monitoring import (
+    ClinicalSeverity,
+    ComplianceStatus,
+    HealthcareMetricsCollector,
+)
+from hacs_infrastructure.rolling_aggregates import HyperLogLog, RollingAggregator
+
+
+def test_hyperloglog_estimates_distinct_values():
+    sketch = HyperLogLog()
+    for i in range(50000):
+        sketch.add(f"patient-{i % 20000}")
+
+    assert abs(sketch.count() - 20000) / 20000 < 0.05
+
+    other = HyperLogLog()
+    for i in range(15000, 30000):
+        other.add(f"patient-{i}")
+    sketch.merge(other)
+    assert abs(sketch.count() - 30000) / 30000 < 0.05
+
+
+def test_windows_use_minute_then_hour_buckets():
+    aggregator = RollingAggregator(("action",), unique=("user",), retention_seconds=3 * 86400)
+    now = time.time()
+    for minutes_ago in range(0, 600, 5):
+        aggregator.add({"action": "read", "user": f"u{minutes_ago % 7}"}, now - minutes_ago * 60)
+    aggregator.add({"action": "write", "user": "u0"}, now - 2 * 86400)
+
+    # Minute resolution: 0..60 minutes ago inclusive
+    last_hour = aggregator.summarize(3600, now)
+    assert last_hour["total"] == 13
+    assert aggregator.count(3600, "action", "read", now) == 13
+
+    three_days = aggregator.summarize(3 * 86400, now)
+    assert three_days["by"]["action"] == {"read": 120, "write": 1}
+    assert three_days["unique"]["user"] == 7
+    assert aggregator.stats()["minute_buckets"] <= 121
+
+
+def test_collector_summaries_and_bounded_raw_events():
+    collector = HealthcareMetricsCollector(max_raw_events=100)
+    for i in range(1000):
+        collector.record_phi_access(f"dr_{i % 10}", f"patient-{i % 250}", "Observation", "read")
+    collector.create_clinical_alert("sepsis", ClinicalSeverity.CRITICAL, "patient-1", "Sepsis risk")
+    collector.record_compliance_event(
+        "audit", ComplianceStatus.VIOLATION, "Missing audit", remediation_required=True
+    )
+
+    phi = collector.get_phi_access_summary()
+    assert phi["total_accesses"] == 1000
+    assert phi["by_user"]["dr_3"] == 100
+    assert phi["unique_users"] == 10
+    assert abs(phi["unique_patients"] - 250) <= 10
+    assert len(collector._phi_access_events) <= 110
+
+    alerts = collector.get_clinical_alerts_summary()
+    assert alerts["by_severity"] == {"critical": 1} and alerts["critical_unresolved"] == 1
+
+    compliance = collector.get_compliance_summary()
+    assert compliance["violations"] == 1 and compliance["remediation_required"] == 1
+    assert compliance["compliance_score"] == 90.0
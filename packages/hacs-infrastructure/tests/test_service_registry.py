@@ -0,0 +1,125 @@
+"""Tests for pooled, adaptive service health checking and circuit breaking."""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from hacs_infrastructure.service_registry import (
+    CircuitState,
+    HealthCheck,
+    ServiceDiscovery,
+    ServiceRegistry,
+    ServiceStatus,
+)
+
+
+class StubServer:
+    """Local HTTP health endpoint recording requests and client connections."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.peers: set[int] = set()
+        self.unhealthy: set[str] = set()
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def _health(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername")[1])
+        status = 503 if request.match_info["instance"] in self.unhealthy else 200
+        return web.Response(status=status)
+
+    async def __aenter__(self) -> "StubServer":
+        app = web.Application()
+        app.router.add_get("/health/{instance}", self._health)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._runner.cleanup()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_load_1000_instances_share_pooled_connections():
+    async with StubServer() as server:
+        registry = ServiceRegistry(HealthCheck(max_concurrency=50, timeout=5.0))
+        for i in range(1000):
+            registry.register_service(
+                f"svc-{i % 10}",
+                "10.0.0.1",
+                10000 + i,
+                health_check_url=f"{server.base_url}/health/{i}",
+            )
+
+        started = time.perf_counter()
+        await registry._perform_health_checks()
+        first_cycle = time.perf_counter() - started
+        await registry._perform_health_checks()
+        await registry.close()
+
+    assert registry.get_health_summary()["healthy_services"] == 1000
+    assert server.requests == 2000
+    # Both cycles reuse at most one pool's worth of connections
+    assert len(server.peers) <= 50
+    assert first_cycle < 10
+
+
+@pytest.mark.asyncio
+async def test_monitoring_backs_off_healthy_and_probes_failing_faster():
+    async with StubServer() as server:
+        server.unhealthy.add("bad")
+        config = HealthCheck(
+            interval=1, min_interval=0.05, max_interval=0.4, backoff_factor=2.0, timeout=1.0
+        )
+        registry = ServiceRegistry(config)
+        good = registry.register_service(
+            "api", "10.0.0.1", 1, health_check_url=f"{server.base_url}/health/good"
+        )
+        bad = registry.register_service(
+            "api", "10.0.0.2", 2, health_check_url=f"{server.base_url}/health/bad"
+        )
+
+        await registry.start_health_monitoring()
+        await asyncio.sleep(0.5)
+        await registry.stop_health_monitoring()
+
+    assert registry.get_service(good).status == ServiceStatus.HEALTHY
+    assert registry.get_service(bad).status == ServiceStatus.UNHEALTHY
+    assert registry._intervals[good] > config.min_interval
+    assert registry._intervals[bad] == config.min_interval
+    assert registry.get_circuit_state(bad) == CircuitState.OPEN
+    assert registry._session is None
+
+
+def test_discovery_skips_open_circuits_until_trial_succeeds():
+    registry = ServiceRegistry(HealthCheck(failure_threshold=2, circuit_reset_timeout=0.05))
+    first = registry.register_service("api", "10.0.0.1", 1)
+    second = registry.register_service("api", "10.0.0.2", 2)
+    for service_id in (first, second):
+        registry.update_service_status(service_id, ServiceStatus.HEALTHY)
+    discovery = ServiceDiscovery(registry)
+
+    discovery.report_result(first, success=False)
+    discovery.report_result(first, success=False)
+
+    assert registry.get_circuit_state(first) == CircuitState.OPEN
+    assert {discovery.discover_service("api").id for _ in range(4)} == {second}
+
+    time.sleep(0.06)
+    assert registry.get_circuit_state(first) == CircuitState.HALF_OPEN
+    assert {discovery.discover_service("api").id for _ in range(4)} == {first, second}
+
+    discovery.report_result(first, success=False)
+    assert registry.get_circuit_state(first) == CircuitState.OPEN
+
+    time.sleep(0.06)
+    discovery.report_result(first, success=True)
+    assert registry.get_circuit_state(first) == CircuitState.CLOSED
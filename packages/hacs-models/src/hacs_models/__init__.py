@@ -37,6 +37,9 @@ from .allergy_intolerance import (
 )
 from .appointment import Appointment
 from .base_resource import BaseResource, DomainResource
+from .bulk_validation import BulkValidationResult, validate_many
+from .json_patch import JsonPatchError, apply_patch
+from .json_patch import diff as json_diff
 from .care_plan import CarePlan
 from .care_team import CareTeam
 from .condition import Condition, ConditionEvidence, ConditionStage
@@ -102,6 +105,8 @@ from .service_request import (
     create_referral_request,
 )
 from .terminology import (
+    CompiledConceptMap,
+    CompiledValueSet,
     ConceptMap,
     ConceptMapElement,
     TerminologyConcept,
@@ -271,6 +276,7 @@ __all__ = [
     "Appointment",
     # Base classes
     "BaseResource",
+    "BulkValidationResult",
     "BundleEntry",
     "BundleStatus",
     "BundleType",
@@ -287,6 +293,8 @@ __all__ = [
     "CompositionAuthor",
     "CompositionEncounter",
     "CompositionSection",
+    "CompiledConceptMap",
+    "CompiledValueSet",
     "ConceptMap",
     "ConceptMapElement",
     # Condition tracking
@@ -352,6 +360,7 @@ __all__ = [
     "IdentifierUse",
     # Immunization (vaccines)
     "Immunization",
+    "JsonPatchError",
     "LayerSpec",
     "LinkRelation",
     "MappingSpec",
@@ -480,6 +489,9 @@ __all__ = [
     "create_therapist",
     "create_workflow_template_bundle",
     "instantiate_stack_template",
+    "validate_many",
+    "apply_patch",
+    "json_diff",
 ]
 
 # Package metadata for introspection
@@ -22,6 +22,7 @@ Design Principles:
     - Zero external dependencies beyond Pydantic
 """
 
+import copy
 import inspect
 import uuid
 from datetime import datetime, timezone as _timezone
@@ -33,6 +34,7 @@ except Exception:  # pragma: no cover
     UTC = _timezone.utc  # type: ignore[assignment]
 from typing import Any, Callable, ClassVar, Literal, TypeVar, get_args, get_origin
 from dataclasses import dataclass
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict, Field, create_model
 
@@ -94,6 +96,72 @@ except ImportError:
 T = TypeVar("T", bound="BaseResource")
 
 
+@lru_cache(maxsize=None)
+def _construction_plan(
+    cls: type[BaseModel],
+) -> tuple[dict[str, str], dict, tuple, frozenset, str | None]:
+    """Field lookup and defaults of a model for trusted construction.
+
+    Returns:
+        (alias or name -> field name, every field in declaration order with its
+        immutable default (None for the others), (name, factory, takes
+        validated data) for defaults built per instance, required fields, the
+        fixed ``resource_type`` if the model declares one)
+    """
+    names: dict[str, str] = {}
+    template: dict[str, Any] = {}
+    factories = []
+    required = set()
+    for name, field in cls.model_fields.items():
+        names[name] = name
+        template[name] = None
+        for alias in (field.alias, field.validation_alias):
+            if isinstance(alias, str):
+                names[alias] = name
+        if field.default_factory is not None:
+            factories.append(
+                (name, field.default_factory, field.default_factory_takes_validated_data)
+            )
+        elif field.is_required():
+            required.add(name)
+        elif isinstance(field.default, list | dict | set):
+            default = field.default
+            factories.append(
+                (name, type(default) if not default else lambda d=default: copy.deepcopy(d), False)
+            )
+        else:
+            template[name] = field.default
+    fixed_type = getattr(cls.model_fields.get("resource_type"), "default", None)
+    if not isinstance(fixed_type, str):
+        fixed_type = None
+    return names, template, tuple(factories), frozenset(required), fixed_type
+
+
+def _holds_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and get_origin(annotation) is None:
+        return issubclass(annotation, BaseModel)
+    return any(_holds_model(arg) for arg in get_args(annotation))
+
+
+@lru_cache(maxsize=None)
+def _model_typed_fields(cls: type[BaseModel]) -> dict[str, bool]:
+    """Fields declared to hold models, mapped to whether they hold a list of them."""
+    fields = {}
+    for name, field in cls.model_fields.items():
+        annotation = field.annotation
+        if _holds_model(annotation):
+            members = get_args(annotation) if get_origin(annotation) is not None else ()
+            fields[name] = any(get_origin(arg) is list for arg in (annotation, *members))
+    return fields
+
+
+def _is_raw(value: Any, many: bool) -> bool:
+    """Whether a model-typed field value is still plain data (a dict)."""
+    if many:
+        return isinstance(value, list) and any(isinstance(item, dict) for item in value)
+    return isinstance(value, dict)
+
+
 @dataclass
 class FacadeSpec:
     """
@@ -344,11 +412,94 @@ class BaseResource(BaseModel):
         Args:
             __context: Pydantic validation context (unused)
         """
-        # Generate ID with resource-type prefix for clarity
+        # Generate ID with resource-type prefix for clarity. The generated ID
+        # always satisfies the field constraints, so it is stored directly
+        # instead of through assignment validation
         if self.id is None:
             resource_prefix = self.resource_type.lower().replace(" ", "-")
-            unique_suffix = str(uuid.uuid4())[:8]
-            self.id = f"{resource_prefix}-{unique_suffix}"
+            self.__dict__["id"] = f"{resource_prefix}-{uuid.uuid4().hex[:8]}"
+            self.__pydantic_fields_set__.add("id")
+
+    @classmethod
+    def trusted(cls: type[T], **data: Any) -> T:
+        """
+        Build a resource from already-validated data without validating it again.
+
+        For internal hot paths whose data comes from validated models or
+        trusted storage. Field values are used as given: no coercion or
+        constraint check runs. Defaults are filled in, ``model_post_init``
+        still runs (so IDs are generated) and field names are checked. If a
+        model-typed field is given plain dicts instead of model instances,
+        the data is validated as usual instead.
+
+        Args:
+            **data: Field values by name or alias
+
+        Returns:
+            The resource
+
+        Raises:
+            ValueError: If a key is not a field of the model, a required field
+                is missing or ``resource_type`` does not match the model
+        """
+        names, template, factories, required, fixed_type = _construction_plan(cls)
+        given: dict[str, Any] = {}
+        for key, value in data.items():
+            name = names.get(key)
+            if name is None:
+                raise ValueError(f"{cls.__name__} has no field {key!r}")
+            given[name] = value
+        if fixed_type is not None and given.get("resource_type", fixed_type) != fixed_type:
+            raise ValueError(
+                f"resource_type {given['resource_type']!r} does not match {cls.__name__}"
+            )
+        if not required <= given.keys():
+            missing = sorted(required - given.keys())
+            raise ValueError(f"{cls.__name__} is missing required fields {missing}")
+        nested = _model_typed_fields(cls)
+        if any(_is_raw(given[name], nested[name]) for name in nested.keys() & given.keys()):
+            return cls.model_validate(given, by_name=True)
+
+        # Copying the template keeps declaration order, which serialization follows
+        values = template.copy()
+        values.update(given)
+        for name, factory, takes_data in factories:
+            if name not in given:
+                values[name] = factory(values) if takes_data else factory()
+
+        # What model_construct does, minus its per-field alias and default lookups
+        resource = cls.__new__(cls)
+        object.__setattr__(resource, "__dict__", values)
+        object.__setattr__(resource, "__pydantic_fields_set__", set(given))
+        object.__setattr__(resource, "__pydantic_extra__", None)
+        object.__setattr__(resource, "__pydantic_private__", None)
+        resource.model_post_init(None)
+        return resource
+
+    def trusted_update(self: T, **changes: Any) -> T:
+        """
+        Set fields without assignment validation.
+
+        The counterpart of ``trusted`` for mutation loops over validated
+        values; field names are still checked.
+
+        Args:
+            **changes: New field values by name or alias
+
+        Returns:
+            This resource
+
+        Raises:
+            ValueError: If a key is not a field of the model
+        """
+        names = _construction_plan(type(self))[0]
+        for key, value in changes.items():
+            name = names.get(key)
+            if name is None:
+                raise ValueError(f"{type(self).__name__} has no field {key!r}")
+            self.__dict__[name] = value
+            self.__pydantic_fields_set__.add(name)
+        return self
 
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp to current time."""
@@ -364,6 +515,31 @@ class BaseResource(BaseModel):
         """Create object from dictionary representation."""
         return cls(**data)
 
+    def to_json(self, profile: str = "storage") -> str:
+        """
+        Serialize to JSON in one pass through the cached pydantic-core serializer.
+
+        Args:
+            profile: "full", "storage", "compact" or "llm" (see ``hacs_models.serialization``)
+
+        Returns:
+            JSON string
+        """
+        from .serialization import dumps
+
+        return dumps(self, profile).decode()
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "BaseResource":
+        """
+        Validate a resource from JSON, rehydrating defaults omitted by compact profiles.
+
+        Called on BaseResource, the model is resolved from ``resource_type``.
+        """
+        from .serialization import loads
+
+        return loads(data, cls)
+
     # Validatable protocol methods
     def validate(self) -> list[str]:
         """Validate the object and return list of errors."""
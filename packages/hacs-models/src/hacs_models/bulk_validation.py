@@ -0,0 +1,213 @@
+"""
+Bulk validation for large batches of HACS resource payloads.
+
+Payloads are grouped by ``resource_type`` and each group is validated in one
+call through a cached ``TypeAdapter(list[Model])``, so pydantic's core
+validator runs once per type instead of once per resource. Errors are
+reported per payload with RFC 6901 JSON-pointer paths. Very large batches
+can be split across worker processes.
+
+Worker processes pause the cyclic garbage collector while they validate a
+chunk: building thousands of models otherwise triggers repeated collections
+over objects that are all still alive. In-process validation leaves the
+collector alone, since its state is shared by every thread.
+
+Example:
+    >>> result = validate_many([{"resource_type": "Patient", "full_name": "Ana"}])
+    >>> result.is_valid
+    True
+"""
+
+from __future__ import annotations
+
+import gc
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from .base_resource import BaseResource
+from .utils import json_pointer
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Disable the cyclic collector, restoring its previous state on exit."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@lru_cache(maxsize=1)
+def _models() -> dict[str, type[BaseResource]]:
+    from . import get_model_registry
+
+    return get_model_registry()
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[BaseResource]) -> TypeAdapter:
+    """Cached ``TypeAdapter(list[model])``."""
+    return TypeAdapter(list[model])
+
+
+@dataclass
+class BulkValidationResult:
+    """Outcome of validating a batch of payloads.
+
+    Errors are ``{"index", "resource_type", "path", "message", "type"}`` dicts,
+    where ``index`` is the payload's position in the batch and ``path`` a JSON
+    pointer into that payload.
+    """
+
+    total: int
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    counts_by_type: dict[str, int] = field(default_factory=dict)
+    models: list[BaseResource | None] | None = None
+
+    @property
+    def invalid_indices(self) -> set[int]:
+        return {error["index"] for error in self.errors}
+
+    @property
+    def valid_count(self) -> int:
+        return self.total - len(self.invalid_indices)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def errors_by_index(self) -> dict[int, list[dict[str, Any]]]:
+        """Errors grouped by payload index."""
+        grouped: dict[int, list[dict[str, Any]]] = {}
+        for error in self.errors:
+            grouped.setdefault(error["index"], []).append(error)
+        return grouped
+
+
+def _error(index: int, resource_type: Any, path: str, message: str, kind: str) -> dict[str, Any]:
+    return {
+        "index": index,
+        "resource_type": resource_type,
+        "path": path,
+        "message": message,
+        "type": kind,
+    }
+
+
+def _validate_in_process(payloads: Sequence[Any], keep_models: bool) -> BulkValidationResult:
+    result = BulkValidationResult(total=len(payloads))
+    models = _models()
+    groups: dict[type[BaseResource], list[int]] = {}
+
+    for index, payload in enumerate(payloads):
+        if not isinstance(payload, dict):
+            result.errors.append(_error(index, None, "", "Resource must be an object", "dict_type"))
+            continue
+        resource_type = payload.get("resource_type")
+        model = models.get(resource_type) if isinstance(resource_type, str) else None
+        if model is None:
+            message = (
+                f"Unknown resource type: {resource_type}"
+                if resource_type
+                else "Resource missing 'resource_type' field"
+            )
+            result.errors.append(
+                _error(index, resource_type, "/resource_type", message, "resource_type")
+            )
+            continue
+        groups.setdefault(model, []).append(index)
+
+    if keep_models:
+        result.models = [None] * len(payloads)
+    for model, indices in groups.items():
+        result.counts_by_type[model.__name__] = len(indices)
+        adapter = list_adapter(model)
+        batch = [payloads[i] for i in indices]
+        try:
+            validated = adapter.validate_python(batch)
+        except ValidationError as e:
+            failed = set()
+            for error in e.errors(include_url=False):
+                position, *location = error["loc"]
+                index = indices[position]
+                failed.add(position)
+                path = json_pointer(location)
+                result.errors.append(
+                    _error(index, model.__name__, path, error["msg"], error["type"])
+                )
+            if not keep_models:
+                continue
+            indices = [i for position, i in enumerate(indices) if position not in failed]
+            validated = adapter.validate_python([payloads[i] for i in indices])
+        if keep_models:
+            for index, model_instance in zip(indices, validated):
+                result.models[index] = model_instance
+
+    result.errors.sort(key=lambda error: error["index"])
+    return result
+
+
+def _validate_chunk(payloads: Sequence[Any]) -> BulkValidationResult:
+    with _gc_paused():
+        return _validate_in_process(payloads, keep_models=False)
+
+
+def validate_many(
+    payloads: Sequence[Any],
+    *,
+    keep_models: bool = False,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BulkValidationResult:
+    """Validate a batch of resource payloads grouped by ``resource_type``.
+
+    Args:
+        payloads: Resource dicts, each with a ``resource_type``
+        keep_models: Return the validated instances (None for invalid payloads)
+        processes: Worker processes for batches larger than ``chunk_size``;
+            None or 1 validates in this process
+        chunk_size: Payloads per worker task
+
+    Returns:
+        BulkValidationResult with errors in payload order
+
+    Raises:
+        ValueError: If ``keep_models`` is combined with ``processes``
+    """
+    if not processes or processes <= 1 or len(payloads) <= chunk_size:
+        return _validate_in_process(payloads, keep_models)
+    if keep_models:
+        raise ValueError("keep_models is only supported for in-process validation")
+
+    offsets = range(0, len(payloads), chunk_size)
+    chunks = [payloads[offset : offset + chunk_size] for offset in offsets]
+    result = BulkValidationResult(total=len(payloads))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for offset, chunk_result in zip(offsets, pool.map(_validate_chunk, chunks)):
+            for error in chunk_result.errors:
+                error["index"] += offset
+                result.errors.append(error)
+            for resource_type, count in chunk_result.counts_by_type.items():
+                result.counts_by_type[resource_type] = (
+                    result.counts_by_type.get(resource_type, 0) + count
+                )
+    return result
+
+
+__all__ = [
+    "BulkValidationResult",
+    "json_pointer",
+    "list_adapter",
+    "validate_many",
+]
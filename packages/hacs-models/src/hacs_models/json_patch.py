@@ -0,0 +1,276 @@
+"""
+RFC 6902 JSON Patch diff and apply for HACS resource documents.
+
+``diff`` produces the operations turning one JSON document into another.
+Lists whose items are all objects with distinct ``id`` values are aligned
+by id, so inserting, removing or reordering one entry of a long list (names,
+telecom, bundle entries) yields a few ``add``/``remove``/``move`` operations
+plus nested changes instead of replacing the whole list. Other lists are
+aligned by position.
+
+Example:
+    >>> before = {"name": "A", "tags": ["x"]}
+    >>> ops = diff(before, {"name": "B", "tags": ["x", "y"]})
+    >>> [(op["op"], op["path"]) for op in ops]
+    [('replace', '/name'), ('add', '/tags/1')]
+    >>> apply_patch(before, ops)
+    {'name': 'B', 'tags': ['x', 'y']}
+"""
+
+from __future__ import annotations
+
+import bisect
+import copy
+from typing import Any
+
+from .utils import json_pointer, parse_json_pointer
+
+PATCH_OPERATIONS = frozenset({"add", "remove", "replace", "move", "copy", "test"})
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch is malformed or cannot be applied to a document."""
+
+
+def _child(path: str, token: Any) -> str:
+    return path + json_pointer([token])
+
+
+def _equal(a: Any, b: Any) -> bool:
+    # JSON equality: true/1 and false/0 differ even though Python treats them as equal
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    return a == b
+
+
+def _item_ids(items: list[Any], id_key: str) -> list[Any] | None:
+    ids = [item.get(id_key) if isinstance(item, dict) else None for item in items]
+    if any(item_id is None for item_id in ids) or len(set(map(repr, ids))) != len(ids):
+        return None
+    return ids
+
+
+def _diff_values(before: Any, after: Any, path: str, ops: list[dict[str, Any]], id_key: str):
+    if isinstance(before, dict) and isinstance(after, dict):
+        for key in before:
+            if key not in after:
+                ops.append({"op": "remove", "path": _child(path, key)})
+        for key, value in after.items():
+            if key not in before:
+                ops.append({"op": "add", "path": _child(path, key), "value": value})
+            else:
+                _diff_values(before[key], value, _child(path, key), ops, id_key)
+    elif isinstance(before, list) and isinstance(after, list):
+        before_ids = _item_ids(before, id_key)
+        after_ids = _item_ids(after, id_key) if before_ids is not None else None
+        if after_ids is not None:
+            _diff_list_by_id(before, after, before_ids, after_ids, path, ops, id_key)
+        else:
+            _diff_list_by_position(before, after, path, ops, id_key)
+    elif not _equal(before, after):
+        ops.append({"op": "replace", "path": path, "value": after})
+
+
+def _diff_list_by_position(before: list, after: list, path: str, ops: list, id_key: str):
+    common = min(len(before), len(after))
+    for index in range(common):
+        _diff_values(before[index], after[index], _child(path, index), ops, id_key)
+    for index in range(len(before) - 1, common - 1, -1):
+        ops.append({"op": "remove", "path": _child(path, index)})
+    for index in range(common, len(after)):
+        ops.append({"op": "add", "path": _child(path, index), "value": after[index]})
+
+
+def _stable_positions(sequence: list[int]) -> set[int]:
+    # Indexes of a longest increasing subsequence (patience sorting)
+    tails: list[int] = []
+    tail_values: list[int] = []
+    previous: list[int] = [-1] * len(sequence)
+    for index, value in enumerate(sequence):
+        position = bisect.bisect_left(tail_values, value)
+        if position:
+            previous[index] = tails[position - 1]
+        if position == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[position] = index
+            tail_values[position] = value
+    stable: set[int] = set()
+    index = tails[-1] if tails else -1
+    while index != -1:
+        stable.add(index)
+        index = previous[index]
+    return stable
+
+
+def _diff_list_by_id(
+    before: list,
+    after: list,
+    before_ids: list,
+    after_ids: list,
+    path: str,
+    ops: list,
+    id_key: str,
+):
+    target = {repr(item_id): index for index, item_id in enumerate(after_ids)}
+    # Remove dropped items from the end so earlier indexes stay valid
+    for index in range(len(before) - 1, -1, -1):
+        if repr(before_ids[index]) not in target:
+            ops.append({"op": "remove", "path": _child(path, index)})
+
+    current = [(repr(i), item) for i, item in zip(before_ids, before) if repr(i) in target]
+    # Items outside the longest run already in target order are moved to the
+    # end first; the walk below then only moves each of them once more
+    stable = _stable_positions([target[key] for key, _ in current])
+    unstable = sorted(
+        (p for p in range(len(current)) if p not in stable), key=lambda p: target[current[p][0]]
+    )
+    if unstable:
+        keys = [key for key, _ in current]
+        for position in unstable:
+            key = current[position][0]
+            ops.append(
+                {"op": "move", "from": _child(path, keys.index(key)), "path": _child(path, "-")}
+            )
+            keys.append(keys.pop(keys.index(key)))
+        by_key = dict(current)
+        current = [(key, by_key[key]) for key in keys]
+
+    for index, (item_id, item) in enumerate(zip(after_ids, after)):
+        key = repr(item_id)
+        position = next((p for p in range(index, len(current)) if current[p][0] == key), None)
+        if position is None:
+            ops.append({"op": "add", "path": _child(path, index), "value": item})
+            current.insert(index, (key, item))
+            continue
+        if position != index:
+            ops.append(
+                {"op": "move", "from": _child(path, position), "path": _child(path, index)}
+            )
+            current.insert(index, current.pop(position))
+        _diff_values(current[index][1], item, _child(path, index), ops, id_key)
+
+
+def diff(before: Any, after: Any, *, id_key: str = "id") -> list[dict[str, Any]]:
+    """RFC 6902 operations that turn ``before`` into ``after``.
+
+    Args:
+        before: Original JSON document
+        after: Updated JSON document
+        id_key: Key used to align lists of objects
+
+    Returns:
+        Patch operations, in application order
+    """
+    ops: list[dict[str, Any]] = []
+    _diff_values(before, after, "", ops, id_key)
+    return ops
+
+
+def _list_index(container: list, token: str, *, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _resolve(document: Any, tokens: list[str]) -> Any:
+    node = document
+    for token in tokens:
+        if isinstance(node, dict):
+            if token not in node:
+                raise JsonPatchError(f"Path not found: {json_pointer(tokens)}")
+            node = node[token]
+        elif isinstance(node, list):
+            node = node[_list_index(node, token, allow_end=False)]
+        else:
+            raise JsonPatchError(f"Path not found: {json_pointer(tokens)}")
+    return node
+
+
+def _add(document: Any, tokens: list[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, tokens[-1], allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Cannot add to a scalar at {json_pointer(tokens[:-1])}")
+    return document
+
+
+def _remove(document: Any, tokens: list[str]) -> Any:
+    if not tokens:
+        raise JsonPatchError("Cannot remove the whole document")
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        if tokens[-1] not in parent:
+            raise JsonPatchError(f"Path not found: {json_pointer(tokens)}")
+        return parent.pop(tokens[-1])
+    if isinstance(parent, list):
+        return parent.pop(_list_index(parent, tokens[-1], allow_end=False))
+    raise JsonPatchError(f"Path not found: {json_pointer(tokens)}")
+
+
+def apply_patch(document: Any, ops: list[dict[str, Any]], *, in_place: bool = False) -> Any:
+    """Apply RFC 6902 operations to a JSON document.
+
+    Args:
+        document: JSON document
+        ops: Patch operations
+        in_place: Mutate ``document`` instead of a deep copy
+
+    Returns:
+        The patched document
+
+    Raises:
+        JsonPatchError: If an operation is malformed, a path does not exist
+            or a ``test`` operation fails
+    """
+    result = document if in_place else copy.deepcopy(document)
+    for op in ops:
+        kind = op.get("op")
+        if kind not in PATCH_OPERATIONS or "path" not in op:
+            raise JsonPatchError(f"Invalid patch operation: {op!r}")
+        tokens = parse_json_pointer(op["path"])
+        if kind in ("add", "replace", "test") and "value" not in op:
+            raise JsonPatchError(f"Operation is missing 'value': {op!r}")
+        if kind in ("move", "copy") and "from" not in op:
+            raise JsonPatchError(f"Operation is missing 'from': {op!r}")
+
+        if kind == "add":
+            result = _add(result, tokens, copy.deepcopy(op["value"]))
+        elif kind == "remove":
+            _remove(result, tokens)
+        elif kind == "replace":
+            value = copy.deepcopy(op["value"])
+            if not tokens:
+                result = value
+                continue
+            _resolve(result, tokens)
+            parent = _resolve(result, tokens[:-1])
+            if isinstance(parent, list):
+                parent[_list_index(parent, tokens[-1], allow_end=False)] = value
+            else:
+                parent[tokens[-1]] = value
+        elif kind == "move":
+            source = parse_json_pointer(op["from"])
+            if tokens[: len(source)] == source and tokens != source:
+                raise JsonPatchError(f"Cannot move {op['from']} into itself")
+            result = _add(result, tokens, _remove(result, source))
+        elif kind == "copy":
+            value = copy.deepcopy(_resolve(result, parse_json_pointer(op["from"])))
+            result = _add(result, tokens, value)
+        elif not _equal(_resolve(result, tokens), op["value"]):
+            raise JsonPatchError(f"Test failed at {op['path']}")
+    return result
+
+
+__all__ = ["JsonPatchError", "PATCH_OPERATIONS", "apply_patch", "diff"]
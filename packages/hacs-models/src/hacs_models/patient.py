@@ -28,6 +28,10 @@ from pydantic import Field, computed_field, field_validator, model_validator
 from .base_resource import DomainResource, FacadeSpec
 from .types import AddressUse, ContactPointSystem, ContactPointUse, Gender, IdentifierUse, NameUse
 
+# Name prefixes and suffixes recognized when parsing full_name (without trailing dots)
+_NAME_PREFIXES = frozenset({"dr", "mr", "ms", "mrs", "prof"})
+_NAME_SUFFIXES = frozenset({"JR", "SR", "III", "II", "IV", "MD", "PHD", "RN", "NP"})
+
 
 class HumanName(DomainResource):
     """
@@ -705,23 +709,15 @@ class Patient(DomainResource):
 
         name_parts = full_name.strip().split()
 
-        # Common prefixes and suffixes
-        prefixes = ["Dr.", "Dr", "Mr.", "Mr", "Ms.", "Ms", "Mrs.", "Mrs", "Prof.", "Prof"]
-        suffixes = ["Jr.", "Jr", "Sr.", "Sr", "III", "II", "IV", "MD", "PhD", "RN", "NP"]
-
         parsed_prefix = []
         parsed_suffix = []
 
         # Extract prefixes
-        while name_parts and any(
-            name_parts[0].rstrip(".").lower() == p.rstrip(".").lower() for p in prefixes
-        ):
+        while name_parts and name_parts[0].rstrip(".").lower() in _NAME_PREFIXES:
             parsed_prefix.append(name_parts.pop(0))
 
         # Extract suffixes
-        while name_parts and any(
-            name_parts[-1].rstrip(".").upper() == s.rstrip(".").upper() for s in suffixes
-        ):
+        while name_parts and name_parts[-1].rstrip(".").upper() in _NAME_SUFFIXES:
             parsed_suffix.insert(0, name_parts.pop())  # Insert at beginning to maintain order
 
         if not name_parts:
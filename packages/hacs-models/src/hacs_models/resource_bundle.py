@@ -1,11 +1,19 @@
 """Resource bundle models.
 
 Minimal yet usable bundle types for grouping related HACS resources.
+
+Bundles keep a private index of their entries by resource type, tag,
+resource id and reference target. It is updated incrementally as entries are
+appended (through ``add_entry``/``extend_entries`` or directly on
+``entries``) and rebuilt when the list is replaced or shrinks; call
+``reindex()`` after editing entries in place.
 """
 
+import re
+from collections.abc import Iterable
 from typing import Any, Literal
 
-from pydantic import Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from .base_resource import BaseResource
 from .types import BundleStatus, BundleType
@@ -36,6 +44,70 @@ class BundleEntry(BaseResource):
     metadata: dict[str, Any] = Field(default_factory=dict, description="Arbitrary entry metadata")
 
 
+_REFERENCE_PATTERN = re.compile(r"^[A-Z][A-Za-z]+/[A-Za-z0-9\-.]+$")
+
+
+def _reference_targets(value: Any, depth: int = 0) -> Iterable[str]:
+    """``Type/id`` reference strings found in a resource's field values."""
+    if depth > 4:
+        return
+    if isinstance(value, str):
+        if _REFERENCE_PATTERN.match(value):
+            yield value
+    elif isinstance(value, BaseModel):
+        for name, item in value.__dict__.items():
+            if name != "id" and item is not None:
+                yield from _reference_targets(item, depth + 1)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _reference_targets(item, depth + 1)
+    elif isinstance(value, list | tuple):
+        for item in value:
+            yield from _reference_targets(item, depth + 1)
+
+
+class BundleIndex:
+    """Entry positions by resource type, tag, resource id and reference target."""
+
+    __slots__ = ("entries", "size", "by_type", "by_tag", "by_id", "by_reference", "duplicate_ids")
+
+    def __init__(self, entries: list["BundleEntry"]):
+        self.entries = entries
+        self.size = 0
+        self.by_type: dict[str, list[int]] = {}
+        self.by_tag: dict[str, list[int]] = {}
+        self.by_id: dict[str, int] = {}
+        self.by_reference: dict[str, list[int]] = {}
+        self.duplicate_ids: set[str] = set()
+
+    def add(self, entry: "BundleEntry") -> None:
+        position = self.size
+        self.size += 1
+        for tag in entry.tags or ():
+            self.by_tag.setdefault(tag, []).append(position)
+        resource = entry.resource
+        if resource is None:
+            return
+        resource_type = getattr(resource, "resource_type", None)
+        if resource_type is not None:
+            self.by_type.setdefault(resource_type, []).append(position)
+        resource_id = getattr(resource, "id", None)
+        if resource_id is not None:
+            if resource_id in self.by_id:
+                self.duplicate_ids.add(resource_id)
+            else:
+                self.by_id[resource_id] = position
+        if isinstance(resource, BaseModel):
+            for target in set(_reference_targets(resource)):
+                self.by_reference.setdefault(target, []).append(position)
+
+    def sync(self) -> "BundleIndex":
+        """Index entries appended since the last call."""
+        for entry in self.entries[self.size :]:
+            self.add(entry)
+        return self
+
+
 class ResourceBundle(BaseResource):
     resource_type: Literal["ResourceBundle"] = Field(default="ResourceBundle")
     title: str | None = Field(default=None, description="Bundle title")
@@ -68,6 +140,21 @@ class ResourceBundle(BaseResource):
     maturity_level: str | None = None
     experimental: bool | None = None
 
+    _index: BundleIndex | None = PrivateAttr(default=None)
+
+    @property
+    def index(self) -> BundleIndex:
+        """Entry index, brought up to date with ``entries``."""
+        index = self._index
+        if index is None or index.entries is not self.entries or index.size > len(self.entries):
+            index = self._index = BundleIndex(self.entries)
+        return index.sync()
+
+    def reindex(self) -> BundleIndex:
+        """Rebuild the index, e.g. after entries were edited in place."""
+        self._index = None
+        return self.index
+
     def add_entry(
         self,
         resource: BaseResource,
@@ -84,6 +171,33 @@ class ResourceBundle(BaseResource):
             contained_resource_id=getattr(resource, "id", None),
         )
         self.entries.append(entry)
+        if self._index is not None and self._index.entries is self.entries:
+            self._index.sync()
+
+    def extend_entries(self, items: Iterable[BundleEntry | BaseResource]) -> int:
+        """
+        Append many entries at once.
+
+        Resources are wrapped in ``BundleEntry`` objects; ready-made entries are
+        appended as-is. The entries list is extended in place, so the bundle is
+        not revalidated, and only the new entries are indexed.
+
+        Args:
+            items: BundleEntry objects or resources
+
+        Returns:
+            Number of entries appended
+        """
+        new_entries = [
+            item
+            if isinstance(item, BundleEntry)
+            else BundleEntry(resource=item, contained_resource_id=getattr(item, "id", None))
+            for item in items
+        ]
+        self.entries.extend(new_entries)
+        if self._index is not None and self._index.entries is self.entries:
+            self._index.sync()
+        return len(new_entries)
 
     # Compatibility helpers used by tests (no-op/simple implementations)
     def add_resource(
@@ -155,14 +269,32 @@ class ResourceBundle(BaseResource):
         return bundle
 
     def get_resources_by_type(self, resource_type: str) -> list[BaseResource]:
-        return [
-            e.resource
-            for e in self.entries
-            if getattr(e.resource, "resource_type", None) == resource_type
-        ]
+        entries = self.entries
+        return [entries[i].resource for i in self.index.by_type.get(resource_type, ())]
 
     def get_resources_by_tag(self, tag: str) -> list[BaseResource]:
-        return [e.resource for e in self.entries if tag in (e.tags or [])]
+        entries = self.entries
+        return [entries[i].resource for i in self.index.by_tag.get(tag, ())]
+
+    def get_resource_by_id(self, resource_id: str) -> BaseResource | None:
+        """First contained resource with this id, if any."""
+        position = self.index.by_id.get(resource_id)
+        return self.entries[position].resource if position is not None else None
+
+    def get_resources_referencing(self, target: str | BaseResource) -> list[BaseResource]:
+        """
+        Contained resources that reference ``target``.
+
+        Args:
+            target: ``"Type/id"`` reference or a resource
+
+        Returns:
+            Resources whose fields contain the reference, in entry order
+        """
+        if isinstance(target, BaseResource):
+            target = target.to_reference()
+        entries = self.entries
+        return [entries[i].resource for i in self.index.by_reference.get(target, ())]
 
     def add_workflow_binding(
         self,
@@ -213,8 +345,7 @@ class ResourceBundle(BaseResource):
 
     def validate_bundle_integrity(self) -> dict[str, Any]:
         issues: list[str] = []
-        ids = [getattr(e.resource, "id", None) for e in self.entries if e.resource is not None]
-        if len(ids) != len(set(ids)):
+        if self.index.duplicate_ids:
             issues.append("Duplicate resource IDs found in bundle")
         # Unique workflow ids
         wf_ids = [getattr(w, "workflow_id", None) for w in self.workflow_bindings]
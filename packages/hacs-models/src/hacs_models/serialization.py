@@ -0,0 +1,306 @@
+"""
+Fast JSON serialization for HACS resources.
+
+Resources are encoded straight to JSON bytes by each class's cached
+pydantic-core serializer (``__pydantic_serializer__.to_json``) instead of
+building a dict with ``model_dump`` and encoding it again with
+``json.dumps``. Plain containers holding resources are encoded with orjson
+when it is installed (``pip install hacs-models[fast]``).
+
+Profiles:
+    - ``full``: every field, including computed fields (``model_dump`` output)
+    - ``storage``: round-trippable; aliases, no computed fields
+    - ``compact``: ``storage`` without None, default values and empty default
+      collections, for compact storage; defaults are restored when the payload
+      is validated again. ``COMPACT_KEEP_FIELDS`` are always written so
+      database-side filters and checks still see them.
+    - ``llm``: readable context without None and default values
+
+Example:
+    >>> data = dumps(patient, profile="compact")
+    >>> loads(data) == patient  # defaults are rehydrated
+    True
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from .base_resource import BaseResource
+from .bulk_validation import _models, validate_many
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# exclude_computed_fields needs pydantic-core from pydantic 2.12 (the declared floor)
+SERIALIZATION_PROFILES: dict[str, dict[str, bool]] = {
+    "full": {},
+    "storage": {"by_alias": True, "exclude_computed_fields": True},
+    "compact": {
+        "by_alias": True,
+        "exclude_computed_fields": True,
+        "exclude_none": True,
+        "exclude_defaults": True,
+    },
+    "llm": {"exclude_none": True, "exclude_defaults": True},
+}
+
+# Top-level fields stored even at their default value: routing, optimistic
+# concurrency (version) and the most common JSONB filters
+COMPACT_KEEP_FIELDS = frozenset(
+    {"resource_type", "id", "version", "status", "subject", "created_at", "updated_at"}
+)
+
+# Profiles that may drop Literal defaults such as resource_type
+_SPARSE_PROFILES = frozenset(
+    name for name, options in SERIALIZATION_PROFILES.items() if options.get("exclude_defaults")
+)
+
+
+def _options(profile: str) -> dict[str, bool]:
+    try:
+        return SERIALIZATION_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown serialization profile {profile!r}; "
+            f"expected one of {sorted(SERIALIZATION_PROFILES)}"
+        ) from None
+
+
+def to_jsonable(resource: BaseModel, profile: str = "storage") -> dict[str, Any]:
+    """JSON-compatible dict of a resource under a profile.
+
+    ``resource_type`` is always kept so the payload can be loaded again.
+    """
+    serializer = resource.__pydantic_serializer__
+    options = _options(profile)
+    data = serializer.to_python(resource, mode="json", **options)
+    if profile == "compact":
+        missing = {
+            name
+            for name in COMPACT_KEEP_FIELDS - data.keys()
+            if getattr(resource, name, None) is not None
+        }
+        if missing:
+            kept = serializer.to_python(
+                resource, mode="json", include=missing, by_alias=options.get("by_alias", False)
+            )
+            data = {**kept, **data}
+    resource_type = getattr(resource, "resource_type", None)
+    if resource_type is not None and "resource_type" not in data:
+        data = {"resource_type": resource_type, **data}
+    return data
+
+
+@lru_cache(maxsize=None)
+def compact_defaults(model: type[BaseModel]) -> dict[str, Any]:
+    """JSON values of the top-level fields ``compact`` documents may omit.
+
+    Keyed like stored documents (by alias). Fields whose default factory
+    does not return a fixed value are left out, as are ``COMPACT_KEEP_FIELDS``.
+    """
+    defaults: dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if field.is_required() or name in COMPACT_KEEP_FIELDS:
+            continue
+        if field.default_factory is not None:
+            if field.default_factory_takes_validated_data:
+                continue
+            value = field.default_factory()
+            if value != field.default_factory():
+                continue
+        else:
+            value = field.default
+        defaults[field.alias or name] = to_jsonable_python(value, by_alias=True)
+    return defaults
+
+
+def json_text(value: Any) -> str:
+    """A JSON scalar as text, the way PostgreSQL's ``->>`` renders it."""
+    return value if isinstance(value, str) else json_dumps(value).decode()
+
+
+def compact_default_text(model: type[BaseModel] | None, name: str) -> str | None:
+    """``json_text`` of a top-level field's default when ``compact`` omits it.
+
+    SQL filters compare ``COALESCE(data->>name, <default>)`` so rows storing
+    the field at its default still match. None for fields without a fixed
+    scalar default.
+    """
+    if model is None:
+        return None
+    value = compact_defaults(model).get(name)
+    if value is None or isinstance(value, dict | list):
+        return None
+    return json_text(value)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, set | frozenset | tuple):
+        return list(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    # Anything else is rendered as text rather than failing the whole payload
+    return str(value)
+
+
+@lru_cache(maxsize=None)
+def _default_for(profile: str):
+    _options(profile)
+
+    def default(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return to_jsonable(value, profile)
+        return _plain(value)
+
+    return default
+
+
+def dumps(resource: BaseModel, profile: str = "storage") -> bytes:
+    """Encode a resource as JSON bytes.
+
+    Args:
+        resource: Resource (or any pydantic model)
+        profile: Serialization profile
+
+    Returns:
+        UTF-8 JSON
+    """
+    if profile in _SPARSE_PROFILES:
+        return json_dumps(to_jsonable(resource, profile), profile)
+    return resource.__pydantic_serializer__.to_json(resource, **_options(profile))
+
+
+def dumps_many(resources: Iterable[BaseResource], profile: str = "storage") -> bytes:
+    """Encode resources as one JSON array."""
+    return b"[" + b",".join(dumps(resource, profile) for resource in resources) + b"]"
+
+
+def json_dumps(value: Any, profile: str = "full") -> bytes:
+    """Encode plain JSON data that may contain resources (orjson when available).
+
+    Args:
+        value: JSON data; nested resources are encoded with ``profile``.
+            Values JSON has no type for (sets, Decimals, arbitrary objects)
+            become lists or text.
+        profile: Serialization profile for nested resources
+
+    Returns:
+        UTF-8 JSON
+    """
+    default = _default_for(profile)
+    if orjson is not None:
+        return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=default, ensure_ascii=False).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def resolve_model(resource_type: str | None) -> type[BaseResource] | None:
+    """Registered model class for a ``resource_type``."""
+    return _models().get(resource_type) if resource_type else None
+
+
+def loads(data: bytes | str | dict[str, Any], model: type[BaseResource] | None = None):
+    """Decode and validate a resource.
+
+    With a known model, JSON is validated directly by pydantic-core without an
+    intermediate dict. Otherwise the model is resolved from ``resource_type``.
+
+    Args:
+        data: JSON bytes/str, or an already-decoded dict
+        model: Expected model class
+
+    Returns:
+        The validated resource
+
+    Raises:
+        ValueError: If the resource type is unknown
+        pydantic.ValidationError: If the payload is invalid
+    """
+    if model is not None and model is not BaseResource:
+        if isinstance(data, dict):
+            return model.model_validate(data)
+        return model.model_validate_json(data)
+
+    payload = data if isinstance(data, dict) else json_loads(data)
+    resolved = resolve_model(payload.get("resource_type"))
+    if resolved is None:
+        raise ValueError(f"Unknown resource type: {payload.get('resource_type')}")
+    return resolved.model_validate(payload)
+
+
+def loads_many(data: bytes | str | list[dict[str, Any]]) -> list[BaseResource]:
+    """Decode and validate a JSON array of resources, batched per type.
+
+    Raises:
+        ValueError: If any payload is invalid (see ``validate_many`` for
+            per-item errors)
+    """
+    payloads = data if isinstance(data, list) else json_loads(data)
+    result = validate_many(payloads, keep_models=True)
+    if not result.is_valid:
+        first = result.errors[0]
+        raise ValueError(
+            f"{len(result.invalid_indices)} invalid resources; first at "
+            f"[{first['index']}]{first['path']}: {first['message']}"
+        )
+    return result.models
+
+
+def profile_sizes(
+    resources: Iterable[BaseResource], profiles: Iterable[str] = ("storage", "compact")
+) -> dict[str, Any]:
+    """Encoded size of resources under each profile.
+
+    Args:
+        resources: Sample resources
+        profiles: Profiles to compare; the first is the baseline
+
+    Returns:
+        ``{"count", "bytes": {profile: total}, "savings": {profile: ratio}}``
+        where savings are relative to the first profile
+    """
+    resources = list(resources)
+    profiles = list(profiles)
+    sizes = {
+        profile: sum(len(dumps(resource, profile)) for resource in resources)
+        for profile in profiles
+    }
+    baseline = sizes[profiles[0]] or 1
+    return {
+        "count": len(resources),
+        "bytes": sizes,
+        "savings": {profile: round(1 - size / baseline, 4) for profile, size in sizes.items()},
+    }
+
+
+__all__ = [
+    "COMPACT_KEEP_FIELDS",
+    "SERIALIZATION_PROFILES",
+    "compact_default_text",
+    "compact_defaults",
+    "dumps",
+    "dumps_many",
+    "json_dumps",
+    "json_loads",
+    "json_text",
+    "loads",
+    "loads_many",
+    "profile_sizes",
+    "resolve_model",
+    "to_jsonable",
+]
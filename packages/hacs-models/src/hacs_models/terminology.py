@@ -4,13 +4,21 @@ HACS Terminology Models (FHIR-inspired)
 This module provides lightweight, agent-friendly terminology models aligned with
 FHIR Terminology resources (CodeSystem, ValueSet, ConceptMap) to support
 code resolution, value set composition, and concept mapping.
+
+ValueSets and ConceptMaps compile into hash indexes keyed by (system, code)
+on first use, so membership checks and translations are O(1) per coding and
+batch calls (``contains_many``/``translate_many``) scale to thousands of
+codings. The compiled index is cached on the resource and rebuilt when its
+concept lists are replaced or change length; after editing concepts in place,
+call ``update_timestamp()`` so the next lookup recompiles.
 """
 
 from __future__ import annotations
 
-from typing import Literal
+from collections.abc import Callable, Iterable
+from typing import Any, Literal
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from .base_resource import DomainResource
 
@@ -75,6 +83,29 @@ class ValueSet(DomainResource):
         default_factory=list, description="Expanded concepts for fast agent lookups"
     )
 
+    _compiled: tuple | None = PrivateAttr(default=None)
+
+    def compile(self) -> CompiledValueSet:
+        """Membership index for the current concepts (built once, then cached)."""
+        sources = (self.expanded_concepts, self.include_concepts, self.include_systems)
+        return _cached_compile(self, sources, CompiledValueSet)
+
+    def contains(self, system: str | None, code: str) -> bool:
+        """Whether a coding is a member of this value set."""
+        return self.compile().contains(system, code)
+
+    def contains_many(self, codings: Iterable[Any]) -> list[bool]:
+        """Membership of many codings, in input order.
+
+        Args:
+            codings: ``(system, code)`` pairs, ``{"system", "code"}`` dicts or
+                Coding-like objects; a missing system matches the code in any system
+
+        Returns:
+            One flag per coding
+        """
+        return self.compile().contains_many(codings)
+
 
 class ConceptMapElement(DomainResource):
     resource_type: Literal["ConceptMapElement"] = Field(default="ConceptMapElement")
@@ -101,3 +132,149 @@ class ConceptMap(DomainResource):
     group: list[ConceptMapElement] = Field(
         default_factory=list, description="List of mapping elements"
     )
+
+    _compiled: tuple | None = PrivateAttr(default=None)
+
+    def compile(self) -> CompiledConceptMap:
+        """Translation tables for the current mapping elements (built once, then cached)."""
+        return _cached_compile(self, (self.group,), CompiledConceptMap)
+
+    def translate(
+        self, system: str | None, code: str, *, reverse: bool = False
+    ) -> list[ConceptMapElement]:
+        """Mapping elements for a source coding (or a target coding when ``reverse``)."""
+        return self.compile().translate(system, code, reverse=reverse)
+
+    def translate_many(
+        self, codings: Iterable[Any], *, reverse: bool = False
+    ) -> list[list[ConceptMapElement]]:
+        """Translate many codings, in input order.
+
+        Args:
+            codings: ``(system, code)`` pairs, ``{"system", "code"}`` dicts or
+                Coding-like objects; a missing system matches the code in any system
+            reverse: Map target codings back to their sources
+
+        Returns:
+            Matching mapping elements per coding (empty when unmapped)
+        """
+        return self.compile().translate_many(codings, reverse=reverse)
+
+
+def coding_key(coding: Any) -> tuple[str | None, str | None]:
+    """(system, code) of a pair, a coding dict or a Coding-like object."""
+    if isinstance(coding, (tuple, list)):
+        return coding[0], coding[1]
+    if isinstance(coding, dict):
+        return coding.get("system"), coding.get("code")
+    return getattr(coding, "system", None), getattr(coding, "code", None)
+
+
+class CompiledValueSet:
+    """Hash index over a ValueSet's concepts.
+
+    The expansion defines membership when present; otherwise explicitly
+    included concepts plus every code of the whole systems listed in
+    ``include_systems``.
+    """
+
+    __slots__ = ("_by_code", "concepts", "systems")
+
+    def __init__(self, value_set: ValueSet):
+        concepts = value_set.expanded_concepts or value_set.include_concepts
+        self.concepts: dict[tuple[str, str], TerminologyConcept] = {
+            (c.system_uri, c.code): c for c in concepts
+        }
+        self.systems: frozenset[str] = frozenset(
+            () if value_set.expanded_concepts
+            else (s["system_uri"] for s in value_set.include_systems if s.get("system_uri"))
+        )
+        self._by_code: dict[str, list[TerminologyConcept]] = {}
+        for concept in self.concepts.values():
+            self._by_code.setdefault(concept.code, []).append(concept)
+
+    def __len__(self) -> int:
+        return len(self.concepts)
+
+    def lookup(self, system: str | None, code: str) -> TerminologyConcept | None:
+        """Concept for a coding, or None when it is not enumerated."""
+        if system is None:
+            matches = self._by_code.get(code)
+            return matches[0] if matches else None
+        return self.concepts.get((system, code))
+
+    def contains(self, system: str | None, code: str | None) -> bool:
+        """Whether a coding is a member."""
+        if code is None:
+            return False
+        if system is None:
+            return code in self._by_code
+        return (system, code) in self.concepts or system in self.systems
+
+    def contains_many(self, codings: Iterable[Any]) -> list[bool]:
+        """Membership of many codings, in input order."""
+        contains = self.contains
+        return [contains(*coding_key(coding)) for coding in codings]
+
+
+class CompiledConceptMap:
+    """Forward and reverse translation tables over a ConceptMap's elements."""
+
+    __slots__ = ("_forward_by_code", "_reverse_by_code", "forward", "reverse")
+
+    def __init__(self, concept_map: ConceptMap):
+        self.forward: dict[tuple[str, str], list[ConceptMapElement]] = {}
+        self.reverse: dict[tuple[str, str], list[ConceptMapElement]] = {}
+        self._forward_by_code: dict[str, list[ConceptMapElement]] = {}
+        self._reverse_by_code: dict[str, list[ConceptMapElement]] = {}
+        for element in concept_map.group:
+            self.forward.setdefault((element.source, element.source_code), []).append(element)
+            self.reverse.setdefault((element.target, element.target_code), []).append(element)
+            self._forward_by_code.setdefault(element.source_code, []).append(element)
+            self._reverse_by_code.setdefault(element.target_code, []).append(element)
+
+    def translate(
+        self, system: str | None, code: str | None, *, reverse: bool = False
+    ) -> list[ConceptMapElement]:
+        """Mapping elements for a coding (empty when unmapped)."""
+        if code is None:
+            return []
+        if system is None:
+            table = self._reverse_by_code if reverse else self._forward_by_code
+            return list(table.get(code, ()))
+        table = self.reverse if reverse else self.forward
+        return list(table.get((system, code), ()))
+
+    def translate_many(
+        self, codings: Iterable[Any], *, reverse: bool = False
+    ) -> list[list[ConceptMapElement]]:
+        """Translate many codings, in input order."""
+        translate = self.translate
+        return [translate(*coding_key(coding), reverse=reverse) for coding in codings]
+
+
+def _cached_compile(
+    resource: ValueSet | ConceptMap, sources: tuple[list, ...], build: Callable
+) -> Any:
+    """Compiled index cached on the resource.
+
+    The cache entry remembers the source lists it was built from (by identity
+    and length) and the resource's ``updated_at``, so assigning a field,
+    appending to a list or calling ``update_timestamp()`` triggers a rebuild.
+    """
+    cached = resource._compiled
+    if cached is not None:
+        compiled, updated_at, seen = cached
+        if updated_at == resource.updated_at and all(
+            source is previous and len(source) == size
+            for source, (previous, size) in zip(sources, seen, strict=True)
+        ):
+            return compiled
+
+    compiled = build(resource)
+    resource._compiled = (
+        compiled,
+        resource.updated_at,
+        tuple((source, len(source)) for source in sources),
+    )
+    return compiled
@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 
+def json_pointer(location: Iterable[Any]) -> str:
+    """RFC 6901 JSON pointer for a sequence of keys and list indexes."""
+    parts = (str(part).replace("~", "~0").replace("/", "~1") for part in location)
+    return "".join(f"/{part}" for part in parts)
+
+
+def parse_json_pointer(pointer: str) -> list[str]:
+    """Reference tokens of an RFC 6901 JSON pointer ("" is the whole document)."""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
 def set_nested_field(obj: Any, path: str, value: Any) -> None:
     parts = path.split(".")
     cur = obj
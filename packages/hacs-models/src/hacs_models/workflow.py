@@ -1,6 +1,6 @@
 """Workflow models - minimal, FHIR-aligned compatibility layer."""
 
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 from pydantic import Field, model_validator
 
@@ -241,32 +241,116 @@ class WorkflowExecution(BaseResource):
     def start_execution(self, input_parameters: dict[str, Any] | None = None) -> None:
         from datetime import datetime
 
-        self.status = EventStatus.IN_PROGRESS
-        self.started = datetime.now().isoformat()
-        if input_parameters:
-            self.input_parameters.update(input_parameters)
+        data = {"input_parameters": input_parameters} if input_parameters else None
+        self.apply_event("started", data, datetime.now().isoformat())
 
     def complete_step(self, idx: int, output: dict[str, Any]) -> None:
-        self.completed_steps[idx] = output
-        if idx >= self.current_step:
-            self.current_step = idx + 1
-        if self.current_step >= self.total_steps:
-            self.status = EventStatus.COMPLETED
-            from datetime import datetime
+        from datetime import datetime
 
-            self.ended = datetime.now().isoformat()
+        self.apply_event("step", {"step": idx, "output": output}, datetime.now().isoformat())
 
     def fail_execution(self, message: str) -> None:
-        self.status = EventStatus.STOPPED
         from datetime import datetime
 
-        self.ended = datetime.now().isoformat()
-        self.errors.append(message)
+        self.apply_event("error", {"message": message, "fatal": True}, datetime.now().isoformat())
 
     def add_task(self, task_id: str, active: bool = True) -> None:
-        self.tasks.append(task_id)
-        if active:
-            self.active_tasks.append(task_id)
+        self.apply_event("task", {"task_id": task_id, "active": active})
+
+    # Event kind -> (handler, payload key types, keys it requires)
+    EVENT_KINDS: ClassVar[dict[str, tuple[str, dict[str, type], tuple[str, ...]]]] = {
+        "started": ("_apply_started", {"input_parameters": dict}, ()),
+        "step": ("_apply_step", {"step": int, "output": dict}, ("step",)),
+        "task": ("_apply_task", {"task_id": str, "active": bool}, ("task_id",)),
+        "warning": ("_apply_warning", {"message": str}, ("message",)),
+        "error": ("_apply_error", {"message": str, "fatal": bool}, ("message",)),
+    }
+
+    @classmethod
+    def validate_event(cls, kind: str, data: dict[str, Any] | None = None) -> None:
+        """
+        Check an event's kind and payload.
+
+        Required keys must be present and every known key must have its type
+        (optional keys may be None); ``step`` must be a non-negative integer.
+
+        Raises:
+            ValueError: If the event kind is unknown or the payload is invalid
+        """
+        if kind not in cls.EVENT_KINDS:
+            raise ValueError(f"Unknown workflow execution event: {kind!r}")
+        if data is not None and not isinstance(data, dict):
+            raise ValueError(f"Workflow execution {kind!r} event payload must be a dict")
+        data = data or {}
+        _, types, required = cls.EVENT_KINDS[kind]
+        missing = [key for key in required if key not in data]
+        if missing:
+            raise ValueError(f"Workflow execution {kind!r} event is missing {missing}")
+        for key, expected in types.items():
+            value = data.get(key)
+            if value is None and key not in required:
+                continue
+            # bool is an int subclass, but not a valid step
+            if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+                raise ValueError(
+                    f"Workflow execution {kind!r} event {key!r} must be "
+                    f"{expected.__name__}, got {value!r}"
+                )
+        if kind == "step" and data["step"] < 0:
+            raise ValueError(f"Workflow execution step must be >= 0, got {data['step']}")
+
+    def apply_event(
+        self, kind: str, data: dict[str, Any] | None = None, at: str | None = None
+    ) -> None:
+        """
+        Apply one recorded state change.
+
+        The lifecycle methods above are built on this, and execution state
+        stores replay their event rows through it.
+
+        Args:
+            kind: "started", "step", "task", "warning" or "error"
+            data: Event payload: ``input_parameters`` (started), ``step`` and
+                ``output`` (step), ``task_id`` and ``active`` (task),
+                ``message`` and ``fatal`` (warning/error)
+            at: ISO timestamp of the event, used for ``started``/``ended``
+
+        Raises:
+            ValueError: If the event kind is unknown or its payload is invalid
+        """
+        self.validate_event(kind, data)
+        getattr(self, self.EVENT_KINDS[kind][0])(data or {}, at)
+
+    def _apply_started(self, data: dict[str, Any], at: str | None) -> None:
+        self.trusted_update(status=EventStatus.IN_PROGRESS.value, started=at)
+        if data.get("input_parameters"):
+            self.input_parameters.update(data["input_parameters"])
+
+    def _apply_step(self, data: dict[str, Any], at: str | None) -> None:
+        idx = data["step"]
+        self.completed_steps[idx] = data.get("output") or {}
+        if idx >= self.current_step:
+            self.trusted_update(current_step=idx + 1)
+        if self.current_step >= self.total_steps:
+            self.trusted_update(status=EventStatus.COMPLETED.value, ended=at)
+
+    def _apply_task(self, data: dict[str, Any], at: str | None) -> None:
+        task_id = data["task_id"]
+        if task_id not in self.tasks:
+            self.tasks.append(task_id)
+        if data.get("active", True):
+            if task_id not in self.active_tasks:
+                self.active_tasks.append(task_id)
+        elif task_id in self.active_tasks:
+            self.active_tasks.remove(task_id)
+
+    def _apply_warning(self, data: dict[str, Any], at: str | None) -> None:
+        self.warnings.append(data["message"])
+
+    def _apply_error(self, data: dict[str, Any], at: str | None) -> None:
+        self.errors.append(data["message"])
+        if data.get("fatal"):
+            self.trusted_update(status=EventStatus.STOPPED.value, ended=at)
 
 
 # Factory helpers for tests
@@ -13,6 +13,8 @@ from .connection_factory import (
     get_default_adapter,
     get_test_adapter,
 )
+from .graph import GraphQuery, GraphTraversal
+from .workflow_state import PostgresWorkflowStateStore, WorkflowStateStore
 
 # Optional granular adapter – depends on hacs_models package
 try:
@@ -43,13 +45,14 @@ except ImportError:
 
 # Import migration functionality
 try:
-    from .migrations import HACSDatabaseMigration, run_migration
+    from .migrations import HACSDatabaseMigration, recompact_resources, run_migration
     from .migrations import get_migration_status as _get_migration_status
 
     MIGRATIONS_AVAILABLE = True
 except ImportError:
     HACSDatabaseMigration = None
     run_migration = None
+    recompact_resources = None
     _get_migration_status = None
     MIGRATIONS_AVAILABLE = False
 
@@ -88,10 +91,17 @@ __all__ = [
     "PostgreSQLAdapter",
     "create_postgres_adapter",
     "GranularPostgreSQLAdapter",
+    # Graph traversal
+    "GraphQuery",
+    "GraphTraversal",
+    # Workflow execution state
+    "WorkflowStateStore",
+    "PostgresWorkflowStateStore",
     "ResourceMapper",
     "HACSSchemaManager",
     "HACSDatabaseMigration",
     "run_migration",
+    "recompact_resources",
     "QdrantVectorStore",
     "HACSVectorStore",
     "create_vector_store",
@@ -7,8 +7,11 @@ using psycopg (v3) for high-performance, non-blocking database operations.
 
 import json
 import logging
+import os
+from datetime import datetime
 from typing import Any
 
+from psycopg.types.json import set_json_loads
 from psycopg_pool import AsyncConnectionPool
 
 from hacs_core import (
@@ -17,11 +20,183 @@ from hacs_core import (
     BaseAdapter,
     BaseResource,
     PersistenceProvider,
+    ResourceConflictError,
+    ResourceError,
+    ResourceNotFoundError,
+    ValidationError,
     get_settings,
 )
+from hacs_core.instrumentation import current_span, traced
+
+from .graph import GraphQuery, GraphTraversal
+from hacs_models import GraphDefinition, ResourceBundle
+from hacs_models.json_patch import JsonPatchError
+from hacs_models.serialization import (
+    compact_default_text,
+    compact_defaults,
+    dumps,
+    json_dumps,
+    json_loads,
+    json_text,
+    resolve_model,
+)
+from hacs_models.utils import parse_json_pointer
 
 logger = logging.getLogger(__name__)
 
+# Serialization profiles that round-trip through model_validate
+STORAGE_PROFILES = ("storage", "compact")
+
+
+def compile_jsonb_patch(
+    ops: list[dict[str, Any]], source: str = "data"
+) -> tuple[str, list[str], dict[str, Any]]:
+    """
+    Translate RFC 6902 operations into a server-side JSONB expression.
+
+    Operations become a chain of ``jsonb_set``/``jsonb_insert``/``#-`` steps
+    joined laterally, so each step reads the previous result once and the
+    SQL grows linearly with the number of operations. ``add`` with a numeric
+    or ``-`` final token is treated as an array insert.
+
+    As RFC 6902 requires, ``replace``, ``remove``, ``move`` and ``copy`` fail
+    when their path (or ``from``) does not exist: the step then yields NULL,
+    which carries through the chain so the caller can reject the patch. An
+    array insert creates a missing array first.
+
+    ``test`` operations must precede all modifications; they become WHERE
+    conditions on the stored document.
+
+    Args:
+        ops: Patch operations
+        source: SQL expression of the document being patched
+
+    Returns:
+        (value_sql, conditions, params) with named ``%(patch_N)s`` parameters
+
+    Raises:
+        JsonPatchError: If an operation is malformed or unsupported
+    """
+    params: dict[str, Any] = {}
+    conditions: list[str] = []
+    steps: list[str] = []
+
+    def param(value: Any, cast: str) -> str:
+        name = f"patch_{len(params)}"
+        params[name] = value
+        return f"%({name})s::{cast}"
+
+    def pointer(path: Any) -> list[str]:
+        try:
+            return parse_json_pointer(path)
+        except ValueError as e:
+            raise JsonPatchError(str(e)) from e
+
+    def value_param(op: dict[str, Any]) -> str:
+        if "value" not in op:
+            raise JsonPatchError(f"Operation is missing 'value': {op!r}")
+        return param(json.dumps(op["value"]), "jsonb")
+
+    def insert(doc: str, tokens: list[str], value: str) -> str:
+        if not tokens:
+            return value
+        last = tokens[-1]
+        if last == "-" or last.isdigit():
+            parent = param(tokens[:-1], "text[]")
+            doc = f"jsonb_set({doc}, {parent}, coalesce({doc} #> {parent}, '[]'), true)"
+        if last == "-":
+            return f"jsonb_insert({doc}, {param([*tokens[:-1], '-1'], 'text[]')}, {value}, true)"
+        if last.isdigit():
+            return f"jsonb_insert({doc}, {param(tokens, 'text[]')}, {value})"
+        return f"jsonb_set({doc}, {param(tokens, 'text[]')}, {value}, true)"
+
+    def existing(doc: str, path: str, expr: str) -> str:
+        return f"CASE WHEN {doc} #> {path} IS NULL THEN NULL ELSE {expr} END"
+
+    for op in ops:
+        kind = op.get("op")
+        if "path" not in op:
+            raise JsonPatchError(f"Invalid patch operation: {op!r}")
+        tokens = pointer(op["path"])
+        doc = f"s{len(steps)}.d"
+
+        if kind == "test":
+            if steps:
+                raise JsonPatchError("test operations must precede modifications")
+            path = param(tokens, "text[]")
+            conditions.append(f"{source} #> {path} = {value_param(op)}")
+            continue
+        if kind == "add":
+            expr = insert(doc, tokens, value_param(op))
+        elif kind == "replace":
+            value = value_param(op)
+            if tokens:
+                path = param(tokens, "text[]")
+                expr = existing(doc, path, f"jsonb_set({doc}, {path}, {value})")
+            else:
+                expr = value
+        elif kind == "remove":
+            path = param(tokens, "text[]")
+            expr = existing(doc, path, f"{doc} #- {path}")
+        elif kind in ("move", "copy"):
+            if "from" not in op:
+                raise JsonPatchError(f"Operation is missing 'from': {op!r}")
+            source_path = param(pointer(op["from"]), "text[]")
+            target = f"{doc} #- {source_path}" if kind == "move" else doc
+            expr = existing(doc, source_path, insert(target, tokens, f"{doc} #> {source_path}"))
+        else:
+            raise JsonPatchError(f"Unsupported patch operation: {op!r}")
+        steps.append(expr)
+
+    if not steps:
+        return source, conditions, params
+    chain = " ".join(
+        f"CROSS JOIN LATERAL (SELECT {expr} AS d) s{i + 1}" for i, expr in enumerate(steps)
+    )
+    value_sql = f"(SELECT s{len(steps)}.d FROM (SELECT {source} AS d) s0 {chain})"
+    return value_sql, conditions, params
+
+
+def recompact_rows(
+    rows: list[tuple[str, dict[str, Any]]], profile: str = "compact"
+) -> tuple[list[tuple[str, str]], dict[str, Any]]:
+    """
+    Re-encode stored resource documents with a storage profile.
+
+    Each document is validated with its registered model, so omitted
+    defaults are restored before the document is written again.
+
+    Args:
+        rows: (id, data) pairs as stored
+        profile: Target storage profile
+
+    Returns:
+        (updates, stats) where updates are (id, JSON) pairs for documents whose
+        encoding changed and stats count ``rows``, ``rewritten``, ``failed``,
+        ``bytes_before`` and ``bytes_after``
+    """
+    updates: list[tuple[str, str]] = []
+    stats = {"rows": 0, "rewritten": 0, "failed": 0, "bytes_before": 0, "bytes_after": 0}
+    for resource_id, data in rows:
+        stats["rows"] += 1
+        before = json_dumps(data)
+        stats["bytes_before"] += len(before)
+        model = resolve_model(data.get("resource_type"))
+        try:
+            if model is None:
+                raise ValueError(f"Unknown resource type: {data.get('resource_type')}")
+            after = dumps(model.model_validate(data), profile)
+        except Exception as e:
+            logger.warning(f"Keeping resource {resource_id} as stored: {e}")
+            stats["failed"] += 1
+            stats["bytes_after"] += len(before)
+            continue
+        stats["bytes_after"] += len(after)
+        if after != before:
+            updates.append((resource_id, after.decode()))
+            stats["rewritten"] += 1
+    return updates, stats
+
 
 class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
     """
@@ -34,6 +209,14 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
     - Efficient JSONB storage for complex HACS resources
     - Robust error handling and logging
     - Built-in asynchronous connection pooling
+
+    Storage profiles (see ``hacs_models.serialization``):
+    - ``storage`` (default): every field is written
+    - ``compact``: None, default values and empty default collections are
+      omitted and restored on read; typically a third of the size for
+      Observations. ``HACS_STORAGE_PROFILE`` sets the default, and
+      ``storage_profiles`` overrides it per resource type. Existing rows are
+      rewritten with ``recompact``.
     """
 
     def __init__(
@@ -41,6 +224,8 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
         database_url: str,
         schema_name: str = "public",
         pool_size: int = 10,
+        storage_profile: str | None = None,
+        storage_profiles: dict[str, str] | None = None,
     ):
         super().__init__(name="PostgreSQL (Async)", version="2.0.0")
 
@@ -48,9 +233,20 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
         self.schema_name = schema_name
         self.pool_size = pool_size
         self.pool: AsyncConnectionPool = None
+        self.storage_profile = storage_profile or os.getenv("HACS_STORAGE_PROFILE", "storage")
+        self.storage_profiles = dict(storage_profiles or {})
+        for profile in [self.storage_profile, *self.storage_profiles.values()]:
+            if profile not in STORAGE_PROFILES:
+                raise ValueError(
+                    f"Unsupported storage profile {profile!r}; expected one of {STORAGE_PROFILES}"
+                )
 
         logger.info(f"PostgreSQLAdapter (Async) configured for schema '{schema_name}'")
 
+    def profile_for(self, resource_type: str) -> str:
+        """Storage profile used to write resources of a type."""
+        return self.storage_profiles.get(resource_type, self.storage_profile)
+
     async def connect(self):
         """Initialize the asynchronous connection pool and database tables."""
         if self.pool:
@@ -62,6 +258,7 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
                 min_size=2,
                 max_size=self.pool_size,
                 open=False,
+                configure=self._configure_connection,
             )
             await self.pool.open()
             await self.pool.wait()
@@ -71,6 +268,11 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
             logger.error(f"Failed to establish async connection pool: {e}")
             raise RuntimeError(f"Async database initialization failed: {e}") from e
 
+    @staticmethod
+    async def _configure_connection(conn) -> None:
+        """Decode JSONB columns with the fast JSON loader."""
+        set_json_loads(json_loads, conn)
+
     async def disconnect(self):
         """Close the asynchronous connection pool."""
         if self.pool:
@@ -109,13 +311,18 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
             logger.error(f"Failed to initialize tables: {e}")
             raise RuntimeError(f"Database initialization failed: {e}") from e
 
+    @traced("persistence.save")
     async def save(self, resource: BaseResource, actor: Actor) -> BaseResource:
         """Save a new resource using async PostgreSQL insert/upsert."""
         await self.connect()
         try:
             async with self.pool.connection() as conn:
                 async with conn.cursor() as cursor:
-                    resource_data = resource.model_dump(mode="json")
+                    profile = self.profile_for(resource.resource_type)
+                    resource_data = dumps(resource, profile).decode()
+                    current_span().set_attributes(
+                        resource_type=resource.resource_type, rows=1, bytes=len(resource_data)
+                    )
                     insert_sql = f"""
                     INSERT INTO {self.schema_name}.hacs_resources
                     (id, resource_type, data, created_by, updated_by)
@@ -130,7 +337,7 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
                         {
                             "id": resource.id,
                             "resource_type": resource.resource_type,
-                            "data": json.dumps(resource_data),
+                            "data": resource_data,
                             "created_by": actor.id,
                             "updated_by": actor.id,
                         },
@@ -143,6 +350,7 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
             logger.error(f"Failed to save resource {resource.id}: {e}")
             raise RuntimeError(f"Database error while saving resource: {e}") from e
 
+    @traced("persistence.read")
     async def read(
         self, resource_type: type[BaseResource], resource_id: str, actor: Actor
     ) -> BaseResource:
@@ -167,7 +375,8 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
                         )
 
                     resource_data = result[0]
-                    resource_instance = resource_type(**resource_data)
+                    current_span().set_attributes(resource_type=resource_type.__name__, rows=1)
+                    resource_instance = resource_type.model_validate(resource_data)
                     logger.info(
                         f"Resource {resource_type.__name__}/{resource_id} read successfully"
                     )
@@ -176,13 +385,15 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
             logger.error(f"Failed to read resource {resource_id}: {e}")
             raise RuntimeError(f"Database error while reading resource: {e}") from e
 
+    @traced("persistence.update")
     async def update(self, resource: BaseResource, actor: Actor) -> BaseResource:
         """Update an existing resource using async PostgreSQL update."""
         await self.connect()
         try:
             async with self.pool.connection() as conn:
                 async with conn.cursor() as cursor:
-                    resource_data = resource.model_dump(mode="json")
+                    profile = self.profile_for(resource.resource_type)
+                    resource_data = dumps(resource, profile).decode()
                     update_sql = f"""
                     UPDATE {self.schema_name}.hacs_resources
                     SET data = %(data)s, updated_at = NOW(), updated_by = %(updated_by)s
@@ -191,13 +402,18 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
                     await cursor.execute(
                         update_sql,
                         {
-                            "data": json.dumps(resource_data),
+                            "data": resource_data,
                             "updated_by": actor.id,
                             "id": resource.id,
                             "resource_type": resource.resource_type,
                         },
                     )
 
+                    current_span().set_attributes(
+                        resource_type=resource.resource_type,
+                        rows=cursor.rowcount,
+                        bytes=len(resource_data),
+                    )
                     if cursor.rowcount == 0:
                         raise ValueError(
                             f"Resource {resource.resource_type}/{resource.id} not found for update"
@@ -210,6 +426,128 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
             logger.error(f"Failed to update resource {resource.id}: {e}")
             raise RuntimeError(f"Database error while updating resource: {e}") from e
 
+    @traced("persistence.patch")
+    async def patch(
+        self,
+        resource_type: type[BaseResource],
+        resource_id: str,
+        ops: list[dict[str, Any]],
+        actor: Actor,
+        *,
+        expected_version: str | None = None,
+        expected_updated_at: datetime | None = None,
+    ) -> BaseResource:
+        """
+        Apply RFC 6902 operations to a stored resource server-side.
+
+        Only the patch is sent; PostgreSQL applies it with jsonb_set/jsonb_insert.
+        The patched document is validated before the transaction commits.
+
+        For types stored with the ``compact`` profile the patch sees the
+        default values compact documents omit, and top-level fields left at
+        their default are dropped again before the document is written.
+
+        Args:
+            resource_type: Resource model class
+            resource_id: Resource ID
+            ops: Patch operations (see ``hacs_models.json_patch.diff``)
+            actor: Actor performing the update
+            expected_version: Only apply if the stored ``version`` matches
+            expected_updated_at: Only apply if the stored ``updated_at`` matches
+
+        Returns:
+            The patched resource
+
+        Raises:
+            ResourceNotFoundError: If the resource does not exist
+            ResourceConflictError: If the stored resource no longer matches the
+                expected version, updated_at or a ``test`` operation
+            ValidationError: If the patch is malformed, targets a path that
+                does not exist, or produces an invalid resource
+        """
+        await self.connect()
+        type_name = resource_type.__name__
+        schema = self.schema_name
+        try:
+            if self.profile_for(type_name) == "compact":
+                defaults = json_dumps(compact_defaults(resource_type)).decode()
+                value_sql, conditions, params = compile_jsonb_patch(
+                    ops, source="(%(patch_defaults)s::jsonb || data)"
+                )
+                params["patch_defaults"] = defaults
+                stored_sql = (
+                    "(SELECT coalesce(jsonb_object_agg(key, value), '{}') "
+                    "FROM jsonb_each(patched.d) "
+                    "WHERE NOT coalesce(%(patch_defaults)s::jsonb -> key = value, false))"
+                )
+            else:
+                value_sql, conditions, params = compile_jsonb_patch(ops)
+                stored_sql = "patched.d"
+            if expected_version is not None:
+                conditions.append("data->>'version' = %(expected_version)s")
+                params["expected_version"] = expected_version
+            if expected_updated_at is not None:
+                conditions.append("(data->>'updated_at')::timestamptz = %(expected_updated_at)s")
+                params["expected_updated_at"] = expected_updated_at
+
+            where_clause = " AND ".join(
+                ["id = %(id)s", "resource_type = %(resource_type)s", *conditions]
+            )
+            # A NULL document means an operation's path does not exist
+            patch_sql = f"""
+            WITH patched AS (
+                SELECT id, {value_sql} AS d FROM {schema}.hacs_resources
+                WHERE {where_clause}
+                FOR UPDATE
+            )
+            UPDATE {schema}.hacs_resources r
+            SET data = jsonb_set({stored_sql}, '{{updated_at}}', to_jsonb(NOW())),
+                updated_at = NOW(),
+                updated_by = %(updated_by)s
+            FROM patched
+            WHERE r.id = patched.id AND r.resource_type = %(resource_type)s
+                AND patched.d IS NOT NULL
+            RETURNING r.data
+            """
+            params.update({"id": resource_id, "resource_type": type_name, "updated_by": actor.id})
+
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(patch_sql, params)
+                    row = await cursor.fetchone()
+                    current_span().set_attributes(
+                        resource_type=type_name, rows=cursor.rowcount, ops=len(ops)
+                    )
+                    if row is None:
+                        matched = " AND ".join(conditions) or "TRUE"
+                        await cursor.execute(
+                            f"SELECT {matched}, {value_sql} IS NULL FROM {schema}.hacs_resources "
+                            "WHERE id = %(id)s AND resource_type = %(resource_type)s",
+                            params,
+                        )
+                        found = await cursor.fetchone()
+                        if found is None:
+                            raise ResourceNotFoundError(type_name, resource_id)
+                        if not found[0]:
+                            raise ResourceConflictError(type_name, resource_id)
+                        raise JsonPatchError("Patch targets a path that does not exist")
+
+                    # Raising here rolls back the patch
+                    resource_instance = resource_type.model_validate(row[0])
+                    logger.info(f"Resource {type_name}/{resource_id} patched ({len(ops)} ops)")
+                    return resource_instance
+        except ResourceError:
+            raise
+        except ValueError as e:
+            # JsonPatchError and pydantic's ValidationError
+            raise ValidationError(
+                f"Invalid patch for {type_name}/{resource_id}: {e}", value=ops
+            ) from e
+        except Exception as e:
+            logger.error(f"Failed to patch resource {resource_id}: {e}")
+            raise RuntimeError(f"Database error while patching resource: {e}") from e
+
+    @traced("persistence.delete")
     async def delete(
         self, resource_type: type[BaseResource], resource_id: str, actor: Actor
     ) -> bool:
@@ -227,6 +565,9 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
                         {"id": resource_id, "resource_type": resource_type.__name__},
                     )
 
+                    current_span().set_attributes(
+                        resource_type=resource_type.__name__, rows=cursor.rowcount
+                    )
                     if cursor.rowcount > 0:
                         logger.info(
                             f"Resource {resource_type.__name__}/{resource_id} deleted successfully"
@@ -241,6 +582,7 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
             logger.error(f"Failed to delete resource {resource_id}: {e}")
             raise RuntimeError(f"Database error while deleting resource: {e}") from e
 
+    @traced("persistence.search")
     async def search(
         self,
         resource_type: type[BaseResource],
@@ -248,7 +590,11 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
         filters: dict[str, Any] | None = None,
         limit: int = 100,
     ) -> list[BaseResource]:
-        """Search for resources using async PostgreSQL JSON queries."""
+        """Search for resources using async PostgreSQL JSON queries.
+
+        Fields that ``compact`` documents omit at their default are compared
+        as ``COALESCE(data->>field, <default>)``.
+        """
         await self.connect()
         try:
             async with self.pool.connection() as conn:
@@ -256,6 +602,13 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
                     where_conditions = ["resource_type = %(resource_type)s"]
                     params = {"resource_type": resource_type.__name__, "limit": limit}
 
+                    def field_sql(field: str) -> str:
+                        default = compact_default_text(resource_type, field)
+                        if default is None:
+                            return f"data->>'{field}'"
+                        params[f"default_{field}"] = default
+                        return f"COALESCE(data->>'{field}', %(default_{field})s)"
+
                     if filters:
                         for key, value in filters.items():
                             param_key = f"filter_{key}"
@@ -264,20 +617,24 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
                                 op_map = {"_gt": ">", "_gte": ">=", "_lt": "<", "_lte": "<="}
                                 op = op_map[key[len(field) :]]
                                 where_conditions.append(
-                                    f"(data->>'{field}')::numeric {op} %({param_key})s"
+                                    f"({field_sql(field)})::numeric {op} %({param_key})s"
                                 )
                                 params[param_key] = value
                             elif key.endswith("_like"):
                                 field = key[:-5]
-                                where_conditions.append(f"data->>'{field}' ILIKE %({param_key})s")
+                                where_conditions.append(
+                                    f"{field_sql(field)} ILIKE %({param_key})s"
+                                )
                                 params[param_key] = f"%{value}%"
                             elif key.endswith("_in"):
                                 field = key[:-3]
-                                where_conditions.append(f"data->>'{field}' = ANY(%({param_key})s)")
-                                params[param_key] = value
+                                where_conditions.append(
+                                    f"{field_sql(field)} = ANY(%({param_key})s)"
+                                )
+                                params[param_key] = [json_text(v) for v in value]
                             else:
-                                where_conditions.append(f"data->>'{key}' = %({param_key})s")
-                                params[param_key] = str(value)
+                                where_conditions.append(f"{field_sql(key)} = %({param_key})s")
+                                params[param_key] = json_text(value)
 
                     where_clause = " AND ".join(where_conditions)
                     search_sql = f"""
@@ -289,12 +646,15 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
 
                     await cursor.execute(search_sql, params)
                     results = await cursor.fetchall()
+                    current_span().set_attributes(
+                        resource_type=resource_type.__name__, rows=len(results)
+                    )
 
                     resources = []
                     for result in results:
                         try:
                             resource_data = result[0]
-                            resource_instance = resource_type(**resource_data)
+                            resource_instance = resource_type.model_validate(resource_data)
                             resources.append(resource_instance)
                         except (json.JSONDecodeError, TypeError) as e:
                             logger.warning(f"Skipping corrupted resource data: {e}")
@@ -306,6 +666,172 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
             logger.error(f"Failed to search resources: {e}")
             raise RuntimeError(f"Database error while searching resources: {e}") from e
 
+    @traced("persistence.traverse_graph")
+    async def traverse_graph(
+        self,
+        definition: GraphDefinition,
+        start_ids: list[str],
+        actor: Actor,
+        *,
+        max_depth: int = 3,
+        max_fanout: int = 100,
+        max_resources: int = 1000,
+    ) -> ResourceBundle:
+        """
+        Collect the resources reachable from ``start_ids`` through a GraphDefinition.
+
+        Each hop issues one batched query per target type (see
+        ``hacs_persistence.graph``), all on one pooled connection.
+
+        Args:
+            definition: Graph to execute; ``definition.start`` is the start type
+            start_ids: IDs of the start resources
+            actor: Actor performing the read
+            max_depth: Number of hops from the start resources
+            max_fanout: Targets kept per link and source resource
+            max_resources: Total resources in the result
+
+        Returns:
+            ResourceBundle of the start resources and everything reached
+        """
+        await self.connect()
+        traversal = GraphTraversal(
+            definition, max_depth=max_depth, max_fanout=max_fanout, max_resources=max_resources
+        )
+        try:
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cursor:
+
+                    async def fetch(query: GraphQuery, limit: int) -> list[dict[str, Any]]:
+                        await cursor.execute(*query.to_sql(self.schema_name, limit))
+                        return [row[0] for row in await cursor.fetchall()]
+
+                    start_query = GraphQuery(definition.start, ids=set(start_ids))
+                    start = await fetch(start_query, len(start_query.ids))
+                    bundle = await traversal.run(fetch, start)
+                    current_span().set_attributes(
+                        resource_type=definition.start,
+                        rows=len(bundle.entries),
+                        queries=traversal.queries_executed + 1,
+                    )
+                    logger.info(
+                        f"Graph {definition.name} reached {len(bundle.entries)} resources "
+                        f"in {traversal.queries_executed + 1} queries"
+                    )
+                    return bundle
+        except Exception as e:
+            logger.error(f"Failed to traverse graph {definition.name}: {e}")
+            raise RuntimeError(f"Database error while traversing graph: {e}") from e
+
+    @traced("persistence.recompact")
+    async def recompact(
+        self,
+        resource_types: list[str] | None = None,
+        *,
+        profile: str | None = None,
+        batch_size: int = 500,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Rewrite stored resources with their storage profile.
+
+        Rows are read in id order, ``batch_size`` at a time, and each batch is
+        updated in one statement and committed on its own, so the migration can
+        run against a live table and be resumed. A batch is locked from the
+        moment it is read (``FOR UPDATE``) until it is committed, so concurrent
+        updates and patches wait for it instead of being overwritten with the
+        document as it was read. ``updated_at`` is left alone because the
+        resources themselves do not change.
+
+        Args:
+            resource_types: Types to rewrite; all types when None
+            profile: Profile to write; defaults to each type's configured profile
+            batch_size: Rows per batch
+            dry_run: Only measure the savings
+
+        Returns:
+            Totals (``rows``, ``rewritten``, ``failed``, ``bytes_before``,
+            ``bytes_after``, ``saved_ratio``) and the same counts per type
+        """
+        if profile is not None and profile not in STORAGE_PROFILES:
+            raise ValueError(
+                f"Unsupported storage profile {profile!r}; expected one of {STORAGE_PROFILES}"
+            )
+        await self.connect()
+        totals: dict[str, Any] = {}
+        by_type: dict[str, dict[str, Any]] = {}
+        try:
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cursor:
+                    if resource_types is None:
+                        await cursor.execute(
+                            f"SELECT DISTINCT resource_type FROM {self.schema_name}.hacs_resources"
+                        )
+                        resource_types = [row[0] for row in await cursor.fetchall()]
+
+                    for resource_type in resource_types:
+                        type_profile = profile or self.profile_for(resource_type)
+                        type_stats: dict[str, Any] = {}
+                        last_id = ""
+                        lock = "" if dry_run else "FOR UPDATE"
+                        while True:
+                            await cursor.execute(
+                                f"""
+                                SELECT id, data FROM {self.schema_name}.hacs_resources
+                                WHERE resource_type = %(resource_type)s AND id > %(last_id)s
+                                ORDER BY id
+                                LIMIT %(limit)s
+                                {lock}
+                                """,
+                                {
+                                    "resource_type": resource_type,
+                                    "last_id": last_id,
+                                    "limit": batch_size,
+                                },
+                            )
+                            rows = await cursor.fetchall()
+                            if not rows:
+                                break
+                            last_id = rows[-1][0]
+                            updates, stats = recompact_rows(rows, type_profile)
+                            for key, value in stats.items():
+                                type_stats[key] = type_stats.get(key, 0) + value
+                            if updates and not dry_run:
+                                await cursor.execute(
+                                    f"""
+                                    UPDATE {self.schema_name}.hacs_resources AS r
+                                    SET data = v.data::jsonb
+                                    FROM unnest(%(ids)s::text[], %(data)s::text[]) AS v(id, data)
+                                    WHERE r.id = v.id
+                                    """,
+                                    {
+                                        "ids": [resource_id for resource_id, _ in updates],
+                                        "data": [data for _, data in updates],
+                                    },
+                                )
+                            # Ends the batch's transaction and releases its row locks
+                            await conn.commit()
+                        if type_stats:
+                            type_stats["profile"] = type_profile
+                            by_type[resource_type] = type_stats
+                            for key, value in type_stats.items():
+                                if key != "profile":
+                                    totals[key] = totals.get(key, 0) + value
+        except Exception as e:
+            logger.error(f"Failed to recompact resources: {e}")
+            raise RuntimeError(f"Database error while recompacting resources: {e}") from e
+
+        before = totals.get("bytes_before", 0)
+        totals["saved_ratio"] = round(1 - totals.get("bytes_after", 0) / before, 4) if before else 0
+        totals["dry_run"] = dry_run
+        totals["resource_types"] = by_type
+        current_span().set_attributes(rows=totals.get("rows", 0))
+        logger.info(
+            f"Recompacted {totals.get('rewritten', 0)}/{totals.get('rows', 0)} resources, "
+            f"saved {totals['saved_ratio']:.1%}{' (dry run)' if dry_run else ''}"
+        )
+        return totals
+
     async def health_check(self) -> bool:
         """Check the health of the PostgreSQL connection pool."""
         if not self.pool or self.pool.closed:
@@ -377,11 +903,14 @@ class PostgreSQLAdapter(BaseAdapter, PersistenceProvider):
 
 
 async def create_postgres_adapter(
-    database_url: str | None = None, schema_name: str | None = None
+    database_url: str | None = None,
+    schema_name: str | None = None,
+    storage_profile: str | None = None,
 ) -> PostgreSQLAdapter:
     """Factory function to create and connect a PostgreSQLAdapter.
 
     If parameters are not provided, read from global settings.
+    ``storage_profile`` defaults to ``HACS_STORAGE_PROFILE`` or ``storage``.
     """
     if database_url is None or schema_name is None:
         settings = get_settings()
@@ -396,6 +925,7 @@ async def create_postgres_adapter(
     adapter = PostgreSQLAdapter(
         database_url=database_url,
         schema_name=schema_name or "public",
+        storage_profile=storage_profile,
     )
     await adapter.connect()
     return adapter
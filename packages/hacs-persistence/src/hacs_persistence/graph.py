@@ -0,0 +1,367 @@
+"""
+GraphDefinition traversal over the generic ``hacs_resources`` table.
+
+A ``GraphDefinition`` is executed breadth-first, one level at a time. At each
+level every link is evaluated against the whole frontier and the resulting
+lookups are merged into one query per target type, so the number of queries
+grows with graph depth and the number of target types, not with the number
+of resources found.
+
+Link semantics:
+    - ``path`` names a reference field on the source resource
+      (``"subject"``, ``"performer.reference"``), optionally prefixed with the
+      source type (``"Observation.encounter"``). Referenced resources are
+      fetched by id.
+    - Target ``params`` containing ``{ref}`` turn the link around:
+      ``"subject={ref}&status=final"`` finds targets whose ``subject`` points
+      at the source. A bare type as ``path`` (``"Patient"``) names the source
+      type of such a reverse link. The reverse field must hold a single
+      reference string (``"subject"`` or ``"subject.reference"``).
+
+Visited resources are never fetched twice, each link contributes at most
+``max_fanout`` (or the link's numeric ``max``) targets per source, and the
+whole traversal stops at ``max_resources``.
+
+Example:
+    >>> graph = GraphDefinition(
+    ...     name="patient-context",
+    ...     start="Patient",
+    ...     link=[
+    ...         GraphDefinitionLink(
+    ...             path="Patient",
+    ...             target=[GraphDefinitionLinkTarget(type="Observation", params="subject={ref}")],
+    ...         ),
+    ...         GraphDefinitionLink(path="Observation.encounter", target=[...]),
+    ...     ],
+    ... )
+    >>> bundle = await adapter.traverse_graph(graph, ["patient-123"], actor)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl
+
+from hacs_models import BundleEntry, BundleType, GraphDefinition, ResourceBundle, validate_many
+from hacs_models.serialization import compact_default_text, json_text, resolve_model
+
+logger = logging.getLogger(__name__)
+
+REF_PLACEHOLDER = "{ref}"
+
+# (query, row limit) -> rows of resource data
+FetchRows = Callable[["GraphQuery", int], Awaitable[list[dict[str, Any]]]]
+
+
+def _values_at(data: Any, path: list[str]) -> list[Any]:
+    nodes = [data]
+    for part in path:
+        next_nodes = []
+        for node in nodes:
+            value = node.get(part) if isinstance(node, dict) else None
+            if isinstance(value, list):
+                next_nodes.extend(value)
+            elif value is not None:
+                next_nodes.append(value)
+        nodes = next_nodes
+    return nodes
+
+
+def _parse_reference(value: Any) -> tuple[str | None, str] | None:
+    if isinstance(value, dict):
+        value = value.get("reference")
+    if not isinstance(value, str) or not value:
+        return None
+    parts = value.rstrip("/").split("/")
+    if len(parts) >= 2:
+        return parts[-2], parts[-1]
+    return None, value
+
+
+def _matches_filters(data: dict[str, Any], filters: Iterable[tuple[str, str]]) -> bool:
+    model = resolve_model(data.get("resource_type"))
+    for key, value in filters:
+        values = [json_text(v) for v in _values_at(data, key.split("."))]
+        if key not in data and (default := compact_default_text(model, key)) is not None:
+            values = [default]
+        if values != [value]:
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class _Link:
+    source_type: str | None
+    target_type: str
+    path: list[str]
+    reverse: list[str] | None
+    filters: tuple[tuple[str, str], ...]
+    cap: int
+    label: str
+
+
+def compile_links(definition: GraphDefinition, max_fanout: int) -> list[_Link]:
+    """Flatten a GraphDefinition into one link per (link, target) pair."""
+    links: list[_Link] = []
+    for link in definition.link:
+        head, _, rest = link.path.partition(".")
+        if rest and head[:1].isupper():
+            source_type, path = head, rest
+        elif not rest and head[:1].isupper():
+            source_type, path = head, ""
+        else:
+            source_type, path = None, link.path
+        cap = max_fanout
+        if link.max and link.max.isdigit():
+            cap = min(cap, int(link.max))
+
+        for target in link.target:
+            reverse_field = None
+            filters = []
+            for key, value in parse_qsl(target.params or "", keep_blank_values=True):
+                if value == REF_PLACEHOLDER:
+                    reverse_field = key.split(".")
+                else:
+                    filters.append((key, value))
+            if reverse_field is None and not path:
+                logger.warning(f"GraphDefinition link {link.path!r} has no path or {{ref}} param")
+                continue
+            links.append(
+                _Link(
+                    source_type=source_type,
+                    target_type=target.type,
+                    path=path.split(".") if path else [],
+                    reverse=reverse_field,
+                    filters=tuple(filters),
+                    cap=cap,
+                    label=link.path,
+                )
+            )
+    return links
+
+
+@dataclass
+class GraphQuery:
+    """One level's lookups for a single target type."""
+
+    resource_type: str
+    ids: set[str] = field(default_factory=set)
+    # (field path, referenced values, extra equality filters)
+    reverse: list[tuple[list[str], list[str], tuple[tuple[str, str], ...]]] = field(
+        default_factory=list
+    )
+
+    def to_sql(self, schema_name: str, limit: int) -> tuple[str, dict[str, Any]]:
+        """Render as a single batched ``ANY(...)`` query."""
+        params: dict[str, Any] = {"resource_type": self.resource_type, "limit": limit}
+        model = resolve_model(self.resource_type)
+        clauses = []
+        if self.ids:
+            clauses.append("id = ANY(%(ids)s)")
+            params["ids"] = sorted(self.ids)
+        for n, (path, values, filters) in enumerate(self.reverse):
+            conditions = [f"data #>> %(path_{n})s::text[] = ANY(%(values_{n})s)"]
+            params[f"path_{n}"] = path
+            params[f"values_{n}"] = values
+            for m, (key, value) in enumerate(filters):
+                field_sql = f"data #>> %(filter_{n}_{m}_key)s::text[]"
+                # Compact documents omit top-level fields left at their default
+                default = compact_default_text(model, key)
+                if default is not None:
+                    field_sql = f"COALESCE({field_sql}, %(filter_{n}_{m}_default)s)"
+                    params[f"filter_{n}_{m}_default"] = default
+                conditions.append(f"{field_sql} = %(filter_{n}_{m})s")
+                params[f"filter_{n}_{m}_key"] = key.split(".")
+                params[f"filter_{n}_{m}"] = value
+            clauses.append("(" + " AND ".join(conditions) + ")")
+        sql = f"""
+        SELECT data FROM {schema_name}.hacs_resources
+        WHERE resource_type = %(resource_type)s AND ({" OR ".join(clauses) or "FALSE"})
+        ORDER BY created_at DESC
+        LIMIT %(limit)s
+        """
+        return sql, params
+
+    def matches(self, data: dict[str, Any]) -> bool:
+        """Whether a stored resource satisfies this query (for in-memory stores)."""
+        if data.get("resource_type") != self.resource_type:
+            return False
+        if data.get("id") in self.ids:
+            return True
+        for path, values, filters in self.reverse:
+            if any(str(v) in values for v in _values_at(data, path)) and _matches_filters(
+                data, filters
+            ):
+                return True
+        return False
+
+
+class GraphTraversal:
+    """Executes a GraphDefinition level by level with batched lookups."""
+
+    def __init__(
+        self,
+        definition: GraphDefinition,
+        *,
+        max_depth: int = 3,
+        max_fanout: int = 100,
+        max_resources: int = 1000,
+    ):
+        """Initialize traversal.
+
+        Args:
+            definition: Graph to execute
+            max_depth: Number of hops from the start resources
+            max_fanout: Targets kept per link and source resource
+            max_resources: Total resources in the result
+        """
+        self.definition = definition
+        self.max_depth = max_depth
+        self.max_resources = max_resources
+        self.links = compile_links(definition, max_fanout)
+        self.queries_executed = 0
+
+    def plan_level(self, frontier: dict[tuple[str, str], dict[str, Any]]) -> list[GraphQuery]:
+        """Merge every link's lookups for a frontier into one query per target type."""
+        queries: dict[str, GraphQuery] = {}
+        for link in self.links:
+            sources = [
+                data
+                for (resource_type, _), data in frontier.items()
+                if link.source_type in (None, resource_type)
+            ]
+            if not sources:
+                continue
+            query = queries.get(link.target_type) or GraphQuery(link.target_type)
+            if link.reverse is not None:
+                values = set()
+                for data in sources:
+                    values.add(f"{data['resource_type']}/{data['id']}")
+                    values.add(data["id"])
+                query.reverse.append((link.reverse, sorted(values), link.filters))
+            else:
+                for data in sources:
+                    for value in _values_at(data, link.path):
+                        reference = _parse_reference(value)
+                        if reference and reference[0] in (None, link.target_type):
+                            query.ids.add(reference[1])
+            if query.ids or query.reverse:
+                queries[link.target_type] = query
+        return list(queries.values())
+
+    def _link_targets(
+        self,
+        link: _Link,
+        sources: list[dict[str, Any]],
+        candidates: list[dict[str, Any]],
+    ) -> Iterable[tuple[dict[str, Any], dict[str, Any]]]:
+        """(source, target) edges produced by one link, capped per source."""
+        by_id = {c["id"]: c for c in candidates}
+        by_reference: dict[str, list[dict[str, Any]]] = {}
+        if link.reverse is not None:
+            for candidate in candidates:
+                if _matches_filters(candidate, link.filters):
+                    for value in {str(v) for v in _values_at(candidate, link.reverse)}:
+                        by_reference.setdefault(value, []).append(candidate)
+
+        for source in sources:
+            count = 0
+            if link.reverse is not None:
+                matched = by_reference.get(f"{source['resource_type']}/{source['id']}", [])
+                matched = matched + by_reference.get(source["id"], [])
+            else:
+                matched = []
+                for value in _values_at(source, link.path):
+                    reference = _parse_reference(value)
+                    if reference and reference[0] in (None, link.target_type):
+                        target = by_id.get(reference[1])
+                        if target is not None:
+                            matched.append(target)
+            for target in matched:
+                if count >= link.cap:
+                    break
+                count += 1
+                yield source, target
+
+    async def run(self, fetch: FetchRows, start: list[dict[str, Any]]) -> ResourceBundle:
+        """Traverse from already-loaded start resources.
+
+        Args:
+            fetch: Runs a query (e.g. ``query.to_sql``) and returns resource data rows
+            start: Start resource data (must match ``definition.start``)
+
+        Returns:
+            ResourceBundle of visited resources in discovery order; each entry's
+            metadata records its ``graph_depth`` and the ``graph_link`` it came from
+        """
+        visited: dict[tuple[str, str], dict[str, Any]] = {}
+        meta: dict[tuple[str, str], dict[str, Any]] = {}
+        for data in start:
+            key = (data["resource_type"], data["id"])
+            visited[key] = data
+            meta[key] = {"graph_depth": 0, "graph_link": None}
+        frontier = dict(visited)
+
+        for depth in range(1, self.max_depth + 1):
+            if not frontier or len(visited) >= self.max_resources:
+                break
+            candidates: dict[str, list[dict[str, Any]]] = {}
+            for query in self.plan_level(frontier):
+                remaining = self.max_resources - len(visited)
+                query.ids -= {rid for (rtype, rid) in visited if rtype == query.resource_type}
+                if remaining <= 0 or not (query.ids or query.reverse):
+                    continue
+                # Reverse matches may include visited resources; leave room for them
+                limit = remaining + (len(visited) if query.reverse else 0)
+                self.queries_executed += 1
+                candidates[query.resource_type] = await fetch(query, limit)
+
+            next_frontier: dict[tuple[str, str], dict[str, Any]] = {}
+            for link in self.links:
+                rows = candidates.get(link.target_type)
+                if not rows:
+                    continue
+                sources = [
+                    data
+                    for (resource_type, _), data in frontier.items()
+                    if link.source_type in (None, resource_type)
+                ]
+                for _, target in self._link_targets(link, sources, rows):
+                    key = (target["resource_type"], target["id"])
+                    if key in visited or len(visited) >= self.max_resources:
+                        continue
+                    visited[key] = next_frontier[key] = target
+                    meta[key] = {"graph_depth": depth, "graph_link": link.label}
+            frontier = next_frontier
+
+        return self._to_bundle(visited, meta)
+
+    def _to_bundle(
+        self,
+        visited: dict[tuple[str, str], dict[str, Any]],
+        meta: dict[tuple[str, str], dict[str, Any]],
+    ) -> ResourceBundle:
+        keys = list(visited)
+        result = validate_many([visited[key] for key in keys], keep_models=True)
+        for error in result.errors:
+            logger.warning(
+                f"Skipping invalid {error['resource_type']} in graph result at "
+                f"{error['path']}: {error['message']}"
+            )
+        bundle = ResourceBundle(
+            title=self.definition.name,
+            bundle_type=BundleType.SEARCHSET,
+            total=len(keys) - len(result.invalid_indices),
+        )
+        bundle.extend_entries(
+            BundleEntry(resource=model, contained_resource_id=model.id, metadata=meta[key])
+            for key, model in zip(keys, result.models)
+            if model is not None
+        )
+        return bundle
+
+
+__all__ = ["GraphQuery", "GraphTraversal", "compile_links"]
@@ -1396,6 +1396,36 @@ async def get_migration_status(database_url: str = None) -> dict[str, Any]:
         return {"error": str(e)}
 
 
+async def recompact_resources(
+    database_url: str = None,
+    schema_name: str = "public",
+    resource_types: list[str] | None = None,
+    profile: str = "compact",
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Rewrite existing ``hacs_resources`` rows with a storage profile.
+
+    See ``PostgreSQLAdapter.recompact``; returns its savings report.
+    """
+    if not database_url:
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            return {"error": "DATABASE_URL not provided"}
+
+    from .adapter import PostgreSQLAdapter
+
+    adapter = PostgreSQLAdapter(database_url, schema_name=schema_name, storage_profile=profile)
+    try:
+        return await adapter.recompact(
+            resource_types, profile=profile, batch_size=batch_size, dry_run=dry_run
+        )
+    except Exception as e:
+        return {"error": str(e)}
+    finally:
+        await adapter.disconnect()
+
+
 if __name__ == "__main__":
     # Command line execution
     import sys
@@ -5,7 +5,6 @@ This module provides asynchronous vector database operations for HACS using Post
 Uses direct async connections for simplicity and reliability.
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Any
@@ -14,6 +13,11 @@ import numpy as np
 import psycopg
 from pgvector.psycopg import register_vector_async
 from psycopg.rows import dict_row
+from psycopg.types.json import set_json_loads
+
+from hacs_core.instrumentation import current_span, traced
+from hacs_models import BaseResource
+from hacs_models.serialization import dumps, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +55,7 @@ class HACSVectorStore:
 
             # Register vector types for async connection
             await register_vector_async(self._connection)
+            set_json_loads(json_loads, self._connection)
 
             await self._initialize_vector_support()
             logger.info("Async vector store connection established.")
@@ -124,7 +129,7 @@ class HACSVectorStore:
                         embedding_id,
                         f"Embedding {embedding_id}",
                         content,
-                        json.dumps(metadata or {}),
+                        json_dumps(metadata or {}).decode(),
                         source,
                         embedding_array,
                     ),
@@ -138,6 +143,37 @@ class HACSVectorStore:
             logger.error(f"Failed to store embedding: {e}")
             raise
 
+    async def store_resource_embedding(
+        self,
+        resource: BaseResource,
+        embedding: list[float],
+        metadata: dict[str, Any] | None = None,
+        profile: str = "llm",
+    ) -> str:
+        """
+        Store an embedding for a resource, using its serialized form as content.
+
+        Args:
+            resource: Resource the embedding was computed from
+            embedding: Embedding vector
+            metadata: Extra metadata; resource_type and resource_id are added
+            profile: Serialization profile for the stored content
+
+        Returns:
+            Embedding ID
+        """
+        return await self.store_embedding(
+            content=dumps(resource, profile).decode(),
+            embedding=embedding,
+            metadata={
+                "resource_type": resource.resource_type,
+                "resource_id": resource.id,
+                **(metadata or {}),
+            },
+            source=resource.to_reference(),
+        )
+
+    @traced("vector.similarity_search")
     async def similarity_search(
         self,
         query_embedding: list[float],
@@ -186,6 +222,7 @@ class HACSVectorStore:
             async with self._connection.cursor(row_factory=dict_row) as cursor:
                 await cursor.execute(base_query, params)
                 results = await cursor.fetchall()
+                current_span().set_attributes(rows=len(results), top_k=top_k)
 
                 logger.info(f"Found {len(results)} similar embeddings")
                 return [dict(row) for row in results]
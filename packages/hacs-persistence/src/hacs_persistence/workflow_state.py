@@ -0,0 +1,372 @@
+"""
+Incremental state store for WorkflowExecution.
+
+A ``WorkflowExecution`` accumulates ``completed_steps``, ``tasks`` and
+``errors`` for its whole run, so saving the resource after every step costs
+more the longer the workflow runs. The store instead appends one small event
+row per state change (step completed, task transition, warning, error) and
+keeps occasional checkpoints, i.e. full snapshots tagged with the sequence
+number of the last event they include:
+
+    - Writes insert one row, whatever the history length.
+    - ``load`` materializes the execution from the latest checkpoint plus the
+      events recorded after it (see ``WorkflowExecution.apply_event``).
+    - Checkpoints are written by ``checkpoint``, or lazily by ``load`` once
+      ``checkpoint_every`` events have accumulated since the last one.
+
+``WorkflowStateStore`` keeps rows in memory; ``PostgresWorkflowStateStore``
+keeps them in ``hacs_workflow_events`` and ``hacs_workflow_checkpoints``.
+
+Example:
+    >>> store = PostgresWorkflowStateStore(adapter)
+    >>> await store.create(execution)
+    >>> await store.record_step(execution.id, 0, {"validated": True})
+    >>> execution = await store.load(execution.id)  # e.g. after a restart
+    >>> next_step = execution.current_step
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Any
+
+from hacs_models import WorkflowExecution
+from hacs_models.serialization import dumps, json_dumps, json_loads
+
+from hacs_core import ResourceConflictError, ResourceNotFoundError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_EVENTS = 500
+# Executions whose next sequence number is cached; older ones re-read it from storage
+DEFAULT_CACHED_SEQUENCES = 10_000
+
+
+class WorkflowStateStore:
+    """Event-sourced WorkflowExecution state, held in memory.
+
+    Subclasses persist rows by overriding the ``_last_seq``,
+    ``_insert_event``, ``_latest_checkpoint``, ``_events_after`` and
+    ``_write_checkpoint`` hooks.
+    """
+
+    def __init__(
+        self,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVENTS,
+        cached_sequences: int = DEFAULT_CACHED_SEQUENCES,
+    ):
+        """Initialize store.
+
+        Args:
+            checkpoint_every: Events replayed by ``load`` before it writes a
+                new checkpoint; 0 disables automatic checkpoints
+            cached_sequences: Executions whose next sequence number is kept in
+                memory (least recently appended to are evicted first)
+        """
+        self.checkpoint_every = checkpoint_every
+        self.cached_sequences = cached_sequences
+        self.events_replayed = 0
+        self._next_seq: OrderedDict[str, int] = OrderedDict()
+        # Appends to one execution are serialized so each gets its own seq;
+        # an entry (lock, appends holding or awaiting it) lives while in use
+        self._append_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+        self._events: dict[str, list[dict[str, Any]]] = {}
+        self._checkpoints: dict[str, tuple[int, bytes]] = {}
+
+    # Storage hooks
+
+    async def _last_seq(self, execution_id: str) -> int | None:
+        if execution_id not in self._checkpoints:
+            return None
+        events = self._events.get(execution_id)
+        return events[-1]["seq"] if events else self._checkpoints[execution_id][0]
+
+    async def _insert_event(self, execution_id: str, event: dict[str, Any]) -> None:
+        self._events.setdefault(execution_id, []).append(event)
+
+    async def _latest_checkpoint(self, execution_id: str) -> tuple[int, Any] | None:
+        return self._checkpoints.get(execution_id)
+
+    async def _events_after(self, execution_id: str, seq: int) -> list[dict[str, Any]]:
+        return [event for event in self._events.get(execution_id, []) if event["seq"] > seq]
+
+    async def _write_checkpoint(self, execution_id: str, seq: int, data: bytes) -> None:
+        current = self._checkpoints.get(execution_id)
+        if current is None or current[0] <= seq:
+            self._checkpoints[execution_id] = (seq, data)
+
+    # Public API
+
+    async def create(self, execution: WorkflowExecution) -> WorkflowExecution:
+        """Store an execution's initial state as its first checkpoint."""
+        if await self._last_seq(execution.id) is not None:
+            raise ResourceConflictError("WorkflowExecution", execution.id)
+        await self._write_checkpoint(execution.id, 0, dumps(execution, "compact"))
+        self._cache_seq(execution.id, 1)
+        return execution
+
+    def _cache_seq(self, execution_id: str, seq: int) -> None:
+        self._next_seq[execution_id] = seq
+        self._next_seq.move_to_end(execution_id)
+        while len(self._next_seq) > self.cached_sequences:
+            self._next_seq.popitem(last=False)
+
+    async def append(
+        self, execution_id: str, kind: str, data: dict[str, Any] | None = None
+    ) -> int:
+        """
+        Record one state change.
+
+        Args:
+            execution_id: Execution ID
+            kind: Event kind (see ``WorkflowExecution.apply_event``)
+            data: Event payload
+
+        Returns:
+            The event's sequence number
+
+        Raises:
+            ValidationError: If the kind is unknown or the payload is invalid
+            ResourceNotFoundError: If the execution was never created
+        """
+        try:
+            WorkflowExecution.validate_event(kind, data)
+        except ValueError as e:
+            raise ValidationError(str(e), field="kind", value=kind) from e
+
+        lock, users = self._append_locks.get(execution_id, (asyncio.Lock(), 0))
+        self._append_locks[execution_id] = (lock, users + 1)
+        try:
+            async with lock:
+                seq = self._next_seq.get(execution_id)
+                if seq is None:
+                    last = await self._last_seq(execution_id)
+                    if last is None:
+                        raise ResourceNotFoundError("WorkflowExecution", execution_id)
+                    seq = last + 1
+                event = {
+                    "seq": seq,
+                    "kind": kind,
+                    "data": data or {},
+                    "at": datetime.now(UTC).isoformat(),
+                }
+                await self._insert_event(execution_id, event)
+                self._cache_seq(execution_id, seq + 1)
+                return seq
+        finally:
+            users = self._append_locks[execution_id][1] - 1
+            if users:
+                self._append_locks[execution_id] = (lock, users)
+            else:
+                del self._append_locks[execution_id]
+
+    async def record_started(
+        self, execution_id: str, input_parameters: dict[str, Any] | None = None
+    ) -> int:
+        """Record the start of an execution."""
+        data = {"input_parameters": input_parameters} if input_parameters else None
+        return await self.append(execution_id, "started", data)
+
+    async def record_step(self, execution_id: str, step: int, output: dict[str, Any]) -> int:
+        """Record a completed step and its output."""
+        return await self.append(execution_id, "step", {"step": step, "output": output})
+
+    async def record_task(self, execution_id: str, task_id: str, active: bool = True) -> int:
+        """Record a task being added, activated or deactivated."""
+        return await self.append(execution_id, "task", {"task_id": task_id, "active": active})
+
+    async def record_warning(self, execution_id: str, message: str) -> int:
+        """Record a warning."""
+        return await self.append(execution_id, "warning", {"message": message})
+
+    async def record_error(self, execution_id: str, message: str, fatal: bool = False) -> int:
+        """Record an error; a fatal error stops the execution."""
+        return await self.append(execution_id, "error", {"message": message, "fatal": fatal})
+
+    async def events(self, execution_id: str, after_seq: int = 0) -> list[dict[str, Any]]:
+        """Event rows (``seq``, ``kind``, ``data``, ``at``) recorded after ``after_seq``."""
+        return await self._events_after(execution_id, after_seq)
+
+    async def _materialize(self, execution_id: str) -> tuple[WorkflowExecution, int, int]:
+        checkpoint = await self._latest_checkpoint(execution_id)
+        if checkpoint is None:
+            raise ResourceNotFoundError("WorkflowExecution", execution_id)
+        seq, data = checkpoint
+        payload = json_loads(data) if isinstance(data, bytes | str) else data
+        execution = WorkflowExecution.model_validate(payload)
+        events = await self._events_after(execution_id, seq)
+        for event in events:
+            try:
+                execution.apply_event(event["kind"], event["data"], event["at"])
+            except ValueError as e:
+                # Rows written before events were validated must not block every load
+                logger.warning(
+                    f"Skipping WorkflowExecution/{execution_id} event {event['seq']}: {e}"
+                )
+        self.events_replayed += len(events)
+        return execution, (events[-1]["seq"] if events else seq), len(events)
+
+    async def load(self, execution_id: str) -> WorkflowExecution:
+        """
+        Materialize the current state of an execution.
+
+        Resuming after a restart is ``load`` followed by continuing at
+        ``execution.current_step``.
+
+        Raises:
+            ResourceNotFoundError: If the execution was never created
+        """
+        execution, seq, replayed = await self._materialize(execution_id)
+        if self.checkpoint_every and replayed >= self.checkpoint_every:
+            await self._write_checkpoint(execution_id, seq, dumps(execution, "compact"))
+        return execution
+
+    async def checkpoint(self, execution_id: str) -> WorkflowExecution:
+        """Materialize an execution and store it as the latest checkpoint."""
+        execution, seq, _ = await self._materialize(execution_id)
+        await self._write_checkpoint(execution_id, seq, dumps(execution, "compact"))
+        logger.info(f"Checkpointed WorkflowExecution/{execution_id} at event {seq}")
+        return execution
+
+
+class PostgresWorkflowStateStore(WorkflowStateStore):
+    """WorkflowExecution state in PostgreSQL, on a ``PostgreSQLAdapter``'s pool."""
+
+    def __init__(
+        self,
+        adapter,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVENTS,
+        cached_sequences: int = DEFAULT_CACHED_SEQUENCES,
+    ):
+        """Initialize store.
+
+        Args:
+            adapter: Connected or unconnected ``PostgreSQLAdapter``
+            checkpoint_every: See ``WorkflowStateStore``
+            cached_sequences: See ``WorkflowStateStore``
+        """
+        super().__init__(checkpoint_every, cached_sequences)
+        self.adapter = adapter
+        self._tables_ready = False
+
+    def _connection(self):
+        return self.adapter.pool.connection()
+
+    async def _ensure_tables(self) -> None:
+        await self.adapter.connect()
+        if not self._tables_ready:
+            schema = self.adapter.schema_name
+            async with self._connection() as conn:
+                await conn.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {schema}.hacs_workflow_events (
+                        execution_id TEXT NOT NULL,
+                        seq BIGINT NOT NULL,
+                        kind TEXT NOT NULL,
+                        data JSONB NOT NULL,
+                        at TIMESTAMP WITH TIME ZONE NOT NULL,
+                        PRIMARY KEY (execution_id, seq)
+                    );
+
+                    CREATE TABLE IF NOT EXISTS {schema}.hacs_workflow_checkpoints (
+                        execution_id TEXT PRIMARY KEY,
+                        seq BIGINT NOT NULL,
+                        data JSONB NOT NULL,
+                        created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+                    );
+                    """
+                )
+            self._tables_ready = True
+
+    async def _last_seq(self, execution_id: str) -> int | None:
+        schema = self.adapter.schema_name
+        await self._ensure_tables()
+        async with self._connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT GREATEST(
+                    (SELECT max(seq) FROM {schema}.hacs_workflow_events
+                     WHERE execution_id = %(id)s),
+                    (SELECT seq FROM {schema}.hacs_workflow_checkpoints
+                     WHERE execution_id = %(id)s)
+                )
+                """,
+                {"id": execution_id},
+            )
+            row = await cursor.fetchone()
+            return row[0] if row else None
+
+    async def _insert_event(self, execution_id: str, event: dict[str, Any]) -> None:
+        from psycopg.errors import UniqueViolation
+
+        schema = self.adapter.schema_name
+        await self._ensure_tables()
+        try:
+            async with self._connection() as conn:
+                await conn.execute(
+                    f"""
+                    INSERT INTO {schema}.hacs_workflow_events (execution_id, seq, kind, data, at)
+                    VALUES (%(id)s, %(seq)s, %(kind)s, %(data)s, %(at)s)
+                    """,
+                    {
+                        "id": execution_id,
+                        "seq": event["seq"],
+                        "kind": event["kind"],
+                        "data": json_dumps(event["data"]).decode(),
+                        "at": event["at"],
+                    },
+                )
+        except UniqueViolation as e:
+            # Another writer appended to this execution; re-read the sequence next time
+            self._next_seq.pop(execution_id, None)
+            raise ResourceConflictError("WorkflowExecution", execution_id) from e
+
+    async def _latest_checkpoint(self, execution_id: str) -> tuple[int, Any] | None:
+        await self._ensure_tables()
+        async with self._connection() as conn:
+            cursor = await conn.execute(
+                f"SELECT seq, data FROM {self.adapter.schema_name}.hacs_workflow_checkpoints "
+                "WHERE execution_id = %(id)s",
+                {"id": execution_id},
+            )
+            row = await cursor.fetchone()
+            return (row[0], row[1]) if row else None
+
+    async def _events_after(self, execution_id: str, seq: int) -> list[dict[str, Any]]:
+        await self._ensure_tables()
+        async with self._connection() as conn:
+            cursor = await conn.execute(
+                f"SELECT seq, kind, data, at FROM {self.adapter.schema_name}.hacs_workflow_events "
+                "WHERE execution_id = %(id)s AND seq > %(seq)s ORDER BY seq",
+                {"id": execution_id, "seq": seq},
+            )
+            return [
+                {"seq": row[0], "kind": row[1], "data": row[2], "at": row[3].isoformat()}
+                for row in await cursor.fetchall()
+            ]
+
+    async def _write_checkpoint(self, execution_id: str, seq: int, data: bytes) -> None:
+        schema = self.adapter.schema_name
+        await self._ensure_tables()
+        async with self._connection() as conn:
+            await conn.execute(
+                f"""
+                INSERT INTO {schema}.hacs_workflow_checkpoints (execution_id, seq, data)
+                VALUES (%(id)s, %(seq)s, %(data)s)
+                ON CONFLICT (execution_id) DO UPDATE SET
+                    seq = EXCLUDED.seq, data = EXCLUDED.data, created_at = NOW()
+                WHERE {schema}.hacs_workflow_checkpoints.seq <= EXCLUDED.seq
+                """,
+                {"id": execution_id, "seq": seq, "data": data.decode()},
+            )
+
+
+__all__ = [
+    "DEFAULT_CACHED_SEQUENCES",
+    "DEFAULT_CHECKPOINT_EVENTS",
+    "PostgresWorkflowStateStore",
+    "WorkflowStateStore",
+]
@@ -25,6 +25,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Protocol, Type, Callable
 from dataclasses import dataclass, field
 
+from hacs_core.instrumentation import start_span
 from hacs_models import ToolDefinition
 from .tool_registry import HACSToolRegistry, get_global_registry
 
@@ -684,9 +685,15 @@ class HACSToolIntegrationManager:
 
         execution_context = context or ExecutionContext()
 
-        return await self._execution_strategy.execute(
-            tool_def.function, params, execution_context
-        )
+        with start_span(
+            "tool.execute", tool=tool_name, category=tool_def.category
+        ) as span:
+            result = await self._execution_strategy.execute(
+                tool_def.function, params, execution_context
+            )
+            if not result.success:
+                span.set_error(result.error or "failed")
+            return result
 
     def get_integration_stats(self) -> Dict[str, Any]:
         """Getintegration statistics."""
@@ -0,0 +1,278 @@
+"""
+HACS Tool Search Index - Incremental indexes behind HACSToolRegistry.search_tools
+
+Tool selection runs on every agent step, so the registry keeps its search
+structures up to date as tools are registered instead of scanning the
+catalog per query:
+
+    🧮 Bitsets per category, domain, tag and capability flag; filters
+       combine with integer AND
+    🔎 Token inverted index over tool names, tags and descriptions
+    📈 BM25 ranking of text queries, with name and tag matches weighted
+       above description matches
+
+A text query matches the tools whose name, description or one of whose tags
+contains it (case-insensitively). The token index only narrows the
+candidates; each one is confirmed with that substring check before ranking.
+
+Each tool is assigned a stable slot on first registration. Slot order is
+registration order, which is also the order of unranked results.
+"""
+
+import math
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from hacs_models import ToolDefinition
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Term frequency multipliers per field (a simplified BM25F)
+FIELD_WEIGHTS: Dict[str, float] = {"name": 3.0, "tags": 2.0, "description": 1.0}
+
+# Boolean ToolDefinition attributes indexed as bitsets
+CAPABILITY_FLAGS: Tuple[str, ...] = (
+    "requires_actor",
+    "requires_db",
+    "requires_vector_store",
+    "is_async",
+    "supports_langchain",
+    "supports_mcp",
+)
+
+# Score multiplier for index terms that only contain the query token
+PARTIAL_MATCH_WEIGHT = 0.5
+
+# Shorter query tokens at the query's edges are not expanded to containing terms
+MIN_INFIX_LENGTH = 3
+
+IndexKey = Tuple[str, object]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens (``save_resource`` -> save, resource)."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    """Yield set bit positions in ascending order."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class ToolSearchIndex:
+    """
+    Secondary indexes and BM25 inverted index over registered tools.
+
+    Filters are expressed as ``(field, value)`` keys such as
+    ``("category", "modeling")``, ``("tag", "fhir")`` or
+    ``("requires_db", True)``.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._slots: Dict[str, int] = {}
+        self._names: List[Optional[str]] = []
+        self._keys: Dict[int, List[IndexKey]] = {}
+        self._all = 0
+        self._bitsets: Dict[IndexKey, int] = {}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._doc_terms: Dict[int, Dict[str, float]] = {}
+        self._texts: Dict[int, Tuple[str, ...]] = {}
+        self._doc_lengths: Dict[int, float] = {}
+        self._total_length = 0.0
+        self._expansions: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, tool: ToolDefinition) -> None:
+        """Index a tool, replacing any previous entry with the same name."""
+        slot = self._slots.get(tool.name)
+        if slot is None:
+            slot = len(self._names)
+            self._slots[tool.name] = slot
+            self._names.append(tool.name)
+        else:
+            self._discard(slot)
+
+        bit = 1 << slot
+        self._all |= bit
+        keys: List[IndexKey] = [("category", tool.category), ("domain", tool.domain)]
+        keys.extend(("tag", tag) for tag in tool.tags)
+        keys.extend((flag, bool(getattr(tool, flag, False))) for flag in CAPABILITY_FLAGS)
+        for key in keys:
+            self._bitsets[key] = self._bitsets.get(key, 0) | bit
+        self._keys[slot] = keys
+
+        terms: Dict[str, float] = {}
+        fields = {
+            "name": tool.name,
+            "tags": " ".join(tool.tags),
+            "description": tool.description or "",
+        }
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._expansions.clear()
+            postings[slot] = frequency
+        self._doc_terms[slot] = terms
+        texts = (tool.name, fields["description"], *tool.tags)
+        self._texts[slot] = tuple(text.lower() for text in texts)
+        length = sum(terms.values())
+        self._doc_lengths[slot] = length
+        self._total_length += length
+
+    def remove(self, name: str) -> None:
+        """Drop a tool from the index; its slot is reused if it is added again."""
+        slot = self._slots.get(name)
+        if slot is not None:
+            self._discard(slot)
+
+    def _discard(self, slot: int) -> None:
+        bit = 1 << slot
+        self._all &= ~bit
+        for key in self._keys.pop(slot, []):
+            remaining = self._bitsets.get(key, 0) & ~bit
+            if remaining:
+                self._bitsets[key] = remaining
+            else:
+                self._bitsets.pop(key, None)
+
+        self._texts.pop(slot, None)
+        for term in self._doc_terms.pop(slot, {}):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(slot, None)
+            if not postings:
+                del self._postings[term]
+                self._expansions.clear()
+        self._total_length -= self._doc_lengths.pop(slot, 0.0)
+
+    def count(self, key: IndexKey) -> int:
+        """Number of indexed tools matching a filter key."""
+        return self._bitsets.get(key, 0).bit_count()
+
+    def match(self, filters: Iterable[IndexKey] = ()) -> int:
+        """Bitset of tools matching all filter keys."""
+        bits = self._all
+        for key in filters:
+            bits &= self._bitsets.get(key, 0)
+            if not bits:
+                break
+        return bits
+
+    def search(self, query: Optional[str] = None, filters: Iterable[IndexKey] = ()) -> List[str]:
+        """
+        Find tools matching a text query and filters.
+
+        Args:
+            query: Text contained in the tool's name, description or a tag
+            filters: ``(field, value)`` keys that must all match
+
+        Returns:
+            Tool names, best match first for a query, otherwise in
+            registration order
+        """
+        bits = self.match(filters)
+        if not bits:
+            return []
+        if not query:
+            return [self._names[slot] for slot in _iter_bits(bits)]
+
+        query = query.lower()
+        terms = self._query_terms(query)
+        for expanded in terms.values():
+            if expanded is not None:
+                bits &= self._term_bits(expanded)
+                if not bits:
+                    return []
+
+        slots = [
+            slot
+            for slot in _iter_bits(bits)
+            if any(query in text for text in self._texts[slot])
+        ]
+        scores = self._score(terms, slots)
+        slots.sort(key=lambda slot: -scores.get(slot, 0.0))
+        return [self._names[slot] for slot in slots]
+
+    def _query_terms(self, query: str) -> Dict[str, Optional[List[str]]]:
+        """
+        Map each query token to the index terms a matching tool must contain.
+
+        A token with separators on both sides is a whole term. A token at the
+        start or end of the query may be part of a longer term, so it expands
+        to every term containing it; below ``MIN_INFIX_LENGTH`` it is not
+        expanded (``None``) and only the substring check applies.
+        """
+        terms: Dict[str, Optional[List[str]]] = {}
+        for match in _TOKEN_PATTERN.finditer(query):
+            token = match.group()
+            if 0 < match.start() and match.end() < len(query):
+                terms[token] = [token] if token in self._postings else []
+            elif len(token) >= MIN_INFIX_LENGTH:
+                terms[token] = self._expand(token)
+            else:
+                terms.setdefault(token, None)
+        return terms
+
+    def _term_bits(self, terms: List[str]) -> int:
+        """Bitset of tools containing any of the terms."""
+        bits = 0
+        for term in terms:
+            for slot in self._postings[term]:
+                bits |= 1 << slot
+        return bits
+
+    def _expand(self, token: str) -> List[str]:
+        """Index terms containing a query token, cached until the vocabulary changes."""
+        expanded = self._expansions.get(token)
+        if expanded is None:
+            expanded = [term for term in self._postings if token in term]
+            self._expansions[token] = expanded
+        return expanded
+
+    def _score(self, terms: Dict[str, Optional[List[str]]], slots: List[int]) -> Dict[int, float]:
+        documents = len(self._doc_lengths)
+        if not documents or not slots:
+            return {}
+        average_length = self._total_length / documents or 1.0
+
+        candidates = set(slots)
+        scores: Dict[int, float] = {}
+        for token, expanded in terms.items():
+            if expanded is None:
+                expanded = [token] if token in self._postings else []
+            for term in expanded:
+                postings = self._postings[term]
+                frequency = len(postings)
+                idf = math.log(1 + (documents - frequency + 0.5) / (frequency + 0.5))
+                if term != token:
+                    idf *= PARTIAL_MATCH_WEIGHT
+                for slot, tf in postings.items():
+                    if slot not in candidates:
+                        continue
+                    relative_length = self._doc_lengths[slot] / average_length
+                    norm = self.k1 * (1 - self.b + self.b * relative_length)
+                    scores[slot] = scores.get(slot, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+
+__all__ = ["ToolSearchIndex", "tokenize", "FIELD_WEIGHTS", "CAPABILITY_FLAGS", "MIN_INFIX_LENGTH"]
@@ -0,0 +1,268 @@
+"""
+HACS Tool Manifest - Cached tool discovery for fast registry startup
+
+Discovering tools means importing every module of a tool package and
+inspecting its functions. The manifest records the resulting
+``ToolDefinition`` metadata per module so later processes can register the
+same tools without importing anything:
+
+    📦 Keyed by package version and per-module file mtimes
+    🔁 Incremental: only new or modified modules are re-imported and rescanned
+    💤 Lazy: cached tools get a ``LazyToolFunction`` that imports the tool's
+       module on first use
+
+Modules that failed to import are cached with their error until they
+change. After installing an optional dependency, call ``ToolManifest.clear()``
+or delete the manifest file to rescan them.
+
+Configuration:
+    HACS_TOOL_MANIFEST: Set to "0" or "false" to always import and scan
+    HACS_TOOL_MANIFEST_PATH: Manifest file location
+        (default: ``$XDG_CACHE_HOME/hacs/tool_manifest.json``)
+"""
+
+import asyncio
+import importlib
+import importlib.metadata
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from hacs_models import ToolDefinition
+
+logger = logging.getLogger(__name__)
+
+# Bump when the record layout or discovery rules change to invalidate old manifests
+MANIFEST_FORMAT = 1
+
+
+class LazyToolFunction:
+    """
+    Stand-in for a tool function that imports its module on first use.
+
+    Calling the stand-in, inspecting its signature or reading any other
+    attribute of the tool function resolves the real function once.
+    """
+
+    def __init__(self, module_path: str, attribute: str, is_async: bool = False, doc: str = ""):
+        """
+        Initialize stand-in.
+
+        Args:
+            module_path: Module defining the tool
+            attribute: Attribute name of the tool function in that module
+            is_async: Whether the tool function is a coroutine function
+            doc: Docstring to expose before the module is imported
+        """
+        self.__module__ = module_path
+        self.__name__ = attribute
+        self.__qualname__ = attribute
+        self.__doc__ = doc
+        self._attribute = attribute
+        self._function: Optional[Callable] = None
+        if is_async:
+            # Recognized by asyncio.iscoroutinefunction (3.11) and inspect (3.12+)
+            self._is_coroutine = getattr(asyncio.coroutines, "_is_coroutine", None)
+            mark = getattr(inspect, "markcoroutinefunction", None)
+            if mark is not None:
+                mark(self)
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the tool's module has been imported."""
+        return self._function is not None
+
+    def resolve(self) -> Callable:
+        """Import the tool's module and return the real function."""
+        if self._function is None:
+            module = importlib.import_module(self.__module__)
+            self._function = getattr(module, self._attribute)
+        return self._function
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        return inspect.signature(self.resolve())
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Dunder lookups (copy, pickle, repr helpers) must not trigger imports
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "resolved" if self.is_resolved else "lazy"
+        return f"<LazyToolFunction {self.__module__}.{self._attribute} ({state})>"
+
+
+def default_manifest_path() -> Path:
+    """Manifest location from the environment or the user cache directory."""
+    configured = os.getenv("HACS_TOOL_MANIFEST_PATH")
+    if configured:
+        return Path(configured)
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "hacs" / "tool_manifest.json"
+
+
+def _package_version(package_name: str) -> str:
+    try:
+        return importlib.metadata.version(package_name.replace("_", "-"))
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class ToolManifest:
+    """
+    On-disk cache of discovered tool metadata per package and module.
+
+    Packages are fingerprinted without importing them: the version comes from
+    installed distribution metadata and module mtimes from the package files.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize manifest.
+
+        Args:
+            path: Manifest file (defaults to ``default_manifest_path()``)
+        """
+        self.path = Path(path) if path is not None else default_manifest_path()
+        self._data: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["ToolManifest"]:
+        """Manifest configured by the environment, or None when disabled."""
+        if os.getenv("HACS_TOOL_MANIFEST", "1").lower() in {"0", "false"}:
+            return None
+        return cls()
+
+    def scan_package(self, package_name: str) -> Optional[Dict[str, int]]:
+        """
+        List a package's modules with their mtimes, without importing it.
+
+        Args:
+            package_name: Top-level package name
+
+        Returns:
+            Module name to mtime in nanoseconds (the package's own
+            ``__init__`` excluded), or None if the package is not file-based
+        """
+        try:
+            spec = importlib.util.find_spec(package_name)
+        except (ImportError, ValueError):
+            return None
+        if spec is None or not spec.submodule_search_locations:
+            return None
+
+        modules: Dict[str, int] = {}
+        for location in spec.submodule_search_locations:
+            root = Path(location)
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [
+                    d
+                    for d in dirnames
+                    if d != "__pycache__" and (Path(dirpath) / d / "__init__.py").exists()
+                ]
+                relative = Path(dirpath).relative_to(root).parts
+                for filename in filenames:
+                    if not filename.endswith(".py"):
+                        continue
+                    stem = filename[:-3]
+                    parts = relative if stem == "__init__" else (*relative, stem)
+                    if not parts:
+                        continue
+                    modname = ".".join((package_name, *parts))
+                    modules[modname] = os.stat(os.path.join(dirpath, filename)).st_mtime_ns
+        return modules
+
+    def load(self, package_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Cached module entries for a package.
+
+        Args:
+            package_name: Top-level package name
+
+        Returns:
+            Module name to ``{"mtime_ns", "tools"}``; empty if the manifest is
+            missing, unreadable or was written for another package version
+        """
+        package = self._read().get("packages", {}).get(package_name)
+        if not package or package.get("version") != _package_version(package_name):
+            return {}
+        return package.get("modules", {})
+
+    def store(self, package_name: str, modules: Dict[str, Dict[str, Any]]) -> None:
+        """Replace a package's module entries and write the manifest atomically."""
+        data = self._read()
+        data.setdefault("packages", {})[package_name] = {
+            "version": _package_version(package_name),
+            "modules": modules,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".tool_manifest.")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write tool manifest {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Delete the manifest so the next discovery rescans every module."""
+        self._data = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                data = {}
+            if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+                data = {"format": MANIFEST_FORMAT, "packages": {}}
+            self._data = data
+        return self._data
+
+    @staticmethod
+    def to_record(tool: ToolDefinition, attribute: str) -> Dict[str, Any]:
+        """Serializable metadata for a discovered tool."""
+        record = tool.model_dump(mode="json", exclude={"function"})
+        record["attribute"] = attribute
+        return record
+
+    @staticmethod
+    def from_record(record: Dict[str, Any]) -> ToolDefinition:
+        """Rebuild a tool definition whose function is imported lazily."""
+        data = dict(record)
+        attribute = data.pop("attribute")
+        data["function"] = LazyToolFunction(
+            data["module_path"],
+            attribute,
+            is_async=data.get("is_async", False),
+            doc=data.get("description", ""),
+        )
+        return ToolDefinition.model_validate(data)
+
+
+def tool_records(entries: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten cached module entries into tool records, in module order."""
+    return [record for modname in sorted(entries) for record in entries[modname]["tools"]]
+
+
+__all__ = [
+    "LazyToolFunction",
+    "ToolManifest",
+    "default_manifest_path",
+    "tool_records",
+    "MANIFEST_FORMAT",
+]
@@ -27,11 +27,32 @@ import pkgutil
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Callable
 
+from .tool_index import ToolSearchIndex
+from .tool_manifest import ToolManifest, tool_records
 from .versioning import VersionStatus
 from hacs_models import ToolDefinition
 
 logger = logging.getLogger(__name__)
 
+# Blocklist generic domains and removed legacy domains
+_BLOCKED_MODULES = {
+    "hacs_tools.domains.fhir_integration",
+    "hacs_tools.domains.development_tools",
+    "hacs_tools.domains.healthcare_analytics",
+    # Legacy domains that have been removed/consolidated into 4 core domains
+    "hacs_tools.domains.admin_operations",
+    "hacs_tools.domains.bundle_tools",
+    "hacs_tools.domains.evidence_tools",
+    "hacs_tools.domains.memory_operations",
+    "hacs_tools.domains.modeling_tools",
+    "hacs_tools.domains.persistence_tools",
+    "hacs_tools.domains.preferences_tools",
+    "hacs_tools.domains.resource_management",
+    "hacs_tools.domains.schema_discovery",
+    "hacs_tools.domains.vector_search",
+    "hacs_tools.domains.workflow_tools",
+}
+
 
 class HACSToolRegistry:
     """
@@ -42,11 +63,20 @@ class HACSToolRegistry:
     capabilities and requirements.
     """
 
-    def __init__(self):
+    def __init__(self, manifest: Optional[ToolManifest] = None):
+        """
+        Initialize registry.
+
+        Args:
+            manifest: Discovery manifest cache (defaults to the one configured
+                by ``HACS_TOOL_MANIFEST`` / ``HACS_TOOL_MANIFEST_PATH``)
+        """
         self._tools: Dict[str, ToolDefinition] = {}
         self._categories: Dict[str, Set[str]] = {}
         self._domains: Dict[str, Set[str]] = {}
         self._tags: Dict[str, Set[str]] = {}
+        self._index = ToolSearchIndex()
+        self._manifest = manifest if manifest is not None else ToolManifest.from_env()
         self._initialized = False
         self._search_paths: List[str] = []
         # Canonical public tool allowlist (target ~22 tools)
@@ -297,6 +327,11 @@ class HACSToolRegistry:
 
     def _discover_from_package(self, package_name: str) -> int:
         """Discover plugins from a specific package."""
+        if self._manifest is not None:
+            discovered = self._discover_from_manifest(package_name)
+            if discovered is not None:
+                return discovered
+
         try:
             package = importlib.import_module(package_name)
         except ImportError as e:
@@ -313,30 +348,11 @@ class HACSToolRegistry:
             return 0
 
         # Walk through all modules in package
-        # Blocklist generic domains and removed legacy domains
-        blocked_substrings = {
-            "hacs_tools.domains.fhir_integration",
-            "hacs_tools.domains.development_tools",
-            "hacs_tools.domains.healthcare_analytics",
-            # Legacy domains that have been removed/consolidated into 4 core domains
-            "hacs_tools.domains.admin_operations",
-            "hacs_tools.domains.bundle_tools",
-            "hacs_tools.domains.evidence_tools",
-            "hacs_tools.domains.memory_operations",
-            "hacs_tools.domains.modeling_tools",
-            "hacs_tools.domains.persistence_tools",
-            "hacs_tools.domains.preferences_tools",
-            "hacs_tools.domains.resource_management",
-            "hacs_tools.domains.schema_discovery",
-            "hacs_tools.domains.vector_search",
-            "hacs_tools.domains.workflow_tools",
-        }
-
         for importer, modname, ispkg in pkgutil.walk_packages(
             package_path, package_name + "."
         ):
             # Skip blocked modules (cleanup of generic domains)
-            if any(b in modname for b in blocked_substrings):
+            if any(b in modname for b in _BLOCKED_MODULES):
                 continue
             try:
                 module = importlib.import_module(modname)
@@ -347,40 +363,118 @@ class HACSToolRegistry:
 
         return discovered_count
 
-    def _scan_module_for_tools(self, module: Any, module_name: str) -> int:
-        """Scan a module for tool functions."""
+    def _discover_from_manifest(self, package_name: str) -> Optional[int]:
+        """
+        Discover plugins using the manifest cache.
+
+        Modules whose mtime matches the manifest are not imported; their tools
+        are registered with lazily imported functions. New or modified modules
+        are imported, scanned and written back to the manifest.
+
+        Returns:
+            Number of plugins discovered, or None if the package cannot be
+            fingerprinted without importing it
+        """
+        modules = self._manifest.scan_package(package_name)
+        if modules is None:
+            return None
+
+        cached = self._manifest.load(package_name)
+        entries: Dict[str, Dict[str, Any]] = {}
+        live: Dict[str, List[ToolDefinition]] = {}
+        for modname, mtime_ns in modules.items():
+            if any(b in modname for b in _BLOCKED_MODULES):
+                continue
+            entry = cached.get(modname)
+            if entry is not None and entry.get("mtime_ns") == mtime_ns:
+                entries[modname] = entry
+                continue
+            try:
+                module = importlib.import_module(modname)
+            except Exception as e:
+                # Cached too, so a broken module is not re-imported on every start
+                logger.debug(f"Could not scan module {modname}: {e}")
+                live[modname] = []
+                entries[modname] = {"mtime_ns": mtime_ns, "tools": [], "error": str(e)}
+                continue
+            # Re-exports are recorded once, under the module defining them
+            found = [
+                (attr_name, plugin)
+                for attr_name, plugin in self._decorated_tools(module)
+                if plugin.module_path == modname
+            ]
+            live[modname] = [plugin for _, plugin in found]
+            if getattr(module.__spec__, "_initializing", False):
+                # Reached re-entrantly (tool decorators create the global registry while
+                # the package is importing); its tools are incomplete, so don't cache them
+                continue
+            entries[modname] = {
+                "mtime_ns": mtime_ns,
+                "tools": [ToolManifest.to_record(plugin, attr) for attr, plugin in found],
+            }
+
+        if live or entries.keys() != cached.keys():
+            self._manifest.store(package_name, entries)
+
         discovered_count = 0
+        cached_entries = {m: e for m, e in entries.items() if m not in live}
+        plugins = [plugin for found in live.values() for plugin in found]
+        for record in tool_records(cached_entries):
+            try:
+                plugins.append(ToolManifest.from_record(record))
+            except Exception as e:
+                logger.debug(f"Invalid manifest record {record.get('name')}: {e}")
+        for plugin in plugins:
+            if self._is_registrable(plugin):
+                self._register_tool_definition(plugin)
+                discovered_count += 1
+
+        logger.debug(
+            f"Manifest discovery for {package_name}: {len(live)} modules scanned, "
+            f"{len(cached_entries)} from cache"
+        )
+        return discovered_count
 
+    def _decorated_tools(self, module: Any) -> List[tuple]:
+        """Find functions in a module decorated as HACS tools, as (attribute, plugin) pairs."""
+        found = []
         for attr_name in dir(module):
             if attr_name.startswith("_"):
                 continue
 
             attr = getattr(module, attr_name)
 
-            # Only register functions explicitly decorated as HACS tools
+            # Only functions explicitly decorated as HACS tools
             if hasattr(attr, "_hacs_registered") and hasattr(attr, "_hacs_plugin"):
-                try:
-                    plugin: ToolDefinition = getattr(attr, "_hacs_plugin")
-                    # Decide registration based on allowlist and specialized toggle
-                    if plugin:
-                        is_specialized = plugin.domain == "resource" or any(
-                            str(tag).startswith("resource:")
-                            for tag in (plugin.tags or [])
-                        )
-                        # Always include specialized resource tools
-                        if (
-                            not is_specialized
-                            and plugin.name not in self._public_allowlist
-                        ):
-                            continue
-                    # Ensure function reference is set
-                    if plugin and not plugin.function:
-                        plugin.function = attr
-                    self._register_tool_definition(plugin)
-                    discovered_count += 1
-                except Exception as e:
-                    logger.debug(f"Failed to register decorated tool {attr_name}: {e}")
+                plugin: ToolDefinition = getattr(attr, "_hacs_plugin")
+                if not plugin:
+                    continue
+                # Ensure function reference is set
+                if not plugin.function:
+                    plugin.function = attr
+                found.append((attr_name, plugin))
+        return found
+
+    def _is_registrable(self, plugin: ToolDefinition) -> bool:
+        """Decide registration based on allowlist and specialized toggle."""
+        is_specialized = plugin.domain == "resource" or any(
+            str(tag).startswith("resource:") for tag in (plugin.tags or [])
+        )
+        # Always include specialized resource tools
+        return is_specialized or plugin.name in self._public_allowlist
+
+    def _scan_module_for_tools(self, module: Any, module_name: str) -> int:
+        """Scan a module for tool functions."""
+        discovered_count = 0
+
+        for attr_name, plugin in self._decorated_tools(module):
+            if not self._is_registrable(plugin):
                 continue
+            try:
+                self._register_tool_definition(plugin)
+                discovered_count += 1
+            except Exception as e:
+                logger.debug(f"Failed to register decorated tool {attr_name}: {e}")
 
         return discovered_count
 
@@ -675,6 +769,9 @@ class HACSToolRegistry:
 
     def _register_tool_definition(self, tool: ToolDefinition) -> None:
         """Register a tool definition in the registry."""
+        previous = self._tools.get(tool.name)
+        if previous is not None:
+            self._unindex(previous)
         self._tools[tool.name] = tool
 
         # Update category index
@@ -693,6 +790,24 @@ class HACSToolRegistry:
                 self._tags[tag] = set()
             self._tags[tag].add(tool.name)
 
+        # Update search bitsets and inverted index
+        self._index.add(tool)
+
+    def _unindex(self, tool: ToolDefinition) -> None:
+        """Remove a replaced tool definition from the name indexes."""
+        for index, keys in (
+            (self._categories, [tool.category]),
+            (self._domains, [tool.domain]),
+            (self._tags, tool.tags),
+        ):
+            for key in keys:
+                names = index.get(key)
+                if names is None:
+                    continue
+                names.discard(tool.name)
+                if not names:
+                    del index[key]
+
     def auto_discover_hacs_tools(self, base_packages: List[str] = None) -> int:
         """
         Automatically discover all HACS tools using the plugin system.
@@ -774,8 +889,12 @@ class HACSToolRegistry:
         """
         Advanced tool search with multiple filter criteria.
 
+        Filters are answered from bitset indexes and the text query from a
+        BM25-ranked inverted index, all maintained at registration time.
+
         Args:
-            query: Text search in name and description
+            query: Text contained in the name, description or a tag
+                (case-insensitive)
             category: Filter by category
             domain: Filter by domain
             tags: Filter by tags (tools must have ALL specified tags)
@@ -786,61 +905,34 @@ class HACSToolRegistry:
             framework: Filter by framework compatibility
 
         Returns:
-            List of matching tools
+            List of matching tools, most relevant first when a query is
+            given, otherwise in registration order
         """
-        results = list(self._tools.values())
-
-        # Text search
-        if query:
-            query_lower = query.lower()
-            results = [
-                tool
-                for tool in results
-                if (
-                    query_lower in tool.name.lower()
-                    or query_lower in tool.description.lower()
-                    or any(query_lower in tag.lower() for tag in tool.tags)
-                )
-            ]
-
-        # Category filter
+        filters = []
         if category:
-            results = [tool for tool in results if tool.category == category]
-
-        # Domain filter
+            filters.append(("category", category))
         if domain:
-            results = [tool for tool in results if tool.domain == domain]
-
-        # Tags filter (AND operation - tool must have ALL specified tags)
-        if tags:
-            results = [
-                tool for tool in results if all(tag in tool.tags for tag in tags)
-            ]
+            filters.append(("domain", domain))
+        for tag in tags or []:
+            filters.append(("tag", tag))
 
         # Capability filters
-        if requires_actor is not None:
-            results = [
-                tool for tool in results if tool.requires_actor == requires_actor
-            ]
-
-        if requires_db is not None:
-            results = [tool for tool in results if tool.requires_db == requires_db]
-
-        if requires_vector_store is not None:
-            results = [
-                tool
-                for tool in results
-                if tool.requires_vector_store == requires_vector_store
-            ]
-
-        if is_async is not None:
-            results = [tool for tool in results if tool.is_async == is_async]
+        for flag, value in (
+            ("requires_actor", requires_actor),
+            ("requires_db", requires_db),
+            ("requires_vector_store", requires_vector_store),
+            ("is_async", is_async),
+        ):
+            if value is not None:
+                filters.append((flag, bool(value)))
 
-        # Framework compatibility
-        if framework:
-            results = [tool for tool in results if tool.is_compatible_with(framework)]
+        # Framework compatibility (unknown frameworks are compatible with everything)
+        if framework == "langchain":
+            filters.append(("supports_langchain", True))
+        elif framework == "mcp":
+            filters.append(("supports_mcp", True))
 
-        return results
+        return [self._tools[name] for name in self._index.search(query, filters)]
 
     def get_tool_stats(self) -> Dict[str, Any]:
         """Get statistics about registered tools."""
@@ -851,20 +943,14 @@ class HACSToolRegistry:
             },
             "domains": {domain: len(tools) for domain, tools in self._domains.items()},
             "capabilities": {
-                "requires_actor": len(
-                    [t for t in self._tools.values() if t.requires_actor]
-                ),
-                "requires_db": len([t for t in self._tools.values() if t.requires_db]),
-                "requires_vector_store": len(
-                    [t for t in self._tools.values() if t.requires_vector_store]
-                ),
-                "is_async": len([t for t in self._tools.values() if t.is_async]),
+                "requires_actor": self._index.count(("requires_actor", True)),
+                "requires_db": self._index.count(("requires_db", True)),
+                "requires_vector_store": self._index.count(("requires_vector_store", True)),
+                "is_async": self._index.count(("is_async", True)),
             },
             "framework_support": {
-                "langchain": len(
-                    [t for t in self._tools.values() if t.supports_langchain]
-                ),
-                "mcp": len([t for t in self._tools.values() if t.supports_mcp]),
+                "langchain": self._index.count(("supports_langchain", True)),
+                "mcp": self._index.count(("supports_mcp", True)),
             },
         }
         return stats
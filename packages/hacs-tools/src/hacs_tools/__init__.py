@@ -13,8 +13,8 @@ from .tools import (
     ALL_HACS_TOOLS,
 )
 
-# Import domain modules for direct access if needed
-from . import domains
+# Domain modules are imported on first access (see __getattr__) so that importing
+# the package does not load every tool module
 
 # Import result types from hacs_core
 try:
@@ -47,6 +47,11 @@ def __getattr__(name: str):
     This allows existing code to continue importing specific tool functions
     while using the existing hacs-registry system.
     """
+    if name == "domains":
+        import importlib
+
+        return importlib.import_module(f"{__name__}.domains")
+
     # Delegate to tools module for tool functions
     from .tools import get_tool
 
@@ -35,6 +35,8 @@ try:
         suggest_resource_codings,
         summarize_codable_concepts,
         map_terminology,
+        check_value_set_membership,
+        translate_codes,
     )
 except Exception:
     # Terminology tools are optional, import failures are ignored
@@ -43,6 +45,8 @@ except Exception:
     suggest_resource_codings = None
     summarize_codable_concepts = None
     map_terminology = None
+    check_value_set_membership = None
+    translate_codes = None
 
 # Extraction domain is optional at import-time due to LLM dependencies. Defer failures.
 try:
@@ -125,6 +129,8 @@ __all__ = [
     "suggest_resource_codings",
     "summarize_codable_concepts",
     "map_terminology",
+    "check_value_set_membership",
+    "translate_codes",
     # Note: Legacy tool names have been consolidated into the 4 core domains above.
     # Users should migrate to the new domain-specific tool names for better clarity.
 ]
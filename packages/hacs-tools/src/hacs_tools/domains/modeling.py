@@ -34,6 +34,8 @@ from hacs_tools.common import HACSCommonInput, build_error_plan
 
 
 from hacs_models import get_model_registry, ResourceBundle, BundleEntry, Document
+from hacs_models.bulk_validation import validate_many
+from hacs_models.json_patch import diff as json_patch_diff
 from hacs_models.utils import set_nested_field
 # from hacs_utils.structured import extract  # Temporarily disabled
 # Tool domain: modeling - Resource instantiation, validation, composition, diffing
@@ -280,25 +282,50 @@ def validate_resource(resource: Dict[str, Any]) -> HACSResult:
 validate_resource._tool_args = ValidateResourceInput  # type: ignore[attr-defined]
 
 
-def validate_resources(resources: List[Dict[str, Any]]) -> HACSResult:
-    """Validate multiple resources at once."""
+def _issue(error: Dict[str, Any]) -> str:
+    return f"{error['path'] or '/'}: {error['message']}"
+
+
+def validate_resources(
+    resources: List[Dict[str, Any]], processes: Optional[int] = None
+) -> HACSResult:
+    """
+    Validate multiple resources at once.
+
+    Resources are grouped by type and validated in batches, so large exports
+    avoid per-resource tool overhead. Issues carry JSON-pointer paths.
+
+    Args:
+        resources: Resource dictionaries, each with a 'resource_type'
+        processes: Worker processes for very large batches (default: in-process)
+
+    Returns:
+        HACSResult with per-resource results in input order
+    """
+    resources = resources or []
+    bulk = validate_many(resources, processes=processes)
+    errors = bulk.errors_by_index()
     results: List[Dict[str, Any]] = []
-    for res in resources or []:
-        single = validate_resource(res)
+    for index, res in enumerate(resources):
+        resource_errors = errors.get(index, [])
         results.append(
             {
-                "resource_type": res.get("resource_type"),
-                "valid": (single.data or {}).get("valid") if single.success else False,
-                "issues": (single.data or {}).get("issues")
-                if single.success
-                else [single.error or single.message],
-                "success": single.success,
+                "resource_type": res.get("resource_type") if isinstance(res, dict) else None,
+                "valid": not resource_errors,
+                "issues": [_issue(e) for e in resource_errors],
+                "errors": resource_errors,
+                "success": not resource_errors,
             }
         )
     return HACSResult(
-        success=all(r.get("success") for r in results),
+        success=bulk.is_valid,
         message=f"Validated {len(results)} resources",
-        data={"results": results},
+        data={
+            "results": results,
+            "valid_count": bulk.valid_count,
+            "invalid_count": len(errors),
+            "counts_by_type": bulk.counts_by_type,
+        },
     )
 
 
@@ -319,7 +346,8 @@ def diff_resources(before: Dict[str, Any], after: Dict[str, Any]) -> HACSResult:
         after: The modified resource state
 
     Returns:
-        HACSResult with detailed change information
+        HACSResult with detailed change information and an RFC 6902 ``patch``
+        that turns ``before`` into ``after``
     """
     try:
         changes = []
@@ -353,7 +381,11 @@ def diff_resources(before: Dict[str, Any], after: Dict[str, Any]) -> HACSResult:
         return HACSResult(
             success=True,
             message=f"Resource comparison completed with {len(changes)} changes",
-            data={"changes": changes, "has_changes": len(changes) > 0},
+            data={
+                "changes": changes,
+                "has_changes": len(changes) > 0,
+                "patch": json_patch_diff(before, after),
+            },
         )
 
     except Exception as e:
@@ -393,61 +425,73 @@ def validate_bundle(bundle: Dict[str, Any]) -> HACSResult:
     Returns:
         HACSResult with validation status and details
     """
-    try:
-        # Instantiate the bundle to perform basic validation
-        bundle_obj = ResourceBundle(**bundle)
-
-        # Perform integrity validation
-        integrity_result = bundle_obj.validate_bundle_integrity()
+    report = _validate_bundle_payloads([bundle])[0]
+    if report.pop("error", None) is not None:
+        return HACSResult(
+            success=False,
+            message="Bundle validation error",
+            error=report["issues"][0],
+            data={"valid": False, "issues": report["issues"]},
+        )
+    return HACSResult(success=True, message="Bundle validation completed", data=report)
 
-        if not integrity_result.success:
-            return HACSResult(
-                success=False,
-                message="Bundle validation failed",
-                error=integrity_result.message,
-                data={"valid": False, "details": integrity_result.data},
-            )
 
-        # Additional validations
-        issues = []
+def _validate_bundle_payloads(
+    bundles: List[Dict[str, Any]], processes: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Validate bundles, checking every entry resource of every bundle in one batch."""
+    reports: List[Dict[str, Any]] = []
+    payloads: List[Dict[str, Any]] = []
+    owners: List[tuple] = []
 
-        # Check that all resources in entries are valid
-        for i, entry in enumerate(bundle_obj.entries):
-            if hasattr(entry, "resource") and entry.resource:
-                resource_result = validate_resource(entry.resource)
-                if not resource_result.success or not resource_result.data.get("valid", False):
-                    issues.extend(
-                        [f"Entry {i}: {issue}" for issue in resource_result.data.get("issues", [])]
-                    )
-
-        # Check for duplicate entry titles
-        titles = [
-            entry.title for entry in bundle_obj.entries if hasattr(entry, "title") and entry.title
-        ]
+    for bundle_index, bundle in enumerate(bundles):
+        try:
+            bundle_obj = ResourceBundle(**bundle)
+            # Raises for empty STACK/TEMPLATE bundles
+            integrity = bundle_obj.validate_bundle_integrity()
+        except Exception as e:
+            reports.append({"valid": False, "issues": [str(e)], "error": str(e)})
+            continue
+
+        issues: List[str] = list(integrity["issues"])
+        ids = []
+        for entry_index, entry in enumerate(bundle_obj.entries):
+            resource = entry.resource
+            if isinstance(resource, BaseResource):
+                resource = resource.model_dump()
+            if isinstance(resource, dict):
+                payloads.append(resource)
+                owners.append((bundle_index, entry_index))
+                if resource.get("id") is not None:
+                    ids.append(resource["id"])
+        duplicate_ids = "Duplicate resource IDs found in bundle"
+        if len(ids) != len(set(ids)) and duplicate_ids not in issues:
+            issues.append(duplicate_ids)
+
+        titles = [entry.title for entry in bundle_obj.entries if entry.title]
         if len(titles) != len(set(titles)):
             issues.append("Bundle contains duplicate entry titles")
 
-        valid = len(issues) == 0
-
-        return HACSResult(
-            success=True,
-            message="Bundle validation completed",
-            data={
-                "valid": valid,
+        reports.append(
+            {
+                "valid": True,
                 "issues": issues,
                 "entry_count": len(bundle_obj.entries),
                 "bundle_type": bundle_obj.bundle_type,
-            },
+            }
         )
 
-    except Exception as e:
-        return HACSResult(
-            success=False,
-            message="Bundle validation error",
-            error=str(e),
-            data={"valid": False, "issues": [str(e)]},
+    bulk = validate_many(payloads, processes=processes)
+    for error in bulk.errors:
+        bundle_index, entry_index = owners[error["index"]]
+        reports[bundle_index]["issues"].append(
+            f"/entries/{entry_index}/resource{error['path']}: {error['message']}"
         )
 
+    for report in reports:
+        report["valid"] = not report["issues"]
+    return reports
+
 
 validate_bundle._tool_args = ValidateBundleInput  # type: ignore[attr-defined]
 
@@ -593,12 +637,24 @@ def add_entries(document: Dict[str, Any], entries: List[Dict[str, Any]], strateg
 add_entries._tool_args = AddEntriesInput  # type: ignore[attr-defined]
 
 
-def validate_bundles(bundles: List[Dict[str, Any]]) -> HACSResult:
-    """Validate multiple bundles."""
-    results: List[Dict[str, Any]] = []
-    for b in bundles or []:
-        single = validate_bundle(b)
-        results.append(single.data or {"valid": False})
+def validate_bundles(
+    bundles: List[Dict[str, Any]], processes: Optional[int] = None
+) -> HACSResult:
+    """
+    Validate multiple bundles.
+
+    Entry resources across all bundles are validated together in batches.
+
+    Args:
+        bundles: ResourceBundle dictionaries
+        processes: Worker processes for very large batches (default: in-process)
+
+    Returns:
+        HACSResult with one validate_bundle-style result per bundle
+    """
+    results = _validate_bundle_payloads(bundles or [], processes=processes)
+    for result in results:
+        result.pop("error", None)
     return HACSResult(
         success=all(r.get("valid") for r in results),
         message=f"Validated {len(results)} bundles",
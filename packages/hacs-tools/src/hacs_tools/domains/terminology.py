@@ -31,9 +31,9 @@ def normalize_code(system: str, code: str, display: Optional[str] = None) -> HAC
 def search_umls(term_or_code: str, *, version: str = "current", pageSize: int = 5) -> HACSResult:
     """Search UMLS for CUIs by term or code (no auth call if key missing)."""
     try:
-        from hacs_utils.terminology.client import UMLSClient
+        from hacs_utils.terminology.client import get_umls_client
 
-        client = UMLSClient()
+        client = get_umls_client()
         res = client.search(term_or_code, version=version, page_size=pageSize)
         if not res.get("success"):
             return HACSResult(success=False, message="UMLS search failed", error=res.get("error"))
@@ -55,9 +55,9 @@ def get_umls_cui(cui: str, *, version: str = "current") -> HACSResult:
         stacklevel=2,
     )
     try:
-        from hacs_utils.terminology.client import UMLSClient
+        from hacs_utils.terminology.client import get_umls_client
 
-        client = UMLSClient()
+        client = get_umls_client()
         res = client.get_cui(cui, version=version)
         if not res.get("success"):
             return HACSResult(
@@ -78,9 +78,9 @@ def crosswalk_umls(source: str, code: str, *, version: str = "current") -> HACSR
         stacklevel=2,
     )
     try:
-        from hacs_utils.terminology.client import UMLSClient
+        from hacs_utils.terminology.client import get_umls_client
 
-        client = UMLSClient()
+        client = get_umls_client()
         res = client.crosswalk(source, code, version=version)
         if not res.get("success"):
             return HACSResult(
@@ -209,31 +209,47 @@ def map_terminology(
     """Task-level tool: suggest mappings from source to target across any HACS resource."""
     try:
         from hacs_utils.terminology.helpers import normalize_system_uri, scan_codable_concepts
-        from hacs_utils.terminology.client import UMLSClient, system_uri_to_source
+        from hacs_utils.terminology.client import (
+            get_umls_client,
+            source_to_system_uri,
+            system_uri_to_source,
+        )
+        from hacs_utils.terminology.service import get_terminology_service
     except Exception as e:
         return HACSResult(success=False, message="Missing terminology utilities", error=str(e))
 
     candidates = scan_codable_concepts(resource)
-    client = UMLSClient()
+    client = get_umls_client()
+    index = get_terminology_service().index
     src_abbrev = system_uri_to_source(normalize_system_uri(source)) or system_uri_to_source(source)
     tgt_abbrev = system_uri_to_source(normalize_system_uri(target)) or system_uri_to_source(target)
     if not src_abbrev or not tgt_abbrev:
         return HACSResult(success=False, message="Unsupported source/target system")
+    target_uri = source_to_system_uri(tgt_abbrev)
 
     mappings: List[Dict[str, Any]] = []
+    resolved: Dict[tuple, List[Dict[str, Any]]] = {}
     for c in candidates:
         if (c.get("system") or "").lower().find(source.lower()) >= 0:
             code = c.get("code")
             if not code:
                 continue
-            # Crosswalk via CUI: find equivalents in target source
-            cw = client.crosswalk(src_abbrev, code)
-            out = []
-            if cw.get("success"):
-                items = (cw.get("data") or {}).get("result") or []
-                for it in items:
-                    if (it.get("rootSource") or "").upper() == tgt_abbrev.upper():
-                        out.append({"code": it.get("ui"), "source": it.get("rootSource")})
+            key = (c.get("system"), code)
+            out = resolved.get(key)
+            if out is None:
+                # Local index (ConceptMaps, shared CUIs) first; UMLS crosswalk on a miss
+                out = [
+                    {"code": m["code"], "source": tgt_abbrev}
+                    for m in index.crosswalk(c.get("system"), code, target_uri)
+                ]
+                if not out:
+                    cw = client.crosswalk(src_abbrev, code)
+                    if cw.get("success"):
+                        items = (cw.get("data") or {}).get("result") or []
+                        for it in items:
+                            if (it.get("rootSource") or "").upper() == tgt_abbrev.upper():
+                                out.append({"code": it.get("ui"), "source": it.get("rootSource")})
+                resolved[key] = out
             if out:
                 mappings.append(
                     {
@@ -248,4 +264,63 @@ def map_terminology(
     )
 
 
+def check_value_set_membership(
+    resources: List[Dict[str, Any]],
+    value_set: Dict[str, Any],
+    *,
+    code_fields: Optional[List[str]] = None,
+) -> HACSResult:
+    """Task-level tool: report codings in resources that fall outside a ValueSet."""
+    try:
+        from hacs_models import ValueSet
+        from hacs_utils.extraction.validation import find_codings_outside_value_set
+    except Exception as e:
+        return HACSResult(success=False, message="Missing terminology utilities", error=str(e))
+
+    try:
+        vs = ValueSet.model_validate(value_set)
+    except Exception as e:
+        return HACSResult(success=False, message="Invalid ValueSet", error=str(e))
+    invalid = find_codings_outside_value_set(resources, vs, code_fields=code_fields)
+    return HACSResult(
+        success=True,
+        message=f"Found {len(invalid)} codings outside the value set",
+        data={"valid": not invalid, "invalid_codings": invalid},
+    )
+
+
+def translate_codes(
+    codings: List[Dict[str, Any]], concept_map: Dict[str, Any], *, reverse: bool = False
+) -> HACSResult:
+    """Task-level tool: translate a batch of codings through a ConceptMap."""
+    from hacs_models import ConceptMap
+
+    try:
+        cm = ConceptMap.model_validate(concept_map)
+    except Exception as e:
+        return HACSResult(success=False, message="Invalid ConceptMap", error=str(e))
+
+    translations = []
+    for coding, elements in zip(codings, cm.translate_many(codings, reverse=reverse)):
+        translations.append(
+            {
+                "source": {"system": coding.get("system"), "code": coding.get("code")},
+                "targets": [
+                    {
+                        "system": e.source if reverse else e.target,
+                        "code": e.source_code if reverse else e.target_code,
+                        "equivalence": e.equivalence,
+                    }
+                    for e in elements
+                ],
+            }
+        )
+    mapped = sum(1 for t in translations if t["targets"])
+    return HACSResult(
+        success=True,
+        message=f"Translated {mapped} of {len(codings)} codings",
+        data={"translations": translations},
+    )
+
+
 # Deprecated alias removed; use get_possible_codes()
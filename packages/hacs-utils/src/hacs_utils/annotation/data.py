@@ -1,6 +1,13 @@
 from __future__ import annotations
 
 # Import types from hacs-models for consistency
+from hacs_models.annotation import (  # noqa: F401
+    AlignmentStatus,
+    AnnotatedDocument,
+    CharInterval,
+    ExtractionResults,
+    FormatType,
+)
 
 # Local Document wrapper used by chunkers (different from hacs_models Document)
 class Document:
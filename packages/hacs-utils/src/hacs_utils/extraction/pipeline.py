@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import Any, Type, TypeVar, Sequence, Literal
 from pydantic import BaseModel, create_model
 
+from hacs_core.instrumentation import start_span
 from hacs_models.annotation import FormatType
 from .prompt_builder import (
     build_structured_prompt, 
@@ -354,22 +355,27 @@ async def _extract_once_async(
     **kwargs,
 ) -> list[T]:
     """Single extraction attempt with retries."""
-    return await _run_structured_pipeline(
-        llm_provider,
-        prompt,
-        output_model,
-        many=many,
-        max_items=max_items,
-        use_descriptive_schema=use_descriptive_schema,
-        format_type=format_type,
-        fenced_output=fenced_output,
-        max_retries=max_retries,
-        injected_instance=injected_instance,
-        injected_fields=injected_fields,
-        debug_dir=debug_dir,
-        debug_label=debug_label,
-        **kwargs,
-    ) or []
+    with start_span(
+        "extraction.extract_once", model=output_model.__name__, bytes=len(prompt)
+    ) as span:
+        result = await _run_structured_pipeline(
+            llm_provider,
+            prompt,
+            output_model,
+            many=many,
+            max_items=max_items,
+            use_descriptive_schema=use_descriptive_schema,
+            format_type=format_type,
+            fenced_output=fenced_output,
+            max_retries=max_retries,
+            injected_instance=injected_instance,
+            injected_fields=injected_fields,
+            debug_dir=debug_dir,
+            debug_label=debug_label,
+            **kwargs,
+        ) or []
+        span.set_attribute("rows", len(result) if isinstance(result, list) else 1)
+        return result
 
 
 async def _run_structured_pipeline(
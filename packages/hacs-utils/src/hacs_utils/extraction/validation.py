@@ -6,6 +6,7 @@ This module handles:
 - Applying canonical defaults and coercion
 - Validating extractable subsets
 - Creating full validated records
+- Checking extracted codings against ValueSets
 """
 
 from __future__ import annotations
@@ -134,6 +135,38 @@ def apply_injection_and_validation(
         raise ValueError(f"Failed to validate record: {e}") from e
 
 
+def find_codings_outside_value_set(
+    records: list[BaseModel | dict[str, Any]],
+    value_set: Any,
+    *,
+    code_fields: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Find extracted codings that are not members of a ValueSet.
+
+    All codings across all records are checked in one batch against the
+    value set's compiled membership index.
+
+    Args:
+        records: Extracted records (models or dicts)
+        value_set: HACS ValueSet
+        code_fields: CodeableConcept field names to scan (defaults to the
+            terminology helpers' defaults)
+
+    Returns:
+        ``{"record_index", "field", "system", "code", "display"}`` for each
+        coding outside the value set
+    """
+    from hacs_utils.terminology.helpers import scan_codable_concepts
+
+    found: list[dict[str, Any]] = []
+    for index, record in enumerate(records):
+        data = record.model_dump() if isinstance(record, BaseModel) else record
+        for coding in scan_codable_concepts(data, code_fields):
+            found.append({"record_index": index, **coding})
+    members = value_set.contains_many(found)
+    return [coding for coding, member in zip(found, members) if not member]
+
+
 def add_agent_metadata(
     record: BaseModel,
     *,
@@ -144,7 +177,7 @@ def add_agent_metadata(
 ) -> None:
     """Add agent metadata to a record if it supports it."""
     try:
-        from hacs_models.base_resource import AgentMeta, CharInterval  # type: ignore
+        from hacs_models.base_resource import AgentMeta, BaseResource, CharInterval  # type: ignore
         meta = AgentMeta(
             reasoning=None,
             citations=[citation] if citation else None,
@@ -153,7 +186,10 @@ def add_agent_metadata(
             provider=getattr(type(llm_provider), "__name__", None),
             generated_at=datetime.utcnow(),
         )
-        if hasattr(record, "agent_meta"):
+        if isinstance(record, BaseResource):
+            # meta was validated above; skip assignment validation
+            record.trusted_update(agent_meta=meta)
+        elif hasattr(record, "agent_meta"):
             try:
                 setattr(record, "agent_meta", meta)
             except Exception:
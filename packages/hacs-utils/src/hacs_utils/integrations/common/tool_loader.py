@@ -7,6 +7,7 @@ Provides a single source of truth for HACS tool management with proper fallback
 
 import logging
 import asyncio
+import importlib.util
 from typing import List, Any, Dict, Optional, Callable
 from functools import wraps
 from contextvars import ContextVar
@@ -57,13 +58,11 @@ def _check_hacs_availability():
     # Treat integration as available when LangChain itself is available; actual import is lazy later.
     availability["hacs_utils_langchain"] = False
 
-    # Check HACS Tools
-    try:
-        import hacs_tools
-
+    # Check HACS Tools (locate only; importing it would load every tool module)
+    if importlib.util.find_spec("hacs_tools") is not None:
         availability["hacs_tools"] = True
         logger.debug("✅ HACS Tools available")
-    except ImportError:
+    else:
         logger.debug("⚠️ HACS Tools not available")
     # Check LangChain
     try:
@@ -177,10 +176,11 @@ def _compute_injected_values(required: set[str]) -> Dict[str, Any]:
     needs_db = any(k in required for k in ("db_adapter", "database"))
     if needs_db:
         try:
-            # Note: get_persistence_provider moved to hacs_infrastructure
+            # Resolved through the container's cached resolution plan
             from hacs_infrastructure import get_container
-            container = get_container()
-            db = container.get_adapter("PersistenceProvider")
+            from hacs_infrastructure.protocols import PersistenceProvider
+
+            db = get_container().get(PersistenceProvider)
             if "db_adapter" in required:
                 injected["db_adapter"] = db
             if "database" in required:
@@ -193,10 +193,11 @@ def _compute_injected_values(required: set[str]) -> Dict[str, Any]:
     needs_vs = any(k in required for k in ("vector_store", "store"))
     if needs_vs:
         try:
-            # Note: get_vector_store moved to hacs_infrastructure
+            # Resolved through the container's cached resolution plan
             from hacs_infrastructure import get_container
-            container = get_container()
-            vs = container.get_adapter("VectorStore")
+            from hacs_infrastructure.protocols import VectorStore
+
+            vs = get_container().get(VectorStore)
             if "vector_store" in required:
                 injected["vector_store"] = vs
             if "store" in required:
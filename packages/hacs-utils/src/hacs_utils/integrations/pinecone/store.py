@@ -11,6 +11,8 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from hacs_core.instrumentation import current_span, traced
+
 # Import core dependencies with graceful degradation
 try:
     from pinecone import Pinecone, ServerlessSpec
@@ -272,6 +274,7 @@ class PineconeVectorStore:
         # Fallback: convert entire dict to text
         return json.dumps(data, default=str)
 
+    @traced("vector.pinecone.query")
     def search(
         self, query: str, top_k: int = 10, resource_type: str | None = None, **kwargs
     ) -> list[tuple[str, float, dict]]:
@@ -434,6 +437,7 @@ class PineconeVectorStore:
             print(f"Error storing vector in Pinecone: {e}")
             return False
 
+    @traced("vector.pinecone.search")
     def search_vectors(
         self,
         query_embedding: list[float],
@@ -457,6 +461,7 @@ class PineconeVectorStore:
                 vector=query_embedding, top_k=top_k, filter=filter_dict, include_metadata=True
             )
 
+            current_span().set_attributes(rows=len(results.matches), top_k=top_k)
             return [(match.id, match.score, match.metadata or {}) for match in results.matches]
 
         except Exception as e:
@@ -6,6 +6,8 @@ This package provides Qdrant vector store integration for HACS vectorization.
 
 from typing import Any
 
+from hacs_core.instrumentation import current_span, traced
+
 try:
     from qdrant_client import QdrantClient
     from qdrant_client.models import Distance, PointStruct, VectorParams
@@ -166,6 +168,7 @@ class QdrantVectorStore:
             print(f"Error storing vector in Qdrant: {e}")
             return False
 
+    @traced("vector.qdrant.search")
     def search_vectors(
         self,
         query_embedding: list[float],
@@ -188,6 +191,7 @@ class QdrantVectorStore:
                 query_filter=filter_dict,
             )
 
+            current_span().set_attributes(rows=len(results), top_k=top_k)
             return [(str(result.id), result.score, result.payload) for result in results]
 
         except Exception as e:
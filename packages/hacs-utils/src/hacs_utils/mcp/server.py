@@ -10,6 +10,7 @@ from typing import Any, Dict
 
 from hacs_core import get_settings
 from hacs_core.auth import AuthManager, get_auth_manager
+from hacs_core.instrumentation import start_span
 
 from .messages import CallToolParams, MCPRequest, MCPResponse
 
@@ -633,6 +634,14 @@ class HacsMCPServer:
 
     async def handle_request(self, request: MCPRequest) -> MCPResponse:
         """Handle incoming MCP requests with enhanced error handling and logging."""
+        with start_span("mcp.handle_request", method=request.method) as span:
+            response = await self._dispatch_request(request)
+            if response.error:
+                span.set_error(str(response.error.code))
+            return response
+
+    async def _dispatch_request(self, request: MCPRequest) -> MCPResponse:
+        """Route an MCP request to its handler."""
         try:
             logger.debug(f"Handling MCP request: {request.method}")
 
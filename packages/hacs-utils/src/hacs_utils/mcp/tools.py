@@ -7,12 +7,20 @@ fields when generating stacks.
 """
 
 import inspect
+import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from .messages import CallToolResult
 
+try:
+    from hacs_models.serialization import json_dumps as _json_dumps
+except Exception:  # pragma: no cover - hacs_models is optional here
+
+    def _json_dumps(value: Any, profile: str = "llm") -> bytes:
+        return json.dumps(value, default=str).encode()
+
 
 def _get_models_info() -> List[Dict[str, Any]]:
     try:
@@ -207,12 +215,14 @@ def _format_result(result: Any, tool_name: str) -> CallToolResult:
                 "timestamp": datetime.now().isoformat(),
             }
             return CallToolResult(
-                content=[{"type": "text", "text": str(content)}], isError=not result.success
+                content=[{"type": "text", "text": _json_dumps(content, profile="llm").decode()}],
+                isError=not result.success,
             )
         else:
             # Simple result
             content = {"result": result, "tool": tool_name, "timestamp": datetime.now().isoformat()}
-            return CallToolResult(content=[{"type": "text", "text": str(content)}], isError=False)
+            text = _json_dumps(content, profile="llm").decode()
+            return CallToolResult(content=[{"type": "text", "text": text}], isError=False)
     except Exception as e:
         logger.error(f"Error formatting result for {tool_name}: {e}")
         return CallToolResult(
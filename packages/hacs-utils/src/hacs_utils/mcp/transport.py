@@ -17,6 +17,12 @@ from urllib.parse import urlparse
 from .messages import MCPRequest, MCPResponse
 from .server import HacsMCPServer
 
+try:
+    from hacs_infrastructure.metrics_engine import get_metrics_engine, render_exported_metrics
+except ImportError:  # hacs-infrastructure is optional; requests are then not metered
+    get_metrics_engine = None
+    render_exported_metrics = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -125,8 +131,7 @@ class StdioTransport(MCPTransport):
 
     async def _write_response(self, response: MCPResponse) -> None:
         """Write response to stdout."""
-        response_json = json.dumps(response.model_dump())
-        print(response_json, flush=True)
+        print(response.model_dump_json(), flush=True)
 
 
 class HTTPTransport(MCPTransport):
@@ -223,19 +228,20 @@ class HTTPTransport(MCPTransport):
 
         return origin in allowed_origins
 
-    async def start(self) -> None:
-        """Start the secure HTTP transport using FastAPI + Uvicorn."""
+    def build_app(self):
+        """Build the FastAPI application served by ``start``."""
         try:
             from fastapi import FastAPI, Request, HTTPException
             from fastapi.middleware.cors import CORSMiddleware
-            from fastapi.responses import JSONResponse
-            import uvicorn
+            from fastapi.responses import JSONResponse, PlainTextResponse
         except ModuleNotFoundError as exc:  # pragma: no cover – runtime guard
             raise RuntimeError(
                 "HTTP transport requires `fastapi` and `uvicorn`. Install with:"
                 " pip install fastapi uvicorn[standard]"
             ) from exc
 
+        metrics_engine = get_metrics_engine() if get_metrics_engine is not None else None
+
         app = FastAPI(
             title="HACS MCP Server",
             version=getattr(self.server, "version", "1.0.0"),
@@ -323,6 +329,14 @@ class HTTPTransport(MCPTransport):
                 "environment": self.settings.environment,
             }
 
+        @app.get("/metrics")
+        async def prometheus_metrics():
+            """Prometheus text exposition of the process metrics engines."""
+            return PlainTextResponse(
+                render_exported_metrics("hacs") if render_exported_metrics is not None else "",
+                media_type="text/plain; version=0.0.4",
+            )
+
         async def _handle_mcp_post(request: Request):
             """Unified handler for MCP POST requests."""
             try:
@@ -351,7 +365,14 @@ class HTTPTransport(MCPTransport):
             client_ip = self._get_client_ip(request)
             logger.info(f"MCP request from {client_ip}: {mcp_request.method}")
 
+            started = time.perf_counter()
             mcp_response = await self.server.handle_request(mcp_request)
+            if metrics_engine is not None:
+                tags = {"method": mcp_request.method}
+                metrics_engine.observe(
+                    "mcp.request.duration_ms", (time.perf_counter() - started) * 1000, tags
+                )
+                metrics_engine.increment("mcp.request.count", 1, tags)
             return mcp_response.model_dump()
 
         @app.post("/")
@@ -373,6 +394,20 @@ class HTTPTransport(MCPTransport):
             """Alias without trailing slash for compatibility."""
             return await _handle_mcp_post(request)
 
+        return app
+
+    async def start(self) -> None:
+        """Start the secure HTTP transport using FastAPI + Uvicorn."""
+        try:
+            import uvicorn
+        except ModuleNotFoundError as exc:  # pragma: no cover – runtime guard
+            raise RuntimeError(
+                "HTTP transport requires `fastapi` and `uvicorn`. Install with:"
+                " pip install fastapi uvicorn[standard]"
+            ) from exc
+
+        app = self.build_app()
+
         # Parse URL to get host and port
         if self.settings.mcp_server_url:
             parsed = urlparse(self.settings.mcp_server_url)
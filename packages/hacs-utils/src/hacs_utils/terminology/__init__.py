@@ -0,0 +1,23 @@
+"""
+Terminology utilities: UMLS clients, response cache and a local code index.
+
+Lookups go to the local ``TerminologyIndex`` first, then to the persistent
+response cache, and only reach the UMLS service on a miss.
+"""
+
+from .cache import TerminologyCache, get_terminology_cache
+from .client import AsyncUMLSClient, UMLSClient, get_umls_client
+from .index import IndexedConcept, TerminologyIndex
+from .service import TerminologyService, get_terminology_service
+
+__all__ = [
+    "AsyncUMLSClient",
+    "IndexedConcept",
+    "TerminologyCache",
+    "TerminologyIndex",
+    "TerminologyService",
+    "UMLSClient",
+    "get_terminology_cache",
+    "get_terminology_service",
+    "get_umls_client",
+]
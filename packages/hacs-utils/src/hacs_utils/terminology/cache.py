@@ -0,0 +1,147 @@
+"""
+Persistent cache for UMLS responses.
+
+Responses are stored in a small SQLite file keyed by endpoint path and query
+parameters (the API key excluded), so repeated lookups across processes skip
+the network. Entries expire after ``ttl_seconds``.
+
+Configuration:
+    HACS_TERMINOLOGY_CACHE: Set to "0" or "false" to disable caching
+    HACS_TERMINOLOGY_CACHE_PATH: Cache file location
+        (default: ``$XDG_CACHE_HOME/hacs/umls_cache.sqlite3``)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+# Query parameters that never take part in the cache key
+_UNCACHED_PARAMS = {"apiKey"}
+
+
+def default_cache_path() -> Path:
+    """Cache location from the environment or the user cache directory."""
+    configured = os.getenv("HACS_TERMINOLOGY_CACHE_PATH")
+    if configured:
+        return Path(configured)
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "hacs" / "umls_cache.sqlite3"
+
+
+def cache_key(path: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable key for an endpoint path and its query parameters."""
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if k not in _UNCACHED_PARAMS)
+    return f"{path}?{urlencode(items)}" if items else path
+
+
+class TerminologyCache:
+    """SQLite-backed response cache shared by the sync and async UMLS clients."""
+
+    def __init__(self, path: Optional[Path] = None, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """Initialize cache.
+
+        Args:
+            path: Cache file (defaults to ``default_cache_path()``); ``":memory:"``
+                keeps the cache in process
+            ttl_seconds: Age after which entries are treated as misses
+        """
+        self.path = str(path) if path is not None else str(default_cache_path())
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["TerminologyCache"]:
+        """Cache configured by the environment, or None when disabled."""
+        if os.getenv("HACS_TERMINOLOGY_CACHE", "1").lower() in {"0", "false"}:
+            return None
+        return cls()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached payload for a key, or None on a miss or expired entry."""
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute("SELECT payload, stored_at FROM responses WHERE key = ?", (key,))
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Terminology cache read failed: {e}")
+            row = None
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, payload: Any) -> None:
+        """Store a JSON-serializable payload."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, stored_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(payload), time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Terminology cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        return {"path": self.path, "hits": self.hits, "misses": self.misses}
+
+
+_default_cache: Optional[TerminologyCache] = None
+_default_cache_loaded = False
+
+
+def get_terminology_cache() -> Optional[TerminologyCache]:
+    """Process-wide cache configured by the environment (None when disabled)."""
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        _default_cache = TerminologyCache.from_env()
+        _default_cache_loaded = True
+    return _default_cache
@@ -4,15 +4,34 @@ UMLS Terminology Client (minimal)
 Centralizes auth and HTTP calls to the UMLS Metathesaurus service.
 Respects UMLS_API_KEY from environment. All methods are safe to import when
 key is missing; network calls will return structured errors in that case.
+
+Both clients reuse pooled HTTP connections and consult the persistent
+response cache (see ``cache.py``) before going to the network.
+``AsyncUMLSClient`` additionally collapses concurrent requests for the same
+resource and offers batch helpers for coding many concepts at once.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, Iterable, Optional
+
 from dotenv import dotenv_values
 
+from .cache import TerminologyCache, cache_key, get_terminology_cache
+
 UMLS_BASE = "https://uts-ws.nlm.nih.gov/rest"
 
+# UMLS source abbreviations to canonical code system URIs
+SOURCE_SYSTEM_URIS = {
+    "SNOMEDCT_US": "http://snomed.info/sct",
+    "LOINC": "http://loinc.org",
+    "RXNORM": "http://www.nlm.nih.gov/research/umls/rxnorm",
+    "ICD10CM": "http://hl7.org/fhir/sid/icd-10-cm",
+    "ICD10": "http://hl7.org/fhir/sid/icd-10",
+}
+UMLS_SYSTEM_URI = "http://identifiers.org/umls"
+
 
 def get_umls_api_key() -> Optional[str]:
     # Read from .env without relying on process environment
@@ -46,14 +65,69 @@ def system_uri_to_source(system_uri: str) -> Optional[str]:
     return None
 
 
+def source_to_system_uri(source: str) -> str:
+    """Map a UMLS source abbreviation to a code system URI (the abbreviation if unknown)."""
+    return SOURCE_SYSTEM_URIS.get((source or "").upper(), source)
+
+
+def system_name_to_uri(system: str) -> str:
+    """Map a code system name or source abbreviation to its URI; URIs are returned as-is."""
+    if not system or system.lower().startswith("http"):
+        return system
+    source = system_uri_to_source(system)
+    return source_to_system_uri(source) if source else system
+
+
+def _search_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    results = ((data or {}).get("result") or {}).get("results") or []
+    return {"success": True, "results": results}
+
+
 class UMLSClient:
-    def __init__(self, api_key: Optional[str] = None, base_url: str = UMLS_BASE):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = UMLS_BASE,
+        cache: Optional[TerminologyCache] = None,
+        use_cache: bool = True,
+    ):
         self.api_key = api_key or get_umls_api_key()
         self.base_url = base_url.rstrip("/")
+        self.cache = cache or (get_terminology_cache() if use_cache else None)
+        self._session = None
 
     def _ensure_key(self) -> Optional[str]:
         return self.api_key
 
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None, timeout: float = 15) -> Any:
+        """GET a UMLS endpoint through the cache and a pooled session."""
+        key = cache_key(self.base_url + path, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        resp = self._session.get(
+            f"{self.base_url}{path}",
+            params={**(params or {}), "apiKey": self.api_key},
+            timeout=timeout,
+        )
+        resp.raise_for_status()
+        data = resp.json() or {}
+        if self.cache is not None:
+            self.cache.set(key, data)
+        return data
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def search(
         self, term_or_code: str, version: str = "current", page_size: int = 5
     ) -> Dict[str, Any]:
@@ -62,14 +136,10 @@ class UMLSClient:
         if not key:
             return {"success": False, "error": "Missing UMLS_API_KEY", "results": []}
         try:
-            import requests
-
-            params = {"string": term_or_code, "pageSize": page_size, "apiKey": key}
-            resp = requests.get(f"{self.base_url}/search/{version}", params=params, timeout=15)
-            resp.raise_for_status()
-            data = resp.json() or {}
-            results = (data.get("result") or {}).get("results") or []
-            return {"success": True, "results": results}
+            data = self._get(
+                f"/search/{version}", {"string": term_or_code, "pageSize": page_size}
+            )
+            return _search_result(data)
         except Exception as e:
             return {"success": False, "error": str(e), "results": []}
 
@@ -78,13 +148,7 @@ class UMLSClient:
         if not key:
             return {"success": False, "error": "Missing UMLS_API_KEY"}
         try:
-            import requests
-
-            resp = requests.get(
-                f"{self.base_url}/content/{version}/CUI/{cui}", params={"apiKey": key}, timeout=15
-            )
-            resp.raise_for_status()
-            return {"success": True, "data": resp.json()}
+            return {"success": True, "data": self._get(f"/content/{version}/CUI/{cui}")}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -93,15 +157,8 @@ class UMLSClient:
         if not key:
             return {"success": False, "error": "Missing UMLS_API_KEY"}
         try:
-            import requests
-
-            resp = requests.get(
-                f"{self.base_url}/crosswalk/{version}/source/{source}/{code}",
-                params={"apiKey": key},
-                timeout=15,
-            )
-            resp.raise_for_status()
-            return {"success": True, "data": resp.json()}
+            data = self._get(f"/crosswalk/{version}/source/{source}/{code}")
+            return {"success": True, "data": data}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -110,15 +167,8 @@ class UMLSClient:
         if not key:
             return {"success": False, "error": "Missing UMLS_API_KEY"}
         try:
-            import requests
-
-            resp = requests.get(
-                f"{self.base_url}/content/{version}/CUI/{cui}/definitions",
-                params={"apiKey": key},
-                timeout=15,
-            )
-            resp.raise_for_status()
-            return {"success": True, "data": resp.json()}
+            data = self._get(f"/content/{version}/CUI/{cui}/definitions")
+            return {"success": True, "data": data}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -131,14 +181,10 @@ class UMLSClient:
         if not key:
             return {"success": False, "error": "Missing UMLS_API_KEY"}
         try:
-            import requests
-
-            params = {"apiKey": key, "pageSize": page_size}
-            resp = requests.get(
-                f"{self.base_url}/content/{version}/CUI/{cui}/atoms", params=params, timeout=20
+            data = self._get(
+                f"/content/{version}/CUI/{cui}/atoms", {"pageSize": page_size}, timeout=20
             )
-            resp.raise_for_status()
-            return {"success": True, "data": resp.json()}
+            return {"success": True, "data": data}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -147,15 +193,8 @@ class UMLSClient:
         if not key:
             return {"success": False, "error": "Missing UMLS_API_KEY"}
         try:
-            import requests
-
-            resp = requests.get(
-                f"{self.base_url}/content/{version}/source/{source}/{code}",
-                params={"apiKey": key},
-                timeout=15,
-            )
-            resp.raise_for_status()
-            return {"success": True, "data": resp.json()}
+            data = self._get(f"/content/{version}/source/{source}/{code}")
+            return {"success": True, "data": data}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -167,15 +206,163 @@ class UMLSClient:
         if not key:
             return {"success": False, "error": "Missing UMLS_API_KEY"}
         try:
-            import requests
-
             rel = rel.strip("/")
-            resp = requests.get(
-                f"{self.base_url}/content/{version}/source/{source}/{code}/{rel}",
-                params={"apiKey": key},
-                timeout=15,
+            data = self._get(f"/content/{version}/source/{source}/{code}/{rel}")
+            return {"success": True, "data": data}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+
+class AsyncUMLSClient:
+    """Async UMLS client with a pooled session, response cache and request coalescing.
+
+    Only cache misses reach the network; concurrent requests for the same
+    resource share one HTTP call.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = UMLS_BASE,
+        cache: Optional[TerminologyCache] = None,
+        use_cache: bool = True,
+        max_connections: int = 10,
+        timeout_seconds: float = 15.0,
+    ):
+        """Initialize client.
+
+        Args:
+            api_key: UMLS API key (defaults to UMLS_API_KEY from .env)
+            base_url: UMLS REST base URL
+            cache: Response cache (defaults to the process-wide cache)
+            use_cache: Whether to use the process-wide cache when none is given
+            max_connections: Connection pool size, which also bounds concurrency
+            timeout_seconds: Total timeout per request
+        """
+        self.api_key = api_key or get_umls_api_key()
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache or (get_terminology_cache() if use_cache else None)
+        self.max_connections = max_connections
+        self.timeout_seconds = timeout_seconds
+        self.requests_sent = 0
+        self._session = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "AsyncUMLSClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
             )
-            resp.raise_for_status()
-            return {"success": True, "data": resp.json()}
+        return self._session
+
+    async def close(self) -> None:
+        """Release pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        key = cache_key(self.base_url + path, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # The leading request was cancelled, not this one; send our own
+                return await self._get(path, params)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.requests_sent += 1
+            async with self._get_session().get(
+                f"{self.base_url}{path}", params={**(params or {}), "apiKey": self.api_key}
+            ) as resp:
+                resp.raise_for_status()
+                data = await resp.json(content_type=None) or {}
+            if self.cache is not None:
+                self.cache.set(key, data)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported as never retrieved
+            future.exception()
+            raise
+        finally:
+            # Cancellation is a BaseException; waiters must still be released
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    async def search(
+        self, term_or_code: str, version: str = "current", page_size: int = 5
+    ) -> Dict[str, Any]:
+        """/search/{version}?string=..."""
+        if not self.api_key:
+            return {"success": False, "error": "Missing UMLS_API_KEY", "results": []}
+        try:
+            data = await self._get(
+                f"/search/{version}", {"string": term_or_code, "pageSize": page_size}
+            )
+            return _search_result(data)
+        except Exception as e:
+            return {"success": False, "error": str(e), "results": []}
+
+    async def get_cui(self, cui: str, version: str = "current") -> Dict[str, Any]:
+        if not self.api_key:
+            return {"success": False, "error": "Missing UMLS_API_KEY"}
+        try:
+            return {"success": True, "data": await self._get(f"/content/{version}/CUI/{cui}")}
         except Exception as e:
             return {"success": False, "error": str(e)}
+
+    async def crosswalk(self, source: str, code: str, version: str = "current") -> Dict[str, Any]:
+        if not self.api_key:
+            return {"success": False, "error": "Missing UMLS_API_KEY"}
+        try:
+            data = await self._get(f"/crosswalk/{version}/source/{source}/{code}")
+            return {"success": True, "data": data}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def search_many(
+        self, terms: Iterable[str], version: str = "current", page_size: int = 5
+    ) -> Dict[str, Dict[str, Any]]:
+        """Search several terms concurrently; duplicates are requested once.
+
+        Returns:
+            Term to search result, in the shape returned by ``search``
+        """
+        unique = list(dict.fromkeys(terms))
+        results = await asyncio.gather(
+            *(self.search(term, version=version, page_size=page_size) for term in unique)
+        )
+        return dict(zip(unique, results))
+
+
+_umls_client: Optional[UMLSClient] = None
+
+
+def get_umls_client() -> UMLSClient:
+    """Process-wide sync client, so helpers and tools share one session and cache."""
+    global _umls_client
+    if _umls_client is None:
+        _umls_client = UMLSClient()
+    return _umls_client
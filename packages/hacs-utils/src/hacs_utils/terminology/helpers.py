@@ -10,7 +10,10 @@ from __future__ import annotations
 from typing import Optional, Dict, Any, List
 
 from hacs_models.observation import CodeableConcept, Coding
-from hacs_utils.terminology.client import UMLSClient, system_uri_to_source
+from hacs_utils.terminology.client import get_umls_client, system_uri_to_source
+from hacs_utils.terminology.service import get_terminology_service
+
+ICD10_SYSTEMS = ("http://hl7.org/fhir/sid/icd-10-cm", "http://hl7.org/fhir/sid/icd-10")
 
 
 # Canonical LOINC codes for common vitals/anthropometrics
@@ -50,11 +53,17 @@ def loinc_for(metric_key: str) -> Optional[CodeableConcept]:
 def lookup_icd10(term_or_code: str, *, page_size: int = 3) -> Optional[CodeableConcept]:
     """Lookup ICD-10 code via UMLS; return best CodeableConcept if found.
 
+    - Checks the local terminology index first (no network call on a hit).
     - Prefers results whose rootSource looks like ICD10CM.
     - Falls back to the top result if no ICD10CM match.
     """
-    client = UMLSClient()
-    res = client.search(term_or_code, page_size=page_size)
+    index = get_terminology_service().index
+    for system in ICD10_SYSTEMS:
+        local = index.search(term_or_code, system=system, limit=1)
+        if local:
+            return codeable_concept(local[0].system, local[0].code, local[0].display)
+
+    res = get_umls_client().search(term_or_code, page_size=page_size)
     if not res.get("success"):
         return None
     results = res.get("results") or []
@@ -83,8 +92,7 @@ def crosswalk(system_uri: str, code: str) -> Optional[dict]:
     source = system_uri_to_source(system_uri)
     if not source:
         return None
-    client = UMLSClient()
-    res = client.crosswalk(source, code)
+    res = get_umls_client().crosswalk(source, code)
     if not res.get("success"):
         return None
     return res.get("data")
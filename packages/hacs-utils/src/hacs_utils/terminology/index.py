@@ -0,0 +1,322 @@
+"""
+Local terminology index for offline code lookup and search.
+
+Concepts can be loaded from HACS ``ValueSet``/``ConceptMap`` resources, UMLS
+``MRCONSO.RRF`` files or simple CSV files, and are then searchable without
+any network access:
+
+- exact lookup by (system, code)
+- token and prefix search over displays and synonyms, plus code prefixes
+- crosswalks through ConceptMap elements and shared UMLS CUIs
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .client import SOURCE_SYSTEM_URIS, source_to_system_uri
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# MRCONSO.RRF column positions
+_RRF_CUI, _RRF_LAT, _RRF_SAB, _RRF_CODE, _RRF_STR = 0, 1, 11, 13, 14
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall((text or "").lower())
+
+
+@dataclass
+class IndexedConcept:
+    """A concept held by the local index."""
+
+    system: str
+    code: str
+    display: Optional[str] = None
+    synonyms: List[str] = field(default_factory=list)
+    cui: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form used in search results."""
+        return {
+            "system": self.system,
+            "code": self.code,
+            "display": self.display,
+            "cui": self.cui,
+            "origin": "local",
+        }
+
+
+class TerminologyIndex:
+    """In-memory code index with token, prefix and crosswalk lookups."""
+
+    def __init__(self) -> None:
+        self._concepts: List[IndexedConcept] = []
+        self._by_code: Dict[Tuple[str, str], int] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._cuis: Dict[str, List[int]] = {}
+        self._concept_maps: List[Any] = []
+        # Sorted views for prefix search, rebuilt lazily after additions
+        self._vocabulary: List[str] = []
+        self._codes: List[Tuple[str, int]] = []
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._concepts)
+
+    def add(
+        self,
+        system: str,
+        code: str,
+        display: Optional[str] = None,
+        synonyms: Iterable[str] = (),
+        cui: Optional[str] = None,
+    ) -> IndexedConcept:
+        """Add a concept, merging labels into an existing (system, code) entry."""
+        key = (system, code)
+        position = self._by_code.get(key)
+        if position is None:
+            position = len(self._concepts)
+            concept = IndexedConcept(system=system, code=code, display=display, cui=cui)
+            self._concepts.append(concept)
+            self._by_code[key] = position
+            self._index_text(code, position)
+        else:
+            concept = self._concepts[position]
+            if display and not concept.display:
+                concept.display = display
+            elif display and display != concept.display and display not in concept.synonyms:
+                concept.synonyms.append(display)
+            if cui and not concept.cui:
+                concept.cui = cui
+
+        for synonym in synonyms:
+            if synonym and synonym != concept.display and synonym not in concept.synonyms:
+                concept.synonyms.append(synonym)
+                self._index_text(synonym, position)
+        if display:
+            self._index_text(display, position)
+        if cui:
+            members = self._cuis.setdefault(cui, [])
+            if position not in members:
+                members.append(position)
+        self._dirty = True
+        return concept
+
+    def _index_text(self, text: str, position: int) -> None:
+        for token in _tokens(text):
+            self._postings.setdefault(token, set()).add(position)
+
+    # Loaders
+
+    def add_value_set(self, value_set: Any) -> int:
+        """Index the expanded (or explicitly included) concepts of a ValueSet."""
+        concepts = value_set.expanded_concepts or value_set.include_concepts
+        for concept in concepts:
+            self.add(concept.system_uri, concept.code, concept.display, concept.synonyms)
+        return len(concepts)
+
+    def add_concept_map(self, concept_map: Any) -> int:
+        """Use a ConceptMap's compiled translation table for offline crosswalks."""
+        self._concept_maps.append(concept_map.compile())
+        return len(concept_map.group)
+
+    def load_rrf(
+        self,
+        path: str | Path,
+        sources: Optional[Iterable[str]] = None,
+        language: str = "ENG",
+    ) -> int:
+        """Load concepts from a UMLS ``MRCONSO.RRF`` file.
+
+        Args:
+            path: MRCONSO.RRF path
+            sources: Source abbreviations to keep (defaults to the sources in
+                ``SOURCE_SYSTEM_URIS``)
+            language: Language to keep
+
+        Returns:
+            Number of rows indexed
+        """
+        keep = {s.upper() for s in (sources or SOURCE_SYSTEM_URIS)}
+        count = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                row = line.rstrip("\n").split("|")
+                if len(row) <= _RRF_STR or row[_RRF_LAT] != language:
+                    continue
+                source = row[_RRF_SAB].upper()
+                if source not in keep:
+                    continue
+                self.add(
+                    source_to_system_uri(source),
+                    row[_RRF_CODE],
+                    row[_RRF_STR],
+                    cui=row[_RRF_CUI] or None,
+                )
+                count += 1
+        return count
+
+    def load_csv(self, path: str | Path, system: Optional[str] = None) -> int:
+        """Load concepts from a CSV file with a header row.
+
+        Columns: ``code`` and ``display`` (required), ``system`` (unless
+        ``system`` is given), and optional ``synonyms`` (``|``-separated) and
+        ``cui``.
+
+        Returns:
+            Number of rows indexed
+        """
+        count = 0
+        with open(path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                row_system = system or row.get("system")
+                code = (row.get("code") or "").strip()
+                if not row_system or not code:
+                    continue
+                synonyms = [s for s in (row.get("synonyms") or "").split("|") if s]
+                self.add(
+                    row_system, code, row.get("display") or None, synonyms, row.get("cui") or None
+                )
+                count += 1
+        return count
+
+    def load_path(self, path: str | Path) -> int:
+        """Load an ``.rrf`` or ``.csv`` file based on its extension."""
+        if str(path).lower().endswith(".rrf"):
+            return self.load_rrf(path)
+        return self.load_csv(path)
+
+    # Queries
+
+    def lookup(self, system: str, code: str) -> Optional[IndexedConcept]:
+        """Exact lookup by code system and code."""
+        position = self._by_code.get((system, code))
+        return self._concepts[position] if position is not None else None
+
+    def _refresh(self) -> None:
+        if self._dirty:
+            self._vocabulary = sorted(self._postings)
+            self._codes = sorted((c.code.lower(), i) for i, c in enumerate(self._concepts))
+            self._dirty = False
+
+    def _prefix_matches(self, token: str) -> Set[int]:
+        matches: Set[int] = set()
+        start = bisect.bisect_left(self._vocabulary, token)
+        for term in self._vocabulary[start:]:
+            if not term.startswith(token):
+                break
+            matches |= self._postings[term]
+        return matches
+
+    def search(
+        self, text: str, system: Optional[str] = None, limit: int = 10
+    ) -> List[IndexedConcept]:
+        """Search by code prefix or by display/synonym tokens.
+
+        Every query token must match the start of a token in the concept's
+        labels. Exact code matches rank first, then exact and leading
+        display matches, then shorter displays.
+
+        Args:
+            text: Free text or code prefix
+            system: Restrict results to one code system
+            limit: Maximum results
+
+        Returns:
+            Matching concepts, best first
+        """
+        query = (text or "").strip().lower()
+        if not query:
+            return []
+        self._refresh()
+
+        candidates: Optional[Set[int]] = None
+        for token in _tokens(query):
+            matches = self._prefix_matches(token)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                break
+        candidates = set(candidates or ())
+
+        start = bisect.bisect_left(self._codes, (query, -1))
+        for code, position in self._codes[start:]:
+            if not code.startswith(query):
+                break
+            candidates.add(position)
+
+        def rank(position: int) -> Tuple[int, int, str]:
+            concept = self._concepts[position]
+            display = (concept.display or "").lower()
+            if concept.code.lower() == query:
+                score = 0
+            elif display == query:
+                score = 1
+            elif display.startswith(query):
+                score = 2
+            else:
+                score = 3
+            return score, len(display), concept.code
+
+        ranked = sorted(
+            (p for p in candidates if system is None or self._concepts[p].system == system),
+            key=rank,
+        )
+        return [self._concepts[p] for p in ranked[:limit]]
+
+    def crosswalk(
+        self, system: str, code: str, target_system: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Equivalent codes from ConceptMaps and concepts sharing the same CUI.
+
+        Args:
+            system: Source code system URI
+            code: Source code
+            target_system: Restrict results to one code system
+
+        Returns:
+            ``{"system", "code", "display", "equivalence"}`` entries
+        """
+        results: List[Dict[str, Any]] = []
+        seen: Set[Tuple[str, str]] = {(system, code)}
+        for concept_map in self._concept_maps:
+            for element in concept_map.translate(system, code):
+                key = (element.target, element.target_code)
+                if key in seen:
+                    continue
+                seen.add(key)
+                known = self.lookup(*key)
+                results.append(
+                    {
+                        "system": element.target,
+                        "code": element.target_code,
+                        "equivalence": element.equivalence,
+                        "display": known.display if known else None,
+                    }
+                )
+
+        concept = self.lookup(system, code)
+        if concept is not None and concept.cui:
+            for position in self._cuis.get(concept.cui, []):
+                other = self._concepts[position]
+                key = (other.system, other.code)
+                if key in seen:
+                    continue
+                seen.add(key)
+                results.append(
+                    {
+                        "system": other.system,
+                        "code": other.code,
+                        "display": other.display,
+                        "equivalence": "equivalent",
+                    }
+                )
+
+        if target_system is not None:
+            results = [r for r in results if r["system"] == target_system]
+        return results
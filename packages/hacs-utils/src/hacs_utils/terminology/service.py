@@ -0,0 +1,183 @@
+"""
+Local-first terminology service.
+
+Resolves lookups against the local ``TerminologyIndex`` first and only falls
+back to UMLS (through the cached, pooled ``AsyncUMLSClient``) on a miss.
+Batch methods deduplicate terms and resolve remote misses concurrently, so
+coding a long note costs at most one request per distinct unknown term.
+
+Configuration:
+    HACS_TERMINOLOGY_INDEX_PATHS: ``os.pathsep``-separated ``.rrf``/``.csv``
+        files loaded into the default service's index
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from .client import (
+    UMLS_SYSTEM_URI,
+    AsyncUMLSClient,
+    source_to_system_uri,
+    system_name_to_uri,
+    system_uri_to_source,
+)
+from .index import TerminologyIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _umls_hit(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "system": UMLS_SYSTEM_URI,
+        "code": result.get("ui"),
+        "display": result.get("name"),
+        "cui": result.get("ui"),
+        "root_source": result.get("rootSource"),
+        "origin": "umls",
+    }
+
+
+class TerminologyService:
+    """Code search and crosswalks backed by a local index with UMLS fallback."""
+
+    def __init__(
+        self,
+        index: Optional[TerminologyIndex] = None,
+        client: Optional[AsyncUMLSClient] = None,
+    ):
+        """Initialize service.
+
+        Args:
+            index: Local index (an empty one if omitted)
+            client: Client for misses (created on first miss if omitted)
+        """
+        self.index = index or TerminologyIndex()
+        self._client = client
+        self.local_hits = 0
+        self.remote_lookups = 0
+
+    @property
+    def client(self) -> AsyncUMLSClient:
+        if self._client is None:
+            self._client = AsyncUMLSClient()
+        return self._client
+
+    async def close(self) -> None:
+        """Close the UMLS client's pooled connections."""
+        if self._client is not None:
+            await self._client.close()
+
+    async def search(
+        self, term: str, system: Optional[str] = None, limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Search a term locally, falling back to UMLS when nothing matches.
+
+        Args:
+            term: Free text or code
+            system: Restrict local results to one code system
+            limit: Maximum results
+
+        Returns:
+            Result dicts with ``system``, ``code``, ``display`` and ``origin``
+            (``"local"`` or ``"umls"``)
+        """
+        local = self.index.search(term, system=system, limit=limit)
+        if local:
+            self.local_hits += 1
+            return [concept.to_dict() for concept in local]
+
+        self.remote_lookups += 1
+        response = await self.client.search(term, page_size=limit)
+        if not response.get("success"):
+            logger.debug(f"UMLS search failed for {term!r}: {response.get('error')}")
+            return []
+        return [_umls_hit(r) for r in response.get("results", [])[:limit]]
+
+    async def search_many(
+        self, terms: Iterable[str], system: Optional[str] = None, limit: int = 5
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search many terms; each distinct term is resolved once.
+
+        Returns:
+            Term to results, in the shape returned by ``search``
+        """
+        unique = list(dict.fromkeys(terms))
+        results = await asyncio.gather(
+            *(self.search(term, system=system, limit=limit) for term in unique)
+        )
+        return dict(zip(unique, results))
+
+    async def crosswalk(
+        self, system: str, code: str, target_system: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Equivalent codes, from the local index or a UMLS crosswalk on a miss.
+
+        Args:
+            system: Source code system URI or name (e.g. ``"SNOMED"``)
+            code: Source code
+            target_system: Restrict results to one code system (URI or name)
+
+        Returns:
+            ``{"system", "code", "display"}`` entries
+        """
+        system = system_name_to_uri(system)
+        if target_system is not None:
+            target_system = system_name_to_uri(target_system)
+        local = self.index.crosswalk(system, code, target_system)
+        if local:
+            self.local_hits += 1
+            return local
+
+        source = system_uri_to_source(system)
+        if not source:
+            return []
+        self.remote_lookups += 1
+        response = await self.client.crosswalk(source, code)
+        if not response.get("success"):
+            return []
+        items = (response.get("data") or {}).get("result") or []
+        results = [
+            {
+                "system": source_to_system_uri(item.get("rootSource") or ""),
+                "code": item.get("ui"),
+                "display": item.get("name"),
+            }
+            for item in items
+        ]
+        if target_system is not None:
+            results = [r for r in results if r["system"] == target_system]
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Local hit and remote lookup counters."""
+        stats = {
+            "indexed_concepts": len(self.index),
+            "local_hits": self.local_hits,
+            "remote_lookups": self.remote_lookups,
+        }
+        if self._client is not None:
+            stats["requests_sent"] = self._client.requests_sent
+            if self._client.cache is not None:
+                stats["cache"] = self._client.cache.get_stats()
+        return stats
+
+
+_terminology_service: Optional[TerminologyService] = None
+
+
+def get_terminology_service() -> TerminologyService:
+    """Process-wide service whose index is loaded from HACS_TERMINOLOGY_INDEX_PATHS."""
+    global _terminology_service
+    if _terminology_service is None:
+        index = TerminologyIndex()
+        for path in filter(None, os.getenv("HACS_TERMINOLOGY_INDEX_PATHS", "").split(os.pathsep)):
+            try:
+                index.load_path(path)
+            except OSError as e:
+                logger.warning(f"Could not load terminology index {path}: {e}")
+        _terminology_service = TerminologyService(index)
+    return _terminology_service
@@ -0,0 +1,42 @@
+"""
+Tests for the MCP HTTP transport.
+
+Validates that:
+- A JSON-RPC POST is dispatched to the server and answered
+- Handled requests are counted in the metrics engine exposed at /metrics
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from hacs_core.config import reset_settings
+from hacs_infrastructure.metrics_engine import get_metrics_engine
+from hacs_utils.mcp.messages import MCPResponse
+from hacs_utils.mcp.transport import HTTPTransport
+
+
+class _EchoServer:
+    """Stand-in for HacsMCPServer that echoes the request method."""
+
+    async def handle_request(self, request):
+        return MCPResponse(id=request.id, result={"method": request.method})
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("HACS_ENVIRONMENT", "development")
+    monkeypatch.setenv("HACS_DEV_MODE", "true")
+    reset_settings()
+    yield TestClient(HTTPTransport(_EchoServer()).build_app())
+    reset_settings()
+
+
+def test_post_is_handled_and_metered(client):
+    tags = {"method": "tools/list"}
+    before = get_metrics_engine().counter_value("mcp.request.count", tags)
+
+    response = client.post("/mcp", json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+    assert response.status_code == 200
+    assert response.json()["result"] == {"method": "tools/list"}
+    assert get_metrics_engine().counter_value("mcp.request.count", tags) == before + 1
+    assert "hacs_mcp_request_count" in client.get("/metrics").text
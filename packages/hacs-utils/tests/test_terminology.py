@@ -0,0 +1,261 @@
+"""
+Tests for the local terminology index and cached UMLS lookups.
+
+Runs against a local stub of the UMLS REST API to validate:
+- ValueSet, ConceptMap, CSV and MRCONSO.RRF loading with prefix/token search
+- Persistent response caching and request coalescing in AsyncUMLSClient
+- Local-first resolution in TerminologyService
+- Compiled ValueSet/ConceptMap indexes and batch membership checks
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from hacs_models.terminology import ConceptMap, ConceptMapElement, TerminologyConcept, ValueSet
+from hacs_utils.extraction.validation import find_codings_outside_value_set
+from hacs_utils.terminology import (
+    AsyncUMLSClient,
+    TerminologyCache,
+    TerminologyIndex,
+    TerminologyService,
+)
+
+SNOMED = "http://snomed.info/sct"
+ICD10 = "http://hl7.org/fhir/sid/icd-10-cm"
+
+RRF_ROWS = [
+    "C0020538|ENG|P|L1|PF|S1|Y|A1||||SNOMEDCT_US|PT|38341003|Hypertensive disorder|9|N||",
+    "C0020538|ENG|P|L2|PF|S2|Y|A2||||ICD10CM|PT|I10|Essential hypertension|0|N||",
+    "C0020538|FRE|P|L3|PF|S3|Y|A3||||MSHFRE|MH|D006973|Hypertension|0|N||",
+]
+
+
+@pytest_asyncio.fixture
+async def umls_stub():
+    hits = {"search": 0, "crosswalk": 0}
+
+    async def search(request):
+        hits["search"] += 1
+        await asyncio.sleep(0.01)
+        term = request.query["string"]
+        return web.json_response(
+            {"result": {"results": [{"ui": "C0011849", "name": term, "rootSource": "MTH"}]}}
+        )
+
+    async def crosswalk(request):
+        hits["crosswalk"] += 1
+        return web.json_response(
+            {"result": [{"ui": "E11.9", "name": "Type 2 diabetes", "rootSource": "ICD10CM"}]}
+        )
+
+    app = web.Application()
+    app.router.add_get("/search/current", search)
+    app.router.add_get("/crosswalk/current/source/{source}/{code}", crosswalk)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", hits
+    await runner.cleanup()
+
+
+def _index(tmp_path):
+    index = TerminologyIndex()
+    value_set = ValueSet(
+        name="hypertension",
+        expanded_concepts=[
+            TerminologyConcept(system_uri=SNOMED, code="38341003", display="Hypertensive disorder"),
+            TerminologyConcept(
+                system_uri=SNOMED,
+                code="59621000",
+                display="Essential hypertension",
+                synonyms=["Primary hypertension"],
+            ),
+        ],
+    )
+    assert index.add_value_set(value_set) == 2
+
+    csv_path = tmp_path / "codes.csv"
+    csv_path.write_text("code,display,synonyms\nE11.9,Type 2 diabetes mellitus,T2DM|NIDDM\n")
+    assert index.load_csv(csv_path, system=ICD10) == 1
+
+    rrf_path = tmp_path / "MRCONSO.RRF"
+    rrf_path.write_text("\n".join(RRF_ROWS) + "\n")
+    assert index.load_rrf(rrf_path) == 2
+    return index
+
+
+def test_index_search_and_crosswalk(tmp_path):
+    index = _index(tmp_path)
+    assert len(index) == 4
+
+    assert [c.code for c in index.search("hypert")][:1] == ["38341003"]
+    assert [c.code for c in index.search("primary hyp")] == ["59621000"]
+    assert [c.code for c in index.search("niddm")] == ["E11.9"]
+    assert [c.code for c in index.search("E11")] == ["E11.9"]
+    assert [c.code for c in index.search("hypertension", system=ICD10)] == ["I10"]
+    assert index.search("hypertension diabetes") == []
+
+    # RRF rows sharing a CUI crosswalk to each other; the French row is skipped
+    assert index.lookup(SNOMED, "38341003").cui == "C0020538"
+    assert [m["code"] for m in index.crosswalk(SNOMED, "38341003", ICD10)] == ["I10"]
+
+    concept_map = ConceptMap(
+        source=SNOMED,
+        target=ICD10,
+        group=[
+            ConceptMapElement(
+                source=SNOMED,
+                source_code="59621000",
+                target=ICD10,
+                target_code="I10",
+                equivalence="equivalent",
+            )
+        ],
+    )
+    index.add_concept_map(concept_map)
+    mapped = index.crosswalk(SNOMED, "59621000")
+    assert mapped == [
+        {
+            "system": ICD10,
+            "code": "I10",
+            "equivalence": "equivalent",
+            "display": "Essential hypertension",
+        }
+    ]
+
+
+def test_compiled_value_set_and_concept_map():
+    value_set = ValueSet(
+        include_systems=[{"system_uri": "http://loinc.org"}],
+        include_concepts=[TerminologyConcept(system_uri=SNOMED, code="38341003")],
+    )
+    compiled = value_set.compile()
+    assert value_set.compile() is compiled
+    assert value_set.contains_many(
+        [
+            (SNOMED, "38341003"),
+            {"system": "http://loinc.org", "code": "8480-6"},
+            (None, "38341003"),
+            (SNOMED, "44054006"),
+            {"system": SNOMED},
+        ]
+    ) == [True, True, True, False, False]
+
+    # Appending, reassigning or touching the timestamp recompiles
+    value_set.include_concepts.append(TerminologyConcept(system_uri=SNOMED, code="44054006"))
+    assert value_set.contains(SNOMED, "44054006")
+    value_set.include_concepts = [TerminologyConcept(system_uri=SNOMED, code="73211009")]
+    assert not value_set.contains(SNOMED, "44054006")
+    compiled = value_set.compile()
+    value_set.include_concepts[0].code = "38341003"
+    value_set.update_timestamp()
+    assert value_set.compile() is not compiled
+    assert value_set.contains(SNOMED, "38341003")
+
+    # Resources with the same identity and counts do not share an index
+    other = ValueSet(
+        id=value_set.id,
+        updated_at=value_set.updated_at,
+        include_concepts=[TerminologyConcept(system_uri=SNOMED, code="1")],
+    )
+    assert other.contains(SNOMED, "1") and not other.contains(SNOMED, "38341003")
+
+    concept_map = ConceptMap(
+        source=SNOMED,
+        target=ICD10,
+        group=[
+            ConceptMapElement(source=SNOMED, source_code=s, target=ICD10, target_code=t)
+            for s, t in [("38341003", "I10"), ("59621000", "I10"), ("44054006", "E11.9")]
+        ],
+    )
+    forward = concept_map.translate_many([(SNOMED, "38341003"), (SNOMED, "1"), (None, "44054006")])
+    assert [[e.target_code for e in row] for row in forward] == [["I10"], [], ["E11.9"]]
+    reverse = concept_map.translate_many([{"system": ICD10, "code": "I10"}], reverse=True)
+    assert [e.source_code for e in reverse[0]] == ["38341003", "59621000"]
+
+
+def test_find_codings_outside_value_set():
+    value_set = ValueSet(
+        expanded_concepts=[TerminologyConcept(system_uri=SNOMED, code="38341003")]
+    )
+    records = [
+        {"code": {"coding": [{"system": SNOMED, "code": "38341003"}]}},
+        {"code": {"coding": [{"system": SNOMED, "code": "44054006", "display": "Diabetes"}]}},
+    ]
+    invalid = find_codings_outside_value_set(records, value_set)
+    assert [(c["record_index"], c["code"]) for c in invalid] == [(1, "44054006")]
+
+
+@pytest.mark.asyncio
+async def test_async_client_caches_and_coalesces(umls_stub, tmp_path):
+    base_url, hits = umls_stub
+    cache = TerminologyCache(tmp_path / "umls.sqlite3")
+
+    async with AsyncUMLSClient(api_key="test", base_url=base_url, cache=cache) as client:
+        results = await asyncio.gather(*(client.search("diabetes") for _ in range(5)))
+        assert all(r["success"] for r in results)
+        assert results[0]["results"][0]["ui"] == "C0011849"
+        assert hits["search"] == 1
+        assert client.requests_sent == 1
+
+        by_term = await client.search_many(["asthma", "copd", "asthma"])
+        assert set(by_term) == {"asthma", "copd"}
+        assert hits["search"] == 3
+
+    # A new client (as in a new process) is served from the persistent cache
+    cache.close()
+    reopened = TerminologyCache(tmp_path / "umls.sqlite3")
+    async with AsyncUMLSClient(api_key="test", base_url=base_url, cache=reopened) as client:
+        result = await client.search("diabetes")
+        assert result["results"][0]["name"] == "diabetes"
+        assert client.requests_sent == 0
+    assert hits["search"] == 3
+    assert reopened.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_releases_waiters_when_leader_is_cancelled(umls_stub):
+    base_url, hits = umls_stub
+    async with AsyncUMLSClient(api_key="test", base_url=base_url) as client:
+        leader = asyncio.create_task(client.search("asthma"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(client.search("asthma"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        result = await asyncio.wait_for(waiter, timeout=5)
+        assert result["results"][0]["name"] == "asthma"
+        assert leader.cancelled() and not client._inflight
+
+
+@pytest.mark.asyncio
+async def test_service_resolves_locally_before_umls(umls_stub, tmp_path):
+    base_url, hits = umls_stub
+    client = AsyncUMLSClient(
+        api_key="test", base_url=base_url, cache=TerminologyCache(tmp_path / "umls.sqlite3")
+    )
+    service = TerminologyService(_index(tmp_path), client)
+    try:
+        results = await service.search_many(["hypertension", "type 2 diabetes", "gout"])
+        assert results["hypertension"][0]["origin"] == "local"
+        assert results["type 2 diabetes"][0]["code"] == "E11.9"
+        assert results["gout"][0]["origin"] == "umls"
+        assert hits["search"] == 1
+
+        assert [m["code"] for m in await service.crosswalk(SNOMED, "38341003")] == ["I10"]
+        by_name = await service.crosswalk("SNOMEDCT_US", "38341003", "ICD10CM")
+        assert [m["code"] for m in by_name] == ["I10"]
+        assert hits["crosswalk"] == 0
+        remote = await service.crosswalk(SNOMED, "44054006", ICD10)
+        assert [m["code"] for m in remote] == ["E11.9"]
+        assert hits["crosswalk"] == 1
+
+        stats = service.get_stats()
+        assert stats["local_hits"] == 4 and stats["remote_lookups"] == 2
+    finally:
+        await service.close()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Container Resolution Benchmark
+
+Measures ``Container.get()`` throughput for singleton, transient and scoped
+services with a small dependency graph, including resolution through a child
+container.
+
+Usage:
+    uv run scripts/benchmark_container.py --iterations 200000
+"""
+
+import argparse
+import json
+import time
+
+from hacs_infrastructure.container import Container, ServiceLifetime
+
+
+class Settings:
+    def __init__(self) -> None:
+        self.dsn = "postgresql://localhost/hacs"
+
+
+class ConnectionPool:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class AuditLog:
+    def __init__(self, pool: ConnectionPool, enabled: bool = True) -> None:
+        self.pool = pool
+        self.enabled = enabled
+
+
+class Repository:
+    def __init__(self, pool: ConnectionPool, audit: AuditLog | None = None) -> None:
+        self.pool = pool
+        self.audit = audit
+
+
+class RequestHandler:
+    def __init__(self, repository: Repository, audit: AuditLog, settings: Settings) -> None:
+        self.repository = repository
+        self.audit = audit
+        self.settings = settings
+
+
+def build_container() -> Container:
+    container = Container()
+    container.register_singleton(Settings)
+    container.register_singleton(ConnectionPool)
+    container.register(AuditLog, lifetime=ServiceLifetime.SCOPED)
+    container.register(Repository)
+    container.register(RequestHandler)
+    return container
+
+
+def throughput(func, iterations: int) -> int:
+    """Calls per second of ``func``."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return round(iterations / (time.perf_counter() - started))
+
+
+def run(iterations: int) -> dict:
+    container = build_container()
+    if hasattr(container, "validate"):
+        container.validate()
+    child = container.create_child()
+
+    def scoped_request():
+        with container.create_scope("request"):
+            container.get(RequestHandler)
+
+    return {
+        "iterations": iterations,
+        "singleton_per_second": throughput(lambda: container.get(ConnectionPool), iterations),
+        "transient_leaf_per_second": throughput(lambda: container.get(Repository), iterations),
+        "transient_graph_per_second": throughput(
+            lambda: container.get(RequestHandler), iterations
+        ),
+        "child_container_per_second": throughput(lambda: child.get(RequestHandler), iterations),
+        "scoped_request_per_second": throughput(scoped_request, iterations // 4),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200_000, help="get() calls per case")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
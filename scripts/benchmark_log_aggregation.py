@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Log Aggregation Benchmark
+
+Ingests synthetic structured logs into a LogAggregator and measures ingest
+throughput, search latency, correlation latency and statistics latency.
+
+Usage:
+    uv run scripts/benchmark_log_aggregation.py --count 1000000
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import UTC, datetime, timedelta
+
+from hacs_infrastructure.log_aggregation import CorrelationType, LogAggregator, LogSeverity
+
+SERVICES = ["mcp-server", "persistence", "extraction", "vector-store", "auth"]
+MESSAGES = [
+    "Tool execution completed for {tool} in {ms} ms",
+    "Patient record read for encounter {n}",
+    "Slow query performance warning on table observations ({ms} ms)",
+    "Authentication failed for user {user}",
+    "PHI access granted for resource Observation/{n}",
+    "Cache miss for terminology lookup {n}",
+    "Internal error while serializing bundle {n}",
+]
+LEVELS = [LogSeverity.INFO] * 8 + [LogSeverity.WARN, LogSeverity.ERROR]
+
+
+def generate_logs(count: int, seed: int = 42) -> list[dict]:
+    """Build reproducible structured log payloads spread over the last hours."""
+    rng = random.Random(seed)
+    start = datetime.now(UTC) - timedelta(hours=6)
+    step = timedelta(hours=6) / count
+    logs = []
+    for i in range(count):
+        template = rng.choice(MESSAGES)
+        logs.append(
+            {
+                "timestamp": (start + step * i).isoformat(),
+                "level": rng.choice(LEVELS).value,
+                "service": rng.choice(SERVICES),
+                "message": template.format(
+                    tool=f"tool_{rng.randrange(50)}",
+                    ms=rng.randrange(1, 5000),
+                    n=rng.randrange(100000),
+                    user=f"user_{rng.randrange(1000)}",
+                ),
+                "logger": "hacs.benchmark",
+                "trace_id": f"trace-{i // 20}",
+                "user_id": f"user_{rng.randrange(1000)}",
+                "request_bytes": rng.randrange(100, 10000),
+            }
+        )
+    return logs
+
+
+def timed(func, repeat: int = 20) -> float:
+    """Median wall time of ``func`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def run(count: int, buffer_size: int) -> dict:
+    logs = generate_logs(count)
+    aggregator = LogAggregator(buffer_size=buffer_size)
+
+    started = time.perf_counter()
+    for log in logs:
+        aggregator.add_structured_log(log)
+    ingest_seconds = time.perf_counter() - started
+
+    last_trace = logs[-1]["trace_id"]
+    return {
+        "count": count,
+        "buffer_size": buffer_size,
+        "retained": len(aggregator._store),
+        "ingest_seconds": round(ingest_seconds, 3),
+        "ingest_per_second": round(count / ingest_seconds),
+        "search_token_ms": timed(lambda: aggregator.search_logs("slow query", limit=100)),
+        "search_prefix_ms": timed(lambda: aggregator.search_logs("authent", limit=100)),
+        "search_filtered_ms": timed(
+            lambda: aggregator.search_logs(
+                "internal error", level=LogSeverity.ERROR, service="persistence", limit=50
+            )
+        ),
+        "search_tags_ms": timed(lambda: aggregator.search_logs(tags=["phi"], limit=100)),
+        "correlate_ms": timed(
+            lambda: (
+                aggregator._correlation_cache.clear(),
+                aggregator.correlate_logs(CorrelationType.TRACE_ID, last_trace, 600),
+            )
+        ),
+        "statistics_ms": timed(lambda: aggregator.get_log_statistics(hours=24), repeat=5),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000, help="Logs to ingest")
+    parser.add_argument(
+        "--buffer-size", type=int, default=None, help="Retained entries (defaults to --count)"
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.count, args.buffer_size or args.count), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Tests for batch validation of resource payloads.
+
+Validates that:
+1. Payloads are validated per type with errors at JSON-pointer paths
+2. validate_resources/validate_bundles report per-item results in input order
+3. Chunked multi-process validation matches in-process results
+4. Empty STACK/TEMPLATE bundles fail, and the GC state is left untouched
+"""
+
+import gc
+
+from hacs_models import Patient, validate_many
+from hacs_models.bulk_validation import json_pointer
+from hacs_tools.domains.modeling import validate_bundle, validate_bundles, validate_resources
+
+OBSERVATION = {
+    "resource_type": "Observation",
+    "status": "final",
+    "code": {"text": "Heart rate", "coding": [{"system": "http://loinc.org", "code": "8867-4"}]},
+}
+
+
+def _payloads():
+    return [
+        {"resource_type": "Patient", "full_name": "Ana Souza"},
+        {**OBSERVATION, "code": {"coding": [{"system": "http://loinc.org"}]}},
+        {"full_name": "No Type"},
+        dict(OBSERVATION),
+        {"resource_type": "Patient", "full_name": "Ana Souza", "unknown": 1},
+    ]
+
+
+def test_validate_many_groups_and_points_at_errors():
+    result = validate_many(_payloads(), keep_models=True)
+
+    assert result.total == 5 and result.valid_count == 2
+    assert result.counts_by_type == {"Patient": 2, "Observation": 2}
+    assert [(e["index"], e["path"], e["type"]) for e in result.errors] == [
+        (1, "/code/coding/0/code", "missing"),
+        (2, "/resource_type", "resource_type"),
+        (4, "/unknown", "extra_forbidden"),
+    ]
+    assert isinstance(result.models[0], Patient)
+    assert result.models[3].status == "final"
+    assert result.models[1] is None and result.models[4] is None
+    assert json_pointer(["a/b", "c~d", 0]) == "/a~1b/c~0d/0"
+
+
+def test_validate_many_with_processes_matches_in_process():
+    payloads = _payloads() * 4
+    in_process = validate_many(payloads)
+    chunked = validate_many(payloads, processes=2, chunk_size=6)
+    assert chunked.errors == in_process.errors
+    assert chunked.counts_by_type == in_process.counts_by_type
+
+
+def test_validate_resources_and_bundles():
+    result = validate_resources(_payloads())
+    assert not result.success
+    assert [r["valid"] for r in result.data["results"]] == [True, False, False, True, False]
+    assert result.data["results"][1]["issues"] == ["/code/coding/0/code: Field required"]
+
+    bundle = {
+        "bundle_type": "collection",
+        "entries": [
+            {"title": "Patient", "resource": {"resource_type": "Patient", "full_name": "Ana"}},
+            {"title": "Observation", "resource": _payloads()[1]},
+        ],
+    }
+    clean = {"bundle_type": "collection", "entries": [{"resource": dict(OBSERVATION)}]}
+    results = validate_bundles([bundle, clean]).data["results"]
+    assert results[0]["issues"] == ["/entries/1/resource/code/coding/0/code: Field required"]
+    assert results[1] == {
+        "valid": True,
+        "issues": [],
+        "entry_count": 1,
+        "bundle_type": "collection",
+    }
+
+
+def test_bundle_integrity_and_gc_state():
+    result = validate_bundle({"bundle_type": "stack", "entries": []})
+    assert not result.success
+    assert "at least one entry" in result.error
+    assert validate_bundles([{"bundle_type": "template"}]).data["results"][0]["valid"] is False
+
+    assert gc.isenabled()
+    validate_many(_payloads())
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        validate_many(_payloads())
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
@@ -0,0 +1,194 @@
+"""
+Tests for the compact storage profile.
+
+Validates that:
+1. Compact documents keep the fields queried in SQL and rehydrate defaults
+2. Existing rows are recompacted with a savings report, one locked batch at a time
+3. Storage profiles are configured per adapter and per resource type
+4. Server-side patches see fields omitted by compact documents and reject
+   invalid operations
+5. Search and graph filters match fields stored at their default
+"""
+
+import pytest
+
+from benchmarks.datasets import make_observations
+from hacs_core import Actor, ValidationError
+from hacs_models import CarePlan, Observation, Patient
+from hacs_models.serialization import (
+    COMPACT_KEEP_FIELDS,
+    compact_defaults,
+    dumps,
+    json_loads,
+    loads,
+    profile_sizes,
+)
+from hacs_persistence.adapter import PostgreSQLAdapter, compile_jsonb_patch, recompact_rows
+from hacs_persistence.graph import GraphQuery
+
+
+def _observations(count=50):
+    payloads = make_observations(count, ["patient-000001"], seed=7)
+    return [Observation.model_validate(payload) for payload in payloads]
+
+
+def test_compact_keeps_query_fields_and_rehydrates():
+    observation = _observations(1)[0]
+    compact = json_loads(dumps(observation, "compact"))
+    present = {name for name in COMPACT_KEEP_FIELDS if getattr(observation, name) is not None}
+    assert present <= compact.keys()
+    assert compact["version"] == "1.0.0"
+    assert "category" not in compact and "performer" not in compact
+    assert loads(dumps(observation, "compact"), Observation).model_dump() == (
+        observation.model_dump()
+    )
+
+    sizes = profile_sizes(_observations(), ("storage", "compact"))
+    assert sizes["count"] == 50
+    assert sizes["savings"]["compact"] > 0.5
+
+
+def test_recompact_rows_reports_savings():
+    observations = _observations(10)
+    rows = [(o.id, json_loads(dumps(o, "storage"))) for o in observations]
+    rows.append(("broken", {"resource_type": "Unknown", "id": "broken"}))
+
+    updates, stats = recompact_rows(rows, "compact")
+    assert [resource_id for resource_id, _ in updates] == [o.id for o in observations]
+    assert stats["rows"] == 11 and stats["rewritten"] == 10 and stats["failed"] == 1
+    assert stats["bytes_after"] < stats["bytes_before"] / 2
+
+    # Compacted rows are stable, and expand again with the storage profile
+    compacted = [(resource_id, json_loads(data)) for resource_id, data in updates]
+    assert recompact_rows(compacted, "compact")[1]["rewritten"] == 0
+    expanded, _ = recompact_rows(compacted, "storage")
+    assert [json_loads(data) for _, data in expanded] == [data for _, data in rows[:-1]]
+
+
+def test_adapter_storage_profiles(monkeypatch):
+    monkeypatch.delenv("HACS_STORAGE_PROFILE", raising=False)
+    adapter = PostgreSQLAdapter(
+        "postgresql://localhost/hacs", storage_profiles={"Observation": "compact"}
+    )
+    assert adapter.profile_for("Observation") == "compact"
+    assert adapter.profile_for("Patient") == "storage"
+
+    monkeypatch.setenv("HACS_STORAGE_PROFILE", "compact")
+    assert PostgreSQLAdapter("postgresql://localhost/hacs").profile_for("Patient") == "compact"
+    with pytest.raises(ValueError):
+        PostgreSQLAdapter("postgresql://localhost/hacs", storage_profile="llm")
+
+
+def test_patch_sees_fields_omitted_by_compact_documents():
+    patient = Patient(full_name="Ana Souza")
+    compact = json_loads(dumps(patient, "compact"))
+    assert "telecom" not in compact and "active" not in compact
+    defaults = compact_defaults(Patient)
+    assert defaults["active"] is True and defaults["telecom"] == []
+    assert "id" not in defaults and "resource_type" not in defaults
+
+    value_sql, _, params = compile_jsonb_patch(
+        [
+            {"op": "replace", "path": "/active", "value": False},
+            {"op": "add", "path": "/telecom/-", "value": {"value": "555-0100"}},
+        ],
+        source="(%(patch_defaults)s::jsonb || data)",
+    )
+    # replace requires the path to exist; the defaults make omitted fields visible
+    assert "CASE WHEN s0.d #> %(patch_1)s::text[] IS NULL THEN NULL" in value_sql
+    assert "jsonb_set(s0.d, %(patch_1)s::text[], %(patch_0)s::jsonb)" in value_sql
+    assert "coalesce(s1.d #> %(patch_3)s::text[], '[]')" in value_sql
+    assert "FROM (SELECT (%(patch_defaults)s::jsonb || data) AS d) s0" in value_sql
+    assert params["patch_3"] == ["telecom"] and params["patch_4"] == ["telecom", "-1"]
+
+
+@pytest.mark.asyncio
+async def test_patch_rejects_invalid_pointers(monkeypatch):
+    adapter = PostgreSQLAdapter("postgresql://localhost/hacs")
+
+    async def connect():
+        return None
+
+    monkeypatch.setattr(adapter, "connect", connect)
+    actor = Actor(name="Dr. Smith", role="physician")
+    with pytest.raises(ValidationError, match="Invalid JSON pointer"):
+        await adapter.patch(
+            Patient, "patient-1", [{"op": "replace", "path": "active", "value": False}], actor
+        )
+
+
+class _RecordingPool:
+    """Connection pool stand-in that records executed queries and commits."""
+
+    def __init__(self, results=()):
+        self.queries = []
+        self.results = list(results)
+        self.commits = 0
+
+    def connection(self):
+        return self
+
+    def cursor(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, sql, params=None):
+        self.queries.append((sql, params))
+
+    async def fetchall(self):
+        return self.results.pop(0) if self.results else []
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.asyncio
+async def test_search_matches_fields_stored_at_their_default():
+    plan = CarePlan(status="active", subject_ref="Patient/p1")
+    row = json_loads(dumps(plan, "compact"))
+    assert "intent" not in row
+
+    adapter = PostgreSQLAdapter("postgresql://localhost/hacs", storage_profile="compact")
+    adapter.pool = _RecordingPool()
+    actor = Actor(name="Dr. Smith", role="physician")
+    await adapter.search(CarePlan, actor, {"intent": "plan", "status": "active"})
+    await adapter.search(Patient, actor, {"active": True})
+    (plan_sql, plan_params), (patient_sql, patient_params) = adapter.pool.queries
+    assert "COALESCE(data->>'intent', %(default_intent)s) = %(filter_intent)s" in plan_sql
+    assert plan_params["default_intent"] == plan_params["filter_intent"] == "plan"
+    assert "data->>'status' = %(filter_status)s" in plan_sql
+    assert patient_params["default_active"] == patient_params["filter_active"] == "true"
+
+    query = GraphQuery(
+        "CarePlan", reverse=[(["subject_ref"], ["Patient/p1"], (("intent", "plan"),))]
+    )
+    sql, params = query.to_sql("public", 10)
+    assert "COALESCE(data #>> %(filter_0_0_key)s::text[], %(filter_0_0_default)s)" in sql
+    assert params["filter_0_0_default"] == "plan"
+    assert query.matches(row)
+    assert not GraphQuery(
+        "CarePlan", reverse=[(["subject_ref"], ["Patient/p1"], (("intent", "order"),))]
+    ).matches(row)
+
+
+@pytest.mark.asyncio
+async def test_recompact_locks_each_batch_until_commit():
+    rows = [(o.id, json_loads(dumps(o, "storage"))) for o in _observations(3)]
+    adapter = PostgreSQLAdapter("postgresql://localhost/hacs")
+    adapter.pool = _RecordingPool([rows[:2], rows[2:]])
+
+    totals = await adapter.recompact(["Observation"], profile="compact", batch_size=2)
+    assert totals["rewritten"] == 3
+    selects = [sql for sql, _ in adapter.pool.queries if "SELECT id, data" in sql]
+    assert len(selects) == 3 and all("FOR UPDATE" in sql for sql in selects)
+    # Each batch ends its own transaction
+    assert adapter.pool.commits == 2
+
+    adapter.pool = _RecordingPool([rows])
+    await adapter.recompact(["Observation"], profile="compact", dry_run=True)
+    assert not any("FOR UPDATE" in sql for sql, _ in adapter.pool.queries)
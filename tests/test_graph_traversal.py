@@ -0,0 +1,115 @@
+"""
+Tests for GraphDefinition traversal with batched, level-wise lookups.
+
+Validates that:
+1. Each hop costs one query per target type, regardless of fan-out
+2. Visited resources are deduplicated and fan-out/total caps apply
+3. Queries render as parameterized ANY(...) lookups
+"""
+
+import pytest
+
+from hacs_models import (
+    Encounter,
+    GraphDefinition,
+    GraphDefinitionLink,
+    GraphDefinitionLinkTarget,
+    Observation,
+    Patient,
+)
+from hacs_persistence.graph import GraphQuery, GraphTraversal
+
+
+def _store():
+    patient = Patient(full_name="Ana Souza")
+    encounters = [
+        Encounter(status="finished", subject=patient.to_reference(), **{"class": "AMB"})
+        for _ in range(2)
+    ]
+    observations = [
+        Observation(
+            status="final" if i % 5 else "preliminary",
+            code={"text": "Heart rate"},
+            subject=patient.to_reference(),
+            encounter=encounters[i % 2].to_reference(),
+        )
+        for i in range(20)
+    ]
+    rows = [
+        r.model_dump(mode="json", by_alias=True, exclude_computed_fields=True)
+        for r in [patient, *encounters, *observations]
+    ]
+    return patient, rows
+
+
+def _graph(observation_max=None):
+    return GraphDefinition(
+        name="patient-context",
+        start="Patient",
+        link=[
+            GraphDefinitionLink(
+                path="Patient",
+                max=observation_max,
+                target=[
+                    GraphDefinitionLinkTarget(
+                        type="Observation", params="subject={ref}&status=final"
+                    )
+                ],
+            ),
+            GraphDefinitionLink(
+                path="Observation.encounter", target=[GraphDefinitionLinkTarget(type="Encounter")]
+            ),
+            GraphDefinitionLink(
+                path="Encounter.subject", target=[GraphDefinitionLinkTarget(type="Patient")]
+            ),
+        ],
+    )
+
+
+def _fetcher(rows, log):
+    async def fetch(query: GraphQuery, limit: int):
+        log.append(query)
+        return [row for row in rows if query.matches(row)][:limit]
+
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_traversal_batches_each_hop():
+    patient, rows = _store()
+    log = []
+    traversal = GraphTraversal(_graph())
+    bundle = await traversal.run(_fetcher(rows, log), [rows[0]])
+
+    # Observations, then encounters; the patient is already visited
+    assert [q.resource_type for q in log] == ["Observation", "Encounter"]
+    assert len(log[1].ids) == 2
+    assert len(bundle.get_resources_by_type("Observation")) == 16
+    assert len(bundle.get_resources_by_type("Encounter")) == 2
+    assert bundle.get_resources_by_type("Patient")[0].id == patient.id
+    assert bundle.total == len(bundle.entries) == 19
+    depths = {e.resource.resource_type: e.metadata["graph_depth"] for e in bundle.entries}
+    assert depths == {"Patient": 0, "Observation": 1, "Encounter": 2}
+
+
+@pytest.mark.asyncio
+async def test_traversal_caps_fanout_and_total():
+    _, rows = _store()
+    bundle = await GraphTraversal(_graph("3")).run(_fetcher(rows, []), [rows[0]])
+    assert len(bundle.get_resources_by_type("Observation")) == 3
+
+    bundle = await GraphTraversal(_graph(), max_resources=5).run(_fetcher(rows, []), [rows[0]])
+    assert len(bundle.entries) == 5
+
+
+def test_graph_query_sql():
+    query = GraphQuery(
+        "Observation",
+        ids={"obs-1"},
+        reverse=[(["subject"], ["Patient/p1", "p1"], (("status", "final"),))],
+    )
+    sql, params = query.to_sql("public", 50)
+    assert "id = ANY(%(ids)s)" in sql
+    assert "data #>> %(path_0)s::text[] = ANY(%(values_0)s)" in sql
+    assert params["values_0"] == ["Patient/p1", "p1"] and params["filter_0_0"] == "final"
+    assert "FALSE" in GraphQuery("Patient").to_sql("public", 1)[0]
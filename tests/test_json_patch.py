@@ -0,0 +1,94 @@
+"""
+Tests for JSON Patch diffs and server-side resource patching.
+
+Validates that:
+1. diff/apply_patch round-trip, aligning lists of objects by id
+2. Malformed or failing operations raise JsonPatchError
+3. Patch operations compile to a single jsonb_set/jsonb_insert expression
+"""
+
+import pytest
+
+from hacs_models import JsonPatchError, Patient, apply_patch, json_diff
+from hacs_persistence.adapter import compile_jsonb_patch
+from hacs_tools.domains.modeling import diff_resources
+
+
+def test_diff_round_trip_aligns_lists_by_id():
+    before = Patient(full_name="Ana Souza", active=True).model_dump(mode="json")
+    before["entries"] = [{"id": f"e{i}", "value": i} for i in range(50)]
+    after = {**before, "full_name": "Ana S. Souza", "active": False}
+    after["entries"] = [e for e in before["entries"] if e["id"] != "e10"]
+    after["entries"].insert(0, {"id": "new", "value": -1})
+    after["entries"][5] = {**after["entries"][5], "value": 99}
+
+    ops = json_diff(before, after)
+    assert {"op": "remove", "path": "/entries/10"} in ops
+    assert {"op": "add", "path": "/entries/0", "value": {"id": "new", "value": -1}} in ops
+    assert len(ops) == 5
+    assert apply_patch(before, ops) == after
+    assert before["full_name"] == "Ana Souza"
+
+    reordered = {**before, "entries": before["entries"][1:] + before["entries"][:1]}
+    ops = json_diff(before, reordered)
+    assert [op["op"] for op in ops] == ["move"]
+    assert apply_patch(before, ops) == reordered
+
+    # true and 1 are different JSON values
+    assert json_diff({"a": True}, {"a": 1}) == [{"op": "replace", "path": "/a", "value": 1}]
+
+    result = diff_resources({"a": {"b": 1}}, {"a": {"b": 2}})
+    assert result.data["patch"] == [{"op": "replace", "path": "/a/b", "value": 2}]
+
+
+def test_apply_patch_operations_and_errors():
+    document = {"a/b": [1, 2], "c": {"d": 1}}
+    patched = apply_patch(
+        document,
+        [
+            {"op": "test", "path": "/c/d", "value": 1},
+            {"op": "add", "path": "/a~1b/-", "value": 3},
+            {"op": "copy", "from": "/c", "path": "/e"},
+            {"op": "move", "from": "/c/d", "path": "/f"},
+        ],
+    )
+    assert patched == {"a/b": [1, 2, 3], "c": {}, "e": {"d": 1}, "f": 1}
+
+    for ops in (
+        [{"op": "test", "path": "/c/d", "value": 2}],
+        [{"op": "remove", "path": "/missing"}],
+        [{"op": "add", "path": "/a~1b/01", "value": 0}],
+        [{"op": "move", "from": "/c", "path": "/c/x"}],
+        [{"op": "replace", "path": "/c"}],
+        [{"op": "upsert", "path": "/c", "value": 1}],
+    ):
+        with pytest.raises(JsonPatchError):
+            apply_patch(document, ops)
+
+
+def test_compile_jsonb_patch():
+    value_sql, conditions, params = compile_jsonb_patch(
+        [
+            {"op": "test", "path": "/version", "value": "1.0.0"},
+            {"op": "replace", "path": "/full_name", "value": "B"},
+            {"op": "add", "path": "/name/-", "value": {"given": ["Ana"]}},
+            {"op": "remove", "path": "/telecom/0"},
+        ]
+    )
+    assert value_sql.count("CROSS JOIN LATERAL") == 3
+    assert "jsonb_set(s0.d" in value_sql and "jsonb_insert(jsonb_set(s1.d" in value_sql
+    assert "s2.d #- " in value_sql
+    assert conditions == ["data #> %(patch_0)s::text[] = %(patch_1)s::jsonb"]
+    assert params["patch_1"] == '"1.0.0"'
+    assert ["name", "-1"] in params.values()
+
+    assert compile_jsonb_patch([]) == ("data", [], {})
+    with pytest.raises(JsonPatchError):
+        compile_jsonb_patch(
+            [
+                {"op": "remove", "path": "/a"},
+                {"op": "test", "path": "/b", "value": 1},
+            ]
+        )
+    with pytest.raises(JsonPatchError, match="Invalid JSON pointer"):
+        compile_jsonb_patch([{"op": "remove", "path": "a"}])
@@ -0,0 +1,34 @@
+"""
+Tests for ResourceBundle entry indexes.
+
+Validates that:
+1. Lookups by type, tag, id and reference use the entry index
+2. Direct appends to entries are picked up
+3. Replacing the entries list rebuilds the index
+"""
+
+from hacs_models import Observation, Patient, ResourceBundle
+
+
+def test_index_lookups_follow_appends():
+    patient = Patient(full_name="Ana Souza")
+    bundle = ResourceBundle(title="Labs")
+    bundle.add_entry(patient, tags=["demographics"])
+    observations = [
+        Observation(status="final", code={"text": "Heart rate"}, subject=patient.to_reference())
+        for _ in range(3)
+    ]
+    assert bundle.extend_entries(observations) == 3
+
+    assert bundle.get_resources_by_type("Observation") == observations
+    assert bundle.get_resources_by_tag("demographics") == [patient]
+    assert bundle.get_resource_by_id(observations[1].id) is observations[1]
+    assert bundle.get_resources_referencing(patient) == observations
+
+    # Direct appends are picked up; replacing the list rebuilds the index
+    bundle.entries.append(bundle.entries[1])
+    assert bundle.validate_bundle_integrity()["issues"] == [
+        "Duplicate resource IDs found in bundle"
+    ]
+    bundle.entries = bundle.entries[:2]
+    assert bundle.get_resources_referencing(patient) == observations[:1]
@@ -0,0 +1,53 @@
+"""
+Tests for the fast resource serialization path.
+
+Validates that:
+1. Every profile round-trips through from_json, rehydrating omitted defaults
+2. Compact profiles keep resource_type and shrink the payload
+3. Plain containers with resources encode through json_dumps
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from hacs_models import BaseResource, Encounter, Observation, Patient
+from hacs_models.serialization import dumps, dumps_many, json_dumps, json_loads, loads_many
+
+
+@pytest.mark.parametrize("profile", ["storage", "compact"])
+def test_profiles_round_trip(profile):
+    patient = Patient(full_name="Ana Souza", gender="female", birth_date="1980-01-02")
+    encounter = Encounter(status="finished", subject=patient.to_reference(), **{"class": "AMB"})
+
+    for resource in (patient, encounter):
+        restored = BaseResource.from_json(resource.to_json(profile))
+        assert type(restored) is type(resource)
+        assert restored.model_dump() == resource.model_dump()
+
+    compact = json_loads(dumps(patient, "compact"))
+    assert compact["resource_type"] == "Patient"
+    assert compact["version"] == "1.0.0" and "language" not in compact
+    assert len(dumps(patient, "compact")) < len(dumps(patient, "storage")) / 2
+
+
+def test_dumps_many_and_json_dumps():
+    observations = [
+        Observation(status="final", code={"text": "Heart rate"}, value_quantity={"value": i})
+        for i in range(3)
+    ]
+    restored = loads_many(dumps_many(observations))
+    assert [o.id for o in restored] == [o.id for o in observations]
+
+    encoded = json_loads(
+        json_dumps(
+            {"resource": observations[0], "at": datetime(2024, 1, 1, tzinfo=UTC), "tags": {"a"}},
+            profile="llm",
+        )
+    )
+    assert encoded["resource"]["resource_type"] == "Observation"
+    assert "language" not in encoded["resource"]
+    assert encoded["tags"] == ["a"] and encoded["at"].startswith("2024-01-01")
+
+    with pytest.raises(ValueError):
+        dumps(observations[0], "minimal")
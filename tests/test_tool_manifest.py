@@ -0,0 +1,109 @@
+"""
+Tests for the HACSToolRegistry discovery manifest.
+
+Validates that:
+1. A warm manifest registers tools without importing their modules
+2. Cached tool functions import their module on first call (sync and async)
+3. Only modified modules are re-imported and rescanned
+"""
+
+import asyncio
+import os
+import sys
+import textwrap
+
+import pytest
+
+from hacs_registry.tool_manifest import LazyToolFunction, ToolManifest
+from hacs_registry.tool_registry import HACSToolRegistry
+
+PACKAGE = "manifest_demo_tools"
+
+MODULE_TEMPLATE = """
+from hacs_registry.tool_registry import HACSToolRegistry
+
+_registry = HACSToolRegistry()
+
+
+@_registry.register_tool(name="{name}", domain="resource", description="{description}")
+{prefix}def {name}(value: int) -> int:
+    return value + 1
+"""
+
+
+def _write_module(root, module, name, description="Demo tool", is_async=False):
+    source = MODULE_TEMPLATE.format(
+        name=name, description=description, prefix="async " if is_async else ""
+    )
+    path = root / PACKAGE / f"{module}.py"
+    path.write_text(textwrap.dedent(source))
+    return path
+
+
+def _forget_package():
+    for modname in [m for m in sys.modules if m.split(".")[0] == PACKAGE]:
+        del sys.modules[modname]
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    (tmp_path / PACKAGE).mkdir()
+    (tmp_path / PACKAGE / "__init__.py").write_text("")
+    _write_module(tmp_path, "sync_tools", "bump_count")
+    _write_module(tmp_path, "async_tools", "bump_count_async", is_async=True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    _forget_package()
+
+
+def _discover(manifest_path):
+    registry = HACSToolRegistry(manifest=ToolManifest(manifest_path))
+    registry.discover_plugins([PACKAGE])
+    return registry
+
+
+def test_warm_manifest_registers_lazily(package):
+    manifest_path = package / "manifest.json"
+    cold = _discover(manifest_path)
+    assert {t.name for t in cold.get_all_tools()} == {"bump_count", "bump_count_async"}
+    assert manifest_path.exists()
+
+    _forget_package()
+    warm = _discover(manifest_path)
+    assert {t.name for t in warm.get_all_tools()} == {"bump_count", "bump_count_async"}
+    assert f"{PACKAGE}.sync_tools" not in sys.modules
+
+    tool = warm.get_tool("bump_count")
+    assert isinstance(tool.function, LazyToolFunction)
+    assert not tool.function.is_resolved
+    assert tool.domain == "resource" and tool.description == "Demo tool"
+    assert tool.function(1) == 2
+    assert f"{PACKAGE}.sync_tools" in sys.modules
+
+    async_tool = warm.get_tool("bump_count_async")
+    assert async_tool.is_async
+    assert asyncio.iscoroutinefunction(async_tool.function)
+    assert asyncio.run(async_tool.function(value=41)) == 42
+
+
+def test_only_modified_modules_are_rescanned(package):
+    manifest_path = package / "manifest.json"
+    _discover(manifest_path)
+    _forget_package()
+
+    path = _write_module(package, "sync_tools", "bump_total", description="Renamed tool")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    registry = _discover(manifest_path)
+    assert registry.get_tool("bump_total").description == "Renamed tool"
+    assert registry.get_tool("bump_count") is None
+    assert f"{PACKAGE}.sync_tools" in sys.modules
+    assert f"{PACKAGE}.async_tools" not in sys.modules
+
+
+def test_manifest_disabled_imports_modules(package, monkeypatch):
+    monkeypatch.setenv("HACS_TOOL_MANIFEST", "0")
+    registry = HACSToolRegistry()
+    assert registry.discover_plugins([PACKAGE]) == 2
+    assert not isinstance(registry.get_tool("bump_count").function, LazyToolFunction)
@@ -0,0 +1,122 @@
+"""
+Tests for HACSToolRegistry search indexes.
+
+Validates that:
+1. Text queries match the same tools as a substring search, ranked with
+   name matches first
+2. Category, domain, tag and capability filters combine correctly
+3. Re-registering a tool replaces its previous index entries
+"""
+
+from hacs_models import ToolDefinition
+from hacs_registry.tool_registry import HACSToolRegistry
+
+
+def _tool(name, description, category="modeling", domain="modeling", tags=None, **flags):
+    return ToolDefinition(
+        name=name,
+        version="1.0.0",
+        description=description,
+        category=category,
+        domain=domain,
+        tags=tags or [],
+        **flags,
+    )
+
+
+def _registry():
+    registry = HACSToolRegistry()
+    for tool in [
+        _tool("save_resource", "Persist a resource", "database", "database", ["crud"],
+              requires_db=True, requires_actor=True),
+        _tool("read_resource", "Load a resource by id", "database", "database", ["crud"],
+              requires_db=True),
+        _tool("validate_resource", "Check a patient resource against its schema", tags=["schema"]),
+        _tool("search_memories", "Find patient memories", "agents", "agents", ["memory"],
+              requires_vector_store=True, is_async=True),
+    ]:
+        registry._register_tool_definition(tool)
+    return registry
+
+
+def test_query_ranks_name_matches_first():
+    registry = _registry()
+
+    names = [t.name for t in registry.search_tools(query="patient")]
+    assert set(names) == {"validate_resource", "search_memories"}
+
+    assert [t.name for t in registry.search_tools(query="save_resource")] == ["save_resource"]
+    names = [t.name for t in registry.search_tools(query="resource")]
+    assert names[-1] == "validate_resource"  # description-only match ranks last
+
+    # Partial words match index terms that contain them
+    assert [t.name for t in registry.search_tools(query="valid")] == ["validate_resource"]
+    assert registry.search_tools(query="unknownword") == []
+
+
+def test_query_matches_substring_search():
+    registry = _registry()
+    for i in range(20):
+        registry._register_tool_definition(
+            _tool(f"resource_tool_{i}", f"Manage resource batch {i}", tags=["bulk_ops"])
+        )
+
+    def substring_search(query):
+        query = query.lower()
+        return {
+            tool.name
+            for tool in registry.get_all_tools()
+            if query in tool.name.lower()
+            or query in tool.description.lower()
+            or any(query in tag.lower() for tag in tool.tags)
+        }
+
+    for query in [
+        "resource_m", "create resource", "_", "e_r", "ce_tool_1", "source", "a resource",
+        "age resource b", "k_o", "ource by", "patient memories", "Load a resource by id", "e",
+    ]:
+        names = [t.name for t in registry.search_tools(query=query)]
+        assert len(names) == len(set(names))
+        assert set(names) == substring_search(query), query
+
+    assert registry.search_tools(query="resource_m") == []
+    assert registry.search_tools(query="create resource") == []
+    assert len(registry.search_tools(query="_")) == 24
+
+
+def test_filters_combine():
+    registry = _registry()
+
+    assert [t.name for t in registry.search_tools(category="database")] == [
+        "save_resource",
+        "read_resource",
+    ]
+    assert [t.name for t in registry.search_tools(requires_db=True, requires_actor=False)] == [
+        "read_resource"
+    ]
+    assert [t.name for t in registry.search_tools(tags=["crud"], query="load")] == [
+        "read_resource"
+    ]
+    assert [t.name for t in registry.search_tools(is_async=True, domain="agents")] == [
+        "search_memories"
+    ]
+    assert registry.search_tools(tags=["crud", "memory"]) == []
+    assert registry.search_tools(category="missing") == []
+    assert len(registry.search_tools(framework="langchain")) == 4
+
+    stats = registry.get_tool_stats()
+    assert stats["capabilities"]["requires_db"] == 2
+    assert stats["capabilities"]["requires_vector_store"] == 1
+
+
+def test_reregistration_replaces_index_entries():
+    registry = _registry()
+    registry._register_tool_definition(
+        _tool("read_resource", "Fetch a record", "agents", "agents", ["lookup"])
+    )
+
+    assert [t.name for t in registry.search_tools(category="database")] == ["save_resource"]
+    assert registry.search_tools(tags=["crud"], query="load") == []
+    assert [t.name for t in registry.search_tools(query="fetch")] == ["read_resource"]
+    assert "read_resource" not in {t.name for t in registry.get_tools_by_tag("crud")}
+    assert registry.get_tool_stats()["capabilities"]["requires_db"] == 1
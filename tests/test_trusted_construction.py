@@ -0,0 +1,68 @@
+"""
+Tests for trusted (zero-revalidation) resource construction.
+
+Validates that:
+1. trusted() fills defaults, generates IDs and matches validated construction
+2. Field names, required fields and resource_type are still checked, and
+   nested models given as plain dicts are validated
+3. trusted_update() sets fields without assignment validation
+"""
+
+import pytest
+
+from hacs_models import CodeableConcept, Encounter, Observation, Patient, ResourceBundle
+from hacs_models.serialization import dumps
+
+
+def test_trusted_matches_validated_construction():
+    code = CodeableConcept(text="Heart rate")
+    trusted = Observation.trusted(status="final", code=code, subject="Patient/p1")
+    assert trusted.id.startswith("observation-") and trusted.version == "1.0.0"
+    assert trusted.model_fields_set == {"status", "code", "subject", "id"}
+    assert trusted.code is code
+
+    validated = Observation(
+        status="final",
+        code=code,
+        subject="Patient/p1",
+        id=trusted.id,
+        created_at=trusted.created_at,
+        updated_at=trusted.updated_at,
+    )
+    assert dumps(trusted) == dumps(validated)
+
+    # Mutable defaults are not shared, subclass post-init still runs
+    assert Observation.trusted(status="final", code=code).category is not trusted.category
+    assert Patient.trusted(full_name="Ana Souza").name[0].family == "Souza"
+    bundle = ResourceBundle.trusted()
+    bundle.add_entry(trusted)
+    assert bundle.get_resource_by_id(trusted.id) is trusted
+
+
+def test_trusted_checks_boundary():
+    with pytest.raises(ValueError, match="no field"):
+        Observation.trusted(status="final", code=CodeableConcept(text="x"), unknown=1)
+    with pytest.raises(ValueError, match="resource_type"):
+        Patient.trusted(resource_type="Observation", full_name="Ana")
+    with pytest.raises(ValueError, match="missing required"):
+        Encounter.trusted(status="finished")
+    assert Encounter.trusted(status="finished", **{"class": "AMB"}).class_ == "AMB"
+
+
+def test_trusted_validates_raw_nested_models():
+    observation = Observation.trusted(status="final", code={"text": "hr"})
+    assert type(observation.code).__name__ == "CodeableConcept" and observation.code.text == "hr"
+    telecom = [{"system": "phone", "value": "555-0100"}]
+    patient = Patient.trusted(full_name="Ana Souza", telecom=telecom)
+    assert type(patient.telecom[0]).__name__ == "ContactPoint"
+    assert patient.telecom[0].value == "555-0100" and patient.name[0].family == "Souza"
+    with pytest.raises(ValueError):
+        Observation.trusted(status="final", code={"coding": "not-a-list"})
+
+
+def test_trusted_update():
+    observation = Observation(status="final", code=CodeableConcept(text="x"))
+    assert observation.trusted_update(status="amended") is observation
+    assert observation.status == "amended" and "status" in observation.model_fields_set
+    with pytest.raises(ValueError, match="no field"):
+        observation.trusted_update(unknown=1)
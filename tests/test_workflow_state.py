@@ -0,0 +1,158 @@
+"""
+Tests for the incremental WorkflowExecution state store.
+
+Validates that:
+1. Replayed events reproduce the state built with the lifecycle methods
+2. Checkpoints bound replay, and load checkpoints lazily
+3. Resuming continues the sequence and unknown executions are rejected
+4. Concurrent appends get distinct sequence numbers; invalid events are rejected
+5. Per-execution append state stays bounded
+"""
+
+import asyncio
+
+import pytest
+from hacs_core import ResourceConflictError, ResourceNotFoundError, ValidationError
+from hacs_models import EventStatus, WorkflowExecution
+from hacs_persistence import WorkflowStateStore
+
+
+def _execution(total_steps=1000):
+    return WorkflowExecution(workflow_definition="PlanDefinition/p", total_steps=total_steps)
+
+
+@pytest.mark.asyncio
+async def test_replay_matches_lifecycle_methods():
+    store = WorkflowStateStore(checkpoint_every=0)
+    stored = await store.create(_execution(3))
+    expected = stored.model_copy(deep=True)
+
+    await store.record_started(stored.id, {"document_id": "doc-1"})
+    await store.record_task(stored.id, "task-1")
+    await store.record_task(stored.id, "task-2", active=False)
+    await store.record_task(stored.id, "task-1", active=False)
+    await store.record_warning(stored.id, "low confidence")
+    for step in range(3):
+        await store.record_step(stored.id, step, {"step": step})
+
+    expected.start_execution({"document_id": "doc-1"})
+    expected.add_task("task-1")
+    expected.add_task("task-2", active=False)
+    expected.add_task("task-1", active=False)
+    expected.warnings.append("low confidence")
+    for step in range(3):
+        expected.complete_step(step, {"step": step})
+
+    loaded = await store.load(stored.id)
+    assert loaded.status == EventStatus.COMPLETED and loaded.ended is not None
+    assert loaded.model_dump(exclude={"started", "ended"}) == expected.model_dump(
+        exclude={"started", "ended"}
+    )
+    assert (loaded.tasks, loaded.active_tasks) == (["task-1", "task-2"], [])
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_bound_replay():
+    store = WorkflowStateStore(checkpoint_every=100)
+    execution = await store.create(_execution())
+    for step in range(250):
+        await store.record_step(execution.id, step, {"value": step})
+
+    # The first load replays everything and checkpoints lazily
+    assert (await store.load(execution.id)).current_step == 250
+    assert store.events_replayed == 250
+    await store.record_step(execution.id, 250, {"value": 250})
+    loaded = await store.load(execution.id)
+    assert store.events_replayed == 251
+    assert loaded.current_step == 251 and loaded.completed_steps[250] == {"value": 250}
+
+    await store.record_error(execution.id, "lost connection", fatal=True)
+    checkpointed = await store.checkpoint(execution.id)
+    assert checkpointed.status == EventStatus.STOPPED
+    assert [e["kind"] for e in await store.events(execution.id, after_seq=250)] == [
+        "step",
+        "error",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resume_and_unknown_executions():
+    store = WorkflowStateStore()
+    execution = await store.create(_execution())
+    assert await store.record_step(execution.id, 0, {}) == 1
+
+    # A fresh process reads the last sequence number from storage
+    store._next_seq.clear()
+    assert await store.record_step(execution.id, 1, {}) == 2
+    assert (await store.load(execution.id)).current_step == 2
+
+    with pytest.raises(ResourceConflictError):
+        await store.create(execution)
+    with pytest.raises(ResourceNotFoundError):
+        await store.record_step("workflowexecution-missing", 0, {})
+    with pytest.raises(ResourceNotFoundError):
+        await store.load("workflowexecution-missing")
+
+
+class _SlowStore(WorkflowStateStore):
+    """Yields to the event loop inside storage calls, like a database round trip."""
+
+    async def _last_seq(self, execution_id):
+        await asyncio.sleep(0)
+        return await super()._last_seq(execution_id)
+
+    async def _insert_event(self, execution_id, event):
+        await asyncio.sleep(0)
+        await super()._insert_event(execution_id, event)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_appends_and_invalid_events():
+    store = _SlowStore()
+    execution = await store.create(_execution())
+    store._next_seq.clear()
+    seqs = await asyncio.gather(
+        *(store.record_step(execution.id, step, {}) for step in range(20))
+    )
+    assert sorted(seqs) == list(range(1, 21))
+    assert (await store.load(execution.id)).current_step == 20
+
+    invalid = (
+        ("paused", {}),
+        ("step", {"output": {}}),
+        ("step", {"step": "two"}),
+        ("step", {"step": -1}),
+        ("step", {"step": True}),
+        ("step", {"step": 21, "output": "done"}),
+        ("task", {"task_id": 7}),
+        ("task", {"task_id": "t", "active": "no"}),
+        ("error", None),
+        ("error", {"message": "lost", "fatal": 1}),
+    )
+    for kind, data in invalid:
+        with pytest.raises(ValidationError):
+            await store.append(execution.id, kind, data)
+    assert len(await store.events(execution.id)) == 20
+    assert (await store.load(execution.id)).current_step == 20
+
+    # Rows stored before validation existed are skipped on replay
+    legacy = {"seq": 21, "kind": "step", "data": {"step": "two"}, "at": None}
+    store._events[execution.id].append(legacy)
+    store._next_seq.clear()
+    assert await store.record_step(execution.id, 20, {"value": 20}) == 22
+    loaded = await store.checkpoint(execution.id)
+    assert loaded.current_step == 21 and loaded.completed_steps[20] == {"value": 20}
+    with pytest.raises(ValueError, match="missing"):
+        execution.apply_event("task", {"active": False})
+
+
+@pytest.mark.asyncio
+async def test_append_state_is_bounded():
+    store = _SlowStore(cached_sequences=3)
+    executions = [await store.create(_execution()) for _ in range(5)]
+    await asyncio.gather(*(store.record_step(e.id, 0, {}) for e in executions for _ in range(2)))
+    assert len(store._next_seq) == 3 and store._append_locks == {}
+
+    # Evicted executions continue from the stored sequence
+    for execution in executions:
+        assert await store.record_step(execution.id, 1, {}) == 3